@@ -1,11 +1,15 @@
 //! Blend mode implementations for layer compositing.
 //!
-//! All blend modes operate on RGBA f64 arrays with shape (height, width, 4).
+//! All blend modes operate on RGBA f64 arrays with shape (height, width, 4);
+//! `blend_full` also accepts f32 layers (see `crate::pixels`).
 //! Input arrays are read-only views, output is written in-place.
 
+use numpy::ndarray::{ArrayView3, ArrayViewMut3};
 use numpy::{PyArray3, PyArrayMethods, PyReadonlyArray3};
 use pyo3::prelude::*;
 
+use crate::pixels::{load, Channel, LayerArray, LayerMatrix};
+
 // ============================================================================
 // BlendMode enum for compositor
 // ============================================================================
@@ -264,99 +268,111 @@ pub fn blend_hard_light<'py>(
 /// - Preservation of base alpha channel in output
 ///
 /// # Arguments
-/// * `img_in` - Base image, RGBA f64 array shape (h, w, 4)
-/// * `img_layer` - Layer to blend, RGBA f64 array shape (h, w, 4)
-/// * `output` - Output array, same shape (h, w, 4)
+/// * `img_in` - Base image, RGBA f64 or f32 array shape (h, w, 4)
+/// * `img_layer` - Layer to blend, same dtype and shape as `img_in`
+/// * `output` - Output array, same dtype and shape as `img_in`
 /// * `blend_mode` - Mode name: "screen", "multiply", "addition", etc.
 /// * `opacity` - Layer opacity 0.0..1.0
 #[pyfunction]
 pub fn blend_full<'py>(
     _py: Python<'py>,
-    img_in: PyReadonlyArray3<'py, f64>,
-    img_layer: PyReadonlyArray3<'py, f64>,
-    output: &Bound<'py, PyArray3<f64>>,
+    img_in: LayerArray<'py>,
+    img_layer: LayerArray<'py>,
+    output: LayerMatrix<'py>,
     blend_mode: &str,
     opacity: f64,
 ) -> PyResult<()> {
-    let base = img_in.as_array();
-    let layer = img_layer.as_array();
-
-    debug_assert_eq!(base.shape(), layer.shape(), "Input shapes must match");
-    debug_assert_eq!(base.shape()[2], 4, "Arrays must have 4 channels (RGBA)");
+    debug_assert_eq!(img_in.shape(), img_layer.shape(), "Input shapes must match");
+    debug_assert_eq!(img_in.shape()[2], 4, "Arrays must have 4 channels (RGBA)");
     debug_assert!(
         (0.0..=1.0).contains(&opacity),
         "Opacity must be between 0.0 and 1.0"
     );
 
-    // Get the blend function based on mode name
-    let blend_fn: fn(f64, f64) -> f64 = match blend_mode {
-        "screen" => |b, l| 1.0 - (1.0 - b) * (1.0 - l),
-        "multiply" => |b, l| (b * l).clamp(0.0, 1.0),
-        "addition" => |b, l| b + l,
-        "lighten_only" => |b: f64, l| b.max(l),
-        "darken_only" => |b: f64, l| b.min(l),
-        "dodge" => |b, l| (b / (1.0 - l)).min(1.0),
-        "subtract" => |b, l| b - l,
-        "grain_extract" => |b, l| (b - l + 0.5).clamp(0.0, 1.0),
-        "grain_merge" => |b, l| (b + l - 0.5).clamp(0.0, 1.0),
-        "divide" => |b, l| ((256.0 / 255.0 * b) / (1.0 / 255.0 + l)).min(1.0),
-        "soft_light" => |b, l| (1.0 - b) * b * l + b * (1.0 - (1.0 - b) * (1.0 - l)),
-        "difference" => |b, l| (b - l).abs(),
-        "hard_light" => |b, l| {
-            if l > 0.5 {
-                (1.0 - (1.0 - b) * (1.0 - (l - 0.5) * 2.0)).min(1.0)
-            } else {
-                (b * (l * 2.0)).min(1.0)
-            }
-        },
-        _ => {
-            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
-                "Unknown blend mode: {}",
-                blend_mode
-            )))
-        }
-    };
+    let mode: BlendMode = blend_mode.parse().map_err(|_| {
+        PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+            "Unknown blend mode: {}",
+            blend_mode
+        ))
+    })?;
 
+    // SAFETY: We have exclusive write access to output through PyO3's borrow rules
     unsafe {
-        let mut out = output.as_array_mut();
-        let shape = base.shape();
-        let (h, w) = (shape[0], shape[1]);
-
-        for row in 0..h {
-            for col in 0..w {
-                let base_alpha = base[[row, col, 3]];
-                let layer_alpha = layer[[row, col, 3]];
-
-                // Alpha composition: min(base, layer) * opacity
-                let comp_alpha = base_alpha.min(layer_alpha) * opacity;
-
-                // Compute new alpha for the output
-                let new_alpha = base_alpha + (1.0 - base_alpha) * comp_alpha;
-
-                // Calculate interpolation ratio (handle division by zero)
-                let ratio = if new_alpha > 0.0 {
-                    comp_alpha / new_alpha
-                } else {
-                    0.0
-                };
+        match (&img_in, &img_layer, &output) {
+            (LayerArray::F64(base), LayerArray::F64(layer), LayerMatrix::F64(out)) => {
+                blend_full_typed(
+                    base.as_array(),
+                    layer.as_array(),
+                    out.as_array_mut(),
+                    mode,
+                    opacity,
+                );
+            }
+            (LayerArray::F32(base), LayerArray::F32(layer), LayerMatrix::F32(out)) => {
+                blend_full_typed(
+                    base.as_array(),
+                    layer.as_array(),
+                    out.as_array_mut(),
+                    mode,
+                    opacity,
+                );
+            }
+            _ => {
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                    "img_in, img_layer and output must have the same dtype",
+                ))
+            }
+        }
+    }
+    Ok(())
+}
 
-                // Apply blend and interpolate for each RGB channel
-                for c in 0..3 {
-                    let b = base[[row, col, c]];
-                    let l = layer[[row, col, c]];
-                    let blended = blend_fn(b, l);
+/// Blend loop shared by all layer precisions, computing in f64.
+fn blend_full_typed<T: Channel>(
+    base: ArrayView3<'_, T>,
+    layer: ArrayView3<'_, T>,
+    mut out: ArrayViewMut3<'_, T>,
+    mode: BlendMode,
+    opacity: f64,
+) {
+    let shape = base.shape();
+    let (h, w) = (shape[0], shape[1]);
+
+    for row in 0..h {
+        for col in 0..w {
+            let base_px = load(&base, row, col);
+            let layer_px = load(&layer, row, col);
+            let base_alpha = base_px[3];
+            let layer_alpha = layer_px[3];
+
+            // Alpha composition: min(base, layer) * opacity
+            let comp_alpha = base_alpha.min(layer_alpha) * opacity;
+
+            // Compute new alpha for the output
+            let new_alpha = base_alpha + (1.0 - base_alpha) * comp_alpha;
+
+            // Calculate interpolation ratio (handle division by zero)
+            let ratio = if new_alpha > 0.0 {
+                comp_alpha / new_alpha
+            } else {
+                0.0
+            };
 
-                    // Handle NaN from division operations
-                    let blended = if blended.is_nan() { 0.0 } else { blended };
+            // Apply blend and interpolate for each RGB channel
+            for c in 0..3 {
+                let b = base_px[c];
+                let l = layer_px[c];
+                let blended = mode.apply(b, l);
 
-                    // Interpolate: blended * ratio + base * (1 - ratio)
-                    out[[row, col, c]] = blended * ratio + b * (1.0 - ratio);
-                }
+                // Handle NaN from division operations
+                let blended = if blended.is_nan() { 0.0 } else { blended };
 
-                // Preserve base alpha channel
-                out[[row, col, 3]] = base_alpha;
+                // Interpolate: blended * ratio + base * (1 - ratio)
+                out[[row, col, c]] = T::from_f64(blended * ratio + b * (1.0 - ratio));
             }
+
+            // Preserve base alpha channel
+            out[[row, col, 3]] = T::from_f64(base_alpha);
         }
     }
-    Ok(())
 }
@@ -1,16 +1,18 @@
 //! Compositor operations for final frame output.
 //!
-//! Converts RGBA float layers to RGB uint8 for hardware output.
+//! Converts RGBA float layers (f64 or f32) to RGB uint8 for hardware output.
 //! Provides both single-layer `rgba2rgb` and multi-layer `compose_layers`.
 //!
 //! Uses thread-local buffer pooling to eliminate per-frame allocations.
 
 use std::cell::RefCell;
 
-use numpy::{PyArray3, PyArrayMethods, PyReadonlyArray3};
+use numpy::ndarray::{ArrayView3, ArrayViewMut3};
+use numpy::{PyArray3, PyArrayMethods};
 use pyo3::prelude::*;
 
 use crate::blending::BlendMode;
+use crate::pixels::{load, Channel, LayerArray};
 
 // Thread-local buffer pool for intermediate RGBA composition.
 // Reused across frames to avoid allocation overhead (typically ~4KB for keyboards,
@@ -19,13 +21,13 @@ thread_local! {
     static COMPOSE_BUFFER: RefCell<Vec<f64>> = const { RefCell::new(Vec::new()) };
 }
 
-/// Convert RGBA f64 layer to RGB u8 for hardware output.
+/// Convert RGBA f64/f32 layer to RGB u8 for hardware output.
 ///
 /// Alpha-composites the input against a background color and converts
 /// to uint8 [0-255] ready for hardware transmission.
 ///
 /// # Arguments
-/// * `arr` - Input RGBA f64 array shape (height, width, 4)
+/// * `arr` - Input RGBA f64 or f32 array shape (height, width, 4)
 /// * `output` - Output RGB u8 array shape (height, width, 3), written in-place
 /// * `bg_r` - Background red component (0.0..1.0)
 /// * `bg_g` - Background green component (0.0..1.0)
@@ -41,40 +43,49 @@ thread_local! {
 #[pyfunction]
 pub fn rgba2rgb<'py>(
     _py: Python<'py>,
-    arr: PyReadonlyArray3<'py, f64>,
+    arr: LayerArray<'py>,
     output: &Bound<'py, PyArray3<u8>>,
     bg_r: f64,
     bg_g: f64,
     bg_b: f64,
 ) -> PyResult<()> {
-    let input = arr.as_array();
-    let shape = input.shape();
-
-    debug_assert_eq!(shape[2], 4, "Input must have 4 channels (RGBA)");
+    debug_assert_eq!(arr.shape()[2], 4, "Input must have 4 channels (RGBA)");
 
-    let (h, w) = (shape[0], shape[1]);
     let bg = [bg_r, bg_g, bg_b];
 
     // SAFETY: We have exclusive write access to output through PyO3's borrow rules
     unsafe {
         let mut out = output.as_array_mut();
+        match &arr {
+            LayerArray::F64(input) => rgba2rgb_typed(input.as_array(), &mut out, bg),
+            LayerArray::F32(input) => rgba2rgb_typed(input.as_array(), &mut out, bg),
+        }
+    }
 
-        for row in 0..h {
-            for col in 0..w {
-                let alpha = input[[row, col, 3]];
-                let inv_alpha = 1.0 - alpha;
+    Ok(())
+}
 
-                for c in 0..3 {
-                    let src = input[[row, col, c]];
-                    let composited = inv_alpha * bg[c] + alpha * src;
-                    let clamped = composited.clamp(0.0, 1.0);
-                    out[[row, col, c]] = (clamped * 255.0) as u8;
-                }
+fn rgba2rgb_typed<T: Channel>(
+    input: ArrayView3<'_, T>,
+    out: &mut ArrayViewMut3<'_, u8>,
+    bg: [f64; 3],
+) {
+    let shape = input.shape();
+    let (h, w) = (shape[0], shape[1]);
+
+    for row in 0..h {
+        for col in 0..w {
+            let px = load(&input, row, col);
+            let alpha = px[3];
+            let inv_alpha = 1.0 - alpha;
+
+            for c in 0..3 {
+                let composited = inv_alpha * bg[c] + alpha * px[c];
+                let clamped = composited.clamp(0.0, 1.0);
+                out[[row, col, c]] = (clamped * 255.0) as u8;
             }
         }
     }
-
-    Ok(())
 }
 
 /// Compose multiple RGBA layers into a single RGB output.
@@ -85,11 +96,12 @@ pub fn rgba2rgb<'py>(
 /// 3. Converts final RGBA to RGB uint8 with background color compositing
 ///
 /// This eliminates N Python→Rust boundary crossings for N layers.
+/// Layers may be f64 or f32 (mixed freely); blending is done in f64.
 #[pyfunction]
 #[allow(clippy::too_many_arguments)]
 pub fn compose_layers<'py>(
     _py: Python<'py>,
-    layers: Vec<PyReadonlyArray3<'py, f64>>,
+    layers: Vec<LayerArray<'py>>,
     blend_modes: Vec<String>,
     opacities: Vec<f64>,
     bg_r: f64,
@@ -101,14 +113,12 @@ pub fn compose_layers<'py>(
         return Ok(());
     }
 
-    let first = layers[0].as_array();
-    let (h, w) = (first.shape()[0], first.shape()[1]);
+    let (h, w) = (layers[0].shape()[0], layers[0].shape()[1]);
     let pixels = h * w;
 
     // Validate all layers have same shape
     for (i, layer) in layers.iter().enumerate() {
-        let arr = layer.as_array();
-        let (lh, lw) = (arr.shape()[0], arr.shape()[1]);
+        let (lh, lw) = (layer.shape()[0], layer.shape()[1]);
         if lh != h || lw != w {
             return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
                 "Layer {} has shape {}x{}, expected {}x{}",
@@ -136,51 +146,19 @@ pub fn compose_layers<'py>(
         }
 
         // Copy base layer into buffer
-        {
-            let base = first;
-            for row in 0..h {
-                for col in 0..w {
-                    let buf_idx = (row * w + col) * 4;
-                    buffer[buf_idx] = base[[row, col, 0]];
-                    buffer[buf_idx + 1] = base[[row, col, 1]];
-                    buffer[buf_idx + 2] = base[[row, col, 2]];
-                    buffer[buf_idx + 3] = base[[row, col, 3]];
-                }
-            }
+        match &layers[0] {
+            LayerArray::F64(base) => load_layer(&mut buffer, base.as_array()),
+            LayerArray::F32(base) => load_layer(&mut buffer, base.as_array()),
         }
 
         // Blend each subsequent layer in-place
         for (layer_idx, layer_arr) in layers.iter().enumerate().skip(1) {
-            let layer = layer_arr.as_array();
             let mode = modes.get(layer_idx).copied().unwrap_or(BlendMode::Screen);
             let opacity = opacities.get(layer_idx).copied().unwrap_or(1.0);
 
-            for row in 0..h {
-                for col in 0..w {
-                    let buf_idx = (row * w + col) * 4;
-
-                    let base_alpha = buffer[buf_idx + 3];
-                    let layer_alpha = layer[[row, col, 3]];
-
-                    let comp_alpha = base_alpha.min(layer_alpha) * opacity;
-                    let new_alpha = base_alpha + (1.0 - base_alpha) * comp_alpha;
-
-                    let ratio = if new_alpha > 0.0 {
-                        comp_alpha / new_alpha
-                    } else {
-                        0.0
-                    };
-
-                    for c in 0..3 {
-                        let b = buffer[buf_idx + c];
-                        let l = layer[[row, col, c]];
-                        let blended = mode.apply(b, l);
-                        let blended = if blended.is_nan() { 0.0 } else { blended };
-                        buffer[buf_idx + c] = blended * ratio + b * (1.0 - ratio);
-                    }
-
-                    buffer[buf_idx + 3] = base_alpha;
-                }
+            match layer_arr {
+                LayerArray::F64(layer) => blend_layer(&mut buffer, layer.as_array(), mode, opacity),
+                LayerArray::F32(layer) => blend_layer(&mut buffer, layer.as_array(), mode, opacity),
             }
         }
 
@@ -209,6 +187,56 @@ pub fn compose_layers<'py>(
     Ok(())
 }
 
+/// Copy a base layer of any precision into the f64 composition buffer.
+fn load_layer<T: Channel>(buffer: &mut [f64], base: ArrayView3<'_, T>) {
+    let (h, w) = (base.shape()[0], base.shape()[1]);
+
+    for row in 0..h {
+        for col in 0..w {
+            let buf_idx = (row * w + col) * 4;
+            buffer[buf_idx..buf_idx + 4].copy_from_slice(&load(&base, row, col));
+        }
+    }
+}
+
+/// Blend a layer of any precision into the f64 composition buffer.
+fn blend_layer<T: Channel>(
+    buffer: &mut [f64],
+    layer: ArrayView3<'_, T>,
+    mode: BlendMode,
+    opacity: f64,
+) {
+    let (h, w) = (layer.shape()[0], layer.shape()[1]);
+
+    for row in 0..h {
+        for col in 0..w {
+            let buf_idx = (row * w + col) * 4;
+            let px = load(&layer, row, col);
+
+            let base_alpha = buffer[buf_idx + 3];
+            let layer_alpha = px[3];
+
+            let comp_alpha = base_alpha.min(layer_alpha) * opacity;
+            let new_alpha = base_alpha + (1.0 - base_alpha) * comp_alpha;
+
+            let ratio = if new_alpha > 0.0 {
+                comp_alpha / new_alpha
+            } else {
+                0.0
+            };
+
+            for c in 0..3 {
+                let b = buffer[buf_idx + c];
+                let blended = mode.apply(b, px[c]);
+                let blended = if blended.is_nan() { 0.0 } else { blended };
+                buffer[buf_idx + c] = blended * ratio + b * (1.0 - ratio);
+            }
+
+            buffer[buf_idx + 3] = base_alpha;
+        }
+    }
+}
+
 // ============================================================================
 // Pure Rust implementation for benchmarking
 // ============================================================================
@@ -2,15 +2,17 @@
 //!
 //! Shimmering vertical curtains with layered sine waves.
 
-use numpy::{PyArray3, PyArrayMethods, PyReadonlyArray2};
+use numpy::PyReadonlyArray2;
 use pyo3::prelude::*;
 
+use crate::pixels::LayerMatrix;
+
 /// Draw aurora effect into the given matrix.
 ///
 /// # Arguments
 /// * `width` - Frame width in pixels
 /// * `height` - Frame height in pixels
-/// * `matrix` - Target numpy array of shape (height, width, 4) for RGBA output
+/// * `matrix` - Target float64 or float32 array of shape (height, width, 4) for RGBA output
 /// * `gradient` - Color gradient as numpy array of shape (N, 3) with RGB floats
 /// * `time` - Animation time in seconds
 /// * `speed` - Animation speed multiplier
@@ -25,7 +27,7 @@ pub fn draw_aurora<'py>(
     _py: Python<'py>,
     width: usize,
     height: usize,
-    matrix: &Bound<'py, PyArray3<f64>>,
+    matrix: LayerMatrix<'py>,
     gradient: PyReadonlyArray2<'py, f64>,
     time: f64,
     speed: f64,
@@ -46,7 +48,7 @@ pub fn draw_aurora<'py>(
     let h_f = height as f64;
 
     unsafe {
-        let mut array = matrix.as_array_mut();
+        let mut array = matrix.as_pixels_mut();
 
         for col in 0..width {
             let col_f = col as f64;
@@ -85,15 +87,18 @@ pub fn draw_aurora<'py>(
                 if intensity > 0.01 {
                     // Gradient shifts slightly per row for depth
                     let color_idx = (base_color_idx + row * 2) % glen;
-                    array[[row, col, 0]] = grad[[color_idx, 0]];
-                    array[[row, col, 1]] = grad[[color_idx, 1]];
-                    array[[row, col, 2]] = grad[[color_idx, 2]];
-                    array[[row, col, 3]] = intensity;
+                    array.set(
+                        row,
+                        col,
+                        [
+                            grad[[color_idx, 0]],
+                            grad[[color_idx, 1]],
+                            grad[[color_idx, 2]],
+                            intensity,
+                        ],
+                    );
                 } else {
-                    array[[row, col, 0]] = 0.0;
-                    array[[row, col, 1]] = 0.0;
-                    array[[row, col, 2]] = 0.0;
-                    array[[row, col, 3]] = 0.0;
+                    array.set(row, col, [0.0, 0.0, 0.0, 0.0]);
                 }
             }
         }
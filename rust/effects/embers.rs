@@ -3,15 +3,17 @@
 //! Renders particles with Gaussian glow falloff.
 //! Particle state management stays in Python; Rust handles rendering.
 
-use numpy::{PyArray3, PyArrayMethods, PyReadonlyArray1};
+use numpy::PyReadonlyArray1;
 use pyo3::prelude::*;
 
+use crate::pixels::LayerMatrix;
+
 /// Render embers particles with Gaussian glow.
 ///
 /// # Arguments
 /// * `width` - Frame width in pixels
 /// * `height` - Frame height in pixels
-/// * `matrix` - Target numpy array of shape (height, width, 4) for RGBA output
+/// * `matrix` - Target float64 or float32 array of shape (height, width, 4) for RGBA output
 /// * `particles` - Flat array [x0, y0, brightness0, radius0, x1, y1, brightness1, radius1, ...]
 /// * `color_r` - Red component of ember color (0.0-1.0)
 /// * `color_g` - Green component of ember color (0.0-1.0)
@@ -23,7 +25,7 @@ pub fn draw_embers<'py>(
     _py: Python<'py>,
     width: usize,
     height: usize,
-    matrix: &Bound<'py, PyArray3<f64>>,
+    matrix: LayerMatrix<'py>,
     particles: PyReadonlyArray1<'py, f64>,
     color_r: f64,
     color_g: f64,
@@ -34,7 +36,7 @@ pub fn draw_embers<'py>(
     let num_particles = parts.len() / 4;
 
     unsafe {
-        let mut array = matrix.as_array_mut();
+        let mut array = matrix.as_pixels_mut();
 
         // Fill with ambient warmth (cooler on G/B channels for warm glow)
         let ambient_r = color_r * ambient_factor;
@@ -43,10 +45,7 @@ pub fn draw_embers<'py>(
 
         for row in 0..height {
             for col in 0..width {
-                array[[row, col, 0]] = ambient_r;
-                array[[row, col, 1]] = ambient_g;
-                array[[row, col, 2]] = ambient_b;
-                array[[row, col, 3]] = 1.0;
+                array.set(row, col, [ambient_r, ambient_g, ambient_b, 1.0]);
             }
         }
 
@@ -76,9 +75,17 @@ pub fn draw_embers<'py>(
                         let glow = brightness * (-dist_sq / sigma_sq).exp();
 
                         // Additive blend
-                        array[[row, col, 0]] = (array[[row, col, 0]] + color_r * glow).min(1.0);
-                        array[[row, col, 1]] = (array[[row, col, 1]] + color_g * glow).min(1.0);
-                        array[[row, col, 2]] = (array[[row, col, 2]] + color_b * glow).min(1.0);
+                        let [r, g, b, a] = array.get(row, col);
+                        array.set(
+                            row,
+                            col,
+                            [
+                                (r + color_r * glow).min(1.0),
+                                (g + color_g * glow).min(1.0),
+                                (b + color_b * glow).min(1.0),
+                                a,
+                            ],
+                        );
                     }
                 }
             }
@@ -3,8 +3,10 @@
 //! Symmetric patterns that rotate and morph using polar coordinate
 //! transforms and n-fold symmetry.
 
-use numpy::{PyArray1, PyArray3, PyArrayMethods, PyReadonlyArray1, PyReadonlyArray2};
+use numpy::{PyArray1, PyReadonlyArray1, PyReadonlyArray2};
 use pyo3::prelude::*;
+
+use crate::pixels::LayerMatrix;
 use std::f64::consts::PI;
 
 const MODE_SPIRAL: u8 = 0;
@@ -16,7 +18,7 @@ const MODE_WAVES: u8 = 2;
 /// # Arguments
 /// * `width` - Frame width in pixels
 /// * `height` - Frame height in pixels (for API consistency, matrix shape used internally)
-/// * `matrix` - Target numpy array of shape (height, width, 4) for RGBA output
+/// * `matrix` - Target float64 or float32 array of shape (height, width, 4) for RGBA output
 /// * `gradient` - Color gradient as numpy array of shape (N, 3) with RGB floats
 /// * `polar_map` - Pre-computed polar coordinates as flat array [angle, radius, ...]
 /// * `time` - Animation time in seconds
@@ -32,7 +34,7 @@ pub fn draw_kaleidoscope<'py>(
     _py: Python<'py>,
     width: usize,
     #[allow(unused_variables)] height: usize,
-    matrix: &Bound<'py, PyArray3<f64>>,
+    matrix: LayerMatrix<'py>,
     gradient: PyReadonlyArray2<'py, f64>,
     polar_map: PyReadonlyArray1<'py, f64>,
     time: f64,
@@ -55,7 +57,7 @@ pub fn draw_kaleidoscope<'py>(
     let wedge = 2.0 * PI / symmetry as f64;
 
     unsafe {
-        let mut array = matrix.as_array_mut();
+        let mut array = matrix.as_pixels_mut();
         let num_pixels = polar.len() / 2;
 
         for idx in 0..num_pixels {
@@ -96,10 +98,11 @@ pub fn draw_kaleidoscope<'py>(
             // Brightness: never fully dark (0.3 to 1.0)
             let brightness = (value + 1.0) / 2.0 * 0.7 + 0.3;
 
-            array[[row, col, 0]] = r * brightness;
-            array[[row, col, 1]] = g * brightness;
-            array[[row, col, 2]] = b * brightness;
-            array[[row, col, 3]] = 1.0;
+            array.set(
+                row,
+                col,
+                [r * brightness, g * brightness, b * brightness, 1.0],
+            );
         }
     }
 
@@ -8,9 +8,11 @@
 //! - Direct numpy buffer writes (no intermediate allocation)
 //! - Branchless field accumulation
 
-use numpy::{PyArray3, PyArrayMethods, PyReadonlyArray2};
+use numpy::PyReadonlyArray2;
 use pyo3::prelude::*;
 
+use crate::pixels::LayerMatrix;
+
 /// Blob data packed for efficient iteration.
 #[derive(Clone, Copy)]
 struct Blob {
@@ -25,7 +27,7 @@ struct Blob {
 /// # Arguments
 /// * `width` - Frame width in pixels
 /// * `height` - Frame height in pixels
-/// * `matrix` - Target numpy array of shape (height, width, 4) for RGBA output
+/// * `matrix` - Target float64 or float32 array of shape (height, width, 4) for RGBA output
 /// * `blobs` - Blob data as numpy array of shape (N, 4): [x, y, radius, hue_idx]
 /// * `gradient` - Color gradient as numpy array of shape (N, 3) with RGB floats
 /// * `threshold` - Field threshold for blob boundary (typically 1.0)
@@ -37,7 +39,7 @@ pub fn draw_metaballs<'py>(
     _py: Python<'py>,
     width: usize,
     height: usize,
-    matrix: &Bound<'py, PyArray3<f64>>,
+    matrix: LayerMatrix<'py>,
     blobs: PyReadonlyArray2<'py, f64>,
     gradient: PyReadonlyArray2<'py, f64>,
     threshold: f64,
@@ -72,7 +74,7 @@ pub fn draw_metaballs<'py>(
 
     // Write directly to numpy array
     unsafe {
-        let mut array = matrix.as_array_mut();
+        let mut array = matrix.as_pixels_mut();
 
         for row in 0..height {
             let row_f = row as f64;
@@ -122,10 +124,7 @@ pub fn draw_metaballs<'py>(
                     (bg_r, bg_g, bg_b)
                 };
 
-                array[[row, col, 0]] = r;
-                array[[row, col, 1]] = g;
-                array[[row, col, 2]] = b;
-                array[[row, col, 3]] = 1.0;
+                array.set(row, col, [r, g, b, 1.0]);
             }
         }
     }
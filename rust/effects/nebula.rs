@@ -3,9 +3,11 @@
 //! Soft, colorful clouds using layered noise (FBM).
 
 use numpy::ndarray::ArrayView2;
-use numpy::{PyArray3, PyArrayMethods, PyReadonlyArray2};
+use numpy::PyReadonlyArray2;
 use pyo3::prelude::*;
 
+use crate::pixels::LayerMatrix;
+
 const NOISE_SIZE: usize = 64;
 
 /// Draw a nebula effect into the given matrix.
@@ -13,7 +15,7 @@ const NOISE_SIZE: usize = 64;
 /// # Arguments
 /// * `width` - Frame width in pixels
 /// * `height` - Frame height in pixels
-/// * `matrix` - Target numpy array of shape (height, width, 4) for RGBA output
+/// * `matrix` - Target float64 or float32 array of shape (height, width, 4) for RGBA output
 /// * `gradient` - Color gradient as numpy array of shape (N, 3) with RGB floats
 /// * `noise_table` - Pre-generated noise lookup table (64x64 random values)
 /// * `time` - Animation time in seconds
@@ -29,7 +31,7 @@ pub fn draw_nebula<'py>(
     _py: Python<'py>,
     width: usize,
     height: usize,
-    matrix: &Bound<'py, PyArray3<f64>>,
+    matrix: LayerMatrix<'py>,
     gradient: PyReadonlyArray2<'py, f64>,
     noise_table: PyReadonlyArray2<'py, f64>,
     time: f64,
@@ -53,7 +55,7 @@ pub fn draw_nebula<'py>(
     let scale_adj = scale * 10.0;
 
     unsafe {
-        let mut array = matrix.as_array_mut();
+        let mut array = matrix.as_pixels_mut();
 
         for row in 0..height {
             for col in 0..width {
@@ -83,10 +85,11 @@ pub fn draw_nebula<'py>(
                 // Brightness modulated by secondary noise
                 let brightness = (base_brightness + n2 * 0.3).clamp(0.3, 1.0);
 
-                array[[row, col, 0]] = r * brightness;
-                array[[row, col, 1]] = g * brightness;
-                array[[row, col, 2]] = b * brightness;
-                array[[row, col, 3]] = 1.0;
+                array.set(
+                    row,
+                    col,
+                    [r * brightness, g * brightness, b * brightness, 1.0],
+                );
             }
         }
     }
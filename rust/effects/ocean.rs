@@ -2,9 +2,11 @@
 //!
 //! Horizontal waves with caustic highlights on crests.
 
-use numpy::{PyArray3, PyArrayMethods, PyReadonlyArray2};
+use numpy::PyReadonlyArray2;
 use pyo3::prelude::*;
 
+use crate::pixels::LayerMatrix;
+
 /// Wave component: (frequency, amplitude, speed, phase)
 const WAVES: [(f64, f64, f64, f64); 3] = [
     (0.3, 0.4, 1.0, 0.0),
@@ -19,7 +21,7 @@ pub fn draw_ocean<'py>(
     _py: Python<'py>,
     width: usize,
     height: usize,
-    matrix: &Bound<'py, PyArray3<f64>>,
+    matrix: LayerMatrix<'py>,
     gradient: PyReadonlyArray2<'py, f64>,
     time: f64,
     wave_speed: f64,
@@ -44,7 +46,7 @@ pub fn draw_ocean<'py>(
     };
 
     unsafe {
-        let mut array = matrix.as_array_mut();
+        let mut array = matrix.as_pixels_mut();
 
         for col in 0..width {
             let col_f = col as f64;
@@ -94,10 +96,11 @@ pub fn draw_ocean<'py>(
 
                 brightness = brightness.min(1.0);
 
-                array[[row, col, 0]] = r * brightness;
-                array[[row, col, 1]] = g * brightness;
-                array[[row, col, 2]] = b * brightness;
-                array[[row, col, 3]] = 1.0;
+                array.set(
+                    row,
+                    col,
+                    [r * brightness, g * brightness, b * brightness, 1.0],
+                );
             }
         }
     }
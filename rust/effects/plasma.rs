@@ -5,8 +5,10 @@
 //! - Pre-computed trig values for duration-dependent terms
 //! - Direct numpy buffer writes (no intermediate allocation)
 
-use numpy::{PyArray3, PyArrayMethods, PyReadonlyArray2};
+use numpy::PyReadonlyArray2;
 use pyo3::prelude::*;
+
+use crate::pixels::LayerMatrix;
 use std::f64::consts::PI;
 
 /// Draw a plasma effect into the given matrix.
@@ -14,7 +16,7 @@ use std::f64::consts::PI;
 /// # Arguments
 /// * `width` - Frame width in pixels
 /// * `height` - Frame height in pixels
-/// * `matrix` - Target numpy array of shape (height, width, 4) for RGBA output
+/// * `matrix` - Target float64 or float32 array of shape (height, width, 4) for RGBA output
 /// * `duration` - Animation time parameter (elapsed seconds)
 /// * `gradient` - Color gradient as numpy array of shape (N, 3) with RGB floats
 /// * `scale` - Pattern scale/zoom (1.0 = default, higher = zoomed in)
@@ -26,7 +28,7 @@ pub fn draw_plasma<'py>(
     _py: Python<'py>,
     width: f64,
     height: f64,
-    matrix: &Bound<'py, PyArray3<f64>>,
+    matrix: LayerMatrix<'py>,
     duration: f64,
     gradient: PyReadonlyArray2<'py, f64>,
     scale: f64,
@@ -63,7 +65,7 @@ pub fn draw_plasma<'py>(
 
     // Write directly to numpy array - no intermediate buffer
     unsafe {
-        let mut array = matrix.as_array_mut();
+        let mut array = matrix.as_pixels_mut();
 
         for row in 0..h {
             let y_base = (row as f64) * inv_height_aspect;
@@ -113,10 +115,11 @@ pub fn draw_plasma<'py>(
                 let idx = (pos as usize).saturating_sub(1).min(glen - 1);
 
                 // Write RGBA directly
-                array[[row, col, 0]] = grad[[idx, 0]];
-                array[[row, col, 1]] = grad[[idx, 1]];
-                array[[row, col, 2]] = grad[[idx, 2]];
-                array[[row, col, 3]] = 1.0;
+                array.set(
+                    row,
+                    col,
+                    [grad[[idx, 0]], grad[[idx, 1]], grad[[idx, 2]], 1.0],
+                );
             }
         }
     }
@@ -3,8 +3,10 @@
 //! A swirling vortex with spiral arms flowing inward or outward,
 //! creating a mesmerizing tunnel effect using polar coordinate transforms.
 
-use numpy::{PyArray3, PyArrayMethods, PyReadonlyArray1, PyReadonlyArray2};
+use numpy::{PyReadonlyArray1, PyReadonlyArray2};
 use pyo3::prelude::*;
+
+use crate::pixels::LayerMatrix;
 use std::f64::consts::PI;
 
 /// Draw vortex effect into the given matrix.
@@ -12,7 +14,7 @@ use std::f64::consts::PI;
 /// # Arguments
 /// * `width` - Frame width in pixels
 /// * `height` - Frame height in pixels (for API consistency)
-/// * `matrix` - Target numpy array of shape (height, width, 4) for RGBA output
+/// * `matrix` - Target float64 or float32 array of shape (height, width, 4) for RGBA output
 /// * `gradient` - Color gradient as numpy array of shape (N, 3) with RGB floats
 /// * `polar_map` - Pre-computed polar coordinates as flat array [angle, radius, ...]
 /// * `time` - Animation time in seconds
@@ -29,7 +31,7 @@ pub fn draw_vortex<'py>(
     _py: Python<'py>,
     width: usize,
     #[allow(unused_variables)] height: usize,
-    matrix: &Bound<'py, PyArray3<f64>>,
+    matrix: LayerMatrix<'py>,
     gradient: PyReadonlyArray2<'py, f64>,
     polar_map: PyReadonlyArray1<'py, f64>,
     time: f64,
@@ -53,7 +55,7 @@ pub fn draw_vortex<'py>(
     let flow_dir = flow_direction as f64;
 
     unsafe {
-        let mut array = matrix.as_array_mut();
+        let mut array = matrix.as_pixels_mut();
         let num_pixels = polar.len() / 2;
 
         for idx in 0..num_pixels {
@@ -91,10 +93,11 @@ pub fn draw_vortex<'py>(
                 brightness = (brightness + center_boost * 0.4).min(1.0);
             }
 
-            array[[row, col, 0]] = r * brightness;
-            array[[row, col, 1]] = g * brightness;
-            array[[row, col, 2]] = b * brightness;
-            array[[row, col, 3]] = 1.0;
+            array.set(
+                row,
+                col,
+                [r * brightness, g * brightness, b * brightness, 1.0],
+            );
         }
     }
 
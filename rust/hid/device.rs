@@ -1,11 +1,12 @@
 //! HID device handle for communication
 
+use crate::hid::runtime;
 use crate::hid::{DeviceInfo, HidError, Result};
 use nusb::transfer::{ControlIn, ControlOut, ControlType, Recipient};
 use pyo3::prelude::*;
 use pyo3_async_runtimes::tokio::future_into_py;
 use std::sync::Arc;
-use std::time::Duration;
+use std::time::{Duration, Instant};
 use tokio::sync::Mutex;
 use tokio::time::timeout;
 
@@ -42,45 +43,27 @@ const DEFAULT_TIMEOUT: Duration = Duration::from_millis(1000);
 // Timeout for opening a device (claiming interface, etc)
 const DEVICE_OPEN_TIMEOUT: Duration = Duration::from_secs(5);
 
-/// Create a new single-threaded tokio runtime.
-/// Returns HidError if runtime creation fails (e.g., under resource pressure).
-pub(crate) fn get_or_create_runtime() -> Result<tokio::runtime::Runtime> {
-    tokio::runtime::Builder::new_current_thread()
-        .enable_all()
-        .build()
-        .map_err(|e| HidError::ProtocolError(format!("Failed to create tokio runtime: {}", e)))
-}
-
 #[pymethods]
 impl HidDevice {
     /// Open a HID device from DeviceInfo.
     ///
     /// Uses a timeout to prevent hanging on misbehaving USB devices.
     #[new]
-    fn new(info: DeviceInfo) -> Result<Self> {
-        let rt = get_or_create_runtime()?;
-        rt.block_on(Self::open_with_timeout(info))
+    fn new(py: Python<'_>, info: DeviceInfo) -> Result<Self> {
+        runtime::block_on(py, Self::open_with_timeout(info))
     }
 
     /// Close the device.
     ///
     /// Blocks until any in-progress operation completes, then closes the device.
-    /// If runtime creation fails, the device will be cleaned up on drop.
-    fn close(&self) {
+    fn close(&self, py: Python<'_>) {
         // Use blocking approach to ensure we actually close
         // This is acceptable since close() is inherently a sync operation
-        if let Ok(rt) = tokio::runtime::Handle::try_current() {
-            rt.block_on(async {
-                let mut guard = self.interface.lock().await;
-                *guard = None;
-            });
-        } else if let Ok(rt) = get_or_create_runtime() {
-            rt.block_on(async {
-                let mut guard = self.interface.lock().await;
-                *guard = None;
-            });
-        }
-        // If runtime creation fails, device will be cleaned up on drop
+        let interface = self.interface.clone();
+        runtime::block_on(py, async move {
+            let mut guard = interface.lock().await;
+            *guard = None;
+        });
     }
 
     /// Check if device is open.
@@ -109,19 +92,14 @@ impl HidDevice {
     ///
     /// Returns:
     ///     Number of bytes sent
-    fn send_feature_report(&self, data: Vec<u8>, report_id: u8) -> Result<usize> {
+    fn send_feature_report(&self, py: Python<'_>, data: Vec<u8>, report_id: u8) -> Result<usize> {
         let interface = self.interface.clone();
         let len = data.len();
 
-        // Get or create runtime
-        let result = if let Ok(rt) = tokio::runtime::Handle::try_current() {
-            rt.block_on(Self::send_feature_report_inner(interface, &data, report_id))
-        } else {
-            let rt = get_or_create_runtime()?;
-            rt.block_on(Self::send_feature_report_inner(interface, &data, report_id))
-        };
-
-        result.map(|_| len)
+        runtime::block_on(py, async move {
+            Self::send_feature_report_inner(interface, &data, report_id).await
+        })
+        .map(|_| len)
     }
 
     /// Get a feature report (blocking).
@@ -132,15 +110,13 @@ impl HidDevice {
     ///
     /// Returns:
     ///     Report data as bytes
-    fn get_feature_report(&self, report_id: u8, size: usize) -> Result<Vec<u8>> {
+    fn get_feature_report(&self, py: Python<'_>, report_id: u8, size: usize) -> Result<Vec<u8>> {
         let interface = self.interface.clone();
 
-        if let Ok(rt) = tokio::runtime::Handle::try_current() {
-            rt.block_on(Self::get_feature_report_inner(interface, report_id, size))
-        } else {
-            let rt = get_or_create_runtime()?;
-            rt.block_on(Self::get_feature_report_inner(interface, report_id, size))
-        }
+        runtime::block_on(
+            py,
+            Self::get_feature_report_inner(interface, report_id, size),
+        )
     }
 
     /// Send a feature report (async).
@@ -234,33 +210,6 @@ impl HidDevice {
         self.interface.clone()
     }
 
-    /// Send a feature report (blocking, callable from Rust).
-    pub fn send_report(&self, data: Vec<u8>, report_id: u8) -> Result<usize> {
-        let interface = self.interface.clone();
-        let len = data.len();
-
-        let result = if let Ok(rt) = tokio::runtime::Handle::try_current() {
-            rt.block_on(Self::send_feature_report_inner(interface, &data, report_id))
-        } else {
-            let rt = get_or_create_runtime()?;
-            rt.block_on(Self::send_feature_report_inner(interface, &data, report_id))
-        };
-
-        result.map(|_| len)
-    }
-
-    /// Get a feature report (blocking, callable from Rust).
-    pub fn get_report(&self, report_id: u8, size: usize) -> Result<Vec<u8>> {
-        let interface = self.interface.clone();
-
-        if let Ok(rt) = tokio::runtime::Handle::try_current() {
-            rt.block_on(Self::get_feature_report_inner(interface, report_id, size))
-        } else {
-            let rt = get_or_create_runtime()?;
-            rt.block_on(Self::get_feature_report_inner(interface, report_id, size))
-        }
-    }
-
     pub(crate) async fn send_feature_report_inner(
         interface: Arc<Mutex<Option<nusb::Interface>>>,
         data: &[u8],
@@ -269,6 +218,33 @@ impl HidDevice {
         let guard = interface.lock().await;
         let iface = guard.as_ref().ok_or(HidError::Disconnected)?;
 
+        Self::set_feature_report(iface, data, report_id).await
+    }
+
+    /// Send several feature reports back-to-back.
+    ///
+    /// The interface is locked once for the whole batch, so other commands
+    /// cannot interleave with it. Returns the time spent waiting for the
+    /// lock and the time spent transferring.
+    pub(crate) async fn send_feature_reports_inner<R: AsRef<[u8]>>(
+        interface: Arc<Mutex<Option<nusb::Interface>>>,
+        reports: &[R],
+        report_id: u8,
+    ) -> Result<(Duration, Duration)> {
+        let lock_start = Instant::now();
+        let guard = interface.lock().await;
+        let lock_wait = lock_start.elapsed();
+        let iface = guard.as_ref().ok_or(HidError::Disconnected)?;
+
+        let transfer_start = Instant::now();
+        for report in reports {
+            Self::set_feature_report(iface, report.as_ref(), report_id).await?;
+        }
+
+        Ok((lock_wait, transfer_start.elapsed()))
+    }
+
+    async fn set_feature_report(iface: &nusb::Interface, data: &[u8], report_id: u8) -> Result<()> {
         // SET_REPORT: bmRequestType=0x21, bRequest=0x09
         // wValue = (report_type << 8) | report_id
         // wIndex = interface number
@@ -19,9 +19,19 @@ const LIST_DEVICES_TIMEOUT: Duration = Duration::from_secs(10);
 ///
 /// Returns a list of DeviceInfo for all matching HID devices.
 /// Pass 0 for vendor_id or product_id to match all.
+///
+/// Blocks without holding the GIL.
 #[pyfunction]
 #[pyo3(signature = (vendor_id=0, product_id=0))]
-pub fn enumerate_devices(vendor_id: u16, product_id: u16) -> Result<Vec<DeviceInfo>> {
+pub fn enumerate_devices(
+    py: Python<'_>,
+    vendor_id: u16,
+    product_id: u16,
+) -> Result<Vec<DeviceInfo>> {
+    py.detach(|| enumerate_blocking(vendor_id, product_id))
+}
+
+fn enumerate_blocking(vendor_id: u16, product_id: u16) -> Result<Vec<DeviceInfo>> {
     let mut results = Vec::new();
 
     // nusb 0.2 uses MaybeFuture - call .wait() for blocking
@@ -138,14 +148,14 @@ mod tests {
     #[test]
     fn test_enumerate_returns_vec() {
         // Should return a vec (possibly empty if no devices)
-        let result = enumerate_devices(0, 0);
+        let result = enumerate_blocking(0, 0);
         assert!(result.is_ok());
     }
 
     #[test]
     fn test_enumerate_with_invalid_filter() {
         // Should return empty vec for non-existent vendor
-        let result = enumerate_devices(0xFFFF, 0xFFFF).unwrap();
+        let result = enumerate_blocking(0xFFFF, 0xFFFF).unwrap();
         assert!(result.is_empty());
     }
 }
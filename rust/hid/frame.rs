@@ -1,13 +1,16 @@
 //! Custom frame upload helpers.
 //!
-//! Sends frame data as a sequence of feature reports with minimal allocations.
+//! Packs frame data into a sequence of feature reports and submits them
+//! back-to-back while holding the interface once per frame.
+//! Uploads may be incremental: only row segments which changed since the
+//! previous frame are transmitted.
 
 use crate::crc::fast_crc_impl;
 use crate::hid::{HidDevice, HidError, DATA_SIZE, REPORT_SIZE};
 use numpy::{PyReadonlyArray3, PyUntypedArrayMethods};
 use pyo3::prelude::*;
 use pyo3_async_runtimes::tokio::future_into_py;
-use std::time::Duration;
+use std::time::{Duration, Instant};
 use tokio::time::sleep;
 
 const REPORT_DATA_OFFSET: usize = 8;
@@ -17,6 +20,103 @@ const COMMAND_ID_FRAME_MATRIX: u8 = 0x0B;
 const COMMAND_CLASS_EXTENDED: u8 = 0x0F;
 const COMMAND_ID_FRAME_EXTENDED: u8 = 0x03;
 
+/// A single row segment scheduled for upload.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+struct Segment {
+    row: usize,
+    start_col: usize,
+    width: usize,
+}
+
+/// Plan the row segments needed to upload a frame.
+///
+/// Each row is split into segments of at most `max_cols` columns. When the
+/// previously uploaded frame is given, segments whose bytes are unchanged
+/// are skipped so only the dirty parts of the matrix are transmitted.
+fn plan_segments(
+    frame: &[u8],
+    previous: Option<&[u8]>,
+    height: usize,
+    width: usize,
+    channels: usize,
+    max_cols: usize,
+) -> Vec<Segment> {
+    let mut segments = Vec::with_capacity(height * width.div_ceil(max_cols.max(1)));
+
+    for row in 0..height {
+        let mut start_col = 0;
+        while start_col < width {
+            let segment_width = (width - start_col).min(max_cols);
+            let start = (row * width + start_col) * channels;
+            let end = start + segment_width * channels;
+
+            let dirty = match previous {
+                Some(prev) => prev.get(start..end) != frame.get(start..end),
+                None => true,
+            };
+            if dirty {
+                segments.push(Segment {
+                    row,
+                    start_col,
+                    width: segment_width,
+                });
+            }
+            start_col += segment_width;
+        }
+    }
+
+    segments
+}
+
+/// Timing breakdown of a single frame upload, in microseconds.
+#[pyclass]
+#[derive(Clone, Debug, Default)]
+pub struct FrameTiming {
+    /// Number of reports transmitted
+    #[pyo3(get)]
+    pub packets: usize,
+
+    /// Building and checksumming the reports
+    #[pyo3(get)]
+    pub pack_us: u64,
+
+    /// Waiting for exclusive access to the interface
+    #[pyo3(get)]
+    pub lock_us: u64,
+
+    /// Control transfers, submitted back-to-back
+    #[pyo3(get)]
+    pub transfer_us: u64,
+
+    /// Inter-command delays before and after the frame
+    #[pyo3(get)]
+    pub delay_us: u64,
+
+    /// Wall time of the whole upload
+    #[pyo3(get)]
+    pub total_us: u64,
+}
+
+#[pymethods]
+impl FrameTiming {
+    fn __repr__(&self) -> String {
+        format!(
+            "FrameTiming(packets={}, pack_us={}, lock_us={}, transfer_us={}, delay_us={}, total_us={})",
+            self.packets, self.pack_us, self.lock_us, self.transfer_us, self.delay_us, self.total_us
+        )
+    }
+}
+
+fn micros(duration: Duration) -> u64 {
+    u64::try_from(duration.as_micros()).unwrap_or(u64::MAX)
+}
+
+/// Upload a custom frame to the device.
+///
+/// All reports are built up front and then submitted back-to-back while
+/// holding the interface once. If `previous` holds the frame which was
+/// last uploaded, only the row segments which differ from it are sent.
+/// Resolves to a `FrameTiming` breakdown of the upload.
 #[pyfunction]
 #[pyo3(
     signature = (
@@ -27,7 +127,8 @@ const COMMAND_ID_FRAME_EXTENDED: u8 = 0x03;
         is_extended=false,
         row_offsets=None,
         pre_delay_ms=7,
-        post_delay_ms=1
+        post_delay_ms=1,
+        previous=None
     )
 )]
 #[allow(clippy::too_many_arguments)]
@@ -41,6 +142,7 @@ pub fn send_frame_async<'py>(
     row_offsets: Option<Vec<u8>>,
     pre_delay_ms: u64,
     post_delay_ms: u64,
+    previous: Option<PyReadonlyArray3<u8>>,
 ) -> PyResult<Bound<'py, PyAny>> {
     let shape = frame.shape();
     if shape.len() != 3 {
@@ -62,131 +164,184 @@ pub fn send_frame_async<'py>(
     let frame_slice = frame
         .as_slice()
         .map_err(|_| pyo3::exceptions::PyValueError::new_err("frame must be C-contiguous uint8"))?;
-    let frame_data = frame_slice.to_vec();
-
-    let interface = device.interface_clone();
-
-    let offsets = row_offsets.map(|vals| vals.into_iter().map(|v| v as usize).collect::<Vec<_>>());
 
-    future_into_py(py, async move {
-        if height == 0 || width == 0 {
-            return Ok(());
-        }
-
-        if let Some(ref vals) = offsets {
-            if vals.len() < height {
+    let previous_slice = match previous.as_ref() {
+        Some(prev) => {
+            if prev.shape() != shape {
                 return Err(pyo3::exceptions::PyValueError::new_err(
-                    "row_offsets length must match frame height",
+                    "previous frame must have the same shape as frame",
                 ));
             }
+            Some(prev.as_slice().map_err(|_| {
+                pyo3::exceptions::PyValueError::new_err("previous frame must be C-contiguous uint8")
+            })?)
         }
-
-        let prefix_len = if is_extended { 5 } else { 4 };
-        let usable = DATA_SIZE
-            .checked_sub(prefix_len)
-            .ok_or_else(|| HidError::ProtocolError("segment payload too small".into()))?;
-        let max_cols = usable / channels;
-        if max_cols == 0 {
-            return Err(HidError::ProtocolError("segment payload too small".into()).into());
+        None => None,
+    };
+
+    if let Some(ref vals) = row_offsets {
+        if vals.len() < height {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "row_offsets length must match frame height",
+            ));
         }
+    }
 
-        let segments_per_row = width.div_ceil(max_cols);
-        let total_packets = height
-            .checked_mul(segments_per_row)
-            .ok_or_else(|| HidError::ProtocolError("packet count overflow".into()))?;
+    let prefix_len = if is_extended { 5 } else { 4 };
+    let usable = DATA_SIZE
+        .checked_sub(prefix_len)
+        .ok_or_else(|| HidError::ProtocolError("segment payload too small".into()))?;
+    let max_cols = usable / channels;
+    if max_cols == 0 {
+        return Err(HidError::ProtocolError("segment payload too small".into()).into());
+    }
 
-        if total_packets > u16::MAX as usize {
-            return Err(HidError::ProtocolError("packet count too large".into()).into());
-        }
+    let pack_start = Instant::now();
+
+    let segments = plan_segments(
+        frame_slice,
+        previous_slice,
+        height,
+        width,
+        channels,
+        max_cols,
+    );
+    if segments.len() > u16::MAX as usize {
+        return Err(HidError::ProtocolError("packet count too large".into()).into());
+    }
 
-        let command_class = if is_extended {
-            COMMAND_CLASS_EXTENDED
-        } else {
-            COMMAND_CLASS_LEGACY
-        };
-        let command_id = if is_extended {
-            COMMAND_ID_FRAME_EXTENDED
-        } else {
-            COMMAND_ID_FRAME_MATRIX
-        };
+    let header = FrameHeader {
+        frame_id,
+        transaction_id,
+        is_extended,
+    };
+    let reports = pack_reports(
+        frame_slice,
+        &segments,
+        width,
+        channels,
+        row_offsets.as_deref(),
+        &header,
+    )?;
+
+    let pack_time = pack_start.elapsed();
 
-        let pre_delay = Duration::from_millis(pre_delay_ms);
-        let post_delay = Duration::from_millis(post_delay_ms);
+    let interface = device.interface_clone();
+    let pre_delay = Duration::from_millis(pre_delay_ms);
+    let post_delay = Duration::from_millis(post_delay_ms);
 
-        let mut report = [0u8; REPORT_SIZE];
-        report[1] = transaction_id;
-        report[6] = command_class;
-        report[7] = command_id;
+    future_into_py(py, async move {
+        let mut timing = FrameTiming {
+            packets: reports.len(),
+            pack_us: micros(pack_time),
+            ..Default::default()
+        };
 
-        let mut packet_index: usize = 0;
+        if reports.is_empty() {
+            timing.total_us = timing.pack_us;
+            return Ok(timing);
+        }
 
-        for row in 0..height {
-            let row_offset = offsets
-                .as_ref()
-                .and_then(|vals| vals.get(row).copied())
-                .unwrap_or(0);
+        let started = Instant::now();
 
-            let mut start_col = 0;
-            while start_col < width {
-                let segment_width = (width - start_col).min(max_cols);
+        // Only apply pre_delay before FIRST packet, post_delay after LAST packet
+        // This prevents 7ms * N delays per frame (was killing framerate)
+        if !pre_delay.is_zero() {
+            sleep(pre_delay).await;
+        }
 
-                // Only apply pre_delay before FIRST packet, post_delay after LAST packet
-                // This prevents 7ms * N delays per frame (was killing framerate)
-                let is_first = packet_index == 0;
-                let is_last = packet_index + 1 == total_packets;
+        let (lock_wait, transfer) =
+            HidDevice::send_feature_reports_inner(interface, &reports, 0).await?;
 
-                packet_index = send_segment(
-                    interface.clone(),
-                    &frame_data,
-                    &mut report,
-                    row,
-                    width,
-                    channels,
-                    row_offset,
-                    start_col,
-                    segment_width,
-                    frame_id,
-                    is_extended,
-                    total_packets,
-                    packet_index,
-                    if is_first { pre_delay } else { Duration::ZERO },
-                    if is_last { post_delay } else { Duration::ZERO },
-                )
-                .await?;
-                start_col += segment_width;
-            }
+        if !post_delay.is_zero() {
+            sleep(post_delay).await;
         }
 
-        Ok(())
+        let elapsed = started.elapsed();
+        timing.lock_us = micros(lock_wait);
+        timing.transfer_us = micros(transfer);
+        timing.delay_us = micros(elapsed.saturating_sub(lock_wait + transfer));
+        timing.total_us = micros(pack_time + elapsed);
+
+        Ok(timing)
     })
 }
 
-#[allow(clippy::too_many_arguments)]
-async fn send_segment(
-    interface: std::sync::Arc<tokio::sync::Mutex<Option<nusb::Interface>>>,
+/// Report fields which are the same for every segment of a frame.
+struct FrameHeader {
+    frame_id: u8,
+    transaction_id: u8,
+    is_extended: bool,
+}
+
+/// Build the feature reports for all planned segments of a frame.
+fn pack_reports(
     frame_data: &[u8],
+    segments: &[Segment],
+    width: usize,
+    channels: usize,
+    row_offsets: Option<&[u8]>,
+    header: &FrameHeader,
+) -> Result<Vec<[u8; REPORT_SIZE]>, HidError> {
+    let (command_class, command_id) = if header.is_extended {
+        (COMMAND_CLASS_EXTENDED, COMMAND_ID_FRAME_EXTENDED)
+    } else {
+        (COMMAND_CLASS_LEGACY, COMMAND_ID_FRAME_MATRIX)
+    };
+
+    let mut template = [0u8; REPORT_SIZE];
+    template[1] = header.transaction_id;
+    template[6] = command_class;
+    template[7] = command_id;
+
+    let total_packets = segments.len();
+    let mut reports = Vec::with_capacity(total_packets);
+
+    for (packet_index, segment) in segments.iter().enumerate() {
+        let row_offset = row_offsets
+            .and_then(|vals| vals.get(segment.row).copied())
+            .unwrap_or(0) as usize;
+
+        let mut report = template;
+        pack_segment(
+            &mut report,
+            frame_data,
+            segment,
+            width,
+            channels,
+            row_offset,
+            header,
+            total_packets - packet_index - 1,
+        )?;
+        reports.push(report);
+    }
+
+    Ok(reports)
+}
+
+#[allow(clippy::too_many_arguments)]
+fn pack_segment(
     report: &mut [u8; REPORT_SIZE],
-    row: usize,
+    frame_data: &[u8],
+    segment: &Segment,
     width: usize,
     channels: usize,
     row_offset: usize,
-    start_col: usize,
-    segment_width: usize,
-    frame_id: u8,
-    is_extended: bool,
-    total_packets: usize,
-    packet_index: usize,
-    pre_delay: Duration,
-    post_delay: Duration,
-) -> Result<usize, HidError> {
+    header: &FrameHeader,
+    remaining: usize,
+) -> Result<(), HidError> {
+    let row = segment.row;
+    let start_col = segment.start_col;
+    let segment_width = segment.width;
+
     if segment_width == 0 {
-        return Ok(packet_index);
+        return Err(HidError::ProtocolError("empty segment".into()));
     }
 
     let data_len = segment_width
         .checked_mul(channels)
         .ok_or_else(|| HidError::ProtocolError("segment size overflow".into()))?;
-    let prefix_len = if is_extended { 5 } else { 4 };
+    let prefix_len = if header.is_extended { 5 } else { 4 };
     if prefix_len + data_len > DATA_SIZE {
         return Err(HidError::ProtocolError("segment payload too large".into()));
     }
@@ -206,9 +361,6 @@ async fn send_segment(
         return Err(HidError::ProtocolError("frame data out of bounds".into()));
     }
 
-    let remaining = total_packets
-        .checked_sub(packet_index + 1)
-        .ok_or_else(|| HidError::ProtocolError("packet index overflow".into()))?;
     let remaining_u16 = u16::try_from(remaining)
         .map_err(|_| HidError::ProtocolError("remaining packet overflow".into()))?;
 
@@ -222,11 +374,10 @@ async fn send_segment(
         return Err(HidError::ProtocolError("column index overflow".into()));
     }
 
-    report[REPORT_DATA_OFFSET..REPORT_CRC_OFFSET].fill(0);
     report[2..4].copy_from_slice(&remaining_u16.to_le_bytes());
     report[5] = (prefix_len + data_len) as u8;
 
-    if is_extended {
+    if header.is_extended {
         // Extended frame format (0x0F/0x03 command):
         // Bytes 0-1: Reserved, must be 0x00 (Razer protocol requirement)
         // Byte 2: Row index
@@ -243,7 +394,7 @@ async fn send_segment(
         // Byte 1: Row index
         // Byte 2: Start column (with offset applied)
         // Byte 3: End column (with offset applied)
-        report[REPORT_DATA_OFFSET] = frame_id;
+        report[REPORT_DATA_OFFSET] = header.frame_id;
         report[REPORT_DATA_OFFSET + 1] = row as u8;
         report[REPORT_DATA_OFFSET + 2] = header_start_col as u8;
         report[REPORT_DATA_OFFSET + 3] = stop_col as u8;
@@ -255,15 +406,58 @@ async fn send_segment(
 
     report[REPORT_CRC_OFFSET] = fast_crc_impl(report);
 
-    if !pre_delay.is_zero() {
-        sleep(pre_delay).await;
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn frame(height: usize, width: usize) -> Vec<u8> {
+        vec![0u8; height * width * 3]
     }
 
-    HidDevice::send_feature_report_inner(interface, report, 0).await?;
+    fn seg(row: usize, start_col: usize, width: usize) -> Segment {
+        Segment {
+            row,
+            start_col,
+            width,
+        }
+    }
+
+    #[test]
+    fn test_plan_full_frame() {
+        let data = frame(6, 22);
+        let segments = plan_segments(&data, None, 6, 22, 3, 25);
+        assert_eq!(segments.len(), 6);
+        assert!(segments.iter().all(|s| s.start_col == 0 && s.width == 22));
+    }
 
-    if !post_delay.is_zero() {
-        sleep(post_delay).await;
+    #[test]
+    fn test_plan_wide_rows_are_split() {
+        let data = frame(2, 30);
+        let segments = plan_segments(&data, None, 2, 30, 3, 25);
+        assert_eq!(
+            segments,
+            vec![seg(0, 0, 25), seg(0, 25, 5), seg(1, 0, 25), seg(1, 25, 5)]
+        );
     }
 
-    Ok(packet_index + 1)
+    #[test]
+    fn test_plan_unchanged_frame_is_empty() {
+        let data = frame(6, 22);
+        let previous = data.clone();
+        assert!(plan_segments(&data, Some(&previous), 6, 22, 3, 25).is_empty());
+    }
+
+    #[test]
+    fn test_plan_only_dirty_segments() {
+        let previous = frame(2, 30);
+        let mut data = previous.clone();
+        // Touch row 1, column 27 (second segment of the second row)
+        data[(30 + 27) * 3] = 0xFF;
+
+        let segments = plan_segments(&data, Some(&previous), 2, 30, 3, 25);
+        assert_eq!(segments, vec![seg(1, 25, 5)]);
+    }
 }
@@ -7,6 +7,7 @@
 
 #![allow(dead_code)] // Constants and struct fields will be used in later tasks
 
+use crate::hid::runtime;
 use crate::hid::{DeviceInfo, HidError, Result};
 use nusb::descriptors::TransferType;
 use nusb::transfer::{Buffer, Direction, In, Interrupt, Out};
@@ -169,20 +170,12 @@ impl HeadsetDevice {
     }
 
     /// Close the device.
-    fn close(&self) {
-        use crate::hid::device::get_or_create_runtime;
-
-        if let Ok(rt) = tokio::runtime::Handle::try_current() {
-            rt.block_on(async {
-                let mut guard = self.interface.lock().await;
-                *guard = None;
-            });
-        } else if let Ok(rt) = get_or_create_runtime() {
-            rt.block_on(async {
-                let mut guard = self.interface.lock().await;
-                *guard = None;
-            });
-        }
+    fn close(&self, py: Python<'_>) {
+        let interface = self.interface.clone();
+        runtime::block_on(py, async move {
+            let mut guard = interface.lock().await;
+            *guard = None;
+        });
     }
 
     /// Check if device is open.
@@ -9,6 +9,7 @@ pub mod error;
 pub mod frame;
 pub mod headset;
 pub mod report;
+pub mod runtime;
 
 pub use device::open_device_async;
 pub use device::HidDevice;
@@ -16,6 +17,6 @@ pub use device_info::DeviceInfo;
 pub use enumerate::enumerate_devices;
 pub use enumerate::enumerate_devices_async;
 pub use error::{HidError, Result};
-pub use frame::send_frame_async;
+pub use frame::{send_frame_async, FrameTiming};
 pub use headset::{headset_constants, HeadsetDevice};
 pub use report::{RazerReport, Status, DATA_SIZE, REPORT_SIZE};
@@ -13,11 +13,13 @@
 //!   89     - Reserved (0x00)
 
 use crate::crc::fast_crc_impl;
+use crate::hid::runtime;
 use crate::hid::{HidDevice, HidError};
 use pyo3::prelude::*;
 use pyo3_async_runtimes::tokio::future_into_py;
-use std::thread;
+use std::sync::Arc;
 use std::time::Duration;
+use tokio::sync::Mutex;
 use tokio::time::sleep;
 
 pub const REPORT_SIZE: usize = 90;
@@ -43,6 +45,57 @@ fn parse_response_buf(response: &[u8]) -> PyResult<(Status, Vec<u8>)> {
     Ok((status, data))
 }
 
+/// Send a packed report and read the response, retrying while the
+/// device reports BUSY. Once the retries are used up the BUSY or
+/// TIMEOUT status is returned so callers can adapt their pacing.
+/// Shared by the blocking and async entry points.
+async fn transact(
+    interface: Arc<Mutex<Option<nusb::Interface>>>,
+    data: Vec<u8>,
+    remaining_packets: u16,
+    delay: Duration,
+    retries: u32,
+) -> PyResult<(Status, Vec<u8>)> {
+    let mut attempts = retries;
+
+    loop {
+        // Delay before sending
+        sleep(delay).await;
+
+        // Send report
+        HidDevice::send_feature_report_inner(interface.clone(), &data, 0).await?;
+
+        // If this is a multi-packet send (remaining > 0), don't read response
+        if remaining_packets > 0 {
+            return Ok((Status::Ok, vec![]));
+        }
+
+        // Delay before reading response
+        sleep(delay).await;
+
+        // Get response
+        let response =
+            HidDevice::get_feature_report_inner(interface.clone(), 0, REPORT_SIZE).await?;
+        let (status, resp_data) = parse_response_buf(&response)?;
+
+        match status {
+            Status::Ok => return Ok((status, resp_data)),
+            Status::Unsupported => return Ok((status, resp_data)),
+            Status::Fail => return Err(HidError::ProtocolError("Command failed".into()).into()),
+            Status::Busy | Status::Timeout => {
+                if attempts == 0 {
+                    return Ok((status, resp_data));
+                }
+                attempts -= 1;
+                sleep(Duration::from_millis(100)).await;
+            }
+            _ => {
+                return Err(HidError::ProtocolError(format!("Unknown status: {:?}", status)).into())
+            }
+        }
+    }
+}
+
 /// Status codes returned by Razer devices.
 #[pyclass(eq, eq_int)]
 #[derive(Clone, Copy, Debug, PartialEq, Eq)]
@@ -194,57 +247,25 @@ impl RazerReport {
     ///     retries: Number of retries on BUSY (default 3)
     ///
     /// Returns:
-    ///     (status, response_data) tuple
+    ///     (status, response_data) tuple, with BUSY or TIMEOUT status
+    ///     if the device was still busy after all retries
     #[pyo3(signature = (device, delay_ms=None, retries=3))]
     fn run(
         &mut self,
+        py: Python<'_>,
         device: &HidDevice,
         delay_ms: Option<u64>,
         retries: u32,
     ) -> PyResult<(Status, Vec<u8>)> {
         let delay = Duration::from_millis(delay_ms.unwrap_or(CMD_DELAY_MS));
         let data = self.pack();
-        let mut attempts = retries;
-
-        loop {
-            // Delay before sending
-            thread::sleep(delay);
-
-            // Send report
-            device.send_report(data.clone(), 0)?;
-
-            // If this is a multi-packet send (remaining > 0), don't read response
-            if self.get_remaining_packets() > 0 {
-                return Ok((Status::Ok, vec![]));
-            }
+        let remaining_packets = self.get_remaining_packets();
+        let interface = device.interface_clone();
 
-            // Delay before reading response
-            thread::sleep(delay);
-
-            // Get response
-            let response = device.get_report(0, REPORT_SIZE)?;
-            let (status, resp_data) = parse_response_buf(&response)?;
-
-            match status {
-                Status::Ok => return Ok((status, resp_data)),
-                Status::Unsupported => return Ok((status, resp_data)),
-                Status::Fail => return Err(HidError::ProtocolError("Command failed".into()).into()),
-                Status::Busy | Status::Timeout => {
-                    if attempts == 0 {
-                        return Err(
-                            HidError::ProtocolError(format!("Max retries: {:?}", status)).into(),
-                        );
-                    }
-                    attempts -= 1;
-                    thread::sleep(Duration::from_millis(100));
-                }
-                _ => {
-                    return Err(
-                        HidError::ProtocolError(format!("Unknown status: {:?}", status)).into(),
-                    )
-                }
-            }
-        }
+        runtime::block_on(
+            py,
+            transact(interface, data, remaining_packets, delay, retries),
+        )
     }
 
     /// Run the report on a device (async).
@@ -257,7 +278,8 @@ impl RazerReport {
     ///     retries: Number of retries on BUSY (default 3)
     ///
     /// Returns:
-    ///     (status, response_data) tuple
+    ///     (status, response_data) tuple, with BUSY or TIMEOUT status
+    ///     if the device was still busy after all retries
     #[pyo3(signature = (device, delay_ms=None, retries=3))]
     fn run_async<'py>(
         &mut self,
@@ -271,56 +293,10 @@ impl RazerReport {
         let remaining_packets = self.get_remaining_packets();
         let interface = device.interface_clone();
 
-        future_into_py(py, async move {
-            let mut attempts = retries;
-
-            loop {
-                // Delay before sending
-                sleep(delay).await;
-
-                // Send report
-                HidDevice::send_feature_report_inner(interface.clone(), &data, 0).await?;
-
-                // If this is a multi-packet send (remaining > 0), don't read response
-                if remaining_packets > 0 {
-                    return Ok((Status::Ok, vec![]));
-                }
-
-                // Delay before reading response
-                sleep(delay).await;
-
-                // Get response
-                let response =
-                    HidDevice::get_feature_report_inner(interface.clone(), 0, REPORT_SIZE).await?;
-                let (status, resp_data) = parse_response_buf(&response)?;
-
-                match status {
-                    Status::Ok => return Ok((status, resp_data)),
-                    Status::Unsupported => return Ok((status, resp_data)),
-                    Status::Fail => {
-                        return Err(HidError::ProtocolError("Command failed".into()).into())
-                    }
-                    Status::Busy | Status::Timeout => {
-                        if attempts == 0 {
-                            return Err(HidError::ProtocolError(format!(
-                                "Max retries: {:?}",
-                                status
-                            ))
-                            .into());
-                        }
-                        attempts -= 1;
-                        sleep(Duration::from_millis(100)).await;
-                    }
-                    _ => {
-                        return Err(HidError::ProtocolError(format!(
-                            "Unknown status: {:?}",
-                            status
-                        ))
-                        .into())
-                    }
-                }
-            }
-        })
+        future_into_py(
+            py,
+            transact(interface, data, remaining_packets, delay, retries),
+        )
     }
 
     /// Get the current argument data pointer position.
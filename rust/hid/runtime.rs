@@ -0,0 +1,40 @@
+//! Process-wide tokio runtime shared by all HID devices
+//!
+//! Async calls are driven by the pyo3-async-runtimes global runtime and
+//! resolve directly as asyncio futures. Blocking calls run on the same
+//! runtime instead of building one per call, with the GIL released.
+
+use pyo3::prelude::*;
+use std::future::Future;
+
+/// Async worker threads. USB control transfers are I/O bound, so a couple
+/// of workers serve any number of devices.
+const WORKER_THREADS: usize = 2;
+
+/// Upper bound on threads tokio may spawn for blocking work.
+const MAX_BLOCKING_THREADS: usize = 4;
+
+/// Configure the shared runtime.
+///
+/// Called when the native module is initialized, before any HID call can
+/// start the runtime.
+pub fn init() {
+    let mut builder = tokio::runtime::Builder::new_multi_thread();
+    builder
+        .worker_threads(WORKER_THREADS)
+        .max_blocking_threads(MAX_BLOCKING_THREADS)
+        .thread_name("uchroma-hid")
+        .enable_all();
+    pyo3_async_runtimes::tokio::init(builder);
+}
+
+/// Run a future to completion on the shared runtime from a Python thread.
+///
+/// The GIL is released while waiting so other Python threads keep running.
+pub(crate) fn block_on<F>(py: Python<'_>, future: F) -> F::Output
+where
+    F: Future + Send,
+    F::Output: Send,
+{
+    py.detach(|| pyo3_async_runtimes::tokio::get_runtime().block_on(future))
+}
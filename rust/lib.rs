@@ -16,6 +16,7 @@ mod crc;
 mod drawing;
 mod effects;
 mod hid;
+mod pixels;
 
 // Re-export for benchmarks
 pub use blending::{blend_full_impl, blend_screen_impl, BlendMode};
@@ -25,6 +26,9 @@ pub use crc::fast_crc_impl;
 /// Native Rust extensions for uchroma performance-critical code.
 #[pymodule(name = "_native")]
 fn _native(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    // Shared HID runtime, configured before any device can start it
+    hid::runtime::init();
+
     // Existing functions
     m.add_function(wrap_pyfunction!(crc::fast_crc, m)?)?;
     m.add_function(wrap_pyfunction!(effects::draw_plasma, m)?)?;
@@ -53,6 +57,7 @@ fn _native(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<hid::HeadsetDevice>()?;
     m.add_class::<hid::RazerReport>()?;
     m.add_class::<hid::Status>()?;
+    m.add_class::<hid::FrameTiming>()?;
     m.add_function(wrap_pyfunction!(hid::enumerate_devices, m)?)?;
     m.add_function(wrap_pyfunction!(hid::enumerate_devices_async, m)?)?;
     m.add_function(wrap_pyfunction!(hid::open_device_async, m)?)?;
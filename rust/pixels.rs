@@ -0,0 +1,153 @@
+//! Layer pixel storage shared by the blending, compositor and effect kernels.
+//!
+//! Layer matrices are RGBA arrays of shape (height, width, 4) stored as
+//! either f64 (the default) or f32. Kernels compute in f64 and convert at
+//! load/store, so f32 layers halve memory traffic without changing results
+//! beyond f32 rounding.
+
+use numpy::ndarray::{ArrayView3, ArrayViewMut3};
+use numpy::{Element, PyArray3, PyArrayMethods, PyReadonlyArray3, PyUntypedArrayMethods};
+use pyo3::prelude::*;
+
+/// Floating point type usable as layer channel storage.
+pub trait Channel: Element + Copy {
+    fn to_f64(self) -> f64;
+    fn from_f64(value: f64) -> Self;
+}
+
+impl Channel for f64 {
+    #[inline(always)]
+    fn to_f64(self) -> f64 {
+        self
+    }
+
+    #[inline(always)]
+    fn from_f64(value: f64) -> Self {
+        value
+    }
+}
+
+impl Channel for f32 {
+    #[inline(always)]
+    fn to_f64(self) -> f64 {
+        self as f64
+    }
+
+    #[inline(always)]
+    fn from_f64(value: f64) -> Self {
+        value as f32
+    }
+}
+
+/// Read-only layer matrix of either supported precision.
+#[derive(FromPyObject)]
+pub enum LayerArray<'py> {
+    F64(PyReadonlyArray3<'py, f64>),
+    F32(PyReadonlyArray3<'py, f32>),
+}
+
+impl LayerArray<'_> {
+    pub fn shape(&self) -> &[usize] {
+        match self {
+            Self::F64(arr) => arr.shape(),
+            Self::F32(arr) => arr.shape(),
+        }
+    }
+}
+
+/// Writable layer matrix of either supported precision.
+#[derive(FromPyObject)]
+pub enum LayerMatrix<'py> {
+    F64(Bound<'py, PyArray3<f64>>),
+    F32(Bound<'py, PyArray3<f32>>),
+}
+
+impl LayerMatrix<'_> {
+    /// Borrow the matrix for writing.
+    ///
+    /// # Safety
+    /// No other reference to the array data may be alive while the
+    /// returned view is in use.
+    pub unsafe fn as_pixels_mut(&self) -> PixelsMut<'_> {
+        match self {
+            Self::F64(arr) => PixelsMut::F64(arr.as_array_mut()),
+            Self::F32(arr) => PixelsMut::F32(arr.as_array_mut()),
+        }
+    }
+}
+
+/// Mutable view of a layer matrix, converting to and from f64.
+pub enum PixelsMut<'a> {
+    F64(ArrayViewMut3<'a, f64>),
+    F32(ArrayViewMut3<'a, f32>),
+}
+
+impl PixelsMut<'_> {
+    /// Write a whole RGBA pixel.
+    #[inline(always)]
+    pub fn set(&mut self, row: usize, col: usize, rgba: [f64; 4]) {
+        match self {
+            Self::F64(arr) => store(arr, row, col, rgba),
+            Self::F32(arr) => store(arr, row, col, rgba),
+        }
+    }
+
+    /// Read a whole RGBA pixel.
+    #[inline(always)]
+    pub fn get(&self, row: usize, col: usize) -> [f64; 4] {
+        match self {
+            Self::F64(arr) => load(&arr.view(), row, col),
+            Self::F32(arr) => load(&arr.view(), row, col),
+        }
+    }
+}
+
+#[inline(always)]
+fn store<T: Channel>(arr: &mut ArrayViewMut3<'_, T>, row: usize, col: usize, rgba: [f64; 4]) {
+    for (c, value) in rgba.into_iter().enumerate() {
+        arr[[row, col, c]] = T::from_f64(value);
+    }
+}
+
+/// Load an RGBA pixel as f64.
+#[inline(always)]
+pub fn load<T: Channel>(arr: &ArrayView3<'_, T>, row: usize, col: usize) -> [f64; 4] {
+    [
+        arr[[row, col, 0]].to_f64(),
+        arr[[row, col, 1]].to_f64(),
+        arr[[row, col, 2]].to_f64(),
+        arr[[row, col, 3]].to_f64(),
+    ]
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use numpy::ndarray::Array3;
+
+    #[test]
+    fn test_set_get_f32() {
+        let mut arr = Array3::<f32>::zeros((2, 3, 4));
+        let mut pixels = PixelsMut::F32(arr.view_mut());
+
+        pixels.set(1, 2, [0.25, 0.5, 0.75, 1.0]);
+        assert_eq!(pixels.get(1, 2), [0.25, 0.5, 0.75, 1.0]);
+        assert_eq!(pixels.get(0, 0), [0.0; 4]);
+    }
+
+    #[test]
+    fn test_load_matches_across_precisions() {
+        let mut wide = Array3::<f64>::zeros((1, 1, 4));
+        let mut narrow = Array3::<f32>::zeros((1, 1, 4));
+        let rgba = [0.1, 0.2, 0.3, 0.4];
+
+        PixelsMut::F64(wide.view_mut()).set(0, 0, rgba);
+        PixelsMut::F32(narrow.view_mut()).set(0, 0, rgba);
+
+        let a = load(&wide.view(), 0, 0);
+        let b = load(&narrow.view(), 0, 0);
+        for c in 0..4 {
+            assert!((a[c] - b[c]).abs() < 1e-6);
+        }
+    }
+}
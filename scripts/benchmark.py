@@ -232,6 +232,327 @@ def bench_metaballs():
         print("Rust module not available - run 'make rebuild' first")
 
 
+class _BenchLayer:
+    """Minimal stand-in for Layer: just the attributes renderers draw into."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.matrix = np.zeros((height, width, 4), dtype=np.float64)
+
+
+def _bench_driver(width: int, height: int):
+    from unittest.mock import MagicMock
+
+    driver = MagicMock()
+    driver.width = width
+    driver.height = height
+    driver.input_manager = None
+    return driver
+
+
+def _run_draw(renderer, layer):
+    """Drive a renderer's draw() coroutine synchronously."""
+    coro = renderer.draw(layer, 0.0)
+    try:
+        coro.send(None)
+    except StopIteration:
+        return
+    coro.close()
+
+
+def bench_rainbow():
+    """Benchmark Rainbow rendering."""
+    print("\n" + "=" * 60)
+    print("Rainbow Benchmarks")
+    print("=" * 60)
+
+    width, height, stagger = 22, 6, 4
+    gradient = np.random.random((width * 8 + height * stagger, 3))
+    glen = len(gradient)
+    matrix = np.zeros((height, width, 4), dtype=np.float64)
+
+    # Previous implementation: per-pixel color lookup and row-wise writes
+    def python_rainbow():
+        for row in range(height):
+            for col in range(width):
+                matrix[row][col] = (*gradient[(row * stagger + col) % glen], 1.0)
+
+    py_result = bench("Python Rainbow", python_rainbow, iterations=2000)
+    print(py_result)
+
+    try:
+        from uchroma.fxlib.rainbow import Rainbow
+
+        renderer = Rainbow(_bench_driver(width, height))
+        renderer.init(None)
+        layer = _BenchLayer(width, height)
+
+        np_result = bench("NumPy Rainbow", lambda: _run_draw(renderer, layer), iterations=2000)
+        print(np_result)
+
+        speedup = py_result.per_iter_us / np_result.per_iter_us
+        print(f"\nNumPy is {speedup:.1f}x faster than Python")
+    except ImportError:
+        print("Rust module not available - run 'make rebuild' first")
+
+
+def bench_typewriter():
+    """Benchmark Typewriter rendering."""
+    print("\n" + "=" * 60)
+    print("Typewriter Benchmarks")
+    print("=" * 60)
+
+    width, height = 22, 6
+    brightness = np.random.random((height, width))
+    matrix = np.zeros((height, width, 4), dtype=np.float64)
+    glow_r, glow_g, glow_b = 1.0, 0.67, 0.27
+    base, warmth = 0.15, 0.3
+
+    # Previous implementation: nested per-pixel loops
+    def python_typewriter():
+        for row in range(height):
+            for col in range(width):
+                b = max(base, brightness[row, col])
+                if b > 0.7 and warmth > 0:
+                    warm_mix = (b - 0.7) / 0.3 * warmth
+                    r = glow_r + (1.0 - glow_r) * warm_mix
+                    g = glow_g + (1.0 - glow_g) * warm_mix
+                    bl = glow_b + (1.0 - glow_b) * warm_mix
+                else:
+                    r, g, bl = glow_r, glow_g, glow_b
+                matrix[row][col] = (r * b, g * b, bl * b, 1.0)
+
+    py_result = bench("Python Typewriter", python_typewriter, iterations=2000)
+    print(py_result)
+
+    try:
+        from types import SimpleNamespace
+
+        from uchroma.fxlib.typewriter import Typewriter
+
+        renderer = Typewriter(_bench_driver(width, height))
+        renderer._input_queue = SimpleNamespace(attach=lambda: True, get_events_nowait=list)
+        renderer._brightness = brightness.copy()
+        renderer._decay_factor = 1.0
+        layer = _BenchLayer(width, height)
+
+        np_result = bench("NumPy Typewriter", lambda: _run_draw(renderer, layer), iterations=2000)
+        print(np_result)
+
+        speedup = py_result.per_iter_us / np_result.per_iter_us
+        print(f"\nNumPy is {speedup:.1f}x faster than Python")
+    except ImportError:
+        print("Rust module not available - run 'make rebuild' first")
+
+
+def bench_comets():
+    """Benchmark Comets trail rendering."""
+    print("\n" + "=" * 60)
+    print("Comets Benchmarks")
+    print("=" * 60)
+
+    import math
+
+    width, height, trail_len, decay = 22, 6, 15, 0.3
+    colors = np.random.random((6, 3))
+    trails = [[(float(x), row) for x in range(trail_len)] for row in range(6)]
+    matrix = np.zeros((height, width, 4), dtype=np.float64)
+
+    # Previous implementation: per-trail-point read-modify-write of tuples
+    def python_comets():
+        matrix.fill(0)
+        for trail, (r, g, b) in zip(trails, colors, strict=True):
+            for i, (tx, ty) in enumerate(trail):
+                col = int(tx)
+                brightness = math.exp(-(len(trail) - i) * decay)
+                existing = matrix[ty][col]
+                matrix[ty][col] = (
+                    min(1.0, existing[0] + r * brightness),
+                    min(1.0, existing[1] + g * brightness),
+                    min(1.0, existing[2] + b * brightness),
+                    1.0,
+                )
+
+    py_result = bench("Python Comets", python_comets, iterations=2000)
+    print(py_result)
+
+    try:
+        from uchroma.fxlib.comets import Comet, Comets
+
+        renderer = Comets(_bench_driver(width, height))
+        renderer.trail_length = trail_len
+        renderer.trail_decay = decay
+        renderer.init(None)
+        renderer._comets = [
+            Comet(x=float(trail_len), y=row, speed=0.0, color=tuple(colors[row]), trail=trail[:])
+            for row, trail in enumerate(trails)
+        ]
+        layer = _BenchLayer(width, height)
+
+        np_result = bench("NumPy Comets", lambda: _run_draw(renderer, layer), iterations=2000)
+        print(np_result)
+
+        speedup = py_result.per_iter_us / np_result.per_iter_us
+        print(f"\nNumPy is {speedup:.1f}x faster than Python")
+    except ImportError:
+        print("Rust module not available - run 'make rebuild' first")
+
+
+def bench_layer_put():
+    """Benchmark per-pixel Layer.put against the bulk pixel API."""
+    print("\n" + "=" * 60)
+    print("Layer Put Benchmarks")
+    print("=" * 60)
+
+    try:
+        from uchroma.colorlib import Color
+        from uchroma.layer import Layer
+    except ImportError:
+        print("Rust module not available - run 'make rebuild' first")
+        return
+
+    width, height = 22, 6
+    layer = Layer(width, height)
+    palette = [Color.NewFromHsv(h, 1.0, 1.0) for h in range(0, 360, 60)]
+    data = [[palette[col % len(palette)] for col in range(width)] for row in range(height)]
+
+    # Previous implementation: one put() per pixel
+    def python_put():
+        for row in range(height):
+            for col in range(width):
+                layer.put(row, col, data[row][col])
+
+    py_result = bench("Layer.put per pixel", python_put, iterations=200)
+    print(py_result)
+
+    bulk_result = bench("Layer.put_all", lambda: layer.put_all(data), iterations=200)
+    print(bulk_result)
+
+    image = np.random.random((height, width, 4))
+    rows, cols = np.indices((height, width))
+    np_result = bench(
+        "Layer.put_pixels (array)",
+        lambda: layer.put_pixels(rows, cols, image),
+        iterations=2000,
+    )
+    print(np_result)
+
+    speedup = py_result.per_iter_us / np_result.per_iter_us
+    print(f"\nBulk array writes are {speedup:.1f}x faster than per-pixel put()")
+
+
+def bench_key_alignment():
+    """Benchmark keyboard alignment fixups against per-op array updates."""
+    print("\n" + "=" * 60)
+    print("Key Alignment Benchmarks")
+    print("=" * 60)
+
+    from types import SimpleNamespace
+
+    from uchroma.server.fixups import KeyboardFixup
+    from uchroma.server.hardware import KeyFixupMapping, PointList
+
+    # Same shape of fixups as the Blade laptops
+    copies = [[[5, 11], [5, 10]], [[0, 22], [2, 22]], [[0, 21], [0, 22]]]
+    mapping = KeyFixupMapping(copy=PointList(copies))
+
+    class Device(KeyboardFixup):
+        _hardware = SimpleNamespace(key_fixup_mapping=mapping, key_row_offsets=None)
+
+    device = Device()
+    frame = SimpleNamespace(debug_opts={})
+    img = np.random.randint(0, 255, (6, 25, 3), dtype=np.uint8)
+
+    # Previous implementation: replay each operation on the pixel data
+    def python_align():
+        frame.debug_opts.get("skip_fixups", False)
+        frame.debug_opts.get("debug_position", None)
+        matrix = img
+        for src, dst in mapping.copy:
+            src_row, src_col = src
+            dst_row, dst_col = dst
+            matrix[dst_row][dst_col] = np.copy(matrix[src_row][src_col])
+        return matrix
+
+    py_result = bench("Per-op alignment", python_align, iterations=20000)
+    print(py_result)
+
+    gather_result = bench(
+        "Compiled gather alignment",
+        lambda: device.align_key_matrix(frame, img),
+        iterations=20000,
+    )
+    print(gather_result)
+
+    speedup = py_result.per_iter_us / gather_result.per_iter_us
+    print(f"\nCompiled alignment is {speedup:.1f}x faster")
+
+
+def bench_layer_handoff():
+    """Benchmark handing drawn layers from renderers to the AnimationLoop."""
+    print("\n" + "=" * 60)
+    print("Layer Handoff Benchmarks")
+    print("=" * 60)
+
+    import asyncio
+
+    from uchroma.util import Mailbox
+
+    num_layers, frames = 5, 20000
+
+    # Previous implementation: a queue per renderer, and a waiter task
+    # per renderer created every frame and raced with FIRST_COMPLETED
+    async def queue_handoff():
+        queues = [asyncio.Queue(maxsize=2) for _ in range(num_layers)]
+        waiters = [None] * num_layers
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            for queue in queues:
+                queue.put_nowait(object())
+
+            for idx, queue in enumerate(queues):
+                if waiters[idx] is None or waiters[idx].done():
+                    waiters[idx] = asyncio.ensure_future(queue.get())
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            for idx, queue in enumerate(queues):
+                if not waiters[idx].done() and not queue.empty():
+                    queue.get_nowait()
+        elapsed = time.perf_counter() - start
+
+        for waiter in waiters:
+            waiter.cancel()
+        return elapsed
+
+    # Latest-wins slots sharing one "any layer ready" event
+    async def slot_handoff():
+        ready = asyncio.Event()
+        slots = [Mailbox(ready) for _ in range(num_layers)]
+
+        start = time.perf_counter()
+        for _ in range(frames):
+            for slot in slots:
+                slot.swap(object())
+
+            while True:
+                ready.clear()
+                taken = [slot.get_nowait() for slot in slots]
+                if any(item is not None for item in taken):
+                    break
+                await ready.wait()
+        return time.perf_counter() - start
+
+    queue_result = BenchResult("Queues + waiter tasks", frames, asyncio.run(queue_handoff()))
+    print(queue_result)
+
+    slot_result = BenchResult("Slots + shared event", frames, asyncio.run(slot_handoff()))
+    print(slot_result)
+
+    speedup = queue_result.per_iter_us / slot_result.per_iter_us
+    print(f"\nSlot handoff is {speedup:.1f}x faster per frame ({num_layers} layers)")
+
+
 def main():
     print("UChroma Native Extension Benchmarks")
     print("=" * 60)
@@ -239,6 +560,12 @@ def main():
     bench_crc()
     bench_plasma()
     bench_metaballs()
+    bench_rainbow()
+    bench_typewriter()
+    bench_comets()
+    bench_layer_put()
+    bench_key_alignment()
+    bench_layer_handoff()
 
     print("\n" + "=" * 60)
     print("Done!")
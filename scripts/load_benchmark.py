@@ -0,0 +1,596 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+"""
+Load benchmark on simulated devices.
+
+Spins up a number of keyboards and mice backed by the mock HID device from
+the test suite and runs real AnimationManager layer stacks on all of them
+in a single event loop, the same way the daemon does. Reports sustained
+FPS, frame-time percentiles, pipeline stage timings, CPU and memory for
+each device. No hardware is needed.
+
+The native HID transport can't talk to a Python object, so only the
+transport is simulated: commands still go through the device's
+run_report() (scheduling, pacing and BUSY retries) and only the final
+send and receive of each report is handed to a MockHIDDevice. Frame
+uploads are packed by a Python port of the native frame packer. A fixed
+latency per report stands in for the USB control transfer.
+
+Run with: uv run python scripts/load_benchmark.py --keyboards 4 --mice 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import uchroma.fxlib  # noqa: F401 - registers the built-in renderers
+from tests.server.mock_hid import MockHIDDevice
+from uchroma.server import hid
+from uchroma.server.hardware import RAZER_VENDOR_ID, Hardware
+from uchroma.server.keyboard import UChromaKeyboard
+from uchroma.server.mouse import UChromaMouse
+from uchroma.server.pacing import CommandPacer
+from uchroma.server.prefs import Preferences
+from uchroma.util import RollingStats
+
+REPORT_DATA_OFFSET = 8
+REPORT_CRC_OFFSET = 88
+
+FRAME_COMMANDS = {False: (0x03, 0x0B), True: (0x0F, 0x03)}
+
+# The device whose event loop callback is currently running
+_current_probe: contextvars.ContextVar[DeviceProbe | None] = contextvars.ContextVar(
+    "current_probe", default=None
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Simulated transport
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class SimulatedHIDDevice(MockHIDDevice):
+    """
+    MockHIDDevice with per-report latency and traffic counters.
+
+    Reports are counted instead of recorded so long runs don't grow
+    without bound.
+    """
+
+    latency: float = 0.0
+    reports: int = 0
+    bytes_sent: int = 0
+
+    def send_feature_report(self, data: bytes) -> int:
+        written = super().send_feature_report(data)
+        self._received.clear()
+        self.reports += 1
+        self.bytes_sent += written
+        return written
+
+    async def send_reports(self, reports: list[bytes]):
+        """Submit reports back-to-back, like the native frame upload."""
+        for report in reports:
+            self.send_feature_report(report)
+        if self.latency > 0:
+            await asyncio.sleep(self.latency * len(reports))
+
+    async def transact(self, data: bytes, delay: float) -> tuple[hid.Status, bytes]:
+        """Send a command report and read the response."""
+        await asyncio.sleep(delay)
+        await self.send_reports([data])
+        if data[2] or data[3]:
+            return hid.Status.Ok, b""
+
+        await asyncio.sleep(delay)
+        response = self.get_feature_report(0, hid.REPORT_SIZE)
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return _parse_response(response)
+
+    def transact_sync(self, data: bytes, delay: float) -> tuple[hid.Status, bytes]:
+        """Blocking variant of transact()."""
+        time.sleep(delay)
+        self.send_feature_report(data)
+        if data[2] or data[3]:
+            return hid.Status.Ok, b""
+
+        time.sleep(delay + self.latency * 2)
+        return _parse_response(self.get_feature_report(0, hid.REPORT_SIZE))
+
+
+def _parse_response(response: bytes) -> tuple[hid.Status, bytes]:
+    size = min(response[5], hid.DATA_SIZE)
+    data = response[REPORT_DATA_OFFSET : REPORT_DATA_OFFSET + size]
+    return hid.Status(response[0]), bytes(data)
+
+
+class SimulatedReport:
+    """
+    RazerReport whose transport is a SimulatedHIDDevice
+
+    Everything but run() and run_async() is the native report.
+    """
+
+    def __init__(self, report: hid.RazerReport):
+        self._report = report
+
+    def __getattr__(self, name):
+        return getattr(self._report, name)
+
+    def run(self, device, delay_ms=None, retries=3) -> tuple[hid.Status, bytes]:
+        return device.transact_sync(self._report.pack(), (delay_ms or 0) / 1000)
+
+    async def run_async(self, device, delay_ms=None, retries=3) -> tuple[hid.Status, bytes]:
+        return await device.transact(self._report.pack(), (delay_ms or 0) / 1000)
+
+
+def _plan_segments(frame, previous, max_cols):
+    """Row segments to upload, skipping the ones unchanged since the last frame."""
+    height, width, _ = frame.shape
+    segments = []
+    for row in range(height):
+        for start_col in range(0, width, max_cols):
+            stop_col = min(start_col + max_cols, width)
+            if previous is not None and np.array_equal(
+                previous[row, start_col:stop_col], frame[row, start_col:stop_col]
+            ):
+                continue
+            segments.append((row, start_col, stop_col))
+    return segments
+
+
+def _pack_frame(frame, previous, frame_id, transaction_id, is_extended, row_offsets):
+    """Python port of the native frame packer."""
+    prefix_len = 5 if is_extended else 4
+    max_cols = (hid.DATA_SIZE - prefix_len) // 3
+    command_class, command_id = FRAME_COMMANDS[is_extended]
+
+    segments = _plan_segments(frame, previous, max_cols)
+    reports = []
+    for index, (row, start_col, stop_col) in enumerate(segments):
+        payload = frame[row, start_col:stop_col].tobytes()
+        offset = row_offsets[row] if row_offsets else 0
+
+        report = bytearray(hid.REPORT_SIZE)
+        report[1] = transaction_id
+        report[2:4] = (len(segments) - index - 1).to_bytes(2, "little")
+        report[5] = prefix_len + len(payload)
+        report[6] = command_class
+        report[7] = command_id
+
+        columns = [row, start_col + offset, stop_col - 1 + offset]
+        header = [0x00, 0x00, *columns] if is_extended else [frame_id, *columns]
+        data_start = REPORT_DATA_OFFSET + prefix_len
+        report[REPORT_DATA_OFFSET:data_start] = bytes(header)
+        report[data_start : data_start + len(payload)] = payload
+
+        report[REPORT_CRC_OFFSET] = int(
+            np.bitwise_xor.reduce(np.frombuffer(report, dtype=np.uint8)[1:REPORT_CRC_OFFSET])
+        )
+        reports.append(bytes(report))
+
+    return reports
+
+
+@contextmanager
+def simulated_frame_uploads():
+    """
+    Route frame uploads for simulated devices through Python
+
+    Real devices are passed on to the native implementation.
+    """
+    native = hid.send_frame_async
+
+    async def send_frame_async(
+        device,
+        frame,
+        frame_id=0xFF,
+        transaction_id=0xFF,
+        is_extended=False,
+        row_offsets=None,
+        pre_delay_ms=7,
+        post_delay_ms=1,
+        previous=None,
+    ):
+        if not isinstance(device, SimulatedHIDDevice):
+            return await native(
+                device,
+                frame,
+                frame_id=frame_id,
+                transaction_id=transaction_id,
+                is_extended=is_extended,
+                row_offsets=row_offsets,
+                pre_delay_ms=pre_delay_ms,
+                post_delay_ms=post_delay_ms,
+                previous=previous,
+            )
+
+        start = time.perf_counter()
+        reports = _pack_frame(frame, previous, frame_id, transaction_id, is_extended, row_offsets)
+        packed = time.perf_counter()
+        if reports:
+            await asyncio.sleep(pre_delay_ms / 1000)
+            await device.send_reports(reports)
+            await asyncio.sleep(post_delay_ms / 1000)
+        done = time.perf_counter()
+
+        return SimpleNamespace(
+            packets=len(reports),
+            pack_us=int((packed - start) * 1e6),
+            lock_us=0,
+            transfer_us=int(device.latency * len(reports) * 1e6),
+            delay_us=(pre_delay_ms + post_delay_ms) * 1000 if reports else 0,
+            total_us=int((done - start) * 1e6),
+        )
+
+    hid.send_frame_async = send_frame_async
+    try:
+        yield
+    finally:
+        hid.send_frame_async = native
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Simulated devices
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class SimulatedDevice:
+    """
+    Driver mixin which talks to a SimulatedHIDDevice instead of USB
+
+    Preferences and learned command pacing are kept in memory so a run
+    never touches the user's files.
+    """
+
+    def __init__(self, *args, latency: float = 0.0, **kwargs):
+        self._latency = latency
+        super().__init__(*args, **kwargs)
+        self._bench_prefs = Preferences(serial=self.serial_number)
+        self._pacer = CommandPacer(self.product_id, self._pacer.default_ms)
+
+    @property
+    def preferences(self):
+        return self._bench_prefs
+
+    def _open_simulated(self):
+        if self._dev is None:
+            self._dev = SimulatedHIDDevice(
+                vendor_id=self.vendor_id, product_id=self.product_id, latency=self._latency
+            )
+            self._dev.open()
+        return True
+
+    def _ensure_open_sync(self) -> bool:
+        return self._open_simulated()
+
+    async def _ensure_open(self) -> bool:
+        return self._open_simulated()
+
+    def get_report(self, *args, **kwargs) -> SimulatedReport:
+        return SimulatedReport(super().get_report(*args, **kwargs))
+
+
+class SimulatedKeyboard(SimulatedDevice, UChromaKeyboard):
+    pass
+
+
+class SimulatedMouse(SimulatedDevice, UChromaMouse):
+    pass
+
+
+DEVICE_KINDS = {
+    "keyboard": (Hardware.Type.KEYBOARD, SimulatedKeyboard),
+    "mouse": (Hardware.Type.MOUSE, SimulatedMouse),
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Measurement
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class DeviceProbe:
+    """Per-device counters collected while the benchmark runs."""
+
+    kind: str
+    driver: SimulatedDevice
+    commits: list[float] = field(default_factory=list)
+    cpu_time: float = 0.0
+    memory: int = 0
+    first_frame: asyncio.Event = field(default_factory=asyncio.Event)
+    _reports: int = 0
+    _dropped: int = 0
+
+    def committed(self, seq: int):
+        self.commits.append(time.perf_counter())
+        self.first_frame.set()
+
+    def reset(self):
+        self.commits.clear()
+        self.cpu_time = 0.0
+        self._reports = self.driver.hid_device.reports if self.driver.hid_device else 0
+        self._dropped = self.driver.animation_manager.frame_stats().get("dropped_frames", 0)
+
+    def result(self, elapsed: float) -> dict:
+        driver = self.driver
+        stats = driver.animation_manager.frame_stats()
+        frames = len(self.commits)
+        frame_ms = RollingStats.summarize(np.diff(self.commits) * 1000.0)
+        reports = (driver.hid_device.reports if driver.hid_device else 0) - self._reports
+
+        return {
+            "device": f"{driver.name} #{driver.device_index}",
+            "kind": self.kind,
+            "size": f"{driver.height}x{driver.width}",
+            "frames": frames,
+            "fps": frames / elapsed,
+            "frame_ms": frame_ms,
+            "stages_p95_ms": {
+                stage: summary["p95"] for stage, summary in stats.get("stages", {}).items()
+            },
+            "dropped_frames": stats.get("dropped_frames", 0) - self._dropped,
+            "reports_per_sec": reports / elapsed,
+            "cpu_percent": self.cpu_time / elapsed * 100.0,
+            "cpu_ms_per_frame": self.cpu_time / frames * 1000.0 if frames else 0.0,
+            "memory_kib": self.memory / 1024.0,
+        }
+
+
+@contextmanager
+def cpu_accounting():
+    """
+    Attribute event loop CPU time to devices
+
+    Every callback the loop runs is charged to the device whose context
+    it was scheduled from. Tasks inherit the context of whoever created
+    them, so this covers renderers, composition and the transmit stage.
+    """
+    original = asyncio.events.Handle._run
+
+    def _run(handle):
+        context = handle._context
+        probe = context.get(_current_probe) if context is not None else None
+        if probe is None:
+            return original(handle)
+        start = time.thread_time()
+        try:
+            return original(handle)
+        finally:
+            probe.cpu_time += time.thread_time() - start
+
+    asyncio.events.Handle._run = _run
+    try:
+        yield
+    finally:
+        asyncio.events.Handle._run = original
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource  # noqa: PLC0415
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _resolve_renderers(driver, names: list[str]) -> list[str]:
+    available = list(driver.animation_manager.renderer_info.keys())
+    resolved = []
+    for name in names:
+        wanted = name.lower()
+        matches = [
+            key
+            for key in available
+            if wanted in (key.lower(), key.rsplit(".", 1)[-1].lower(), key.split(".")[-2])
+        ]
+        if not matches:
+            raise SystemExit(f"Unknown renderer: {name}")
+        resolved.append(matches[0])
+    return resolved
+
+
+def _lookup_hardware(kind: str, product_id: int) -> Hardware:
+    hardware = Hardware.get_device(product_id, DEVICE_KINDS[kind][0])
+    if hardware is None or hardware.dimensions is None:
+        raise SystemExit(f"No {kind} with a lighting matrix has product ID 0x{product_id:04x}")
+    return hardware
+
+
+async def _start_device(kind: str, hardware: Hardware, index: int, args) -> DeviceProbe:
+    device_class = DEVICE_KINDS[kind][1]
+    product_id = hardware.product_id
+    devinfo = SimpleNamespace(
+        vendor_id=RAZER_VENDOR_ID, product_id=product_id, serial_number=f"BENCH{index:04d}"
+    )
+    driver = device_class(
+        hardware, devinfo, index, f"/sys/bench/{index}", latency=args.latency_ms / 1000
+    )
+
+    probe = DeviceProbe(kind, driver)
+    _current_probe.set(probe)
+    driver.frame_control.frame_committed.connect(probe.committed)
+
+    for name in _resolve_renderers(driver, args.layers):
+        if driver.animation_manager.add_renderer(name, {}) < 0:
+            raise SystemExit(f"Failed to start renderer {name} on {driver.name}")
+
+    # Renderers pick their own rate in init(), so override it afterwards
+    if args.fps is not None:
+        for holder in driver.animation_manager._loop.layers:
+            holder.renderer.fps = args.fps
+
+    try:
+        await asyncio.wait_for(probe.first_frame.wait(), 5.0)
+    except TimeoutError:
+        driver.logger.warning("No frame committed within 5s")
+    return probe
+
+
+async def run_benchmark(args) -> dict:
+    """Start all devices, measure a steady-state window and tear down."""
+    specs = [("keyboard", _lookup_hardware("keyboard", args.keyboard_pid))] * args.keyboards
+    specs += [("mouse", _lookup_hardware("mouse", args.mouse_pid))] * args.mice
+
+    probes = []
+    with simulated_frame_uploads(), cpu_accounting():
+        # Memory retained by bringing each device up, measured one at a time
+        tracemalloc.start()
+        for index, (kind, hardware) in enumerate(specs):
+            before = tracemalloc.get_traced_memory()[0]
+            # Each device starts in its own task, so everything it spawns
+            # inherits its probe
+            probe = await asyncio.ensure_future(_start_device(kind, hardware, index, args))
+            probe.memory = tracemalloc.get_traced_memory()[0] - before
+            probes.append(probe)
+        tracemalloc.stop()
+
+        await asyncio.sleep(args.warmup)
+
+        for probe in probes:
+            probe.reset()
+        rss_start = _rss_bytes()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+
+        await asyncio.sleep(args.duration)
+
+        elapsed = time.perf_counter() - wall_start
+        cpu_total = time.process_time() - cpu_start
+        results = [probe.result(elapsed) for probe in probes]
+        rss_end = _rss_bytes()
+
+        for probe in probes:
+            await probe.driver.shutdown()
+
+    total_frames = sum(result["frames"] for result in results)
+    return {
+        "config": {
+            "keyboards": args.keyboards,
+            "mice": args.mice,
+            "layers": args.layers,
+            "fps": args.fps,
+            "latency_ms": args.latency_ms,
+            "duration": args.duration,
+        },
+        "devices": results,
+        "process": {
+            "elapsed": elapsed,
+            "fps": total_frames / elapsed,
+            "cpu_percent": cpu_total / elapsed * 100.0,
+            "rss_mib": rss_end / (1 << 20),
+            "rss_growth_kib": (rss_end - rss_start) / 1024.0,
+        },
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Reporting
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def print_report(report: dict):
+    config = report["config"]
+    print("UChroma Load Benchmark")
+    print("=" * 100)
+    print(
+        f"{config['keyboards']} keyboard(s), {config['mice']} mouse/mice, "
+        f"layers: {', '.join(config['layers'])} @ {config['fps'] or 'default'} fps, "
+        f"{config['latency_ms']:g} ms/report, {config['duration']:g}s"
+    )
+    print()
+
+    header = (
+        f"{'Device':<34} {'Size':>5} {'FPS':>6} {'p50':>6} {'p95':>6} {'p99':>6} {'max':>6} "
+        f"{'Drop':>5} {'Rep/s':>6} {'CPU%':>5} {'ms/fr':>6} {'KiB':>7}"
+    )
+    print(header)
+    print("-" * len(header))
+    for dev in report["devices"]:
+        frame_ms = dev["frame_ms"]
+        print(
+            f"{dev['device'][:34]:<34} {dev['size']:>5} {dev['fps']:>6.1f} "
+            f"{frame_ms['p50']:>6.1f} {frame_ms['p95']:>6.1f} {frame_ms['p99']:>6.1f} "
+            f"{frame_ms['max']:>6.1f} {dev['dropped_frames']:>5} "
+            f"{dev['reports_per_sec']:>6.0f} {dev['cpu_percent']:>5.1f} "
+            f"{dev['cpu_ms_per_frame']:>6.2f} {dev['memory_kib']:>7.0f}"
+        )
+
+    print()
+    print("Stage p95 (ms)")
+    for dev in report["devices"]:
+        stages = "  ".join(f"{k}={v:.2f}" for k, v in dev["stages_p95_ms"].items())
+        print(f"  {dev['device'][:34]:<34} {stages}")
+
+    process = report["process"]
+    print()
+    print(
+        f"Total: {process['fps']:.1f} frames/s, CPU {process['cpu_percent']:.1f}%, "
+        f"RSS {process['rss_mib']:.1f} MiB ({process['rss_growth_kib']:+.0f} KiB during run)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--keyboards", type=int, default=2, help="simulated keyboards")
+    parser.add_argument("--mice", type=int, default=2, help="simulated mice")
+    parser.add_argument(
+        "--keyboard-pid",
+        type=lambda v: int(v, 0),
+        default=0x0203,
+        help="product ID of the simulated keyboards (default: BlackWidow Chroma)",
+    )
+    parser.add_argument(
+        "--mouse-pid",
+        type=lambda v: int(v, 0),
+        default=0x0099,
+        help="product ID of the simulated mice (default: Basilisk V3)",
+    )
+    parser.add_argument(
+        "--layers",
+        type=lambda v: [name.strip() for name in v.split(",") if name.strip()],
+        default=["plasma", "rainbow"],
+        help="comma-separated renderer stack, bottom first (default: plasma,rainbow)",
+    )
+    parser.add_argument(
+        "--fps", type=float, default=None, help="override the renderers' frame rates (max 30)"
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=1.0, help="simulated transfer time per report"
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds before measuring")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(args))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@
 #
 """Tests for CLI commands."""
 
+from typing import ClassVar
+
 import pytest
 
 from uchroma.client.cli_base import UChromaCLI
@@ -101,6 +103,7 @@ class MockDeviceProxy:
         }
         self.CurrentRenderers = []
         self.CurrentFX = ("static", {})
+        self.FrameStats = {}
 
         # System control properties (laptops)
         self.HasSystemControl = is_laptop
@@ -134,6 +137,9 @@ class MockDeviceProxy:
     def StopAnimation(self):
         return True
 
+    def GetFrameStats(self):
+        return self.FrameStats
+
     def SetLayerTraits(self, zindex, traits):
         return True
 
@@ -220,6 +226,9 @@ class MockDeviceService(DeviceService):
     def set_layer_traits(self, device, zindex, traits):
         return device.SetLayerTraits(zindex, traits)
 
+    def get_frame_stats(self, device):
+        return device.GetFrameStats()
+
     # System control methods
     def has_system_control(self, device):
         return device.HasSystemControl
@@ -295,6 +304,7 @@ def mock_device_service(monkeypatch):
     monkeypatch.setattr("uchroma.client.commands.led.get_device_service", lambda: mock)
     monkeypatch.setattr("uchroma.client.commands.power.get_device_service", lambda: mock)
     monkeypatch.setattr("uchroma.client.commands.battery.get_device_service", lambda: mock)
+    monkeypatch.setattr("uchroma.client.commands.stats.get_device_service", lambda: mock)
     return mock
 
 
@@ -721,3 +731,65 @@ class TestBatteryCommand:
         # Test 'wireless' alias
         args = cli.parse_args(["wireless"])
         assert args.command == "wireless"
+
+
+class TestStatsCommand:
+    """Test stats command."""
+
+    SAMPLE_STATS: ClassVar[dict] = {
+        "stages": {
+            stage: {"count": 10, "p50": 1.0, "p95": 2.0, "p99": 3.0, "max": 4.0}
+            for stage in ("draw", "compose", "align", "transmit")
+        },
+        "layers": [
+            {
+                "zindex": 0,
+                "renderer": "uchroma.fxlib.plasma.Plasma",
+                "draw": {"count": 10, "p50": 1.0, "p95": 2.0, "p99": 3.0, "max": 4.0},
+                "late_ticks": 1,
+                "dropped_ticks": 2,
+            }
+        ],
+        "dropped_frames": 5,
+        "skipped_frames": 0,
+        "late_ticks": 0,
+        "dropped_ticks": 0,
+    }
+
+    def _run(self, argv, monkeypatch, stats):
+        from uchroma.client.commands.stats import StatsCommand
+
+        device = MockDeviceProxy()
+        device.FrameStats = stats
+        monkeypatch.setattr(
+            "uchroma.client.device_service._service.require_device", lambda spec: device
+        )
+
+        cli = UChromaCLI()
+        subparsers = cli.add_subparsers()
+        cmd = StatsCommand.register(cli, subparsers)
+        return cmd.run(cli.parse_args(argv))
+
+    def test_stats_table(self, monkeypatch, capsys):
+        result = self._run(["stats"], monkeypatch, self.SAMPLE_STATS)
+
+        assert result == 0
+        output = capsys.readouterr().out
+        for stage in ("draw", "compose", "align", "transmit"):
+            assert stage in output
+        assert "Plasma" in output
+        assert "dropped frames" in output
+
+    def test_stats_json(self, monkeypatch, capsys):
+        import json
+
+        result = self._run(["stats", "--json"], monkeypatch, self.SAMPLE_STATS)
+
+        assert result == 0
+        assert json.loads(capsys.readouterr().out) == self.SAMPLE_STATS
+
+    def test_stats_no_animation(self, monkeypatch, capsys):
+        result = self._run(["stats"], monkeypatch, {})
+
+        assert result == 0
+        assert "No animation running" in capsys.readouterr().out
@@ -205,6 +205,20 @@ def sample_report_bytes() -> bytes:
     return bytes(data)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Environment
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_dir(tmp_path_factory):
+    """Keep caches written during tests (e.g. the hardware index) out of ~/.cache."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(cache_dir))
+        yield cache_dir
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Pytest configuration
 # ─────────────────────────────────────────────────────────────────────────────
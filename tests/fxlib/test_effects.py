@@ -90,12 +90,12 @@ class TestRainbowRenderer:
         assert rainbow._gradient is not None
 
     def test_hue_gradient_creates_colors(self):
-        """_hue_gradient creates list of colors."""
+        """_hue_gradient creates an array of RGB colors."""
         from uchroma.fxlib.rainbow import Rainbow
 
         gradient = Rainbow._hue_gradient(0, 10)
-        assert len(gradient) == 10
-        assert all(isinstance(c, Color) for c in gradient)
+        assert gradient.shape == (10, 3)
+        np.testing.assert_allclose(gradient[0], Color.NewFromHsv(0, 1, 1).rgb)
 
     def test_draw_returns_true(self, rainbow, mock_frame, mock_layer):
         """Rainbow.draw returns True."""
@@ -119,15 +119,19 @@ class TestRainbowRenderer:
         new_offset = asyncio.run(run_test())
         assert new_offset == (initial_offset + 1) % len(rainbow._gradient)
 
-    def test_draw_calls_put_all(self, rainbow, mock_frame, mock_layer):
-        """Rainbow.draw calls layer.put_all."""
+    def test_draw_fills_matrix(self, rainbow, mock_frame, mock_layer):
+        """Rainbow.draw writes staggered gradient colors to every pixel."""
         rainbow.init(mock_frame)
+        gradient = rainbow._gradient
 
         async def run_test():
             await rainbow.draw(mock_layer, time.time())
 
         asyncio.run(run_test())
-        mock_layer.put_all.assert_called_once()
+        matrix = mock_layer.matrix
+        assert np.all(matrix[..., 3] == 1.0)
+        np.testing.assert_allclose(matrix[0, 5, :3], gradient[5])
+        np.testing.assert_allclose(matrix[2, 3, :3], gradient[2 * rainbow.stagger + 3])
 
     def test_draw_no_gradient_returns_false(self, rainbow, mock_layer):
         """Rainbow.draw returns False without gradient."""
@@ -180,7 +184,7 @@ class TestPlasmaRenderer:
     def test_init_creates_gradient(self, plasma, mock_frame):
         """Plasma.init creates gradient."""
         plasma.init(mock_frame)
-        assert plasma._gradient is not None
+        assert plasma._gradient_array is not None
 
     def test_init_sets_start_time(self, plasma, mock_frame):
         """Plasma.init sets start time."""
@@ -513,3 +517,132 @@ class TestCometsRenderer:
 
         result = asyncio.run(run_test())
         assert result is True
+
+    def test_draw_blends_trails_additively(self, comets, mock_frame, mock_layer):
+        """Overlapping trails add up and saturate at full brightness."""
+        from uchroma.fxlib.comets import Comet
+
+        comets.init(mock_frame)
+        comets._comets = [
+            Comet(x=5.0, y=2, speed=0.0, color=(1.0, 0.5, 0.0), trail=[(4.0, 2)]),
+            Comet(x=5.0, y=2, speed=0.0, color=(1.0, 0.5, 0.0), trail=[(4.0, 2)]),
+        ]
+
+        async def run_test():
+            return await comets.draw(mock_layer, time.time())
+
+        asyncio.run(run_test())
+        matrix = mock_layer.matrix
+        assert np.all(matrix[..., :3] <= 1.0)
+        # Heads overlap at col 5; trails at col 4
+        assert matrix[2, 5, 0] == 1.0
+        assert matrix[2, 4, 3] == 1.0
+        assert matrix[2, 4, 1] > 0.0
+        # Untouched pixels stay transparent
+        assert matrix[0, 0, 3] == 0.0
+
+    def test_draw_ignores_offscreen_points(self, comets, mock_frame, mock_layer):
+        """Trail points left of the matrix are not drawn."""
+        from uchroma.fxlib.comets import Comet
+
+        comets.init(mock_frame)
+        comets._comets = [
+            Comet(x=-3.0, y=1, speed=0.0, color=(0.0, 1.0, 1.0), trail=[(-5.0, 1), (-4.0, 1)]),
+        ]
+
+        async def run_test():
+            return await comets.draw(mock_layer, time.time())
+
+        assert asyncio.run(run_test()) is True
+        assert not np.any(mock_layer.matrix)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Typewriter Effect Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestTypewriterRenderer:
+    """Tests for Typewriter renderer."""
+
+    @pytest.fixture
+    def typewriter(self, mock_driver):
+        """Create Typewriter renderer with a fake input queue."""
+        from uchroma.fxlib.typewriter import Typewriter
+
+        renderer = Typewriter(mock_driver)
+        renderer._input_queue = MagicMock()
+        renderer._input_queue.attach.return_value = True
+        renderer._input_queue.get_events_nowait.return_value = []
+        return renderer
+
+    @staticmethod
+    def _key_event(row, col):
+        event = MagicMock()
+        event.coords = [MagicMock(x=col, y=row)]
+        return event
+
+    def test_draw_without_init_returns_false(self, typewriter, mock_layer):
+        """Typewriter.draw returns False before init."""
+
+        async def run_test():
+            return await typewriter.draw(mock_layer, time.time())
+
+        assert asyncio.run(run_test()) is False
+
+    def test_idle_keys_glow_at_base_brightness(self, typewriter, mock_frame, mock_layer):
+        """With no input every key shows the base glow."""
+        typewriter.init(mock_frame)
+
+        async def run_test():
+            return await typewriter.draw(mock_layer, time.time())
+
+        assert asyncio.run(run_test()) is True
+        glow = np.array(typewriter._glow_rgb) * typewriter.base_brightness
+        np.testing.assert_allclose(mock_layer.matrix[..., :3], np.broadcast_to(glow, (6, 22, 3)))
+        assert np.all(mock_layer.matrix[..., 3] == 1.0)
+
+    def test_keypress_lights_key_and_neighbors(self, typewriter, mock_frame, mock_layer):
+        """A keypress peaks the key and spreads to its neighbors."""
+        typewriter.init(mock_frame)
+        typewriter._input_queue.get_events_nowait.return_value = [self._key_event(0, 0)]
+
+        async def run_test():
+            return await typewriter.draw(mock_layer, time.time())
+
+        asyncio.run(run_test())
+        brightness = typewriter._brightness
+        decay = typewriter._decay_factor
+        assert brightness[0, 0] == pytest.approx(typewriter.peak_brightness * decay)
+        spread = typewriter.peak_brightness * typewriter.spread * decay
+        assert brightness[1, 1] == pytest.approx(spread)
+        assert brightness[0, 2] == 0.0
+        # Brightest key is shifted toward white
+        assert mock_layer.matrix[0, 0, 2] > typewriter._glow_rgb[2] * brightness[0, 0]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Alignment Effect Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestAlignmentRenderer:
+    """Tests for Alignment renderer."""
+
+    def test_draws_column_pattern_and_cursor(self, mock_driver):
+        """Columns cycle through the palette with a white cursor on top."""
+        from uchroma.fxlib.alignment import COLUMN_COLORS, Alignment
+        from uchroma.layer import Layer
+
+        renderer = Alignment(mock_driver)
+        renderer.cur_row = 2
+        renderer.cur_col = 7
+        layer = Layer(width=22, height=6)
+
+        assert asyncio.run(renderer.draw(layer, time.time())) is True
+
+        for col in (0, 1, 6, 13):
+            expected = tuple(COLUMN_COLORS[col % len(COLUMN_COLORS)])[:3]
+            np.testing.assert_allclose(layer.matrix[:, col, :3], np.tile(expected, (6, 1)))
+        np.testing.assert_allclose(layer.matrix[2, 7], [1.0, 1.0, 1.0, 1.0])
+        assert np.all(layer.matrix[..., 3] == 1.0)
@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -166,11 +167,11 @@ class TestRendererInit:
         assert renderer.zindex == -1
 
     def test_init_creates_queues(self, renderer):
-        """Renderer creates available and active queues."""
+        """Renderer creates the available queue and the active slot."""
         assert hasattr(renderer, "_avail_q")
-        assert hasattr(renderer, "_active_q")
+        assert hasattr(renderer, "_active_slot")
         assert renderer._avail_q.maxsize == NUM_BUFFERS
-        assert renderer._active_q.maxsize == NUM_BUFFERS
+        assert renderer._active_slot.empty()
 
     def test_init_creates_ticker(self, renderer):
         """Renderer creates Ticker with default fps."""
@@ -359,15 +360,15 @@ class TestRendererQueueManagement:
         """_flush clears queues when not running."""
         # Add items to queues
         renderer._avail_q.put_nowait(MagicMock())
-        renderer._active_q.put_nowait(MagicMock())
+        renderer._active_slot.put(MagicMock())
 
         assert renderer._avail_q.qsize() == 1
-        assert renderer._active_q.qsize() == 1
+        assert not renderer._active_slot.empty()
 
         renderer._flush()
 
         assert renderer._avail_q.qsize() == 0
-        assert renderer._active_q.qsize() == 0
+        assert renderer._active_slot.empty()
 
     def test_flush_noop_when_running(self, renderer):
         """_flush is noop when running."""
@@ -484,7 +485,7 @@ class TestRendererAsync:
         assert layer.opacity == 0.5
 
     def test_run_locks_and_queues_layer_on_success(self, renderer):
-        """_run locks layer and puts in active queue on draw success."""
+        """_run locks layer and puts it in the active slot on draw success."""
 
         async def run_test():
             layer = MagicMock()
@@ -496,11 +497,47 @@ class TestRendererAsync:
                 renderer.running = False
 
             await asyncio.gather(renderer._run(), stop_after_draw())
-            return layer, renderer._active_q.qsize()
+            return layer, renderer._active_slot.get_nowait()
 
-        layer, qsize = asyncio.run(run_test())
+        layer, active = asyncio.run(run_test())
         layer.lock.assert_called_with(True)
-        assert qsize == 1
+        assert active is layer
+
+    def test_run_recycles_untaken_layer(self, renderer):
+        """A drawn layer replaces one the loop never took, which is freed."""
+
+        async def run_test():
+            stale = MagicMock()
+            renderer._active_slot.put(stale)
+            renderer._avail_q.put_nowait(MagicMock())
+            renderer._draw_result = True
+
+            async def stop_after_draw():
+                await asyncio.sleep(0.01)
+                renderer.running = False
+
+            await asyncio.gather(renderer._run(), stop_after_draw())
+            return stale
+
+        stale = asyncio.run(run_test())
+        stale.lock.assert_called_with(False)
+        stale.clear.assert_called_once()
+
+    def test_run_records_draw_time(self, renderer):
+        """_run records the duration of each draw."""
+
+        async def run_test():
+            renderer._avail_q.put_nowait(MagicMock())
+
+            async def stop_after_draw():
+                await asyncio.sleep(0.01)
+                renderer.running = False
+
+            await asyncio.gather(renderer._run(), stop_after_draw())
+
+        asyncio.run(run_test())
+        assert renderer.draw_stats.count == 1
+        assert renderer.draw_stats.samples[0] >= 0.0
 
     def test_run_handles_draw_exception(self, mock_driver):
         """_run handles exceptions in draw gracefully."""
@@ -557,6 +594,146 @@ class TestRendererAsync:
             asyncio.run(run_test())
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Draw Offload Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestRendererDrawOffload:
+    """Tests for running draw() on the worker pool."""
+
+    def test_offload_disabled_by_default(self, renderer):
+        """Renderers draw on the event loop unless they opt in."""
+        assert renderer.offload_draw is False
+
+    def test_offloaded_draw_runs_on_worker_thread(self, mock_driver):
+        """Offloaded draw() runs off the event loop thread."""
+
+        class ThreadRenderer(ConcreteRenderer):
+            offload_draw = True
+
+            async def draw(self, layer, timestamp):
+                self.draw_thread = threading.current_thread()
+                return True
+
+        async def run_test():
+            renderer = ThreadRenderer(mock_driver)
+            status = await renderer._draw(MagicMock(), 0.0)
+            return renderer, status
+
+        renderer, status = asyncio.run(run_test())
+        assert status is True
+        assert renderer.draw_thread is not threading.main_thread()
+
+    def test_offloaded_draw_must_not_suspend(self, mock_driver):
+        """An offloaded draw() which awaits raises instead of hanging."""
+
+        class SuspendingRenderer(ConcreteRenderer):
+            offload_draw = True
+
+            async def draw(self, layer, timestamp):
+                await asyncio.sleep(0)  # suspends without needing the event loop
+                return True
+
+        async def run_test():
+            renderer = SuspendingRenderer(mock_driver)
+            await renderer._draw(MagicMock(), 0.0)
+
+        with pytest.raises(RuntimeError, match="must not suspend"):
+            asyncio.run(run_test())
+
+    def test_draw_sync_without_event_loop(self, renderer):
+        """draw_sync() runs draw() to completion with no loop running."""
+        assert renderer.draw_sync(MagicMock(), 0.0) is True
+        assert renderer._draw_count == 1
+
+    def test_offloaded_draw_queues_layer(self, mock_driver):
+        """Layers drawn on the worker pool still reach the active slot."""
+
+        class OffloadRenderer(ConcreteRenderer):
+            offload_draw = True
+
+        async def run_test():
+            renderer = OffloadRenderer(mock_driver)
+            renderer._avail_q.put_nowait(MagicMock())
+
+            async def stop_after_draw():
+                await asyncio.sleep(0.05)
+                renderer.running = False
+
+            await asyncio.gather(renderer._run(), stop_after_draw())
+            return renderer._active_slot.empty()
+
+        assert asyncio.run(run_test()) is False
+
+    def test_trait_change_waits_for_offloaded_draw(self, mock_driver):
+        """Traits set during an offloaded draw() apply after it returns."""
+        started = threading.Event()
+        release = threading.Event()
+        events = []
+
+        class SlowRenderer(ConcreteRenderer):
+            offload_draw = True
+
+            async def draw(self, layer, timestamp):
+                started.set()
+                release.wait(5)
+                events.append(("drawn", self.opacity))
+                return True
+
+        renderer = SlowRenderer(mock_driver)
+        drawer = threading.Thread(target=renderer.draw_sync, args=(MagicMock(), 0.0))
+        drawer.start()
+        started.wait(5)
+
+        def set_opacity():
+            renderer.opacity = 0.5
+            events.append(("set", renderer.opacity))
+
+        setter = threading.Thread(target=set_opacity)
+        setter.start()
+        setter.join(0.05)
+        release.set()
+        drawer.join(5)
+        setter.join(5)
+
+        assert events == [("drawn", 1.0), ("set", 0.5)]
+
+    def test_stop_waits_for_offloaded_draw(self, mock_driver):
+        """Layers are not flushed while a cancelled draw() still runs."""
+        started = threading.Event()
+        release = threading.Event()
+        events = []
+
+        class SlowRenderer(ConcreteRenderer):
+            offload_draw = True
+
+            async def draw(self, layer, timestamp):
+                started.set()
+                release.wait(5)
+                events.append("drawn")
+                return True
+
+            def _flush(self):
+                events.append("flushed")
+                super()._flush()
+
+        async def run_test():
+            renderer = SlowRenderer(mock_driver)
+            renderer._avail_q.put_nowait(MagicMock())
+            task = asyncio.ensure_future(renderer._run())
+
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            task.cancel()
+            stop = asyncio.ensure_future(renderer._stop())
+            await asyncio.sleep(0.05)
+            release.set()
+            await asyncio.wait([task, stop])
+
+        asyncio.run(run_test())
+        assert events == ["drawn", "flushed"]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Meta Property Tests
 # ─────────────────────────────────────────────────────────────────────────────
@@ -182,6 +182,192 @@ class TestAnimationLoop:
         result = loop._dequeue_nowait(10)  # No layers
         assert result is False
 
+    def test_get_layers_waits_for_any_renderer(self, mock_frame):
+        """_get_layers yields until any slot has a buffer, then takes all ready ones."""
+        from uchroma.server.anim import AnimationLoop
+        from uchroma.util import Mailbox
+
+        loop = AnimationLoop(mock_frame)
+        loop.running = True  # don't start the loop when the layers are added
+
+        holders = []
+        for _ in range(3):
+            holder = MagicMock(active_buf=None)
+            holder.renderer._active_slot = Mailbox(loop._layers_ready)
+            holders.append(holder)
+        loop.layers = holders
+
+        async def run_test():
+            getter = asyncio.ensure_future(loop._get_layers())
+            await asyncio.sleep(0)
+            assert not getter.done()
+
+            holders[1].renderer._active_slot.put("b")
+            holders[2].renderer._active_slot.put("c")
+            await asyncio.wait_for(getter, timeout=1.0)
+
+        asyncio.run(run_test())
+        assert [holder.active_buf for holder in holders] == [None, "b", "c"]
+
+    def test_dequeue_nowait_frees_previous_buffer(self, mock_frame):
+        """Taking a new buffer returns the previous one to the renderer."""
+        from uchroma.server.anim import AnimationLoop
+        from uchroma.util import Mailbox
+
+        loop = AnimationLoop(mock_frame)
+        loop.running = True
+
+        holder = MagicMock(active_buf="old")
+        holder.renderer._active_slot = Mailbox()
+        holder.renderer._active_slot.put("new")
+        loop.layers = [holder]
+
+        assert loop._dequeue_nowait(0) is True
+        assert holder.active_buf == "new"
+        holder.renderer._free_layer.assert_called_once_with("old")
+        assert loop._dequeue_nowait(0) is False
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# AnimationLoop Transmit Stage Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestAnimationLoopTransmit:
+    """Tests for the pipelined compose/transmit stages."""
+
+    def test_commit_layers_queues_composed_frame(self, mock_frame):
+        """Composition hands the frame to the transmit mailbox."""
+        from uchroma.server.anim import AnimationLoop
+
+        loop = AnimationLoop(mock_frame)
+        holder = MagicMock()
+        holder.active_buf = MagicMock()
+        loop._sorted_layers = [holder]
+        loop._layers_dirty = False
+        mock_frame.compose = MagicMock(return_value="img")
+        mock_frame.commit_image = AsyncMock()
+
+        asyncio.run(loop._commit_layers())
+
+        mock_frame.compose.assert_called_once_with([holder.active_buf])
+        mock_frame.commit_image.assert_not_called()
+        assert loop._tx_mailbox.get_nowait() == "img"
+
+    def test_transmit_sends_latest_frame(self, mock_frame):
+        """A slow transmitter drops stale frames in favor of the newest."""
+        from uchroma.server.anim import AnimationLoop
+
+        loop = AnimationLoop(mock_frame)
+        sent = []
+
+        async def commit_image(img):
+            sent.append(img)
+            loop.running = False
+
+        mock_frame.commit_image = commit_image
+
+        async def run():
+            loop.running = True
+            loop._tx_mailbox.put("stale")
+            loop._tx_mailbox.put("latest")
+            await asyncio.wait_for(loop._transmit(), timeout=1.0)
+
+        asyncio.run(run())
+
+        assert sent == ["latest"]
+        assert loop.dropped_frames == 1
+
+    def test_transmit_error_stops_loop(self, mock_frame):
+        """A failed upload flags the error and stops the animation."""
+        from uchroma.server.anim import AnimationLoop
+
+        loop = AnimationLoop(mock_frame)
+        mock_frame.commit_image = AsyncMock(side_effect=OSError("gone"))
+
+        async def run():
+            loop.running = True
+            loop._tx_mailbox.put("img")
+            with patch.object(loop, "_stop", new=AsyncMock()) as mock_stop:
+                await asyncio.wait_for(loop._transmit(), timeout=1.0)
+                mock_stop.assert_awaited_once()
+
+        asyncio.run(run())
+
+        assert loop._error is True
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# AnimationLoop Stats Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestAnimationLoopStats:
+    """Tests for frame pipeline instrumentation."""
+
+    @pytest.fixture
+    def stats_frame(self, mock_frame):
+        from uchroma.util import RollingStats
+
+        mock_frame.align_stats = RollingStats()
+        mock_frame.transmit_stats = RollingStats()
+        mock_frame.skipped_frames = 3
+        return mock_frame
+
+    def test_commit_layers_records_compose_time(self, stats_frame):
+        """Each composition adds a compose sample."""
+        from uchroma.server.anim import AnimationLoop
+
+        loop = AnimationLoop(stats_frame)
+        holder = MagicMock()
+        holder.active_buf = MagicMock()
+        loop._sorted_layers = [holder]
+        loop._layers_dirty = False
+        stats_frame.compose = MagicMock(return_value="img")
+
+        asyncio.run(loop._commit_layers())
+        asyncio.run(loop._commit_layers())
+
+        assert loop.stats()["stages"]["compose"]["count"] == 2
+
+    def test_stats_reports_stages_layers_and_counters(self, stats_frame):
+        """Stats cover every stage, each layer and the drop counters."""
+        from uchroma.server.anim import AnimationLoop
+        from uchroma.util import RollingStats, Ticker
+
+        loop = AnimationLoop(stats_frame)
+        stats_frame.transmit_stats.add(0.004)
+
+        renderer = MagicMock()
+        renderer.draw_stats = RollingStats()
+        for value in (0.001, 0.002, 0.003):
+            renderer.draw_stats.add(value)
+        renderer.ticker = Ticker(1 / 15)
+        holder = MagicMock(zindex=0, type_string="uchroma.fxlib.plasma.Plasma")
+        holder.renderer = renderer
+        loop.running = True  # don't start the loop when the layer is added
+        loop.layers = [holder]
+
+        stats = loop.stats()
+
+        assert set(stats["stages"]) == {"draw", "compose", "align", "transmit"}
+        assert stats["stages"]["draw"]["count"] == 3
+        assert stats["stages"]["draw"]["max"] == pytest.approx(3.0)
+        assert stats["stages"]["transmit"]["p50"] == pytest.approx(4.0)
+        assert stats["layers"][0]["renderer"] == "uchroma.fxlib.plasma.Plasma"
+        assert stats["layers"][0]["draw"]["p50"] == pytest.approx(2.0)
+        assert stats["layers"][0]["late_ticks"] == 0
+        assert stats["skipped_frames"] == 3
+        assert stats["dropped_frames"] == 0
+
+    def test_manager_stats_empty_without_loop(self, mock_driver):
+        """No stats are reported before an animation exists."""
+        from uchroma.server.anim import AnimationManager
+
+        with patch.object(AnimationManager, "_discover_renderers", return_value={}):
+            animgr = AnimationManager(mock_driver)
+        assert animgr.frame_stats() == {}
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # LayerHolder Tests
@@ -199,6 +385,7 @@ class TestLayerHolder:
         renderer.zindex = 0
         renderer._flush = MagicMock()
         renderer._free_layer = MagicMock()
+        renderer._active_slot = MagicMock()
         renderer.observe = MagicMock()
         renderer.finish = MagicMock()
         renderer._run = AsyncMock()
@@ -212,7 +399,6 @@ class TestLayerHolder:
         holder = LayerHolder(mock_renderer, mock_frame)
         assert holder._renderer is mock_renderer
         assert holder._frame is mock_frame
-        assert holder.waiter is None
         assert holder.active_buf is None
         assert holder.task is None
 
@@ -285,17 +471,17 @@ class TestLayerHolder:
         result = asyncio.run(run_test())
         assert result is True
 
-    def test_stop_cancels_waiter_when_renderer_not_running(self, mock_frame, mock_renderer):
-        """LayerHolder.stop cancels waiter task even when renderer is not running."""
+    def test_stop_cancels_task_when_renderer_not_running(self, mock_frame, mock_renderer):
+        """LayerHolder.stop cancels the renderer task even when renderer is not running."""
         from uchroma.server.anim import LayerHolder
 
         mock_renderer.running = False
         holder = LayerHolder(mock_renderer, mock_frame)
 
         async def run_test():
-            holder.waiter = asyncio.create_task(asyncio.sleep(10))
+            holder.task = asyncio.create_task(asyncio.sleep(10))
             await holder.stop()
-            return holder.waiter.cancelled() and mock_renderer.finish.called
+            return holder.task.cancelled() and mock_renderer.finish.called
 
         result = asyncio.run(run_test())
         assert result is True
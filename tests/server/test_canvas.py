@@ -0,0 +1,310 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+
+# uchroma - SharedCanvas unit tests
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+from dbus_fast.errors import DBusError
+
+from uchroma.server.canvas import SharedCanvas, Viewport, _sample_index
+from uchroma.server.dbus import DeviceManagerAPI
+from uchroma.util import Signal
+
+
+class _FakeDriver:
+    """Device stand-in which records committed images."""
+
+    def __init__(self, key, width, height):
+        self.key = key
+        self.name = key
+        self.width = width
+        self.height = height
+        self.suspended = False
+        self.is_animating = False
+        self.fx_manager = None
+        self.images = []
+
+        self.frame_control = MagicMock()
+        self.frame_control.commit_image = AsyncMock(side_effect=self.images.append)
+
+        self.animation_manager = MagicMock()
+        self.animation_manager.running = False
+        self.animation_manager.state_changed = Signal()
+        self.animation_manager.stop_async = AsyncMock()
+
+        self.reset = AsyncMock()
+
+
+def _image(canvas):
+    """Canvas image where each pixel encodes its own position."""
+    img = np.zeros((canvas.height, canvas.width, 3), dtype=np.uint8)
+    img[..., 0] = np.arange(canvas.height)[:, None]
+    img[..., 1] = np.arange(canvas.width)[None, :]
+    return img
+
+
+async def _settle():
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Sampling Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestSampleIndex:
+    """Tests for viewport resampling."""
+
+    def test_identity(self):
+        """A full viewport at canvas size samples every pixel once."""
+        rows, cols = _sample_index(Viewport(0, 0, 8, 4), 4, 8, 4, 8)
+        assert rows.tolist() == [0, 1, 2, 3]
+        assert cols.tolist() == list(range(8))
+
+    def test_downsample(self):
+        """A smaller device samples evenly spaced pixels."""
+        rows, cols = _sample_index(Viewport(0, 0, 8, 4), 4, 8, 1, 4)
+        assert rows.tolist() == [2]
+        assert cols.tolist() == [1, 3, 5, 7]
+
+    def test_offset_viewport(self):
+        """Viewports are offset into the canvas and clipped to its bounds."""
+        rows, cols = _sample_index(Viewport(6, 0, 4, 1), 4, 8, 1, 4)
+        assert rows.tolist() == [0]
+        assert cols.tolist() == [6, 7, 7, 7]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Fan-out Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestSharedCanvas:
+    """Tests for attaching devices and distributing frames."""
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            SharedCanvas("bad", 0, 4)
+
+    def test_frames_fan_out(self):
+        """One composed image reaches every device at its own size."""
+
+        async def run():
+            canvas = SharedCanvas("desk", 8, 4)
+            keyboard = _FakeDriver("kbd", 8, 4)
+            strip = _FakeDriver("strip", 4, 1)
+
+            assert await canvas.attach(keyboard)
+            assert await canvas.attach(strip, Viewport(0, 2, 8, 2))
+            assert canvas.devices == [keyboard, strip]
+
+            img = _image(canvas)
+            await canvas.frame_control.commit_image(img)
+            await _settle()
+
+            assert np.array_equal(keyboard.images[0], img)
+            assert strip.images[0].shape == (1, 4, 3)
+            assert strip.images[0][0, :, 0].tolist() == [3, 3, 3, 3]
+            assert strip.images[0][0, :, 1].tolist() == [1, 3, 5, 7]
+            assert canvas.stats()["kbd"] == {"frames": 1, "dropped_frames": 0}
+
+            await canvas.shutdown()
+
+        asyncio.run(run())
+
+    def test_attach_stops_device_animation(self):
+        async def run():
+            canvas = SharedCanvas("desk", 8, 4)
+            driver = _FakeDriver("kbd", 8, 4)
+            driver.is_animating = True
+
+            await canvas.attach(driver)
+            driver.animation_manager.stop_async.assert_awaited_once()
+            await canvas.shutdown()
+
+        asyncio.run(run())
+
+    def test_attach_without_matrix(self):
+        async def run():
+            canvas = SharedCanvas("desk", 8, 4)
+            driver = _FakeDriver("mouse", 1, 1)
+            driver.frame_control = None
+
+            assert not await canvas.attach(driver)
+            assert canvas.devices == []
+
+        asyncio.run(run())
+
+    def test_slow_device_drops_only_its_frames(self):
+        """Frames queued behind a busy device are replaced, not backlogged."""
+
+        async def run():
+            canvas = SharedCanvas("desk", 8, 4)
+            fast = _FakeDriver("fast", 8, 4)
+            slow = _FakeDriver("slow", 8, 4)
+            release = asyncio.Event()
+
+            async def stall(img):
+                slow.images.append(img)
+                await release.wait()
+
+            slow.frame_control.commit_image = AsyncMock(side_effect=stall)
+
+            await canvas.attach(fast)
+            await canvas.attach(slow)
+
+            for _ in range(3):
+                await canvas.frame_control.commit_image(_image(canvas))
+                await _settle()
+
+            release.set()
+            await _settle()
+
+            stats = canvas.stats()
+            assert stats["fast"] == {"frames": 3, "dropped_frames": 0}
+            assert stats["slow"]["dropped_frames"] == 1
+            assert len(slow.images) == 2
+
+            await canvas.shutdown()
+
+        asyncio.run(run())
+
+    def test_detach_resets_device(self):
+        async def run():
+            canvas = SharedCanvas("desk", 8, 4)
+            driver = _FakeDriver("kbd", 8, 4)
+
+            await canvas.attach(driver)
+            assert await canvas.detach(driver)
+            assert not await canvas.detach(driver)
+            driver.reset.assert_awaited_once()
+
+            await canvas.frame_control.commit_image(_image(canvas))
+            await _settle()
+            assert driver.images == []
+
+        asyncio.run(run())
+
+    def test_device_animation_detaches(self):
+        """Starting an animation on an attached device takes it off the canvas."""
+
+        async def run():
+            canvas = SharedCanvas("desk", 8, 4)
+            driver = _FakeDriver("kbd", 8, 4)
+            await canvas.attach(driver)
+
+            driver.animation_manager.running = True
+            driver.animation_manager.state_changed.fire("running")
+            await _settle()
+
+            assert canvas.devices == []
+            driver.reset.assert_not_awaited()
+
+        asyncio.run(run())
+
+    def test_failed_commit_detaches(self):
+        async def run():
+            canvas = SharedCanvas("desk", 8, 4)
+            driver = _FakeDriver("kbd", 8, 4)
+            driver.frame_control.commit_image = AsyncMock(side_effect=OSError("gone"))
+            await canvas.attach(driver)
+
+            await canvas.frame_control.commit_image(_image(canvas))
+            await _settle()
+
+            assert canvas.devices == []
+
+        asyncio.run(run())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# D-Bus Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _manager_api(*drivers):
+    """DeviceManagerAPI over a stand-in device manager holding drivers."""
+    canvases = {}
+
+    def create_canvas(name, width, height):
+        canvases[name] = SharedCanvas(name, width, height)
+        return canvases[name]
+
+    async def remove_canvas(name):
+        canvas = canvases.pop(name, None)
+        if canvas is not None:
+            await canvas.shutdown()
+        return canvas is not None
+
+    dm = MagicMock()
+    dm.callbacks = []
+    dm.canvases = canvases
+    dm.create_canvas = create_canvas
+    dm.remove_canvas = remove_canvas
+
+    api = DeviceManagerAPI(dm, MagicMock())
+    api._bus = MagicMock()
+    for driver in drivers:
+        devapi = MagicMock(driver=driver, bus_path=f"/io/uchroma/test/{driver.key}")
+        api._devs[driver.key] = devapi
+    return api
+
+
+class TestCanvasDBus:
+    """Tests for managing canvases over D-Bus."""
+
+    def test_create_attach_remove(self):
+        async def run():
+            driver = _FakeDriver("kbd", 8, 4)
+            api = _manager_api(driver)
+
+            assert api.create_canvas("desk", 16, 4) == "/io/uchroma/canvas/desk"
+            assert "/io/uchroma/canvas/desk" in api.build_managed_objects()
+
+            assert await api.attach_canvas("desk", "/io/uchroma/test/kbd", (8, 0, 8, 4))
+            canvas = api._dm.canvases["desk"]
+            assert canvas.viewport(driver) == Viewport(8, 0, 8, 4)
+            assert api.device_paths(canvas.devices) == ["/io/uchroma/test/kbd"]
+
+            assert await api.remove_canvas("desk")
+            assert api.canvas_paths() == []
+            assert canvas.devices == []
+
+        asyncio.run(run())
+
+    def test_empty_viewport_is_whole_canvas(self):
+        async def run():
+            driver = _FakeDriver("kbd", 8, 4)
+            api = _manager_api(driver)
+            api.create_canvas("desk", 16, 4)
+
+            await api.attach_canvas("desk", "/io/uchroma/test/kbd", (0, 0, 0, 0))
+            assert api._dm.canvases["desk"].viewport(driver) == Viewport(0, 0, 16, 4)
+            await api.remove_canvas("desk")
+
+        asyncio.run(run())
+
+    def test_invalid_requests(self):
+        async def run():
+            api = _manager_api(_FakeDriver("kbd", 8, 4))
+
+            with pytest.raises(DBusError):
+                api.create_canvas("not/a name", 16, 4)
+            with pytest.raises(DBusError):
+                api.create_canvas("desk", 0, 4)
+            with pytest.raises(DBusError):
+                await api.attach_canvas("desk", "/io/uchroma/test/kbd", (0, 0, 0, 0))
+
+            api.create_canvas("desk", 16, 4)
+            with pytest.raises(DBusError):
+                await api.attach_canvas("desk", "/io/uchroma/test/mouse", (0, 0, 0, 0))
+            await api.remove_canvas("desk")
+
+        asyncio.run(run())
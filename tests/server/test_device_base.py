@@ -11,7 +11,9 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
-from uchroma.server.device_base import BaseUChromaDevice
+from uchroma.server import hid
+from uchroma.server.device_base import BUSY_RETRIES, BaseUChromaDevice
+from uchroma.server.pacing import CommandPacer
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Fixtures
@@ -77,6 +79,9 @@ def device(mock_hardware, mock_devinfo):
             sys_path="/sys/devices/test",
             input_devices=None,
         )
+        # Stopped, so idle handles can be released
+        dev._animation_manager.running = False
+        dev._prefs = MagicMock()
         return dev
 
 
@@ -437,6 +442,128 @@ class TestBaseUChromaDeviceOpenClose:
                 mock_open.assert_called_once()
             mock_close.assert_called_once()
 
+    def test_close_without_loop_releases_handle(self, device):
+        """Outside an event loop an unused handle is closed right away."""
+        mock_dev = MagicMock()
+        device._dev = mock_dev
+
+        device.close()
+
+        mock_dev.close.assert_called_once()
+        assert device.handle_stats()["closes"] == 1
+
+    def test_idle_handle_kept_open(self, device):
+        """An unused handle stays open until the idle timeout expires."""
+
+        async def run():
+            device.handle_idle_timeout = 0.01
+            mock_dev = MagicMock()
+            device._dev = mock_dev
+
+            device.close()
+            assert device._dev is mock_dev
+
+            await asyncio.sleep(0.05)
+            mock_dev.close.assert_called_once()
+            assert device._dev is None
+
+        asyncio.run(run())
+
+    def test_open_cancels_idle_close(self, device):
+        """Reusing a handle before it expires keeps it open."""
+
+        async def run():
+            device.handle_idle_timeout = 0.01
+            mock_dev = MagicMock()
+            device._dev = mock_dev
+            device.close()
+
+            async with device.device_open():
+                await asyncio.sleep(0.05)
+                mock_dev.close.assert_not_called()
+
+            stats = device.handle_stats()
+            assert stats["open"] is True
+            assert stats["opens"] == 0
+            device.close(force=True)
+
+        asyncio.run(run())
+
+    def test_zero_handle_idle_timeout_closes_immediately(self, device):
+        async def run():
+            device.handle_idle_timeout = 0
+            mock_dev = MagicMock()
+            device._dev = mock_dev
+
+            device.close()
+            mock_dev.close.assert_called_once()
+
+        asyncio.run(run())
+
+    def test_handle_idle_timeout_is_saved(self, device):
+        device.handle_idle_timeout = 5
+        assert device.preferences.handle_idle_timeout == 5.0
+        assert device.handle_stats()["handle_idle_timeout"] == 5.0
+
+    def test_handle_idle_timeout_restored(self, device):
+        device.preferences.brightness = None
+        device.preferences.handle_idle_timeout = 2.5
+
+        device.fire_restore_prefs()
+        assert device.handle_idle_timeout == 2.5
+
+    def test_open_counts_new_handles(self, device):
+        """Only opens which create a handle are counted."""
+
+        def ensure_open():
+            device._dev = MagicMock()
+            return True
+
+        with patch.object(device, "_ensure_open_sync", side_effect=ensure_open):
+            device._device_open_sync()
+            device._device_close()
+            assert device.handle_stats()["opens"] == 1
+
+    def test_reopen_idle_handle(self, device):
+        """reopen replaces an idle handle immediately."""
+
+        async def run():
+            old_dev = MagicMock()
+            new_dev = MagicMock()
+            device._dev = old_dev
+
+            async def ensure_open():
+                device._dev = new_dev
+                return True
+
+            with patch.object(device, "_ensure_open", side_effect=ensure_open):
+                assert await device.reopen()
+
+            old_dev.close.assert_called_once()
+            assert device._dev is new_dev
+            assert device.handle_stats()["reopens"] == 1
+            device.close(force=True)
+
+        asyncio.run(run())
+
+    def test_reopen_in_use_handle_deferred(self, device):
+        """A handle in use is dropped when its last user releases it."""
+
+        async def run():
+            mock_dev = MagicMock()
+            device._dev = mock_dev
+            device._ref_count = 1
+
+            assert not await device.reopen()
+            mock_dev.close.assert_not_called()
+
+            device._device_close()
+            mock_dev.close.assert_called_once()
+            assert device._dev is None
+            assert device.handle_stats()["reopens"] == 1
+
+        asyncio.run(run())
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Report Tests
@@ -474,6 +601,76 @@ class TestBaseUChromaDeviceReports:
         """_get_timeout_cb returns None by default."""
         assert device._get_timeout_cb() is None
 
+    def test_run_report_retries_busy(self, device):
+        """A BUSY answer widens the pacing gap and the report is retried."""
+        device._pacer = CommandPacer(0x0227, 4)
+        device._dev = MagicMock()
+        report = MagicMock()
+        report.get_remaining_packets.return_value = 0
+        report.run_async = AsyncMock(side_effect=[(hid.Status.Busy, b""), (hid.Status.Ok, b"\x01")])
+
+        with patch("uchroma.server.device_base.BUSY_BACKOFF", 0):
+            assert asyncio.run(device.run_report(report)) == (True, b"\x01")
+
+        assert [call.args[1] for call in report.run_async.call_args_list] == [4, 8]
+        assert device.handle_stats()["pacing"]["busy"] == 1
+        device.close(force=True)
+
+    def test_run_report_gives_up_when_busy(self, device):
+        """A report that stays BUSY fails after the retries run out."""
+        device._pacer = CommandPacer(0x0227, 4)
+        device._dev = MagicMock()
+        device.logger = MagicMock()
+        report = MagicMock()
+        report.get_remaining_packets.return_value = 0
+        report.run.return_value = (hid.Status.Busy, b"")
+
+        with patch("uchroma.server.device_base.BUSY_BACKOFF", 0):
+            assert device.run_report_sync(report) == (False, b"")
+
+        assert report.run.call_count == BUSY_RETRIES + 1
+        device.logger.warning.assert_called_once_with(
+            "Device still busy after %d retries", BUSY_RETRIES
+        )
+
+    def test_run_report_timeout_not_retried(self, device):
+        """A timeout fails at once and isn't reported as busy."""
+        device._pacer = CommandPacer(0x0227, 4)
+        device._dev = MagicMock()
+        device.logger = MagicMock()
+        report = MagicMock()
+        report.get_remaining_packets.return_value = 0
+        report.run.return_value = (hid.Status.Timeout, b"")
+
+        assert device.run_report_sync(report) == (False, b"")
+
+        report.run.assert_called_once()
+        device.logger.warning.assert_called_once_with("Device did not respond to report")
+
+    def test_run_report_delay_is_minimum_gap(self, device):
+        device._pacer = CommandPacer(0x0227, 4)
+        dev = MagicMock()
+        device._dev = dev
+        report = MagicMock()
+        report.get_remaining_packets.return_value = 0
+        report.run.return_value = (hid.Status.Ok, b"")
+
+        device.run_report_sync(report, delay=0.035)
+
+        report.run.assert_called_once_with(dev, 35, 0)
+
+    def test_run_report_skips_pacing_mid_transfer(self, device):
+        """Unanswered packets of a multi-packet transfer are not counted."""
+        device._pacer = CommandPacer(0x0227, 4)
+        device._dev = MagicMock()
+        report = MagicMock()
+        report.get_remaining_packets.return_value = 2
+        report.run.return_value = (hid.Status.Ok, b"")
+
+        assert device.run_report_sync(report) == (True, b"")
+
+        assert device.handle_stats()["pacing"]["acks"] == 0
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Serial/Firmware Tests
@@ -0,0 +1,195 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+
+# uchroma - KeyboardFixup unit tests
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from uchroma.server.fixups import KeyboardFixup
+from uchroma.server.hardware import KeyFixupMapping, PointList
+
+
+class _Base:
+    def __init__(self, hardware):
+        self._hardware = hardware
+
+
+class _FixupDevice(KeyboardFixup, _Base):
+    pass
+
+
+def _device(mapping=None, row_offsets=None):
+    hardware = SimpleNamespace(key_fixup_mapping=mapping, key_row_offsets=row_offsets)
+    return _FixupDevice(hardware)
+
+
+def _frame(**debug_opts):
+    return SimpleNamespace(debug_opts=dict(debug_opts))
+
+
+def _image(height=3, width=5):
+    return np.arange(height * width * 3, dtype=np.uint8).reshape(height, width, 3)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Alignment Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestKeyboardFixupAlign:
+    """Tests for KeyboardFixup.align_key_matrix."""
+
+    def test_no_mapping_returns_input(self):
+        """Without a fixup map the matrix passes through untouched."""
+        img = _image()
+        result = _device().align_key_matrix(_frame(), img)
+        assert result is img
+
+    def test_copy_moves_cell(self):
+        """A copy duplicates the source cell into the destination."""
+        mapping = KeyFixupMapping(copy=PointList([[[2, 1], [0, 4]]]))
+        img = _image()
+        original = img.copy()
+
+        result = _device(mapping).align_key_matrix(_frame(), img)
+
+        expected = original.copy()
+        expected[0, 4] = original[2, 1]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_chained_copies_apply_in_order(self):
+        """Later copies see the result of earlier ones, like the laptop wheel mapping."""
+        mapping = KeyFixupMapping(copy=PointList([[[0, 3], [2, 3]], [[0, 2], [0, 3]]]))
+        img = _image()
+        original = img.copy()
+
+        result = _device(mapping).align_key_matrix(_frame(), img)
+
+        expected = original.copy()
+        expected[2, 3] = original[0, 3]
+        expected[0, 3] = original[0, 2]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_insert_shifts_row_right(self):
+        """An insert adds an empty cell and pushes the rest of the row right."""
+        mapping = KeyFixupMapping(insert=PointList([[1, 2]]))
+        img = _image()
+        original = img.copy()
+
+        result = _device(mapping).align_key_matrix(_frame(), img)
+
+        np.testing.assert_array_equal(result[0], original[0])
+        np.testing.assert_array_equal(result[1, :2], original[1, :2])
+        np.testing.assert_array_equal(result[1, 2], [0, 0, 0])
+        np.testing.assert_array_equal(result[1, 3:], original[1, 2:4])
+
+    def test_delete_shifts_row_left(self):
+        """A delete removes a cell and leaves an empty cell at the row end."""
+        mapping = KeyFixupMapping(delete=PointList([[2, 1]]))
+        img = _image()
+        original = img.copy()
+
+        result = _device(mapping).align_key_matrix(_frame(), img)
+
+        np.testing.assert_array_equal(result[2, :1], original[2, :1])
+        np.testing.assert_array_equal(result[2, 1:4], original[2, 2:])
+        np.testing.assert_array_equal(result[2, 4], [0, 0, 0])
+
+    def test_copy_applies_after_insert(self):
+        """Copies read positions after inserts have shifted the row."""
+        mapping = KeyFixupMapping(
+            insert=PointList([[0, 0]]),
+            copy=PointList([[[0, 1], [1, 0]]]),
+        )
+        img = _image()
+        original = img.copy()
+
+        result = _device(mapping).align_key_matrix(_frame(), img)
+
+        np.testing.assert_array_equal(result[1, 0], original[0, 0])
+
+    def test_aligns_in_place(self):
+        """Only the moved cells are rewritten, directly in the input matrix."""
+        mapping = KeyFixupMapping(copy=PointList([[[2, 1], [0, 4]]]))
+        img = _image()
+        original = img.copy()
+
+        result = _device(mapping).align_key_matrix(_frame(), img)
+
+        assert result is img
+        np.testing.assert_array_equal(img[0, 4], original[2, 1])
+
+    def test_non_contiguous_input(self):
+        """Strided input is aligned correctly."""
+        mapping = KeyFixupMapping(copy=PointList([[[2, 1], [0, 4]]]))
+        img = _image(3, 10)[:, ::2]
+
+        result = _device(mapping).align_key_matrix(_frame(), img)
+
+        np.testing.assert_array_equal(result[0, 4], img[2, 1])
+
+    def test_index_compiled_once_per_shape(self, monkeypatch):
+        """The gather index is compiled on first use and reused afterwards."""
+        mapping = KeyFixupMapping(copy=PointList([[[2, 1], [0, 4]]]))
+        device = _device(mapping)
+        calls = []
+        compile_alignment = KeyboardFixup._compile_alignment
+
+        def counting(*args):
+            calls.append(args[1:])
+            return compile_alignment(*args)
+
+        monkeypatch.setattr(KeyboardFixup, "_compile_alignment", staticmethod(counting))
+
+        for _ in range(3):
+            device.align_key_matrix(_frame(), _image())
+        device.align_key_matrix(_frame(), _image(4, 6))
+
+        assert calls == [(3, 5), (4, 6)]
+
+    def test_skip_fixups(self):
+        """The skip_fixups debug option bypasses alignment."""
+        mapping = KeyFixupMapping(copy=PointList([[[2, 1], [0, 4]]]))
+        img = _image()
+        original = img.copy()
+
+        result = _device(mapping).align_key_matrix(_frame(skip_fixups=True), img)
+
+        np.testing.assert_array_equal(result, original)
+
+    def test_debug_position_records_row(self):
+        """debug_position captures the row before and after alignment."""
+        mapping = KeyFixupMapping(copy=PointList([[[2, 1], [0, 4]]]))
+        img = _image()
+        original = img.copy()
+        frame = _frame(debug_position=(0, 4))
+
+        _device(mapping).align_key_matrix(frame, img)
+
+        np.testing.assert_array_equal(frame.debug_opts["in_data"], original[0])
+        np.testing.assert_array_equal(frame.debug_opts["out_data"][4], original[2, 1])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Row Offset Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestKeyboardFixupRowOffset:
+    """Tests for KeyboardFixup.get_row_offset."""
+
+    @pytest.mark.parametrize("row,expected", [(0, 0), (1, 2), (2, 1)])
+    def test_row_offset(self, row, expected):
+        """Offsets come from the hardware row offset table."""
+        device = _device(row_offsets=[0, 2, 1])
+        assert device.get_row_offset(_frame(), row) == expected
+
+    def test_row_offset_skipped(self):
+        """skip_fixups disables row offsets."""
+        device = _device(row_offsets=[0, 2, 1])
+        assert device.get_row_offset(_frame(skip_fixups=True), 1) == 0
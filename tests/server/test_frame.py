@@ -19,6 +19,7 @@ from uchroma.layer import Layer
 from uchroma.server import hid
 from uchroma.server.frame import Frame
 from uchroma.server.hardware import Hardware
+from uchroma.server.scheduler import CommandScheduler
 from uchroma.server.types import BaseCommand
 
 
@@ -50,7 +51,7 @@ def mock_driver():
     driver.hardware = MagicMock()
     driver.hardware.has_quirk = MagicMock(return_value=False)
     driver.device_type = Hardware.Type.KEYBOARD
-    driver._async_lock = None
+    driver.command_scheduler = CommandScheduler()
     driver.hid_device = MagicMock()
 
     @asynccontextmanager
@@ -244,6 +245,20 @@ class TestFrameCreateLayer:
         assert layer.height == 1
         assert layer.matrix.shape == (1, 15, 4)
 
+    def test_create_layer_defaults_to_float64(self, frame_6x22):
+        """Layers are float64 unless configured otherwise."""
+        assert frame_6x22.create_layer().dtype == np.float64
+
+    def test_create_layer_uses_layer_dtype(self, frame_6x22):
+        """create_layer honors the configured layer precision."""
+        frame_6x22.layer_dtype = np.float32
+        assert frame_6x22.create_layer().matrix.dtype == np.float32
+
+    def test_layer_dtype_rejects_unsupported(self, frame_6x22):
+        """Only float64 and float32 storage are supported."""
+        with pytest.raises(ValueError, match="Unsupported layer dtype"):
+            frame_6x22.layer_dtype = np.uint8
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Frame.compose Tests - Empty List
@@ -320,6 +335,29 @@ class TestFrameComposeSingleLayer:
 class TestFrameComposeMultipleLayers:
     """Tests for Frame.compose with multiple layers."""
 
+    def test_compose_float32_matches_float64(self):
+        """float32 layers compose to the same output as float64 layers."""
+        results = []
+        for dtype in (np.float64, np.float32):
+            base = Layer(4, 4, dtype=dtype)
+            base._matrix[:, :] = [0.2, 0.4, 0.6, 1.0]
+            overlay = Layer(4, 4, dtype=dtype)
+            overlay._matrix[:, :] = [0.5, 0.1, 0.9, 0.7]
+            overlay.blend_mode = "soft_light"
+            results.append(Frame.compose([base, overlay]))
+
+        np.testing.assert_allclose(results[0], results[1], atol=1)
+
+    def test_compose_mixed_precision_layers(self, red_layer):
+        """float32 and float64 layers can be stacked together."""
+        overlay = Layer(22, 6, dtype=np.float32)
+        overlay._matrix[:, :] = [0.0, 1.0, 0.0, 1.0]
+
+        result = Frame.compose([red_layer, overlay])
+
+        assert result is not None
+        assert result.shape == (6, 22, 3)
+
     def test_compose_two_layers_blends(self, red_layer, green_layer):
         """compose with two layers blends them together."""
         result = Frame.compose([red_layer, green_layer])
@@ -573,6 +611,89 @@ class TestFrameWideFrames:
         assert call_kwargs["post_delay_ms"] == 1
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Frame Delta Upload Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestFrameDeltaUpload:
+    """Tests for incremental (changed segments only) matrix uploads."""
+
+    def test_first_frame_is_sent_in_full(self, frame_6x22, mock_send_frame_async):
+        """The first upload has nothing to diff against."""
+        run_commit(frame_6x22, [frame_6x22.create_layer()], show=False)
+
+        assert mock_send_frame_async.call_args.kwargs["previous"] is None
+
+    def test_next_frame_diffs_against_last_frame(self, frame_6x22, mock_send_frame_async):
+        """Subsequent uploads pass the previously sent frame."""
+        run_commit(frame_6x22, [frame_6x22.create_layer()], show=False)
+        first = frame_6x22.last_frame
+
+        layer = frame_6x22.create_layer()
+        layer._matrix[2, 5] = [1.0, 0.0, 0.0, 1.0]
+        run_commit(frame_6x22, [layer], show=False)
+
+        assert mock_send_frame_async.call_args.kwargs["previous"] is first
+
+    def test_reset_custom_frame_state_forces_full_refresh(self, frame_6x22, mock_send_frame_async):
+        """Leaving custom frame mode invalidates the device-side frame."""
+        run_commit(frame_6x22, [frame_6x22.create_layer()], show=False)
+        frame_6x22.reset_custom_frame_state()
+        run_commit(frame_6x22, [frame_6x22.create_layer()], show=False)
+
+        assert mock_send_frame_async.call_args.kwargs["previous"] is None
+
+    def test_periodic_full_refresh(self, frame_6x22, mock_send_frame_async):
+        """A full frame is resent once the refresh interval has elapsed."""
+        with patch.object(Frame, "FULL_REFRESH_INTERVAL", 0.0):
+            run_commit(frame_6x22, [frame_6x22.create_layer()], show=False)
+            run_commit(frame_6x22, [frame_6x22.create_layer()], show=False)
+
+        assert mock_send_frame_async.call_args.kwargs["previous"] is None
+
+    def test_failed_upload_forces_full_refresh(self, frame_6x22, mock_send_frame_async):
+        """A failed upload leaves the hardware state unknown."""
+        run_commit(frame_6x22, [frame_6x22.create_layer()], show=False)
+
+        layer = frame_6x22.create_layer()
+        layer._matrix[0, 0] = [1.0, 0.0, 0.0, 1.0]
+
+        mock_send_frame_async.side_effect = OSError("transfer failed")
+        with pytest.raises(OSError, match="transfer failed"):
+            run_commit(frame_6x22, [layer], show=False)
+
+        mock_send_frame_async.side_effect = None
+        run_commit(frame_6x22, [layer], show=False)
+
+        assert mock_send_frame_async.call_args.kwargs["previous"] is None
+
+    def test_row_offset_change_forces_full_refresh(
+        self, frame_6x22, mock_driver, mock_send_frame_async
+    ):
+        """Changing row offsets moves every segment on the device."""
+        mock_driver.get_row_offset = MagicMock(return_value=0)
+        run_commit(frame_6x22, [frame_6x22.create_layer()], show=False)
+
+        layer = frame_6x22.create_layer()
+        layer._matrix[0, 0] = [1.0, 0.0, 0.0, 1.0]
+
+        mock_driver.get_row_offset.return_value = 1
+        run_commit(frame_6x22, [layer], show=False)
+
+        assert mock_send_frame_async.call_args.kwargs["previous"] is None
+
+    def test_upload_timing_is_recorded(self, frame_6x22, mock_send_frame_async):
+        """The timing breakdown returned by the upload is kept."""
+        assert frame_6x22.upload_timing is None
+
+        timing = MagicMock(packets=6)
+        mock_send_frame_async.return_value = timing
+        run_commit(frame_6x22, [frame_6x22.create_layer()], show=False)
+
+        assert frame_6x22.upload_timing is timing
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Frame.commit Tests
 # ─────────────────────────────────────────────────────────────────────────────
@@ -666,6 +787,105 @@ class TestFrameCommit:
             assert mock_set.call_args.args[1] is None
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Frame Unchanged Commit Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestFrameSkipUnchanged:
+    """Tests for skipping commits whose composed image did not change."""
+
+    def test_identical_frame_is_skipped(self, frame_6x22, mock_driver, mock_send_frame_async):
+        """An identical frame is neither uploaded nor re-activated."""
+        layer = frame_6x22.create_layer()
+        layer._matrix[:, :] = [1.0, 0.0, 0.0, 1.0]
+
+        run_commit(frame_6x22, [layer])
+        run_commit(frame_6x22, [layer])
+
+        mock_send_frame_async.assert_called_once()
+        mock_driver.run_command.assert_called_once()
+        assert frame_6x22.skipped_frames == 1
+
+    def test_changed_frame_is_sent(self, frame_6x22, mock_send_frame_async):
+        """A frame with different content is uploaded."""
+        run_commit(frame_6x22, [frame_6x22.create_layer()])
+
+        layer = frame_6x22.create_layer()
+        layer._matrix[0, 0] = [0.0, 0.0, 1.0, 1.0]
+        run_commit(frame_6x22, [layer])
+
+        assert mock_send_frame_async.call_count == 2
+        assert frame_6x22.skipped_frames == 0
+
+    def test_not_skipped_after_custom_frame_reset(self, frame_6x22, mock_send_frame_async):
+        """Leaving custom frame mode requires the frame to be resent."""
+        run_commit(frame_6x22, [frame_6x22.create_layer()])
+        frame_6x22.reset_custom_frame_state()
+        run_commit(frame_6x22, [frame_6x22.create_layer()])
+
+        assert mock_send_frame_async.call_count == 2
+
+    def test_not_skipped_when_refresh_due(self, frame_6x22, mock_send_frame_async):
+        """The periodic full refresh is sent even if nothing changed."""
+        with patch.object(Frame, "FULL_REFRESH_INTERVAL", 0.0):
+            run_commit(frame_6x22, [frame_6x22.create_layer()])
+            run_commit(frame_6x22, [frame_6x22.create_layer()])
+
+        assert mock_send_frame_async.call_count == 2
+
+    def test_not_skipped_after_failed_upload(self, frame_6x22, mock_send_frame_async):
+        """A partly uploaded frame is overwritten even if the next one is unchanged."""
+        frame_a = frame_6x22.create_layer()
+        frame_a._matrix[:, :] = [1.0, 0.0, 0.0, 1.0]
+        frame_b = frame_6x22.create_layer()
+        frame_b._matrix[:, :] = [0.0, 0.0, 1.0, 1.0]
+
+        run_commit(frame_6x22, [frame_a])
+
+        mock_send_frame_async.side_effect = OSError("transfer failed")
+        with pytest.raises(OSError):
+            run_commit(frame_6x22, [frame_b])
+
+        mock_send_frame_async.side_effect = None
+        run_commit(frame_6x22, [frame_a])
+
+        assert mock_send_frame_async.call_count == 3
+        assert frame_6x22.skipped_frames == 0
+
+    def test_skip_compares_before_alignment(self, frame_6x22, mock_driver, mock_send_frame_async):
+        """In-place changes made by the alignment hook don't defeat the check."""
+
+        def align(frame, img):
+            img[0, 0] = [1, 2, 3]
+            return img
+
+        mock_driver.align_key_matrix = MagicMock(side_effect=align)
+
+        run_commit(frame_6x22, [frame_6x22.create_layer()])
+        run_commit(frame_6x22, [frame_6x22.create_layer()])
+
+        mock_send_frame_async.assert_called_once()
+        assert frame_6x22.skipped_frames == 1
+
+    def test_not_skipped_with_debug_opts(self, frame_6x22, mock_send_frame_async):
+        """Debug tooling sees every frame."""
+        frame_6x22.debug_opts["debug_position"] = (0, 0)
+
+        run_commit(frame_6x22, [frame_6x22.create_layer()])
+        run_commit(frame_6x22, [frame_6x22.create_layer()])
+
+        assert mock_send_frame_async.call_count == 2
+
+    def test_single_row_identical_frame_is_skipped(self, frame_1x15, mock_driver):
+        """Single-row devices skip unchanged frames too."""
+        run_commit(frame_1x15, [frame_1x15.create_layer()], show=False)
+        run_commit(frame_1x15, [frame_1x15.create_layer()], show=False)
+
+        mock_driver.run_command.assert_called_once()
+        assert frame_1x15.skipped_frames == 1
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Frame.reset Tests
 # ─────────────────────────────────────────────────────────────────────────────
@@ -740,6 +960,30 @@ class TestFrameSetFrameData:
             call_args = mock_single.call_args[0]
             assert call_args[1] == Frame.DEFAULT_FRAME_ID
 
+    def test_set_frame_data_fires_frame_committed(self, frame_6x22, mock_driver):
+        """frame_committed fires with the new sequence number once the frame is sent."""
+        img = np.zeros((6, 22, 3), dtype=np.uint8)
+        seqs = []
+        frame_6x22.frame_committed.connect(seqs.append)
+
+        with patch.object(frame_6x22, "_set_frame_data_matrix", new=AsyncMock(return_value=img)):
+            asyncio.run(frame_6x22._set_frame_data(img))
+            asyncio.run(frame_6x22._set_frame_data(img))
+
+        assert seqs == [1, 2]
+        assert frame_6x22.frame_seq == 2
+
+    def test_set_frame_data_no_signal_when_nothing_sent(self, frame_6x22, mock_driver):
+        """frame_committed does not fire if the upload produced no frame."""
+        img = np.zeros((6, 22, 3), dtype=np.uint8)
+        seqs = []
+        frame_6x22.frame_committed.connect(seqs.append)
+
+        with patch.object(frame_6x22, "_set_frame_data_matrix", new=AsyncMock(return_value=None)):
+            asyncio.run(frame_6x22._set_frame_data(img))
+
+        assert seqs == []
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Frame Integration Tests
@@ -5,6 +5,9 @@
 # uchroma - Hardware unit tests
 from __future__ import annotations
 
+import os
+import pickle
+
 import pytest
 
 from uchroma.server.hardware import (
@@ -333,6 +336,112 @@ class TestHardwareGetDevice:
         assert device is None
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Hardware Index Cache Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestHardwareIndexCache:
+    """Tests for the compiled device index behind get_device."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_index(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(Hardware, "_device_index", None)
+        yield
+        Hardware._device_index = None
+
+    def test_index_written_on_first_lookup(self):
+        """The first lookup compiles the index and stores it on disk."""
+        assert not os.path.exists(Hardware._cache_path())
+        assert Hardware.get_device(0x0203) is not None
+        assert os.path.exists(Hardware._cache_path())
+
+    def test_cached_index_skips_yaml(self, monkeypatch):
+        """A valid cache is used without parsing the YAML database."""
+        Hardware.get_device(0x0203)
+        Hardware._device_index = None
+
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr(Hardware, "_build_index", fail)
+
+        device = Hardware.get_device(0x0203)
+        assert device.name == "BlackWidow Chroma"
+        assert device.dimensions == (6, 22)
+        assert device.key_mapping is not None
+
+    def test_stale_cache_rebuilt(self, monkeypatch):
+        """A change to the YAML files invalidates the cache."""
+        Hardware.get_device(0x0203)
+        Hardware._device_index = None
+
+        signature = Hardware._data_signature()
+        monkeypatch.setattr(Hardware, "_data_signature", staticmethod(lambda: (*signature, "x")))
+
+        built = []
+        build_index = Hardware._build_index.__func__
+
+        def counting(cls):
+            built.append(True)
+            return build_index(cls)
+
+        monkeypatch.setattr(Hardware, "_build_index", classmethod(counting))
+
+        assert Hardware.get_device(0x0203) is not None
+        assert built == [True]
+
+    def test_cache_from_other_layout_rebuilt(self, monkeypatch):
+        """A cache written with different Hardware fields is not loaded."""
+        Hardware.get_device(0x0203)
+        Hardware._device_index = None
+
+        path = Hardware._cache_path()
+        with open(path, "rb") as cache_file:
+            cached = pickle.load(cache_file)
+        fields = (*Hardware.__slots__[:-1], "removed_field")
+        cached["signature"] = (*cached["signature"][:-1], fields)
+        with open(path, "wb") as cache_file:
+            pickle.dump(cached, cache_file)
+
+        built = []
+        build_index = Hardware._build_index.__func__
+
+        def counting(cls):
+            built.append(True)
+            return build_index(cls)
+
+        monkeypatch.setattr(Hardware, "_build_index", classmethod(counting))
+
+        assert Hardware.get_device(0x0203) is not None
+        assert built == [True]
+
+    def test_corrupt_cache_rebuilt(self):
+        """An unreadable cache file is replaced."""
+        path = Hardware._cache_path()
+        os.makedirs(os.path.dirname(path))
+        with open(path, "wb") as cache_file:
+            cache_file.write(b"not a pickle")
+
+        assert Hardware.get_device(0x0203) is not None
+        with open(path, "rb") as cache_file:
+            assert cache_file.read() != b"not a pickle"
+
+    def test_records_match_yaml(self):
+        """Indexed records carry the fully inherited YAML values."""
+        config = Hardware.get_type(Hardware.Type.LAPTOP)
+        for node in config.search("type", Hardware.Type.LAPTOP):
+            if node.product_id is None:
+                continue
+            device = Hardware.get_device(node.product_id, Hardware.Type.LAPTOP)
+            assert device._asdict() == node._asdict()
+
+    def test_lookup_returns_same_instance(self):
+        """Repeated lookups share one record."""
+        assert Hardware.get_device(0x0203) is Hardware.get_device(0x0203)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Hardware.Type Enum Tests
 # ─────────────────────────────────────────────────────────────────────────────
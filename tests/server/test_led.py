@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections import OrderedDict
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, call, patch
@@ -14,9 +15,10 @@ import pytest
 
 from uchroma.colorlib import Color
 from uchroma.server.hardware import Quirks
-from uchroma.server.led import LED, NOSTORE, VARSTORE, LEDManager, LEDMode
+from uchroma.server.led import LED, NOSTORE, REFRESH_TTL, VARSTORE, LEDManager, LEDMode
+from uchroma.server.scheduler import CommandPriority
 from uchroma.server.types import LEDType
-from uchroma.util import Signal
+from uchroma.util import Signal, scale_brightness
 
 # ─────────────────────────────────────────────────────────────────────────────
 # LEDMode Enum Tests
@@ -253,7 +255,7 @@ class TestLEDGetSet:
         cmd = LED.Command.GET_LED_STATE
         asyncio.run(logo_led._get(cmd))
         mock_led_driver.run_with_result.assert_called_once_with(
-            cmd, VARSTORE, LEDType.LOGO.hardware_id
+            cmd, VARSTORE, LEDType.LOGO.hardware_id, priority=CommandPriority.TELEMETRY
         )
 
     def test_set_calls_run_command(self, logo_led, mock_led_driver):
@@ -261,7 +263,11 @@ class TestLEDGetSet:
         cmd = LED.Command.SET_LED_STATE
         asyncio.run(logo_led._set(cmd, 1))
         mock_led_driver.run_command.assert_called_once_with(
-            cmd, VARSTORE, LEDType.LOGO.hardware_id, 1, delay=0.035
+            cmd,
+            VARSTORE,
+            LEDType.LOGO.hardware_id,
+            1,
+            coalesce=(cmd, LEDType.LOGO),
         )
 
     def test_set_with_multiple_args(self, logo_led, mock_led_driver):
@@ -269,7 +275,13 @@ class TestLEDGetSet:
         cmd = LED.Command.SET_LED_COLOR
         asyncio.run(logo_led._set(cmd, 255, 128, 64))
         mock_led_driver.run_command.assert_called_once_with(
-            cmd, VARSTORE, LEDType.LOGO.hardware_id, 255, 128, 64, delay=0.035
+            cmd,
+            VARSTORE,
+            LEDType.LOGO.hardware_id,
+            255,
+            128,
+            64,
+            coalesce=(cmd, LEDType.LOGO),
         )
 
     def test_get_returns_driver_result(self, logo_led, mock_led_driver):
@@ -294,7 +306,10 @@ class TestLEDBrightnessCommands:
         asyncio.run(logo_led._get_brightness())
         mock_led_driver.has_quirk.assert_called_with(Quirks.EXTENDED_FX_CMDS)
         mock_led_driver.run_with_result.assert_called_once_with(
-            LED.Command.GET_LED_BRIGHTNESS, VARSTORE, LEDType.LOGO.hardware_id
+            LED.Command.GET_LED_BRIGHTNESS,
+            VARSTORE,
+            LEDType.LOGO.hardware_id,
+            priority=CommandPriority.TELEMETRY,
         )
 
     def test_get_brightness_uses_extended_command_with_quirk(self, logo_led, mock_led_driver):
@@ -303,7 +318,10 @@ class TestLEDBrightnessCommands:
         asyncio.run(logo_led._get_brightness())
         mock_led_driver.has_quirk.assert_called_with(Quirks.EXTENDED_FX_CMDS)
         mock_led_driver.run_with_result.assert_called_once_with(
-            LED.ExtendedCommand.GET_LED_BRIGHTNESS, VARSTORE, LEDType.LOGO.hardware_id
+            LED.ExtendedCommand.GET_LED_BRIGHTNESS,
+            VARSTORE,
+            LEDType.LOGO.hardware_id,
+            priority=CommandPriority.TELEMETRY,
         )
 
     def test_set_brightness_uses_standard_command(self, logo_led, mock_led_driver):
@@ -312,7 +330,11 @@ class TestLEDBrightnessCommands:
         asyncio.run(logo_led._set_brightness(128))
         mock_led_driver.has_quirk.assert_called_with(Quirks.EXTENDED_FX_CMDS)
         mock_led_driver.run_command.assert_called_once_with(
-            LED.Command.SET_LED_BRIGHTNESS, VARSTORE, LEDType.LOGO.hardware_id, 128, delay=0.035
+            LED.Command.SET_LED_BRIGHTNESS,
+            VARSTORE,
+            LEDType.LOGO.hardware_id,
+            128,
+            coalesce=(LED.Command.SET_LED_BRIGHTNESS, LEDType.LOGO),
         )
 
     def test_set_brightness_uses_extended_command_with_quirk(self, logo_led, mock_led_driver):
@@ -325,7 +347,7 @@ class TestLEDBrightnessCommands:
             VARSTORE,
             LEDType.LOGO.hardware_id,
             200,
-            delay=0.035,
+            coalesce=(LED.ExtendedCommand.SET_LED_BRIGHTNESS, LEDType.LOGO),
         )
 
 
@@ -340,7 +362,7 @@ class TestLEDRefresh:
     def _make_refresh_side_effect(self, state=None, color=None, mode=None, brightness=None):
         """Create a side_effect function that returns appropriate values for each command."""
 
-        def side_effect(cmd, *args):
+        def side_effect(cmd, *args, **kwargs):
             if cmd == LED.Command.GET_LED_STATE:
                 return state
             elif cmd == LED.Command.GET_LED_COLOR:
@@ -366,7 +388,12 @@ class TestLEDRefresh:
         )
         asyncio.run(led._refresh())
         calls = mock_led_driver.run_with_result.call_args_list
-        state_call = call(LED.Command.GET_LED_STATE, VARSTORE, LEDType.LOGO.hardware_id)
+        state_call = call(
+            LED.Command.GET_LED_STATE,
+            VARSTORE,
+            LEDType.LOGO.hardware_id,
+            priority=CommandPriority.TELEMETRY,
+        )
         assert state_call in calls
 
     def test_refresh_reads_color(self, mock_led_driver):
@@ -382,7 +409,12 @@ class TestLEDRefresh:
         )
         asyncio.run(led._refresh())
         calls = mock_led_driver.run_with_result.call_args_list
-        color_call = call(LED.Command.GET_LED_COLOR, VARSTORE, LEDType.LOGO.hardware_id)
+        color_call = call(
+            LED.Command.GET_LED_COLOR,
+            VARSTORE,
+            LEDType.LOGO.hardware_id,
+            priority=CommandPriority.TELEMETRY,
+        )
         assert color_call in calls
 
     def test_refresh_reads_mode(self, mock_led_driver):
@@ -398,7 +430,12 @@ class TestLEDRefresh:
         )
         asyncio.run(led._refresh())
         calls = mock_led_driver.run_with_result.call_args_list
-        mode_call = call(LED.Command.GET_LED_MODE, VARSTORE, LEDType.LOGO.hardware_id)
+        mode_call = call(
+            LED.Command.GET_LED_MODE,
+            VARSTORE,
+            LEDType.LOGO.hardware_id,
+            priority=CommandPriority.TELEMETRY,
+        )
         assert mode_call in calls
 
     def test_refresh_reads_brightness(self, mock_led_driver):
@@ -415,14 +452,19 @@ class TestLEDRefresh:
         )
         asyncio.run(led._refresh())
         calls = mock_led_driver.run_with_result.call_args_list
-        brightness_call = call(LED.Command.GET_LED_BRIGHTNESS, VARSTORE, LEDType.LOGO.hardware_id)
+        brightness_call = call(
+            LED.Command.GET_LED_BRIGHTNESS,
+            VARSTORE,
+            LEDType.LOGO.hardware_id,
+            priority=CommandPriority.TELEMETRY,
+        )
         assert brightness_call in calls
 
     def test_refresh_sets_state_from_response(self, mock_led_driver):
         """_refresh should set state from device response."""
 
         # Return state=1 (True)
-        def side_effect(cmd, *args):
+        def side_effect(cmd, *args, **kwargs):
             if cmd == LED.Command.GET_LED_STATE:
                 return [0, 0, 1]
             return None
@@ -436,7 +478,7 @@ class TestLEDRefresh:
     def test_refresh_sets_color_from_response(self, mock_led_driver):
         """_refresh should set color from device response (RGB bytes)."""
 
-        def side_effect(cmd, *args):
+        def side_effect(cmd, *args, **kwargs):
             if cmd == LED.Command.GET_LED_COLOR:
                 return [0, 0, 255, 128, 64]  # R=255, G=128, B=64
             return None
@@ -452,7 +494,7 @@ class TestLEDRefresh:
     def test_refresh_sets_mode_from_response(self, mock_led_driver):
         """_refresh should set mode from device response."""
 
-        def side_effect(cmd, *args):
+        def side_effect(cmd, *args, **kwargs):
             if cmd == LED.Command.GET_LED_MODE:
                 return [0, 0, 0x02]  # PULSE mode
             return None
@@ -466,7 +508,7 @@ class TestLEDRefresh:
     def test_refresh_sets_brightness_from_response(self, mock_led_driver):
         """_refresh should set brightness from device response (scaled)."""
 
-        def side_effect(cmd, *args):
+        def side_effect(cmd, *args, **kwargs):
             if cmd == LED.Command.GET_LED_BRIGHTNESS:
                 return [0, 0, 255]  # Max brightness
             return None
@@ -490,7 +532,7 @@ class TestLEDRefresh:
         """_refresh should set _refreshing flag during execution."""
         refreshing_during_call = []
 
-        async def capture_refreshing(cmd, *args):
+        async def capture_refreshing(cmd, *args, **kwargs):
             refreshing_during_call.append(led._refreshing)
             return None
 
@@ -668,6 +710,96 @@ class TestLEDLazyRefresh:
         # run_with_result is used by _get_async, which is called in _refresh
         mock_led_driver.run_with_result.assert_not_called()
 
+    def test_no_refresh_within_ttl(self, mock_led_driver):
+        """A dirty LED isn't re-read until the cached state expires."""
+        with patch.object(LED, "_refresh", new=AsyncMock()) as mock_refresh:
+            led = LED(mock_led_driver, LEDType.LOGO)
+            led._refreshed_at = time.monotonic()
+            led._dirty = True
+            _ = led.brightness
+            mock_refresh.assert_not_called()
+            assert led._dirty is True
+
+            led._refreshed_at -= REFRESH_TTL
+            _ = led.brightness
+            mock_refresh.assert_called_once()
+            assert led._dirty is False
+
+    def test_refresh_records_time(self, mock_led_driver):
+        """_refresh should restart the cache TTL."""
+        with patch.object(LED, "_refresh", new=AsyncMock()):
+            led = LED(mock_led_driver, LEDType.LOGO)
+        assert led.refresh_expired
+        asyncio.run(led._refresh())
+        assert not led.refresh_expired
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# LED Write Coalescing Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestLEDWriteCoalescing:
+    """Tests for merging trait writes made while a write is in flight."""
+
+    @staticmethod
+    def _brightness_calls(driver):
+        return [
+            c.args[-1]
+            for c in driver.run_command.call_args_list
+            if c.args[0] == LED.Command.SET_LED_BRIGHTNESS
+        ]
+
+    def test_rapid_writes_send_latest(self, logo_led, mock_led_driver):
+        """Several writes while busy collapse into one SET with the last value."""
+        logo_led._apply_task = SimpleNamespace(done=lambda: False)
+        for value in (10.0, 20.0, 30.0):
+            logo_led.brightness = value
+
+        asyncio.run(logo_led._apply_pending())
+
+        assert self._brightness_calls(mock_led_driver) == [scale_brightness(30.0)]
+
+    def test_merged_change_keeps_first_old_value(self, logo_led, mock_led_driver):
+        """Brightness state transitions use the value before the first merged write."""
+        logo_led._refreshing = True
+        logo_led.brightness = 0.0
+        logo_led._refreshing = False
+
+        logo_led._apply_task = SimpleNamespace(done=lambda: False)
+        logo_led.brightness = 10.0
+        logo_led.brightness = 40.0
+        asyncio.run(logo_led._apply_pending())
+
+        state_calls = [
+            c.args[-1]
+            for c in mock_led_driver.run_command.call_args_list
+            if c.args[0] == LED.Command.SET_LED_STATE
+        ]
+        assert state_calls == [1]
+
+    def test_writes_that_cancel_out_send_nothing(self, logo_led, mock_led_driver):
+        """A value changed and changed back before sending isn't written."""
+        original = logo_led.brightness
+        logo_led._apply_task = SimpleNamespace(done=lambda: False)
+        logo_led.brightness = 10.0
+        logo_led.brightness = original
+
+        asyncio.run(logo_led._apply_pending())
+
+        mock_led_driver.run_command.assert_not_called()
+
+    def test_properties_written_separately(self, scroll_led, mock_led_driver):
+        """Only writes to the same property are merged."""
+        scroll_led._apply_task = SimpleNamespace(done=lambda: False)
+        scroll_led.mode = LEDMode.PULSE
+        scroll_led.brightness = 20.0
+
+        asyncio.run(scroll_led._apply_pending())
+
+        commands = [c.args[0] for c in mock_led_driver.run_command.call_args_list]
+        assert commands == [LED.Command.SET_LED_MODE, LED.Command.SET_LED_BRIGHTNESS]
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # LED get_values / set_values Tests
@@ -868,6 +1000,92 @@ class TestLEDManagerGet:
         assert len(handler_called) > 0
 
 
+class TestLEDManagerRefresh:
+    """Tests for batched LED refresh via LEDManager."""
+
+    @pytest.fixture
+    def refreshed(self):
+        refreshed = []
+
+        async def fake_refresh(led):
+            refreshed.append(led.led_type)
+            led._refreshed_at = time.monotonic()
+
+        with patch.object(LED, "_refresh", new=fake_refresh):
+            yield refreshed
+
+    def test_led_created_with_manager(self, mock_led_driver, refreshed):
+        """LEDs created by the manager refresh through it."""
+        manager = LEDManager(mock_led_driver)
+        led = manager.get(LEDType.LOGO)
+        assert led._manager is manager
+
+    def test_reading_one_led_refreshes_all_expired(self, mock_led_driver, refreshed):
+        """The first read refreshes every expired LED in one batch."""
+        manager = LEDManager(mock_led_driver)
+        logo = manager.get(LEDType.LOGO)
+        scroll = manager.get(LEDType.SCROLL_WHEEL)
+
+        _ = logo.brightness
+        _ = scroll.brightness
+        _ = scroll.color
+
+        assert refreshed == [LEDType.LOGO, LEDType.SCROLL_WHEEL]
+
+    def test_fresh_leds_not_batched(self, mock_led_driver, refreshed):
+        """LEDs refreshed within the TTL are left out of a batch."""
+        manager = LEDManager(mock_led_driver)
+        logo = manager.get(LEDType.LOGO)
+        scroll = manager.get(LEDType.SCROLL_WHEEL)
+        scroll._refreshed_at = time.monotonic()
+
+        manager.refresh(logo)
+
+        assert refreshed == [LEDType.LOGO]
+
+    def test_explicit_refresh_ignores_ttl(self, mock_led_driver, refreshed):
+        """Passing an LED refreshes it even if its cache is valid."""
+        manager = LEDManager(mock_led_driver)
+        logo = manager.get(LEDType.LOGO)
+        logo._refreshed_at = time.monotonic()
+
+        manager.refresh(logo)
+
+        assert refreshed == [LEDType.LOGO]
+
+    def test_refresh_joins_running_batch(self, mock_led_driver, refreshed):
+        """Requests made while a batch is running are queued into it."""
+        manager = LEDManager(mock_led_driver)
+        logo = manager.get(LEDType.LOGO)
+        manager._refresh_task = SimpleNamespace(done=lambda: False)
+
+        manager.refresh(logo)
+        manager.refresh(logo)
+        assert manager._refresh_pending == [logo]
+
+        asyncio.run(manager._refresh_batch())
+        assert refreshed == [LEDType.LOGO]
+
+    def test_failed_led_does_not_stop_batch(self, mock_led_driver):
+        """An LED whose refresh raises is logged and the batch continues."""
+        refreshed = []
+
+        async def fake_refresh(led):
+            if led.led_type == LEDType.LOGO:
+                raise ValueError("bad mode")
+            refreshed.append(led.led_type)
+
+        manager = LEDManager(mock_led_driver)
+        with patch.object(LED, "_refresh", new=fake_refresh):
+            logo = manager.get(LEDType.LOGO)
+            manager.get(LEDType.SCROLL_WHEEL)
+            manager.refresh(logo)
+
+        assert refreshed == [LEDType.SCROLL_WHEEL]
+        assert manager._refresh_pending == []
+        mock_led_driver.logger.error.assert_called_once()
+
+
 class TestLEDManagerRestorePrefs:
     """Tests for LEDManager._restore_prefs method."""
 
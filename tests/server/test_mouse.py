@@ -0,0 +1,90 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+
+"""Unit tests for uchroma.server.mouse module."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from uchroma.server import mouse
+
+# ─────────────────────────────────────────────────────────────────────────────
+# UChromaMouse.polling_rate Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _make_mouse(cls=mouse.UChromaMouse):
+    # Bypass device setup, only the telemetry accessors are exercised
+    dev = object.__new__(cls)
+    dev._cached_polling_rate = mouse.PollingRate.INVALID
+    dev.run_with_result = AsyncMock(return_value=bytes([0x02]))
+    dev.run_with_result_sync = MagicMock()
+    dev.run_command_sync = MagicMock(return_value=True)
+    return dev
+
+
+class TestMousePollingRate:
+    """Tests for the cached UChromaMouse.polling_rate."""
+
+    def test_refresh_caches_rate(self):
+        """The getter is served from the last telemetry refresh."""
+        dev = _make_mouse()
+        assert dev.polling_rate == mouse.PollingRate.INVALID
+
+        assert asyncio.run(dev.refresh_polling_rate()) == {"PollingRate": "MHZ_500"}
+        assert dev.polling_rate == mouse.PollingRate.MHZ_500
+        dev.run_with_result_sync.assert_not_called()
+
+    def test_refresh_unknown_code(self):
+        dev = _make_mouse()
+        dev.run_with_result.return_value = bytes([0x7F])
+
+        asyncio.run(dev.refresh_polling_rate())
+        assert dev.polling_rate == mouse.PollingRate.INVALID
+
+    def test_set_updates_cache(self):
+        dev = _make_mouse()
+        dev.polling_rate = "mhz_1000"
+
+        assert dev.polling_rate == mouse.PollingRate.MHZ_1000
+        dev.run_command_sync.assert_called_once_with(
+            mouse.UChromaMouse.Command.SET_POLLING_RATE, 0x01
+        )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# UChromaWirelessMouse battery Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _make_wireless_mouse(level, charging):
+    dev = _make_mouse(mouse.UChromaWirelessMouse)
+    dev._cached_battery_level = -1.0
+    dev._cached_is_charging = False
+    dev._wireless_lock = asyncio.Lock()
+    dev.run_with_result = AsyncMock(side_effect=[bytes([0x00, level]), bytes([0x00, charging])])
+    return dev
+
+
+class TestWirelessMouseBattery:
+    """Tests for the cached UChromaWirelessMouse battery state."""
+
+    def test_refresh_returns_dbus_values(self):
+        dev = _make_wireless_mouse(0xFF, 0x01)
+
+        values = asyncio.run(dev.refresh_wireless_state())
+
+        assert values == {"BatteryLevel": 100.0, "IsCharging": True}
+        assert dev.battery_level == 100.0
+        assert dev.is_charging is True
+        dev.run_with_result_sync.assert_not_called()
+
+    def test_poll_interval_faster_while_charging(self):
+        dev = _make_wireless_mouse(0x80, 0x01)
+        assert dev._wireless_poll_interval() == mouse.BATTERY_POLL_INTERVAL
+
+        asyncio.run(dev.refresh_wireless_state())
+        assert dev._wireless_poll_interval() == mouse.BATTERY_POLL_CHARGING
@@ -0,0 +1,132 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+
+# uchroma - CommandPacer unit tests
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from uchroma.server import hid
+from uchroma.server.pacing import (
+    MAX_GAP_MS,
+    MIN_GAP_MS,
+    PROBE_AFTER,
+    CommandPacer,
+    PacingStore,
+)
+
+
+def _reset_store():
+    # Clear the singleton instance (uses __instance attribute on class)
+    if hasattr(PacingStore, "_Singleton__instance"):
+        delattr(PacingStore, "_Singleton__instance")
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """A fresh PacingStore backed by a temporary cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    _reset_store()
+    yield PacingStore()
+    _reset_store()
+
+
+def _ack(pacer, count):
+    for _ in range(count):
+        assert not pacer.record(hid.Status.Ok)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Pacing Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestCommandPacer:
+    """Tests for gap probing and backoff."""
+
+    def test_starts_from_default(self):
+        pacer = CommandPacer(0x0227, 7)
+        assert pacer.gap_ms == 7
+        assert pacer.default_ms == 7
+
+    def test_default_is_clamped(self):
+        assert CommandPacer(0x0227, 0).gap_ms == MIN_GAP_MS
+        assert CommandPacer(0x0227, 1000).gap_ms == MAX_GAP_MS
+
+    def test_acks_probe_shorter_gap(self):
+        pacer = CommandPacer(0x0227, 7)
+
+        _ack(pacer, PROBE_AFTER - 1)
+        assert pacer.gap_ms == 7
+
+        _ack(pacer, 1)
+        assert pacer.gap_ms == 6
+        assert pacer.stats()["probes"] == 1
+
+    def test_busy_backs_off(self):
+        """BUSY doubles the gap and asks for a retry."""
+        pacer = CommandPacer(0x0227, 4)
+
+        assert pacer.record(hid.Status.Busy)
+        assert pacer.gap_ms == 8
+        assert pacer.stats()["busy"] == 1
+
+    def test_probing_stops_above_failed_gap(self):
+        """A gap which produced BUSY is never probed again."""
+        pacer = CommandPacer(0x0227, 3)
+        pacer.record(hid.Status.Busy)
+
+        _ack(pacer, PROBE_AFTER * 10)
+        assert pacer.gap_ms == 4
+        assert pacer.stats()["floor_ms"] == 4
+
+    def test_timeout_keeps_gap(self):
+        """A timeout is not a pacing signal and is not retried."""
+        pacer = CommandPacer(0x0227, 4)
+
+        assert not pacer.record(hid.Status.Timeout)
+        assert pacer.gap_ms == 4
+        assert pacer.stats()["floor_ms"] == MIN_GAP_MS
+        assert pacer.stats()["busy"] == 0
+
+    def test_other_statuses_ignored(self):
+        pacer = CommandPacer(0x0227, 7)
+
+        assert not pacer.record(hid.Status.Unsupported)
+        assert pacer.stats()["acks"] == 0
+        assert pacer.gap_ms == 7
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Persistence Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestPacingStore:
+    """Tests for remembering learned gaps per product."""
+
+    def test_learned_gap_persists(self, store, tmp_path):
+        pacer = CommandPacer(0x0227, 7, store)
+        _ack(pacer, PROBE_AFTER)
+        store.flush()
+
+        with open(tmp_path / "uchroma" / "pacing.json") as store_file:
+            assert json.load(store_file) == {"0227": 6}
+
+        _reset_store()
+        assert CommandPacer(0x0227, 7, PacingStore()).gap_ms == 6
+        assert CommandPacer(0x0228, 7, PacingStore()).gap_ms == 7
+
+    def test_flush_without_changes(self, store, tmp_path):
+        store.flush()
+        assert not (tmp_path / "uchroma" / "pacing.json").exists()
+
+    def test_corrupt_store_ignored(self, store, tmp_path):
+        (tmp_path / "uchroma").mkdir()
+        (tmp_path / "uchroma" / "pacing.json").write_text("not json")
+
+        _reset_store()
+        assert PacingStore().get(0x0227) is None
@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 import tempfile
 import time
@@ -112,6 +113,8 @@ class TestPreferenceManager:
         yield
         # Clean up after test
         if hasattr(PreferenceManager, "_Singleton__instance"):
+            instance = PreferenceManager._Singleton__instance
+            instance._root.__class__.unobserve(instance._preferences_changed)
             delattr(PreferenceManager, "_Singleton__instance")
 
     @pytest.fixture
@@ -248,6 +251,80 @@ class TestPreferenceManager:
             mgr._preferences_changed(mgr._root, "brightness", 50.0)
             mock_save.assert_called_once()
 
+    def test_changes_coalesced_under_event_loop(self, mock_conf_paths):
+        """Changes made while a loop runs are written once, after the delay."""
+        from uchroma.server.prefs import PreferenceManager
+
+        mgr = PreferenceManager()
+        prefs = mgr.get("COALESCE")
+        writes = []
+
+        async def tweak():
+            for value in range(20):
+                prefs.brightness = float(value)
+            assert writes == []
+            await asyncio.sleep(0.1)
+            mgr.flush()
+
+        with (
+            patch("uchroma.server.prefs.SAVE_DELAY", 0.05),
+            patch.object(PreferenceManager, "_write", side_effect=writes.append),
+        ):
+            asyncio.run(tweak())
+
+        assert len(writes) == 1
+        assert "brightness: 19.0" in writes[0]
+
+    def test_flush_writes_pending_changes(self, mock_conf_paths):
+        """flush writes immediately and cancels the scheduled save."""
+        from uchroma.server.prefs import PreferenceManager, Preferences
+
+        _conf_dir, conf_file = mock_conf_paths
+        mgr = PreferenceManager()
+        prefs = mgr.get("FLUSH")
+
+        async def change_and_flush():
+            prefs.brightness = 33.0
+            assert not os.path.exists(conf_file)
+            mgr.flush()
+            assert mgr._save_handle is None
+
+        asyncio.run(change_and_flush())
+
+        Preferences._yaml_cache.clear()
+        loaded = Preferences.load_yaml(conf_file)
+        assert loaded.search("serial", "FLUSH")[0].brightness == 33.0
+
+    def test_flush_without_changes_does_not_write(self, mock_conf_paths):
+        """flush is a no-op when nothing changed."""
+        from uchroma.server.prefs import PreferenceManager
+
+        mgr = PreferenceManager()
+        with patch.object(PreferenceManager, "_write") as mock_write:
+            mgr.flush()
+            mock_write.assert_not_called()
+
+    def test_write_error_logged_in_background(self, mock_conf_paths):
+        """A failed background write is logged rather than raised on the loop."""
+        from uchroma.server.prefs import PreferenceManager
+
+        mgr = PreferenceManager()
+        prefs = mgr.get("ERROR")
+
+        async def change():
+            prefs.brightness = 10.0
+            await asyncio.sleep(0.1)
+            mgr.flush()
+
+        with (
+            patch("uchroma.server.prefs.SAVE_DELAY", 0.01),
+            patch.object(PreferenceManager, "_write", side_effect=OSError("disk full")),
+            patch.object(mgr, "_logger") as logger,
+        ):
+            asyncio.run(change())
+
+        logger.error.assert_called_once()
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # YAML Color Serialization Tests
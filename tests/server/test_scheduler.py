@@ -0,0 +1,235 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+
+# uchroma - CommandScheduler unit tests
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from uchroma.server.scheduler import CommandPriority, CommandScheduler
+
+
+def _recorder(log, name, result=None):
+    async def func():
+        log.append(name)
+        await asyncio.sleep(0)
+        return result
+
+    return func
+
+
+async def _hold(scheduler):
+    """Take the channel and return an event which releases it."""
+    release = asyncio.Event()
+    started = asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot():
+            started.set()
+            await release.wait()
+
+    task = asyncio.ensure_future(holder())
+    await started.wait()
+    return release, task
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Ordering Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestCommandSchedulerOrdering:
+    """Tests for priority ordering of waiters."""
+
+    def test_uncontended_acquire(self):
+        """The channel is taken immediately when nobody holds it."""
+
+        async def run():
+            scheduler = CommandScheduler()
+            async with scheduler.slot(CommandPriority.TELEMETRY):
+                assert scheduler.locked
+            assert not scheduler.locked
+
+        asyncio.run(run())
+
+    def test_priority_order(self):
+        """Interactive requests jump ahead of queued frames and telemetry."""
+
+        async def run():
+            scheduler = CommandScheduler()
+            log = []
+            release, holder = await _hold(scheduler)
+
+            tasks = [
+                asyncio.ensure_future(
+                    scheduler.run(_recorder(log, "telemetry"), CommandPriority.TELEMETRY)
+                ),
+                asyncio.ensure_future(
+                    scheduler.run(_recorder(log, "frame"), CommandPriority.FRAME)
+                ),
+                asyncio.ensure_future(
+                    scheduler.run(_recorder(log, "interactive"), CommandPriority.INTERACTIVE)
+                ),
+            ]
+            await asyncio.sleep(0)
+            assert scheduler.pending == 3
+
+            release.set()
+            await asyncio.gather(holder, *tasks)
+            return log
+
+        assert asyncio.run(run()) == ["interactive", "frame", "telemetry"]
+
+    def test_fifo_within_priority(self):
+        """Requests of equal priority run in arrival order."""
+
+        async def run():
+            scheduler = CommandScheduler()
+            log = []
+            release, holder = await _hold(scheduler)
+
+            tasks = [
+                asyncio.ensure_future(scheduler.run(_recorder(log, n), CommandPriority.FRAME))
+                for n in range(4)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(holder, *tasks)
+            return log
+
+        assert asyncio.run(run()) == [0, 1, 2, 3]
+
+    def test_cancelled_waiter_is_skipped(self):
+        """A waiter cancelled while queued doesn't block the others."""
+
+        async def run():
+            scheduler = CommandScheduler()
+            log = []
+            release, holder = await _hold(scheduler)
+
+            cancelled = asyncio.ensure_future(scheduler.run(_recorder(log, "cancelled")))
+            kept = asyncio.ensure_future(scheduler.run(_recorder(log, "kept")))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+
+            release.set()
+            await asyncio.gather(holder, kept)
+            assert not scheduler.locked
+            return log
+
+        assert asyncio.run(run()) == ["kept"]
+
+    def test_exception_releases_channel(self):
+        """A failing request doesn't leave the channel held."""
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def run():
+            scheduler = CommandScheduler()
+            with pytest.raises(RuntimeError):
+                await scheduler.run(fail)
+            assert not scheduler.locked
+
+        asyncio.run(run())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Coalescing Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestCommandSchedulerCoalescing:
+    """Tests for latest-wins coalescing of keyed requests."""
+
+    def test_latest_wins(self):
+        """Queued requests with the same key collapse into the newest one."""
+
+        async def run():
+            scheduler = CommandScheduler()
+            log = []
+            release, holder = await _hold(scheduler)
+
+            tasks = [
+                asyncio.ensure_future(scheduler.run(_recorder(log, n, n), key="brightness"))
+                for n in range(5)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+            await holder
+            return log, results, scheduler.superseded
+
+        log, results, superseded = asyncio.run(run())
+        assert log == [4]
+        assert results == [4] * 5
+        assert superseded == 4
+
+    def test_distinct_keys_not_coalesced(self):
+        """Requests with different keys all run."""
+
+        async def run():
+            scheduler = CommandScheduler()
+            log = []
+            release, holder = await _hold(scheduler)
+
+            tasks = [
+                asyncio.ensure_future(scheduler.run(_recorder(log, key), key=key))
+                for key in ("logo", "scroll")
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(holder, *tasks)
+            return log
+
+        assert asyncio.run(run()) == ["logo", "scroll"]
+
+    def test_running_request_not_replaced(self):
+        """A request that already started runs to completion; the next one queues."""
+
+        async def run():
+            scheduler = CommandScheduler()
+            log = []
+            gate = asyncio.Event()
+
+            async def slow():
+                log.append("first")
+                await gate.wait()
+                return "first"
+
+            first = asyncio.ensure_future(scheduler.run(slow, key="led"))
+            await asyncio.sleep(0)
+            second = asyncio.ensure_future(
+                scheduler.run(_recorder(log, "second", "second"), key="led")
+            )
+            await asyncio.sleep(0)
+            gate.set()
+            return log, await first, await second, scheduler.superseded
+
+        log, first, second, superseded = asyncio.run(run())
+        assert log == ["first", "second"]
+        assert (first, second) == ("first", "second")
+        assert superseded == 0
+
+    def test_cancelled_caller_does_not_cancel_shared_request(self):
+        """One caller giving up doesn't cancel the request for the others."""
+
+        async def run():
+            scheduler = CommandScheduler()
+            log = []
+            release, holder = await _hold(scheduler)
+
+            quitter = asyncio.ensure_future(scheduler.run(_recorder(log, "a", "a"), key="led"))
+            waiter = asyncio.ensure_future(scheduler.run(_recorder(log, "b", "b"), key="led"))
+            await asyncio.sleep(0)
+            quitter.cancel()
+
+            release.set()
+            result = await waiter
+            await holder
+            return log, result
+
+        assert asyncio.run(run()) == (["b"], "b")
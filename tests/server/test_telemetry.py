@@ -0,0 +1,184 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+
+# uchroma - TelemetryScheduler unit tests
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from uchroma.server.telemetry import TelemetryScheduler
+
+
+class _Counter:
+    """Telemetry source returning a scripted sequence of values."""
+
+    def __init__(self, *values):
+        self.values = list(values)
+        self.calls = 0
+
+    async def __call__(self):
+        value = self.values[min(self.calls, len(self.values) - 1)]
+        self.calls += 1
+        if isinstance(value, Exception):
+            raise value
+        return dict(value)
+
+
+@pytest.fixture
+def telemetry():
+    return TelemetryScheduler(MagicMock())
+
+
+@pytest.fixture
+def changes(telemetry):
+    received = []
+    telemetry.changed.connect(lambda source, values: received.append((source, values)))
+    return received
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Refresh Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestTelemetryRefresh:
+    """Tests for refreshing a single source."""
+
+    def test_first_refresh_reports_everything(self, telemetry, changes):
+        """The first refresh of a source reports all of its values."""
+        telemetry.add("wireless", _Counter({"BatteryLevel": 50.0, "IsCharging": False}), 10)
+
+        asyncio.run(telemetry.refresh("wireless"))
+
+        assert changes == [("wireless", {"BatteryLevel": 50.0, "IsCharging": False})]
+        assert telemetry.values("wireless") == {"BatteryLevel": 50.0, "IsCharging": False}
+
+    def test_only_changes_reported(self, telemetry, changes):
+        """Later refreshes report only the values that changed."""
+        source = _Counter(
+            {"BatteryLevel": 50.0, "IsCharging": False},
+            {"BatteryLevel": 50.0, "IsCharging": True},
+            {"BatteryLevel": 50.0, "IsCharging": True},
+        )
+        telemetry.add("wireless", source, 10)
+
+        async def run():
+            for _ in range(3):
+                await telemetry.refresh("wireless")
+
+        asyncio.run(run())
+
+        assert changes[1:] == [("wireless", {"IsCharging": True})]
+
+    def test_refresh_returns_all_values(self, telemetry):
+        """refresh() returns the full set of values, not just the changes."""
+        telemetry.add("system", _Counter({"FanRPM": [0]}), 10)
+
+        async def run():
+            await telemetry.refresh("system")
+            return await telemetry.refresh("system")
+
+        assert asyncio.run(run()) == {"FanRPM": [0]}
+
+    def test_adaptive_interval(self, telemetry, monkeypatch):
+        """The interval is recomputed after each refresh."""
+        monkeypatch.setattr("uchroma.server.telemetry.time.monotonic", lambda: 100.0)
+        state = {"charging": False}
+        telemetry.add("wireless", _Counter({}), lambda: 30.0 if state["charging"] else 300.0)
+
+        asyncio.run(telemetry.refresh("wireless"))
+        assert telemetry._sources["wireless"].due == 400.0
+
+        state["charging"] = True
+        asyncio.run(telemetry.refresh("wireless"))
+        assert telemetry._sources["wireless"].due == 130.0
+
+    def test_failed_refresh_rescheduled(self, telemetry, changes):
+        """A failing source keeps its cache and is retried after its interval."""
+        telemetry.add("wireless", _Counter(OSError("gone")), 5.0)
+
+        with pytest.raises(OSError):
+            asyncio.run(telemetry.refresh("wireless"))
+
+        assert telemetry._sources["wireless"].due > 0.0
+        assert telemetry.values("wireless") == {}
+        assert changes == []
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Background Task Tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestTelemetryBackground:
+    """Tests for the background refresh task."""
+
+    def test_start_without_loop_is_noop(self, telemetry):
+        """Starting outside an event loop does nothing."""
+        telemetry.add("wireless", _Counter({}), 10)
+        telemetry.start()
+        assert not telemetry.running
+
+    def test_start_without_sources_is_noop(self, telemetry):
+        """A device without telemetry sources never starts a task."""
+
+        async def run():
+            telemetry.start()
+            return telemetry.running
+
+        assert asyncio.run(run()) is False
+
+    def test_refreshes_all_sources_then_waits(self, telemetry):
+        """Every source is refreshed on start, then again once due."""
+        wireless = _Counter({"IsCharging": False})
+        system = _Counter({"FanRPM": [0]})
+        telemetry.add("wireless", wireless, 60.0)
+        telemetry.add("system", system, 0.01)
+
+        async def run():
+            telemetry.start()
+            await asyncio.sleep(0.05)
+            await telemetry.stop()
+
+        asyncio.run(run())
+
+        assert wireless.calls == 1
+        assert system.calls > 1
+        assert not telemetry.running
+
+    def test_poke_refreshes_early(self, telemetry):
+        """poke() wakes the task and refreshes the source right away."""
+        source = _Counter({"IsCharging": False})
+        telemetry.add("wireless", source, 60.0)
+
+        async def run():
+            telemetry.start()
+            await asyncio.sleep(0.01)
+            telemetry.poke("wireless")
+            await asyncio.sleep(0.01)
+            await telemetry.stop()
+
+        asyncio.run(run())
+
+        assert source.calls == 2
+
+    def test_errors_logged_and_loop_continues(self, telemetry):
+        """A failing source doesn't stop the others."""
+        broken = _Counter(OSError("gone"))
+        working = _Counter({"FanRPM": [0]})
+        telemetry.add("wireless", broken, 60.0)
+        telemetry.add("system", working, 60.0)
+
+        async def run():
+            telemetry.start()
+            await asyncio.sleep(0.01)
+            await telemetry.stop()
+
+        asyncio.run(run())
+
+        assert working.calls == 1
+        telemetry._logger.exception.assert_called_once()
@@ -111,11 +111,26 @@ class TestBlendFunction:
         expected = np.full((4, 4, 3), 0.75, dtype=np.float64)
         np.testing.assert_array_almost_equal(result[:, :, :3], expected)
 
-    def test_blend_requires_float64(self, rgba_half):
-        """Blend raises assertion for non-float64 arrays."""
-        img_int = rgba_half.astype(np.float32)
-        with pytest.raises(AssertionError, match="float64"):
-            blend(img_int, rgba_half, "screen", opacity=1.0)
+    def test_blend_requires_float_storage(self, rgba_half):
+        """Blend raises assertion for non-float arrays."""
+        img_int = rgba_half.astype(np.uint8)
+        with pytest.raises(AssertionError, match="float64 or float32"):
+            blend(img_int, img_int, "screen", opacity=1.0)
+
+    def test_blend_requires_matching_dtypes(self, rgba_half):
+        """Blend raises assertion when precisions are mixed."""
+        img_f32 = rgba_half.astype(np.float32)
+        with pytest.raises(AssertionError, match="same dtype"):
+            blend(img_f32, rgba_half, "screen", opacity=1.0)
+
+    def test_blend_float32(self, rgba_half):
+        """float32 images blend to the same result and keep their dtype."""
+        img_f32 = rgba_half.astype(np.float32)
+        result = blend(img_f32, img_f32, "multiply", opacity=0.5)
+        expected = blend(rgba_half, rgba_half, "multiply", opacity=0.5)
+
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, expected, atol=1e-6)
 
     def test_blend_requires_4_channels_input(self):
         """Blend raises assertion for 3-channel input."""
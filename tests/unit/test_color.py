@@ -1125,6 +1125,52 @@ class TestColorUtilsSchemeGenerator:
         assert isinstance(color, tuple)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Tests for ColorUtils.gradient_lut
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestColorUtilsGradientLut:
+    """Tests for ColorUtils.gradient_lut method."""
+
+    def test_matches_gradient(self):
+        """Lookup table holds the RGB values of gradient()."""
+        colors = ("#004777", "#a30000", "#ff7700")
+        lut = ColorUtils.gradient_lut(90, *colors)
+        expected = [c.rgb for c in ColorUtils.gradient(90, *colors)]
+        assert lut.dtype == np.float64
+        np.testing.assert_array_equal(lut, expected)
+
+    def test_is_read_only(self):
+        """Shared tables cannot be modified by callers."""
+        lut = ColorUtils.gradient_lut(36, "red", "blue")
+        with pytest.raises(ValueError):
+            lut[0, 0] = 0.5
+
+    def test_equal_schemes_share_table(self):
+        """Equal color stops return the same cached array."""
+        first = ColorUtils.gradient_lut(36, "red", "blue")
+        second = ColorUtils.gradient_lut(36, to_color("red"), (0, 0, 255))
+        assert first is second
+
+    def test_key_includes_length_loop_and_saturation(self):
+        """Different parameters produce different tables."""
+        base = ColorUtils.gradient_lut(36, "red", "blue")
+        assert ColorUtils.gradient_lut(72, "red", "blue") is not base
+        assert ColorUtils.gradient_lut(36, "red", "blue", loop=False) is not base
+        desaturated = ColorUtils.gradient_lut(36, "red", "blue", saturation=0.5)
+        assert desaturated is not base
+        expected = [c.ColorWithSaturation(0.5).rgb for c in ColorUtils.gradient(36, "red", "blue")]
+        np.testing.assert_array_equal(desaturated, expected)
+
+    def test_achromatic_stops_hit_cache(self):
+        """Stops with undefined hue still produce a stable cache key."""
+        gray = Color.NewFromHsv(0, 0, 0.5)
+        assert ColorUtils.gradient_lut(10, gray, "white") is ColorUtils.gradient_lut(
+            10, Color.NewFromHsv(0, 0, 0.5), "white"
+        )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Tests for ColorUtils.rgba2rgb
 # ─────────────────────────────────────────────────────────────────────────────
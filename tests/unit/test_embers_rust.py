@@ -35,6 +35,28 @@ class TestDrawEmbers:
         # Alpha should be set
         assert np.all(matrix[:, :, 3] == 1.0)
 
+    def test_draw_embers_float32_matches_float64(self):
+        """float32 matrices render the same image as float64 ones."""
+        width, height = 22, 6
+        particles = np.array([11.0, 3.0, 0.8, 2.0, 4.0, 1.0, 0.5, 1.5], dtype=np.float64)
+        results = []
+
+        for dtype in (np.float64, np.float32):
+            matrix = np.zeros((height, width, 4), dtype=dtype)
+            draw_embers(
+                width=width,
+                height=height,
+                matrix=matrix,
+                particles=particles,
+                color_r=1.0,
+                color_g=0.42,
+                color_b=0.21,
+                ambient_factor=0.05,
+            )
+            results.append(matrix)
+
+        np.testing.assert_allclose(results[1], results[0], atol=1e-6)
+
     def test_draw_embers_respects_dimensions(self):
         """Embers writes correct array shape."""
         width, height = 10, 4
@@ -58,6 +58,17 @@ class TestLayerInitialization:
         """Matrix dtype is float64."""
         assert small_layer.matrix.dtype == np.float64
 
+    def test_float32_storage(self):
+        """Layers can be backed by float32 matrices."""
+        layer = Layer(width=4, height=3, dtype=np.float32)
+        assert layer.matrix.dtype == np.float32
+        assert layer.dtype == np.float32
+
+    def test_unsupported_dtype_raises(self):
+        """Integer storage is rejected."""
+        with pytest.raises(ValueError, match="Unsupported layer dtype"):
+            Layer(width=4, height=3, dtype=np.uint8)
+
     def test_matrix_initialized_to_zeros(self, small_layer):
         """Matrix is initialized to all zeros."""
         np.testing.assert_array_equal(small_layer.matrix, np.zeros((10, 10, 4), dtype=np.float64))
@@ -444,6 +455,95 @@ class TestLayerPutAll:
                     tiny_layer.matrix[row, col][:3], [0.0, 1.0, 0.0], decimal=2
                 )
 
+    def test_put_all_accepts_array(self, rect_layer):
+        """put_all() writes an (h, w, 3) float array directly."""
+        data = np.random.default_rng(1).random((12, 8, 3))
+        rect_layer.put_all(data)
+        np.testing.assert_allclose(rect_layer.matrix[..., :3], data)
+        assert np.all(rect_layer.matrix[..., 3] == 1.0)
+
+    def test_put_all_matches_put(self, tiny_layer, red_color, green_color):
+        """put_all() produces the same matrix as per-pixel put() calls."""
+        data = [[red_color, green_color, "blue", (255, 255, 0), "#00ffff"] for _ in range(5)]
+        expected = Layer(width=5, height=5)
+        for row, values in enumerate(data):
+            for col, value in enumerate(values):
+                expected.put(row, col, value)
+
+        tiny_layer.put_all(data)
+        np.testing.assert_array_equal(tiny_layer.matrix, expected.matrix)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# put_pixels() tests
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestLayerPutPixels:
+    """Tests for Layer.put_pixels() method."""
+
+    def test_single_color_for_all_coordinates(self, small_layer, red_color):
+        """A single color is applied to every coordinate."""
+        small_layer.put_pixels([1, 2, 3], [4, 5, 6], red_color)
+        for row, col in ((1, 4), (2, 5), (3, 6)):
+            np.testing.assert_array_equal(small_layer.matrix[row, col], [1.0, 0.0, 0.0, 1.0])
+        assert np.count_nonzero(small_layer.matrix[..., 3]) == 3
+
+    def test_per_pixel_color_array(self, small_layer):
+        """An (N, 4) array supplies one color per coordinate."""
+        colors = np.array([[1.0, 0.0, 0.0, 1.0], [0.0, 0.0, 1.0, 0.5]])
+        small_layer.put_pixels([0, 9], [0, 9], colors)
+        np.testing.assert_array_equal(small_layer.matrix[0, 0], colors[0])
+        np.testing.assert_array_equal(small_layer.matrix[9, 9], colors[1])
+
+    def test_rgb_array_gets_opaque_alpha(self, small_layer):
+        """(N, 3) colors are treated as fully opaque."""
+        small_layer.put_pixels([2], [3], np.array([[0.2, 0.4, 0.6]]))
+        np.testing.assert_allclose(small_layer.matrix[2, 3], [0.2, 0.4, 0.6, 1.0])
+
+    def test_samples_image_at_coordinates(self, rect_layer):
+        """An (h, w, 4) image is sampled at the given coordinates."""
+        image = np.random.default_rng(2).random((12, 8, 4))
+        rows, cols = np.array([0, 5, 11]), np.array([7, 3, 0])
+        rect_layer.put_pixels(rows, cols, image)
+        np.testing.assert_allclose(rect_layer.matrix[rows, cols], image[rows, cols])
+
+    def test_matches_put_when_blending(self, small_layer, red_color):
+        """Bulk writes blend over existing pixels the same way as put()."""
+        expected = Layer(width=10, height=10)
+        for layer in (small_layer, expected):
+            layer.matrix[...] = [0.0, 0.5, 0.0, 1.0]
+
+        color = Color.NewFromRgb(0.0, 0.0, 1.0, 0.5)
+        for col in range(10):
+            expected.put(4, col, color)
+        small_layer.put_pixels([4] * 10, range(10), color)
+
+        np.testing.assert_allclose(small_layer.matrix, expected.matrix)
+
+    def test_out_of_bounds_ignored(self, tiny_layer):
+        """Coordinates outside the layer are skipped along with their colors."""
+        colors = np.array([[1.0, 0.0, 0.0, 1.0], [0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0]])
+        tiny_layer.put_pixels([-1, 2, 7], [0, 2, 0], colors)
+        np.testing.assert_array_equal(tiny_layer.matrix[2, 2], colors[1])
+        assert np.count_nonzero(tiny_layer.matrix[..., 3]) == 1
+
+    def test_color_count_mismatch_raises(self, tiny_layer):
+        """A color array of the wrong length raises ValueError."""
+        with pytest.raises(ValueError):
+            tiny_layer.put_pixels([0, 1], [0, 1], np.ones((3, 4)))
+
+    def test_returns_self(self, tiny_layer, red_color):
+        """put_pixels() returns the layer instance for chaining."""
+        assert tiny_layer.put_pixels([], [], red_color) is tiny_layer
+
+    def test_float32_layer(self, red_color):
+        """Bulk writes keep the layer's storage type."""
+        layer = Layer(width=4, height=4, dtype=np.float32)
+        layer.put_pixels([1], [1], red_color)
+        assert layer.matrix.dtype == np.float32
+        np.testing.assert_array_equal(layer.matrix[1, 1], [1.0, 0.0, 0.0, 1.0])
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # circle() tests
@@ -616,6 +616,23 @@ class TestSignal:
         signal.fire(1, b=2)
         assert results == [(1, 2)]
 
+    def test_signal_disconnect(self):
+        """Disconnected handlers are no longer called, even from inside fire()."""
+        from uchroma.util import Signal
+
+        results = []
+        signal = Signal()
+
+        def once(x):
+            results.append(x)
+            signal.disconnect(once)
+
+        signal.connect(once)
+        signal.fire(1)
+        signal.fire(2)
+        signal.disconnect(once)
+        assert results == [1]
+
 
 # =============================================================================
 # Singleton tests
@@ -708,6 +725,165 @@ class TestTicker:
         result = asyncio.run(test_async())
         assert result is True
 
+    def test_ticker_counts_late_and_dropped_ticks(self):
+        """Overruns are counted and the next tick syncs to the interval."""
+        from unittest.mock import patch
+
+        from uchroma.util import Ticker
+
+        ticker = Ticker(0.1)
+        with patch("uchroma.util.time.monotonic", side_effect=[0.0, 0.25]), ticker:
+            pass
+        assert ticker.late_ticks == 1
+        assert ticker.dropped_ticks == 2
+        assert ticker._next_tick == pytest.approx(0.05)
+
+        with patch("uchroma.util.time.monotonic", side_effect=[1.0, 1.02]), ticker:
+            pass
+        assert ticker.late_ticks == 1
+        assert ticker._next_tick == pytest.approx(0.08)
+
+
+# =============================================================================
+# RollingStats tests
+# =============================================================================
+class TestRollingStats:
+    """Tests for the RollingStats class."""
+
+    def test_empty_summary(self):
+        """An empty window summarizes to zeros."""
+        from uchroma.util import RollingStats
+
+        summary = RollingStats().summary()
+        assert summary == {"count": 0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+    def test_percentiles(self):
+        """Percentiles are computed over the window."""
+        from uchroma.util import RollingStats
+
+        stats = RollingStats(size=100)
+        for value in range(1, 101):
+            stats.add(value / 1000)
+
+        summary = stats.summary(scale=1000.0)
+        assert summary["count"] == 100
+        assert summary["p50"] == pytest.approx(50.5)
+        assert summary["p99"] == pytest.approx(99.01)
+        assert summary["max"] == pytest.approx(100.0)
+
+    def test_window_keeps_recent_samples(self):
+        """Old samples expire while the total count keeps growing."""
+        from uchroma.util import RollingStats
+
+        stats = RollingStats(size=4)
+        for value in (100, 100, 1, 2, 3, 4):
+            stats.add(value)
+
+        assert stats.count == 6
+        assert sorted(stats.samples) == [1, 2, 3, 4]
+        assert stats.summary()["max"] == 4
+
+    def test_clear(self):
+        """clear() discards all samples."""
+        from uchroma.util import RollingStats
+
+        stats = RollingStats()
+        stats.add(1.0)
+        stats.clear()
+        assert stats.count == 0
+        assert len(stats.samples) == 0
+
+
+# =============================================================================
+# Mailbox tests
+# =============================================================================
+class TestMailbox:
+    """Tests for the Mailbox class."""
+
+    def test_mailbox_starts_empty(self):
+        """A new mailbox has nothing pending."""
+        from uchroma.util import Mailbox
+
+        mailbox = Mailbox()
+        assert mailbox.empty()
+        assert mailbox.get_nowait() is None
+        assert mailbox.dropped == 0
+
+    def test_mailbox_put_get(self):
+        """An item put in the mailbox can be taken once."""
+        from uchroma.util import Mailbox
+
+        mailbox = Mailbox()
+        assert mailbox.put("a") is False
+        assert not mailbox.empty()
+        assert mailbox.get_nowait() == "a"
+        assert mailbox.empty()
+
+    def test_mailbox_latest_wins(self):
+        """Putting replaces a pending item and counts the drop."""
+        from uchroma.util import Mailbox
+
+        mailbox = Mailbox()
+        mailbox.put("a")
+        assert mailbox.put("b") is True
+        assert mailbox.get_nowait() == "b"
+        assert mailbox.dropped == 1
+
+    def test_mailbox_swap(self):
+        """swap hands back the pending item it replaced."""
+        from uchroma.util import Mailbox
+
+        mailbox = Mailbox()
+        assert mailbox.swap("a") is None
+        assert mailbox.swap("b") == "a"
+        assert mailbox.get_nowait() == "b"
+        assert mailbox.dropped == 1
+
+    def test_mailbox_shared_ready_event(self):
+        """Every put sets the shared ready event."""
+        import asyncio
+
+        from uchroma.util import Mailbox
+
+        async def test_async():
+            ready = asyncio.Event()
+            first, second = Mailbox(ready), Mailbox(ready)
+            first.put("a")
+            assert ready.is_set()
+
+            ready.clear()
+            second.swap("b")
+            return ready.is_set()
+
+        assert asyncio.run(test_async())
+
+    def test_mailbox_clear(self):
+        """clear discards the pending item without counting a drop."""
+        from uchroma.util import Mailbox
+
+        mailbox = Mailbox()
+        mailbox.put("a")
+        mailbox.clear()
+        assert mailbox.empty()
+        assert mailbox.dropped == 0
+
+    def test_mailbox_get_waits_for_put(self):
+        """get yields until an item is available."""
+        import asyncio
+
+        from uchroma.util import Mailbox
+
+        async def test_async():
+            mailbox = Mailbox()
+            getter = asyncio.ensure_future(mailbox.get())
+            await asyncio.sleep(0)
+            assert not getter.done()
+
+            mailbox.put("a")
+            return await asyncio.wait_for(getter, timeout=1.0)
+
+        assert asyncio.run(test_async()) == "a"
+
 
 # =============================================================================
 # autocast_decorator tests
@@ -39,14 +39,14 @@ def blend(
     """
     Blend two RGBA images using the specified blend mode.
 
-    :param img_in: Base image (float64, shape [h, w, 4])
-    :param img_layer: Layer image (float64, shape [h, w, 4])
+    :param img_in: Base image (float64 or float32, shape [h, w, 4])
+    :param img_layer: Layer image (same dtype as img_in, shape [h, w, 4])
     :param blend_mode: Blend mode name (default: "screen")
     :param opacity: Layer opacity (0.0 to 1.0)
-    :returns: Blended image (float64, shape [h, w, 4])
+    :returns: Blended image (same dtype as img_in, shape [h, w, 4])
     """
-    assert img_in.dtype == np.float64, "img_in must be float64"
-    assert img_layer.dtype == np.float64, "img_layer must be float64"
+    assert img_in.dtype in (np.float64, np.float32), "img_in must be float64 or float32"
+    assert img_layer.dtype == img_in.dtype, "img_layer must have the same dtype as img_in"
     assert img_in.shape[2] == 4, "img_in must have 4 channels (RGBA)"
     assert img_layer.shape[2] == 4, "img_layer must have 4 channels (RGBA)"
     assert 0.0 <= opacity <= 1.0, "opacity must be between 0.0 and 1.0"
@@ -19,6 +19,7 @@ from uchroma.client.commands.led import LEDCommand
 from uchroma.client.commands.matrix import MatrixCommand
 from uchroma.client.commands.power import PowerCommand
 from uchroma.client.commands.profile import ProfileCommand
+from uchroma.client.commands.stats import StatsCommand
 from uchroma.client.commands.watch import WatchCommand
 
 # All available commands — order determines help output order
@@ -34,6 +35,7 @@ COMMANDS: list[type[Command]] = [
     WatchCommand,
     ProfileCommand,
     AnimCommand,
+    StatsCommand,
     DumpCommand,
 ]
 
@@ -0,0 +1,103 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+"""
+Stats command — animation frame pipeline timings.
+
+Works entirely through D-Bus, no server-side imports.
+"""
+
+import json
+from argparse import ArgumentParser, Namespace
+from typing import ClassVar
+
+from uchroma.client.commands.base import Command
+from uchroma.client.device_service import get_device_service
+
+STAGES = ("draw", "compose", "align", "transmit")
+COUNTERS = ("dropped_frames", "skipped_frames", "late_ticks", "dropped_ticks")
+
+
+class StatsCommand(Command):
+    """Frame pipeline timings for a running animation."""
+
+    name = "stats"
+    help = "Show animation frame timings"
+    aliases: ClassVar[list[str]] = ["perf"]
+
+    def configure_parser(self, parser: ArgumentParser) -> None:
+        parser.add_argument("--json", action="store_true", help="output as JSON")
+
+    def run(self, args: Namespace) -> int:
+        service = get_device_service()
+
+        try:
+            device = service.require_device(args.device_spec)
+        except ValueError as e:
+            return self.error(str(e))
+
+        stats = service.get_frame_stats(device)
+        if stats is None:
+            return self.error("Device does not support animations")
+
+        if args.json:
+            self.print(json.dumps(stats, indent=2))
+            return 0
+
+        if not stats:
+            self.print(self.out.muted("No animation running"))
+            return 0
+
+        self.print()
+        self.print(self.out.header(f" {device.Name}"))
+        self.print()
+
+        key_width = 14
+        self.print(self.out.table_header(key_width, "stage", self._columns()))
+        self.print(self.out.table_sep(key_width))
+
+        stages = stats.get("stages", {})
+        for stage in STAGES:
+            if stage in stages:
+                self.print(
+                    self.out.table_row(
+                        key_width, self.out.key(stage), self._format_summary(stages[stage])
+                    )
+                )
+
+        layers = stats.get("layers", [])
+        if layers:
+            self.print()
+            for layer in layers:
+                name = layer.get("renderer", "").rsplit(".", 1)[-1]
+                label = f"{layer.get('zindex', 0)}: {name}"
+                self.print(
+                    self.out.table_row(
+                        key_width,
+                        self.out.device(label),
+                        self._format_summary(layer.get("draw", {})),
+                    )
+                )
+
+        self.print()
+        for counter in COUNTERS:
+            if counter in stats:
+                label = counter.replace("_", " ")
+                self.print(
+                    self.out.table_row(
+                        key_width, self.out.key(label), self.out.number(stats[counter])
+                    )
+                )
+        self.print()
+
+        return 0
+
+    @staticmethod
+    def _columns() -> str:
+        return "".join(f"{col:>9}" for col in ("p50", "p95", "p99", "max", "count"))
+
+    def _format_summary(self, summary: dict) -> str:
+        """Format a stage summary as aligned millisecond columns."""
+        values = [f"{summary.get(col, 0.0):9.2f}" for col in ("p50", "p95", "p99", "max")]
+        values.append(f"{summary.get('count', 0):9d}")
+        return self.out.number("".join(values))
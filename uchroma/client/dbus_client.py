@@ -364,6 +364,13 @@ class DeviceProxy:
         loop = self._get_loop()
         return loop.run_until_complete(self._anim_iface.call_stop_animation())
 
+    def GetFrameStats(self):
+        if self._anim_iface is None:
+            return None
+        loop = self._get_loop()
+        raw = loop.run_until_complete(self._anim_iface.call_get_frame_stats())
+        return self._unwrap_variants(raw)
+
     # LED Manager properties and methods
     @property
     def AvailableLEDs(self):
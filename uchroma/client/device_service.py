@@ -369,6 +369,10 @@ class DeviceService:
         """Stop and clear all animation layers."""
         return device.StopAnimation()
 
+    def get_frame_stats(self, device: "DeviceProxy") -> dict | None:
+        """Get animation frame pipeline timings and counters."""
+        return device.GetFrameStats()
+
     def get_layer_info(self, device: "DeviceProxy", zindex: int) -> dict | None:
         """Get properties for a specific layer."""
         if not self._try_connect():
@@ -4,6 +4,7 @@
 
 # pylint: disable=invalid-name, no-member
 
+import functools
 import itertools
 import math
 import random
@@ -328,6 +329,32 @@ class ColorUtils:
 
         return gradient
 
+    @staticmethod
+    def gradient_lut(length: int, *colors, loop=True, saturation: float = 1.0) -> np.ndarray:
+        """
+        Generate a gradient as an RGB lookup table
+
+        Produces the same colors as gradient(), as a read-only float64
+        array of shape (N, 3). Tables are kept in a process-wide LRU
+        cache keyed by the color stops, length, loop flag and saturation,
+        so renderers using the same scheme share a single array and
+        regenerating after a trait change is a dictionary lookup.
+
+        :param length: Total number of entries in the final gradient
+        :param colors: Color stops, varargs
+        :param loop: If the gradient should loop back to the first stop
+        :param saturation: Saturation (0-1) applied to every entry when below 1.0
+
+        :return: Read-only array of RGB floats
+        """
+        stops = []
+        for arg in colors:
+            color = to_color(arg)
+            assert isinstance(color, Color)
+            stops.append((color.space(), tuple(color.coords(nans=False)), color.alpha(nans=False)))
+
+        return _cached_gradient_lut(tuple(stops), length, loop, saturation)
+
     @staticmethod
     def color_generator(
         gradient: list, randomize: bool = False, alternate: bool = False, rgb: bool = False
@@ -580,3 +607,24 @@ class ColorUtils:
         output = np.empty((arr.shape[0], arr.shape[1], 3), dtype=np.uint8)
         _rust_rgba2rgb(arr, output, bg[0], bg[1], bg[2])
         return output
+
+
+# Number of gradient lookup tables kept by ColorUtils.gradient_lut
+GRADIENT_LUT_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=GRADIENT_LUT_CACHE_SIZE)
+def _cached_gradient_lut(stops: tuple, length: int, loop: bool, saturation: float) -> np.ndarray:
+    colors = []
+    for space, coords, alpha in stops:
+        color = Color(space, coords)
+        color["alpha"] = alpha
+        colors.append(color)
+
+    gradient = ColorUtils.gradient(length, *colors, loop=loop)
+    if saturation < 1.0:
+        gradient = [c.ColorWithSaturation(saturation) for c in gradient]
+
+    lut = np.array([c.rgb for c in gradient], dtype=np.float64)
+    lut.setflags(write=False)
+    return lut
@@ -10,8 +10,10 @@ cursor position. Used by the key configuration tool to verify that
 the LED matrix coordinates match physical key positions.
 """
 
+import numpy as np
 from traitlets import Int, observe
 
+from uchroma._layer import color_to_np
 from uchroma.colorlib import Color
 from uchroma.renderer import Renderer, RendererMeta
 
@@ -27,6 +29,9 @@ COLUMN_COLORS = [
 
 CURSOR_COLOR = Color.NewFromHsv(0, 0, 1.0)  # White
 
+# RGBA rows of COLUMN_COLORS for bulk drawing
+_COLUMN_RGBA = color_to_np(*COLUMN_COLORS)
+
 
 class Alignment(Renderer):
     """
@@ -64,17 +69,12 @@ class Alignment(Renderer):
             self.cur_col = max(0, min(self.cur_col, self.width - 1))
 
     async def draw(self, layer, timestamp):
-        num_colors = len(COLUMN_COLORS)
-        cur_r, cur_c = self.cur_row, self.cur_col
-
-        for row in range(layer.height):
-            for col in range(layer.width):
-                if row == cur_r and col == cur_c:
-                    # Cursor position - bright white
-                    layer.put(row, col, CURSOR_COLOR)
-                else:
-                    # Column color pattern
-                    color_idx = col % num_colors
-                    layer.put(row, col, COLUMN_COLORS[color_idx])
+        # Column color pattern, tiled across the full width
+        pattern = _COLUMN_RGBA[np.arange(layer.width) % len(_COLUMN_RGBA)]
+        rows, cols = np.indices((layer.height, layer.width))
+        layer.put_pixels(rows, cols, np.broadcast_to(pattern, (layer.height, layer.width, 4)))
+
+        # Cursor position - bright white
+        layer.put_pixels(self.cur_row, self.cur_col, CURSOR_COLOR)
 
         return True
@@ -8,7 +8,6 @@ Shimmering vertical curtains of light that undulate horizontally,
 with colors flowing through greens, teals, and purples.
 """
 
-import numpy as np
 from traitlets import Float, observe
 
 from uchroma._native import draw_aurora as _rust_draw_aurora
@@ -42,16 +41,13 @@ class Aurora(Renderer):
 
     def __init__(self, *args, **kwargs):
         self.gradient_length = 180
-        self._gradient = None
         self._gradient_array = None
         self._time = 0.0
         super().__init__(*args, **kwargs)
         self.fps = 15
 
     def _gen_gradient(self):
-        self._gradient = ColorUtils.gradient(self.gradient_length, *self.color_scheme)
-        # Pre-convert to numpy array for Rust
-        self._gradient_array = np.array([c.rgb for c in self._gradient], dtype=np.float64)
+        self._gradient_array = ColorUtils.gradient_lut(self.gradient_length, *self.color_scheme)
 
     @observe("color_scheme")
     def _scheme_changed(self, changed):
@@ -9,10 +9,10 @@ glowing trails. Multiple comets at different speeds create
 depth and motion.
 """
 
-import math
 import random
 from dataclasses import dataclass, field
 
+import numpy as np
 from traitlets import Float, Int, observe
 
 from uchroma.color import ColorUtils
@@ -21,6 +21,8 @@ from uchroma.traits import ColorSchemeTrait
 
 COMET_COLORS = ["#00ffff", "#ff00ff", "#ffff00", "#00ff88"]
 
+_CHANNELS = np.arange(3)
+
 
 @dataclass
 class Comet:
@@ -64,17 +66,17 @@ class Comets(Renderer):
         x = -self.trail_length - random.random() * 5 if off_screen else random.random() * self.width
         y = random.randint(0, self.height - 1)
         color = self._colors[idx % len(self._colors)]
-        return Comet(x=x, y=y, speed=self.speed * speed_var, color=color.rgb)
+        return Comet(x=x, y=y, speed=self.speed * speed_var, color=tuple(color))
 
     def _gen_colors(self):
-        self._colors = list(ColorUtils.gradient(len(self.color_scheme) * 2, *self.color_scheme))
+        self._colors = ColorUtils.gradient_lut(len(self.color_scheme) * 2, *self.color_scheme)
 
     @observe("color_scheme")
     def _scheme_changed(self, changed):
         self._gen_colors()
         for idx, comet in enumerate(self._comets):
-            if self._colors:
-                comet.color = self._colors[idx % len(self._colors)].rgb
+            if len(self._colors):
+                comet.color = tuple(self._colors[idx % len(self._colors)])
 
     @observe("comet_count")
     def _count_changed(self, changed):
@@ -96,8 +98,7 @@ class Comets(Renderer):
         trail_len = self.trail_length
         head_bright = self.head_brightness
 
-        # Clear layer
-        layer.matrix.fill(0)
+        visible = []
 
         for idx, comet in enumerate(self._comets):
             # Store current position in trail
@@ -105,8 +106,8 @@ class Comets(Renderer):
                 comet.trail.append((comet.x, comet.y))
 
             # Trim trail to max length
-            while len(comet.trail) > trail_len:
-                comet.trail.pop(0)
+            if len(comet.trail) > trail_len:
+                del comet.trail[: len(comet.trail) - trail_len]
 
             # Move comet
             comet.x += comet.speed
@@ -116,37 +117,44 @@ class Comets(Renderer):
                 self._comets[idx] = self._spawn_comet(idx, off_screen=True)
                 continue
 
-            # Render trail with exponential decay
-            for i, (tx, ty) in enumerate(comet.trail):
-                col = int(tx)
-                if 0 <= col < width and 0 <= ty < height:
-                    age = len(comet.trail) - i
-                    brightness = math.exp(-age * decay)
-                    r, g, b = comet.color
-                    # Additive blend
-                    existing = layer.matrix[ty][col]
-                    layer.matrix[ty][col] = (
-                        min(1.0, existing[0] + r * brightness),
-                        min(1.0, existing[1] + g * brightness),
-                        min(1.0, existing[2] + b * brightness),
-                        1.0,
-                    )
-
-            # Render bright head
-            head_col = int(comet.x)
-            if 0 <= head_col < width:
-                r, g, b = comet.color
-                peak = max(r, g, b, 1e-6)
-                scale = head_bright / peak
-                head_r = min(1.0, r * scale)
-                head_g = min(1.0, g * scale)
-                head_b = min(1.0, b * scale)
-                existing = layer.matrix[comet.y][head_col]
-                layer.matrix[comet.y][head_col] = (
-                    min(1.0, existing[0] + head_r),
-                    min(1.0, existing[1] + head_g),
-                    min(1.0, existing[2] + head_b),
-                    1.0,
-                )
+            visible.append(comet)
+
+        # Gather every trail point, then every head, into flat arrays.
+        # A comet never changes row, so its trail shares the head's row.
+        lengths = [len(comet.trail) for comet in visible]
+        xs = np.array(
+            [x for comet in visible for x, _ in comet.trail] + [comet.x for comet in visible],
+            dtype=np.float64,
+        )
+        heads = np.array([comet.y for comet in visible], dtype=np.intp)
+        colors = np.array([comet.color for comet in visible], dtype=np.float64).reshape(-1, 3)
+
+        # Trail with exponential decay: the oldest point has the highest age
+        falloff = np.exp(-np.arange(max(lengths, default=0), 0, -1) * decay)
+        weights = np.concatenate([falloff[len(falloff) - n :] for n in lengths] + [falloff[:0]])
+        trail_rgb = np.repeat(colors, lengths, axis=0) * weights[:, np.newaxis]
+
+        # Bright head, scaled so the dominant channel hits head_brightness
+        peaks = np.maximum(colors.max(axis=1, initial=0.0), 1e-6)
+        head_rgb = np.minimum(colors * (head_bright / peaks)[:, np.newaxis], 1.0)
+
+        rows = np.concatenate((np.repeat(heads, lengths), heads))
+        cols = xs.astype(np.intp)
+        mask = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+        rows = rows[mask]
+        cols = cols[mask]
+        flat = rows * width + cols
+        rgb = np.concatenate((trail_rgb, head_rgb))[mask]
+
+        # Additive blend, saturating at full brightness
+        matrix = layer.matrix
+        acc = np.bincount(
+            (flat[:, np.newaxis] * 3 + _CHANNELS).ravel(),
+            weights=rgb.ravel(),
+            minlength=width * height * 3,
+        )
+        np.minimum(acc.reshape(height, width, 3), 1.0, out=matrix[..., :3])
+        matrix[..., 3] = 0.0
+        matrix[rows, cols, 3] = 1.0
 
         return True
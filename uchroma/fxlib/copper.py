@@ -47,7 +47,7 @@ class CopperBars(Renderer):
         self.fps = 15
 
     def _gen_gradient(self):
-        self._gradient = ColorUtils.gradient(self.gradient_length, *self.color_scheme)
+        self._gradient = ColorUtils.gradient_lut(self.gradient_length, *self.color_scheme)
 
     @observe("color_scheme", "gradient_length", "preset")
     def _scheme_changed(self, changed):
@@ -89,11 +89,11 @@ class CopperBars(Renderer):
                 for col in range(width):
                     h_mod = math.sin(col * 0.3 + t * 1.5) * band_w * 0.3
                     idx = int(base_idx + h_mod) % grad_len
-                    layer.matrix[row][col] = (*gradient[idx].rgb, 1.0)
+                    layer.matrix[row][col] = (*gradient[idx], 1.0)
             else:
                 # Uniform row color (classic copper bar look)
                 idx = int(base_idx) % grad_len
-                color = (*gradient[idx].rgb, 1.0)
+                color = (*gradient[idx], 1.0)
                 for col in range(width):
                     layer.matrix[row][col] = color
 
@@ -60,7 +60,6 @@ class Metaballs(Renderer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._blobs: list[Blob] = []
-        self._gradient = None
         self._gradient_array = None  # Numpy array for Rust
         self.fps = 15
 
@@ -78,13 +77,11 @@ class Metaballs(Renderer):
         )
 
     def _gen_gradient(self):
-        self._gradient = ColorUtils.gradient(360, *self.color_scheme)
-        # Convert Color objects to numpy array for Rust
-        self._gradient_array = np.array([c.rgb for c in self._gradient], dtype=np.float64)
+        self._gradient_array = ColorUtils.gradient_lut(360, *self.color_scheme)
 
     @observe("color_scheme")
     def _scheme_changed(self, changed):
-        if not hasattr(self, "_gradient"):
+        if not hasattr(self, "_gradient_array"):
             return  # Not initialized yet
         self._gen_gradient()
 
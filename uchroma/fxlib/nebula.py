@@ -41,16 +41,13 @@ class Nebula(Renderer):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._gradient = None
         self._gradient_array = None
         self._noise_table = None
         self._time = 0.0
         self.fps = 12
 
     def _gen_gradient(self):
-        self._gradient = ColorUtils.gradient(360, *self.color_scheme)
-        # Pre-convert to numpy array for Rust
-        self._gradient_array = np.array([c.rgb for c in self._gradient], dtype=np.float64)
+        self._gradient_array = ColorUtils.gradient_lut(360, *self.color_scheme)
 
     def _init_noise_table(self, size: int = 64):
         """Generate a simple value noise lookup table as numpy array."""
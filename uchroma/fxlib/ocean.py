@@ -5,7 +5,6 @@
 Ocean - Rolling wave caustics effect.
 """
 
-import numpy as np
 from traitlets import Float, observe
 
 from uchroma._native import draw_ocean as _rust_draw_ocean
@@ -36,17 +35,14 @@ class Ocean(Renderer):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._gradient = None
         self._gradient_array = None
         self._time = 0.0
         self.fps = 15
 
     def _gen_gradient(self):
-        gradient = ColorUtils.gradient(100, *self.color_scheme, loop=False)
-        if self.saturation < 1.0:
-            gradient = [c.ColorWithSaturation(self.saturation) for c in gradient]
-        self._gradient = gradient
-        self._gradient_array = np.array([c.rgb for c in gradient], dtype=np.float64)
+        self._gradient_array = ColorUtils.gradient_lut(
+            100, *self.color_scheme, loop=False, saturation=self.saturation
+        )
 
     @observe("color_scheme", "saturation")
     def _scheme_changed(self, changed):
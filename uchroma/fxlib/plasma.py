@@ -6,7 +6,6 @@
 
 import time
 
-import numpy as np
 from traitlets import Float, Int, observe
 
 from uchroma._native import draw_plasma
@@ -39,16 +38,13 @@ class Plasma(Renderer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self._gradient = None
         self._gradient_array = None  # Numpy array for Rust
         self._start_time = 0
         self.fps = 15
 
     def _gen_gradient(self):
         length = max(2, self.gradient_length)
-        self._gradient = ColorUtils.gradient(length, *self.color_scheme)
-        # Convert Color objects to numpy array for Rust
-        self._gradient_array = np.array([c.rgb for c in self._gradient], dtype=np.float64)
+        self._gradient_array = ColorUtils.gradient_lut(length, *self.color_scheme)
 
     @observe("color_scheme", "gradient_length", "preset")
     def _scheme_changed(self, changed):
@@ -2,6 +2,7 @@
 # Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
 #
 
+import numpy as np
 from traitlets import Int, observe
 
 from uchroma.colorlib import Color
@@ -22,14 +23,18 @@ class Rainbow(Renderer):
         super().__init__(*args, **kwargs)
 
         self._gradient = None
+        self._index = None
         self._offset = 0
 
         self.fps = 5
 
     @staticmethod
-    def _hue_gradient(start, length):
+    def _hue_gradient(start, length) -> np.ndarray:
         step = 360 / length
-        return [Color.NewFromHsv((start + (step * x)) % 360, 1, 1) for x in range(length)]
+        return np.array(
+            [Color.NewFromHsv((start + (step * x)) % 360, 1, 1).rgb for x in range(length)],
+            dtype=np.float64,
+        )
 
     @observe("speed", "stagger")
     def _create_gradient(self, change=None):
@@ -37,25 +42,23 @@ class Rainbow(Renderer):
         length = max(1, self.speed * self.width + (self.height * self.stagger))
         self._gradient = Rainbow._hue_gradient(0, length)
 
+        # Gradient position of each pixel at offset 0
+        rows, cols = np.indices((self.height, self.width))
+        self._index = rows * self.stagger + cols
+
     def init(self, frame):
         self._create_gradient()
         return True
 
     async def draw(self, layer, timestamp):
-        gradient = self._gradient
-        if gradient is None:
+        gradient, index = self._gradient, self._index
+        if gradient is None or index is None:
             return False
 
-        data = []
-        for row in range(layer.height):
-            data.append(
-                [
-                    gradient[(self._offset + (row * self.stagger) + col) % len(gradient)]
-                    for col in range(layer.width)
-                ]
-            )
+        matrix = layer.matrix
+        matrix[..., :3] = gradient[(index + self._offset) % len(gradient)]
+        matrix[..., 3] = 1.0
 
-        layer.put_all(data)
         self._offset = (self._offset + 1) % len(gradient)
 
         return True
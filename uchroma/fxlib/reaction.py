@@ -91,9 +91,9 @@ class Reaction(Renderer):
             self.logger.error("No coordinates available: %s", event)
             return
 
-        react_color = event.data[REACT_COLOR_KEY]
-        for coord in event.coords:
-            layer.put(coord.y, coord.x, react_color)
+        rows = [coord.y for coord in event.coords]
+        cols = [coord.x for coord in event.coords]
+        layer.put_pixels(rows, cols, event.data[REACT_COLOR_KEY])
 
     async def draw(self, layer, timestamp):
         """
@@ -94,42 +94,29 @@ class Typewriter(Renderer):
             for coord in event.coords:
                 row, col = coord.y, coord.x
                 if 0 <= row < height and 0 <= col < width:
-                    brightness[row, col] = peak
-
                     # Spread to neighbors
                     if spread > 0:
-                        for dy in [-1, 0, 1]:
-                            for dx in [-1, 0, 1]:
-                                if dy == 0 and dx == 0:
-                                    continue
-                                ny, nx = row + dy, col + dx
-                                if 0 <= ny < height and 0 <= nx < width:
-                                    brightness[ny, nx] = max(
-                                        brightness[ny, nx],
-                                        peak * spread,
-                                    )
+                        neighbors = brightness[max(row - 1, 0) : row + 2, max(col - 1, 0) : col + 2]
+                        np.maximum(neighbors, peak * spread, out=neighbors)
+
+                    brightness[row, col] = peak
 
         # Decay all brightness values
         brightness *= self._decay_factor
 
         # Render
-        base = self.base_brightness
+        b = np.maximum(brightness, self.base_brightness)
         warmth = self.warmth
-        glow_r, glow_g, glow_b = self._glow_rgb
-
-        for row in range(height):
-            for col in range(width):
-                b = max(base, brightness[row, col])
-
-                # Color temperature: brighter = warmer (shift toward white)
-                if b > 0.7 and warmth > 0:
-                    warm_mix = (b - 0.7) / 0.3 * warmth
-                    r = glow_r + (1.0 - glow_r) * warm_mix
-                    g = glow_g + (1.0 - glow_g) * warm_mix
-                    bl = glow_b + (1.0 - glow_b) * warm_mix
-                else:
-                    r, g, bl = glow_r, glow_g, glow_b
-
-                layer.matrix[row][col] = (r * b, g * b, bl * b, 1.0)
+        glow = np.asarray(self._glow_rgb, dtype=np.float64)
+
+        matrix = layer.matrix
+        if warmth > 0:
+            # Color temperature: brighter = warmer (shift toward white)
+            warm_mix = np.clip(b - 0.7, 0.0, None) / 0.3 * warmth
+            rgb = glow + (1.0 - glow) * warm_mix[..., np.newaxis]
+            matrix[..., :3] = rgb * b[..., np.newaxis]
+        else:
+            matrix[..., :3] = glow * b[..., np.newaxis]
+        matrix[..., 3] = 1.0
 
         return True
@@ -51,10 +51,8 @@ class Vortex(Renderer):
         self.fps = 15
 
     def _gen_gradient(self):
-        """Generate gradient and convert to numpy array for Rust."""
-        gradient = ColorUtils.gradient(360, *self.color_scheme)
-        # Pre-convert to numpy array for Rust
-        self._gradient_array = np.array([c.rgb for c in gradient], dtype=np.float64)
+        """Look up the shared gradient table for the current scheme."""
+        self._gradient_array = ColorUtils.gradient_lut(360, *self.color_scheme)
 
     def _compute_polar_map(self):
         """Precompute polar coordinates using Rust."""
@@ -45,6 +45,7 @@ class DBusService:
         self._bus: MessageBus | None = None
         self._manager_proxy = None
         self._device_proxies = {}
+        self._frame_handlers: dict[str, dict] = {}
         self._change_callbacks = []
         self._state_callbacks: list[Callable[[ConnectionState], None]] = []
         self._state = ConnectionState.DISCONNECTED
@@ -133,6 +134,7 @@ class DBusService:
         self._bus = None
         self._manager_proxy = None
         self._device_proxies.clear()
+        self._frame_handlers.clear()
         self._disconnect_monitor = None
 
     async def _reconnect_loop(self):
@@ -379,6 +381,56 @@ class DBusService:
             print(f"Failed to get current frame: {e}")
             return {}
 
+    async def subscribe_frames(
+        self, path: str, callback: Callable[[dict], None], fps: int = 30
+    ) -> float:
+        """
+        Receive composed frames as they are committed, instead of polling.
+
+        Calling again renews the subscription; the daemon drops it unless
+        renewed within the returned lease.
+
+        :param path: Device object path
+        :param callback: Invoked with the unwrapped frame dict
+        :param fps: Highest rate at which frames should be delivered
+
+        :return: Lease duration in seconds, or 0 on failure
+        """
+        anim_proxy = await self.get_anim_proxy(path)
+        if not anim_proxy or not self._bus:
+            return 0.0
+
+        handlers = self._frame_handlers.setdefault(path, {})
+        if callback not in handlers:
+
+            def handler(raw):
+                callback(self._unwrap_variants(raw))
+
+            handlers[callback] = handler
+            anim_proxy.on_frame_updated(handler)
+
+        try:
+            return await anim_proxy.call_subscribe_frames(self._bus.unique_name, fps)
+        except Exception as e:
+            print(f"Failed to subscribe to frames: {e}")
+            return 0.0
+
+    async def unsubscribe_frames(self, path: str, callback: Callable[[dict], None]):
+        """Stop delivering frames to a callback registered with subscribe_frames."""
+        anim_proxy = await self.get_anim_proxy(path)
+        handler = self._frame_handlers.get(path, {}).pop(callback, None)
+        if not anim_proxy or handler is None:
+            return
+
+        anim_proxy.off_frame_updated(handler)
+        if self._frame_handlers[path] or not self._bus:
+            return
+
+        try:
+            await anim_proxy.call_unsubscribe_frames(self._bus.unique_name)
+        except Exception as e:
+            print(f"Failed to unsubscribe from frames: {e}")
+
     async def get_layer_info(self, path: str, zindex: int) -> dict:
         """Fetch layer trait values."""
         anim_proxy = await self.get_anim_proxy(path)
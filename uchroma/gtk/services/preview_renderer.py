@@ -5,16 +5,77 @@
 Preview Renderer Service
 
 Renders effects locally for real-time preview visualization.
+
+Effects which exist as renderers (plasma, rainbow) are drawn by the
+same Renderer classes and native kernels the daemon uses, into a
+headless frame. Hardware effects have no software implementation and
+are approximated with vectorized numpy.
 """
 
+import importlib
 import math
 import time
 
 import numpy as np
 from gi.repository import GLib
+from traitlets import TraitError
 
+from uchroma._native import compose_layers
 from uchroma.color import to_rgb
-from uchroma.colorlib import Color
+from uchroma.layer import Layer
+from uchroma.log import Log
+
+# Effects previewed with the daemon's own renderers
+RENDERER_EFFECTS = {
+    "plasma": "uchroma.fxlib.plasma.Plasma",
+    "rainbow": "uchroma.fxlib.rainbow.Rainbow",
+}
+
+# Effects which don't change over time, drawn once per change
+STATIC_EFFECTS = {None, "disable", "static"}
+
+
+class _PreviewDriver:
+    """Headless stand-in for a device, sized like the preview."""
+
+    def __init__(self, rows: int, cols: int):
+        self.name = "preview"
+        self.width = cols
+        self.height = rows
+        self.input_manager = None
+        self.logger = Log.get("uchroma.preview")
+
+
+class _PreviewFrame:
+    """
+    Headless frame for preview renderers
+
+    Provides what renderers use from a device Frame, and composes
+    a single layer with the native compositor.
+    """
+
+    def __init__(self, driver: _PreviewDriver):
+        self._driver = driver
+        self.width = driver.width
+        self.height = driver.height
+
+    def create_layer(self) -> Layer:
+        return Layer(self.width, self.height, logger=self._driver.logger, dtype=np.float32)
+
+    @staticmethod
+    def compose(layer: Layer) -> np.ndarray:
+        output = np.empty((layer.height, layer.width, 3), dtype=np.uint8)
+        compose_layers(
+            [layer.matrix], [layer.blend_mode or "screen"], [layer.opacity], 0.0, 0.0, 0.0, output
+        )
+        return output
+
+
+def _hue_to_rgb(hue: np.ndarray | float) -> np.ndarray:
+    """Fully saturated RGB floats for an array of hues in [0, 1)."""
+    hue = np.asarray(hue, dtype=np.float32)[..., None]
+    offsets = np.array([0.0, 4.0, 2.0], dtype=np.float32)
+    return np.clip(np.abs((hue * 6.0 + offsets) % 6.0 - 3.0) - 1.0, 0.0, 1.0)
 
 
 class PreviewRenderer:
@@ -30,6 +91,10 @@ class PreviewRenderer:
         self._tick = 0
         self._start_time = time.time()
 
+        self._renderer = None
+        self._headless = None
+        self._layer = None
+
         self._running = False
         self._source_id = None
         self._fps = 30
@@ -37,9 +102,13 @@ class PreviewRenderer:
 
     def set_size(self, rows: int, cols: int):
         """Update matrix size."""
+        if (rows, cols) == (self.rows, self.cols):
+            return
         self.rows = rows
         self.cols = cols
         self.frame = np.zeros((rows, cols, 3), dtype=np.float32)
+        self._create_renderer()
+        self._schedule()
 
     def set_effect(self, effect_id: str, params: dict | None = None):
         """Set the effect to render."""
@@ -47,6 +116,8 @@ class PreviewRenderer:
         self._effect_params = params or {}
         self._tick = 0
         self._start_time = time.time()
+        self._create_renderer()
+        self._schedule()
 
     def set_callback(self, callback):
         """Set frame update callback: callback(frame: np.ndarray)."""
@@ -59,7 +130,7 @@ class PreviewRenderer:
 
         self._fps = fps
         self._running = True
-        self._source_id = GLib.timeout_add(1000 // fps, self._tick_callback)
+        self._schedule()
 
     def stop(self):
         """Stop rendering loop."""
@@ -67,10 +138,29 @@ class PreviewRenderer:
             return
 
         self._running = False
+        self._cancel()
+
+    def _cancel(self):
         if self._source_id:
             GLib.source_remove(self._source_id)
             self._source_id = None
 
+    def _schedule(self):
+        """(Re)arm the timer at the rate the current effect needs."""
+        self._cancel()
+        if not self._running:
+            return
+
+        # Draw the first frame right away, static effects need nothing more
+        self._tick_callback()
+        if self._effect_id in STATIC_EFFECTS:
+            return
+
+        fps = self._fps
+        if self._renderer is not None:
+            fps = min(fps, self._renderer.fps)
+        self._source_id = GLib.timeout_add(max(1, int(1000 / fps)), self._tick_callback)
+
     def _tick_callback(self) -> bool:
         """GLib timeout callback."""
         if not self._running:
@@ -84,11 +174,58 @@ class PreviewRenderer:
 
         return True
 
+    def _create_renderer(self):
+        """Instantiate the daemon renderer for the current effect, if it has one."""
+        if self._renderer is not None:
+            self._renderer.finish(self._headless)
+        self._renderer = None
+        self._layer = None
+        self.frame = np.zeros((self.rows, self.cols, 3), dtype=np.float32)
+
+        path = RENDERER_EFFECTS.get(self._effect_id)
+        if path is None:
+            return
+
+        module_name, class_name = path.rsplit(".", 1)
+        try:
+            clazz = getattr(importlib.import_module(module_name), class_name)
+            driver = _PreviewDriver(self.rows, self.cols)
+            renderer = clazz(driver)
+            self._apply_traits(renderer)
+            self._headless = _PreviewFrame(driver)
+            if not renderer.init(self._headless):
+                return
+        except Exception as err:
+            Log.get("uchroma.preview").error("Preview renderer %s failed: %s", path, err)
+            return
+
+        self._layer = self._headless.create_layer()
+        self._renderer = renderer
+
+    def _apply_traits(self, renderer):
+        """Apply effect params which match the renderer's configurable traits."""
+        params = dict(self._effect_params)
+        colors = [params.pop(f"color{idx}") for idx in range(1, 5) if f"color{idx}" in params]
+        if colors and renderer.has_trait("color_scheme"):
+            params["color_scheme"] = colors
+
+        traits = renderer.traits(config=True)
+        for name, value in params.items():
+            if name not in traits:
+                continue
+            try:
+                renderer.set_trait(name, value)
+            except TraitError as err:
+                renderer.logger.debug("Ignoring preview param %s=%r: %s", name, value, err)
+
     def _render_frame(self):
         """Render current frame based on effect."""
         t = time.time() - self._start_time
 
-        if self._effect_id == "disable" or self._effect_id is None:
+        if self._renderer is not None:
+            self._render_renderer()
+
+        elif self._effect_id in ("disable", None):
             self.frame.fill(0)
 
         elif self._effect_id == "static":
@@ -113,43 +250,45 @@ class PreviewRenderer:
         elif self._effect_id == "starlight":
             self._render_starlight(t)
 
-        elif self._effect_id == "plasma":
-            self._render_plasma(t)
-
-        elif self._effect_id == "rainbow":
-            self._render_rainbow(t)
-
         else:
             self.frame.fill(0)
 
+    def _render_renderer(self):
+        """Draw one frame with the daemon renderer and compose it natively."""
+        layer = self._layer
+        if layer is None:
+            return
+
+        layer.clear()
+        try:
+            drawn = self._renderer.draw_sync(layer, time.time())
+        except Exception as err:
+            self._renderer.logger.error("Preview draw failed: %s", err)
+            self._renderer = None
+            return
+
+        if drawn:
+            self.frame = self._headless.compose(layer)
+
     def _render_wave(self, t: float):
         """Render wave effect."""
         direction = self._effect_params.get("direction", "RIGHT")
         speed = self._effect_params.get("speed", 2) * 2
 
-        for col in range(self.cols):
-            if direction == "LEFT":
-                phase = (col / self.cols + t * speed * 0.1) % 1.0
-            else:
-                phase = (1 - col / self.cols + t * speed * 0.1) % 1.0
+        position = np.arange(self.cols, dtype=np.float32) / self.cols
+        if direction != "LEFT":
+            position = 1 - position
 
-            # Rainbow gradient
-            self.frame[:, col] = Color.NewFromHsv(phase * 360, 1.0, 1.0).rgb
+        # Rainbow gradient
+        self.frame[:, :] = _hue_to_rgb((position + t * speed * 0.1) % 1.0)
 
     def _render_spectrum(self, t: float):
         """Render spectrum cycle effect."""
-        hue = (t * 0.1) % 1.0
-        self.frame[:, :] = Color.NewFromHsv(hue * 360, 1.0, 1.0).rgb
+        self.frame[:, :] = _hue_to_rgb((t * 0.1) % 1.0)
 
     def _render_breathe(self, t: float):
         """Render breathing effect."""
-        colors = self._effect_params.get("colors") or []
-        if colors:
-            color1 = self._parse_color(colors[0])
-            color2 = self._parse_color(colors[1] if len(colors) > 1 else colors[0])
-        else:
-            color1 = self._parse_color(self._effect_params.get("color1", "#e135ff"))
-            color2 = self._parse_color(self._effect_params.get("color2", "#80ffea"))
+        color1, color2 = self._color_pair()
         speed = self._effect_params.get("speed", 2)
 
         # Smooth sine wave between colors
@@ -164,67 +303,36 @@ class PreviewRenderer:
 
     def _render_starlight(self, t: float):
         """Render twinkling starlight effect."""
-        colors = self._effect_params.get("colors") or []
-        if colors:
-            color1 = self._parse_color(colors[0])
-            color2 = self._parse_color(colors[1] if len(colors) > 1 else colors[0])
-        else:
-            color1 = self._parse_color(self._effect_params.get("color1", "#e135ff"))
-            color2 = self._parse_color(self._effect_params.get("color2", "#80ffea"))
+        color1, color2 = self._color_pair()
 
         # Base dim color
         self.frame[:, :] = [c * 0.1 for c in color1]
 
         # Random twinkling stars
-        np.random.seed(int(t * 10) % 1000)
-        for _ in range(self.rows * self.cols // 6):
-            row = np.random.randint(0, self.rows)
-            col = np.random.randint(0, self.cols)
-            color = color1 if np.random.random() > 0.5 else color2
-            brightness = 0.5 + 0.5 * np.random.random()
-            self.frame[row, col] = [c * brightness for c in color]
-
-    def _render_plasma(self, t: float):
-        """Render plasma effect."""
-        colors = [
+        rng = np.random.default_rng(int(t * 10) % 1000)
+        count = self.rows * self.cols // 6
+        rows = rng.integers(0, self.rows, count)
+        cols = rng.integers(0, self.cols, count)
+        colors = np.where(
+            (rng.random(count) > 0.5)[:, None],
+            np.asarray(color1, dtype=np.float32),
+            np.asarray(color2, dtype=np.float32),
+        )
+        brightness = 0.5 + 0.5 * rng.random(count, dtype=np.float32)
+        self.frame[rows, cols] = colors * brightness[:, None]
+
+    def _color_pair(self) -> tuple:
+        """Two effect colors, from a color list or color1/color2 params."""
+        colors = self._effect_params.get("colors") or []
+        if colors:
+            return (
+                self._parse_color(colors[0]),
+                self._parse_color(colors[1] if len(colors) > 1 else colors[0]),
+            )
+        return (
             self._parse_color(self._effect_params.get("color1", "#e135ff")),
             self._parse_color(self._effect_params.get("color2", "#80ffea")),
-            self._parse_color(self._effect_params.get("color3", "#ff6ac1")),
-            self._parse_color(self._effect_params.get("color4", "#f1fa8c")),
-        ]
-
-        for row in range(self.rows):
-            for col in range(self.cols):
-                # Classic plasma formula
-                x = col / self.cols
-                y = row / self.rows
-
-                v1 = math.sin(x * 10 + t)
-                v2 = math.sin(10 * (x * math.sin(t / 2) + y * math.cos(t / 3)) + t)
-                v3 = math.sin(math.sqrt((x - 0.5) ** 2 + (y - 0.5) ** 2) * 10 + t)
-                v = (v1 + v2 + v3) / 3
-
-                # Map to color palette
-                idx = int((v + 1) / 2 * (len(colors) - 1))
-                idx = max(0, min(len(colors) - 1, idx))
-                frac = ((v + 1) / 2 * (len(colors) - 1)) % 1
-
-                c1 = colors[idx]
-                c2 = colors[min(idx + 1, len(colors) - 1)]
-
-                r = c1[0] * (1 - frac) + c2[0] * frac
-                g = c1[1] * (1 - frac) + c2[1] * frac
-                b = c1[2] * (1 - frac) + c2[2] * frac
-
-                self.frame[row, col] = [r, g, b]
-
-    def _render_rainbow(self, t: float):
-        """Render flowing rainbow effect."""
-        speed = self._effect_params.get("speed", 1.0)
-
-        for col in range(self.cols):
-            hue = (col / self.cols + t * speed * 0.1) % 1.0
-            self.frame[:, col] = Color.NewFromHsv(hue * 360, 1.0, 1.0).rgb
+        )
 
     def _parse_color(self, color_str: str) -> tuple:
         """Parse hex color to RGB floats."""
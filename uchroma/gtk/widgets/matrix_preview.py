@@ -8,6 +8,7 @@ Animated LED matrix visualization using Cairo.
 """
 
 import math
+import sys
 
 import cairo
 import gi
@@ -40,6 +41,19 @@ class MatrixPreview(Gtk.DrawingArea):
         self.cell_gap = 2
         self.glow_enabled = True
 
+        # Cell colors as floats, with CELL_OFF where there is no data
+        self._colors = None
+
+        # Cached layers: the background is redrawn only on resize,
+        # the cells only where their color changed
+        self._background_surface = None
+        self._background_key = None
+        self._cell_surface = None
+        self._cell_key = None
+        self._drawn_colors = None
+        self._glow_surface = None
+        self._glow_data = None
+
         # Set size request based on matrix
         self.set_content_width(cols * 28 + 40)
         self.set_content_height(rows * 28 + 40)
@@ -52,33 +66,64 @@ class MatrixPreview(Gtk.DrawingArea):
         # Styling
         self.add_css_class("matrix-preview")
 
+        self._set_colors()
+
     def set_matrix_size(self, rows: int, cols: int):
         """Update matrix dimensions."""
         self.rows = rows
         self.cols = cols
         self.set_content_width(cols * 28 + 40)
         self.set_content_height(rows * 28 + 40)
-        self.queue_draw()
+        self._set_colors()
 
     def set_active_cells(self, cells: set[tuple[int, int]] | None):
         """Set active cell positions to render (None = all)."""
         self.active_cells = cells
+        self._cell_surface = None
         self.queue_draw()
 
     def update_frame(self, frame: np.ndarray):
         """Update with new frame data. Shape: (rows, cols, 3) or (rows, cols, 4)."""
         self.frame_data = frame
-        self.queue_draw()
+        self._set_colors()
 
     def clear(self):
         """Clear the display."""
         self.frame_data = None
+        self._set_colors()
+
+    def _set_colors(self):
+        """
+        Convert the frame to cell colors, and skip the redraw
+        entirely if nothing changed
+        """
+        colors = np.empty((self.rows, self.cols, 3), dtype=np.float64)
+        colors[:] = self.CELL_OFF
+
+        frame = self.frame_data
+        if frame is not None:
+            rows = min(self.rows, frame.shape[0])
+            cols = min(self.cols, frame.shape[1])
+            pixels = frame[:rows, :cols, :3]
+            if frame.dtype == np.uint8:
+                colors[:rows, :cols] = pixels / 255
+            else:
+                colors[:rows, :cols] = pixels
+
+        if self._colors is not None and np.array_equal(colors, self._colors):
+            return
+
+        self._colors = colors
+        self._glow_surface = None
         self.queue_draw()
 
     def _draw(self, area, cr, width, height):
         """Cairo draw function."""
+        scale = area.get_scale_factor()
+
         # Background with subtle gradient
-        self._draw_background(cr, width, height)
+        cr.set_source_surface(self._get_background(width, height, scale), 0, 0)
+        cr.paint()
 
         # Ambient halo (color wash based on frame content)
         if self.glow_enabled:
@@ -97,33 +142,71 @@ class MatrixPreview(Gtk.DrawingArea):
             self._draw_glow_layer(cr, padding, cell_w, cell_h)
 
         # Draw cells
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.active_cells is not None and (row, col) not in self.active_cells:
-                    continue
-
-                x = padding + col * cell_w
-                y = padding + row * cell_h
-
-                # Get color
-                if (
-                    self.frame_data is not None
-                    and row < self.frame_data.shape[0]
-                    and col < self.frame_data.shape[1]
-                ):
-                    pixel = self.frame_data[row, col]
-                    if self.frame_data.dtype == np.uint8:
-                        r, g, b = pixel[0] / 255, pixel[1] / 255, pixel[2] / 255
-                    else:
-                        r, g, b = pixel[0], pixel[1], pixel[2]
-                else:
-                    r, g, b = self.CELL_OFF
-
-                self._draw_cell(cr, x, y, cell_w, cell_h, r, g, b)
+        cr.set_source_surface(self._get_cells(width, height, scale, padding), 0, 0)
+        cr.paint()
 
         # Border frame
         self._draw_border(cr, width, height, padding)
 
+    @staticmethod
+    def _create_surface(width, height, scale) -> cairo.ImageSurface:
+        """Transparent image surface matching the widget's device pixels."""
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32, math.ceil(width * scale), math.ceil(height * scale)
+        )
+        surface.set_device_scale(scale, scale)
+        return surface
+
+    def _get_background(self, width, height, scale) -> cairo.ImageSurface:
+        """The background, rendered once per widget size."""
+        key = (width, height, scale)
+        if self._background_key != key:
+            self._background_surface = self._create_surface(width, height, scale)
+            self._draw_background(cairo.Context(self._background_surface), width, height)
+            self._background_key = key
+        return self._background_surface
+
+    def _get_cells(self, width, height, scale, padding) -> cairo.ImageSurface:
+        """
+        The cell layer, where only cells whose color changed since
+        the last draw are repainted
+        """
+        key = (width, height, scale, self.rows, self.cols)
+        if self._cell_surface is None or self._cell_key != key:
+            self._cell_surface = self._create_surface(width, height, scale)
+            self._cell_key = key
+            self._drawn_colors = None
+
+        colors = self._colors
+        if self._drawn_colors is None:
+            dirty = np.ones((self.rows, self.cols), dtype=bool)
+        else:
+            dirty = np.any(colors != self._drawn_colors, axis=2)
+
+        cell_w = (width - padding * 2) / self.cols
+        cell_h = (height - padding * 2) / self.rows
+
+        cr = cairo.Context(self._cell_surface)
+        for row, col in zip(*np.nonzero(dirty), strict=True):
+            if self.active_cells is not None and (row, col) not in self.active_cells:
+                continue
+
+            x = padding + col * cell_w
+            y = padding + row * cell_h
+
+            cr.save()
+            cr.rectangle(x, y, cell_w, cell_h)
+            cr.clip()
+            cr.set_operator(cairo.OPERATOR_CLEAR)
+            cr.paint()
+            cr.restore()
+
+            r, g, b = colors[row, col]
+            self._draw_cell(cr, x, y, cell_w, cell_h, r, g, b)
+
+        self._drawn_colors = colors
+        return self._cell_surface
+
     def _draw_background(self, cr, width, height):
         """Draw gradient background with vignette and subtle texture."""
         # Vignette-style radial gradient
@@ -152,38 +235,58 @@ class MatrixPreview(Gtk.DrawingArea):
             cr.line_to(width, gy)
         cr.stroke()
 
+    def _get_glow(self) -> cairo.ImageSurface:
+        """
+        Glow as a small image with one pixel per cell, plus a one
+        cell margin, blurred so it spills onto the neighbouring cells
+        """
+        if self._glow_surface is not None:
+            return self._glow_surface
+
+        colors = self._colors
+
+        # Moderate glow for bright cells only (rec. 709 luma)
+        brightness = colors @ np.array([0.2126, 0.7152, 0.0722])
+        alpha = np.where(brightness < 0.4, 0.0, brightness * 0.3)
+
+        # Premultiplied BGRA, padded by a cell on every side
+        rgba = np.zeros((self.rows + 2, self.cols + 2, 4), dtype=np.float64)
+        rgba[1:-1, 1:-1, :3] = colors[..., ::-1] * alpha[..., None]
+        rgba[1:-1, 1:-1, 3] = alpha
+
+        # 3x3 box blur
+        padded = np.pad(rgba, ((1, 1), (1, 1), (0, 0)))
+        blurred = sum(
+            padded[dy : dy + self.rows + 2, dx : dx + self.cols + 2]
+            for dy in range(3)
+            for dx in range(3)
+        )
+        blurred *= 1.5 / 9
+
+        width = self.cols + 2
+        height = self.rows + 2
+        stride = cairo.ImageSurface.format_stride_for_width(cairo.FORMAT_ARGB32, width)
+        data = np.zeros((height, stride), dtype=np.uint8)
+        pixels = np.clip(blurred * 255, 0, 255).astype(np.uint8)
+        if sys.byteorder == "big":
+            pixels = pixels[..., ::-1]
+        data[:, : width * 4] = pixels.reshape(height, width * 4)
+
+        self._glow_data = data
+        self._glow_surface = cairo.ImageSurface.create_for_data(
+            data.data, cairo.FORMAT_ARGB32, width, height, stride
+        )
+        return self._glow_surface
+
     def _draw_glow_layer(self, cr, padding, cell_w, cell_h):
         """Draw subtle glow behind bright cells."""
-        if self.frame_data is None:
-            return
-
-        # Single pass: moderate glow for bright cells only
-        for row in range(self.rows):
-            for col in range(self.cols):
-                pixel = self.frame_data[row, col]
-                if self.frame_data.dtype == np.uint8:
-                    r, g, b = pixel[0] / 255, pixel[1] / 255, pixel[2] / 255
-                else:
-                    r, g, b = float(pixel[0]), float(pixel[1]), float(pixel[2])
-
-                # Calculate perceptual brightness (rec. 709 luma)
-                brightness = 0.2126 * r + 0.7152 * g + 0.0722 * b
-                if brightness < 0.4:  # Higher threshold = less glow
-                    continue
-
-                x = padding + col * cell_w + cell_w / 2
-                y = padding + row * cell_h + cell_h / 2
-
-                # Moderate glow radius
-                glow_radius = max(cell_w, cell_h) * 1.3
-                pattern = cairo.RadialGradient(x, y, 0, x, y, glow_radius)
-                pattern.add_color_stop_rgba(0, r, g, b, brightness * 0.3)
-                pattern.add_color_stop_rgba(0.6, r, g, b, brightness * 0.08)
-                pattern.add_color_stop_rgba(1, r, g, b, 0)
-
-                cr.set_source(pattern)
-                cr.arc(x, y, glow_radius, 0, 2 * math.pi)
-                cr.fill()
+        cr.save()
+        cr.translate(padding - cell_w, padding - cell_h)
+        cr.scale(cell_w, cell_h)
+        cr.set_source_surface(self._get_glow(), 0, 0)
+        cr.get_source().set_filter(cairo.FILTER_BILINEAR)
+        cr.paint()
+        cr.restore()
 
     def _draw_cell(self, cr, x, y, cell_w, cell_h, r, g, b):
         """Draw a single LED cell with clean lighting."""
@@ -238,13 +341,7 @@ class MatrixPreview(Gtk.DrawingArea):
             return
 
         # Sample average color from frame
-        avg_r = float(np.mean(self.frame_data[:, :, 0]))
-        avg_g = float(np.mean(self.frame_data[:, :, 1]))
-        avg_b = float(np.mean(self.frame_data[:, :, 2]))
-
-        # Normalize if uint8
-        if self.frame_data.dtype == np.uint8:
-            avg_r, avg_g, avg_b = avg_r / 255, avg_g / 255, avg_b / 255
+        avg_r, avg_g, avg_b = (float(c) for c in self._colors.mean(axis=(0, 1)))
 
         # Only glow if there's meaningful color
         brightness = 0.2126 * avg_r + 0.7152 * avg_g + 0.0722 * avg_b
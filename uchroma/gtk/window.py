@@ -36,6 +36,9 @@ from .services.preview_renderer import PreviewRenderer  # noqa: E402
 from .widgets import BrightnessScale, MatrixPreview  # noqa: E402
 from .widgets.effect_card import icon_for_effect, preview_for_effect  # noqa: E402
 
+# Renew the daemon's frame subscription well inside its lease
+LIVE_PREVIEW_RENEW_MS = 2000
+
 
 class UChromaWindow(Adw.ApplicationWindow):
     """Main application window."""
@@ -76,6 +79,7 @@ class UChromaWindow(Adw.ApplicationWindow):
         self._device_preview_renderers = {}
         self._device_previews = {}
         self._live_preview_source = None
+        self._live_preview_path = None
         self._live_preview_inflight = False
         self._live_preview_seq = None
         self._live_preview_interval_ms = self._read_live_preview_interval()
@@ -957,10 +961,14 @@ class UChromaWindow(Adw.ApplicationWindow):
             return
         self._preview_renderer.stop()
         self._live_preview_seq = None
+        self._live_preview_path = self._device.path
+        # Frames are pushed by the daemon; the timer only renews the subscription
         self._live_preview_source = GLib.timeout_add(
-            self._live_preview_interval_ms,
+            LIVE_PREVIEW_RENEW_MS,
             self._live_preview_tick,
         )
+        self._live_preview_inflight = True
+        self._schedule_task(self._subscribe_live_frames(self._live_preview_path, initial=True))
 
     def _stop_live_preview(self):
         if self._live_preview_source is None:
@@ -968,50 +976,67 @@ class UChromaWindow(Adw.ApplicationWindow):
         GLib.source_remove(self._live_preview_source)
         self._live_preview_source = None
         self._live_preview_seq = None
+        self._schedule_task(self._unsubscribe_live_frames(self._live_preview_path))
+        self._live_preview_path = None
 
     def _live_preview_tick(self) -> bool:
         if self._live_preview_inflight:
             return True
-        if not self._device:
+        if not self._live_preview_path:
             return False
         self._live_preview_inflight = True
-        self._schedule_task(self._fetch_live_frame(self._device))
+        self._schedule_task(self._subscribe_live_frames(self._live_preview_path))
         return True
 
-    async def _fetch_live_frame(self, device):
+    async def _subscribe_live_frames(self, path: str, initial: bool = False):
         try:
             app = self.get_application()
             if not app or not hasattr(app, "dbus"):
                 return
-            if self._live_preview_source is None:
-                return
-
-            frame = await app.dbus.get_current_frame(device.path)
-            if not frame:
-                return
-
-            data = frame.get("data")
-            width = int(frame.get("width") or 0)
-            height = int(frame.get("height") or 0)
-            seq = frame.get("seq")
-            if not data or width <= 0 or height <= 0:
-                return
-            if seq is not None and seq == self._live_preview_seq:
+            if self._live_preview_path != path:
                 return
 
-            buffer = np.frombuffer(data, dtype=np.uint8)
-            expected = width * height * 3
-            if buffer.size < expected:
-                return
+            fps = max(1, 1000 // self._live_preview_interval_ms)
+            await app.dbus.subscribe_frames(path, self._on_live_frame, fps)
 
-            matrix = buffer[:expected].reshape((height, width, 3))
-            if self._matrix_preview.rows != height or self._matrix_preview.cols != width:
-                GLib.idle_add(self._matrix_preview.set_matrix_size, height, width)
-            GLib.idle_add(self._matrix_preview.update_frame, matrix)
-            self._live_preview_seq = seq
+            # Paused animations commit nothing, so fetch what is already there
+            if initial and self._live_preview_path == path:
+                frame = await app.dbus.get_current_frame(path)
+                if frame:
+                    self._on_live_frame(frame)
         finally:
             self._live_preview_inflight = False
 
+    async def _unsubscribe_live_frames(self, path: str | None):
+        app = self.get_application()
+        if not path or not app or not hasattr(app, "dbus"):
+            return
+        await app.dbus.unsubscribe_frames(path, self._on_live_frame)
+
+    def _on_live_frame(self, frame: dict):
+        if self._live_preview_source is None or not frame:
+            return
+
+        data = frame.get("data")
+        width = int(frame.get("width") or 0)
+        height = int(frame.get("height") or 0)
+        seq = frame.get("seq")
+        if not data or width <= 0 or height <= 0:
+            return
+        if seq is not None and seq == self._live_preview_seq:
+            return
+
+        buffer = np.frombuffer(data, dtype=np.uint8)
+        expected = width * height * 3
+        if buffer.size < expected:
+            return
+
+        matrix = buffer[:expected].reshape((height, width, 3))
+        if self._matrix_preview.rows != height or self._matrix_preview.cols != width:
+            GLib.idle_add(self._matrix_preview.set_matrix_size, height, width)
+        GLib.idle_add(self._matrix_preview.update_frame, matrix)
+        self._live_preview_seq = seq
+
     def _iter_target_devices(self) -> list:
         if self._selected_devices:
             return self._selected_devices
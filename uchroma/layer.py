@@ -16,6 +16,10 @@ from uchroma.colorlib import Color
 from uchroma.log import Log
 from uchroma.util import clamp
 
+# Supported storage types for layer matrices. float32 halves the memory
+# traffic of drawing and compositing; float64 is the default.
+LAYER_DTYPES = (np.float64, np.float32)
+
 
 class Layer:
     """
@@ -23,7 +27,11 @@ class Layer:
     custom display frame. Layers may be stacked and composited together.
     """
 
-    def __init__(self, width: int, height: int, logger=None):
+    def __init__(self, width: int, height: int, logger=None, dtype=np.float64):
+        dtype = np.dtype(dtype)
+        if dtype not in LAYER_DTYPES:
+            raise ValueError(f"Unsupported layer dtype: {dtype}")
+
         self._width = width
         self._height = height
 
@@ -32,7 +40,7 @@ class Layer:
         else:
             self._logger = logger
 
-        self._matrix = np.zeros(shape=(self._height, self._width, 4), dtype=np.float64)
+        self._matrix = np.zeros(shape=(self._height, self._width, 4), dtype=dtype)
 
         self._bg_color = None
         self._blend_mode = "screen"
@@ -96,6 +104,13 @@ class Layer:
         """
         return self._matrix
 
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        The storage type of the layer matrix (float64 or float32)
+        """
+        return self._matrix.dtype
+
     @property
     def background_color(self) -> Color | None:
         """
@@ -179,14 +194,91 @@ class Layer:
 
         return self
 
-    def put_all(self, data: list) -> "Layer":
+    def put_pixels(self, rows, cols, colors, alpha=1.0) -> "Layer":
         """
-        Set the color of all pixels
+        Set the color of many pixels in a single operation
+
+        Skips per-pixel Color construction: colors may be given as a
+        prebuilt float array of shape (N, 4) or (N, 3) matching the
+        coordinates, a single (4,) or (3,) color applied to every
+        coordinate, an image of shape (height, width, 3|4) sampled at
+        the coordinates, or any single color accepted by put().
+        Pixels outside the layer are ignored. If a coordinate appears
+        more than once, the last color wins.
+
+        :param rows: Y-coordinates of the pixels
+        :param cols: X-coordinates of the pixels
+        :param colors: Color data as described above
+        :param alpha: Alpha multiplier (scalar or per-pixel array)
+
+        :return: This layer instance
+        """
+        rr = np.asarray(rows, dtype=np.intp).ravel()
+        cc = np.asarray(cols, dtype=np.intp).ravel()
+        if rr.shape != cc.shape:
+            raise ValueError(f"rows and cols must have the same length ({rr.size} != {cc.size})")
+
+        inside = (rr >= 0) & (rr < self._height) & (cc >= 0) & (cc < self._width)
+        clipped = not inside.all()
+        if clipped:
+            rr, cc = rr[inside], cc[inside]
+        if rr.size == 0:
+            return self
+
+        if isinstance(colors, np.ndarray):
+            rgba = np.asarray(colors, dtype=np.float64)
+            if rgba.ndim == 3:
+                rgba = rgba[rr, cc]
+            elif rgba.ndim == 2:
+                if rgba.shape[0] != inside.size:
+                    raise ValueError(f"Expected {inside.size} colors, got {rgba.shape[0]}")
+                if clipped:
+                    rgba = rgba[inside]
+            if rgba.shape[-1] == 3:
+                rgba = np.concatenate((rgba, np.ones((*rgba.shape[:-1], 1))), axis=-1)
+            if rgba.ndim > 2 or rgba.shape[-1] != 4:
+                raise ValueError(f"Unsupported color array shape: {colors.shape}")
+        else:
+            color = to_color(colors)
+            assert isinstance(color, Color)
+            rgba = color_to_np(color)[0]
+
+        if rgba.ndim == 1:
+            rgba = np.broadcast_to(rgba, (rr.size, 4))
+
+        if not np.isscalar(alpha):
+            alpha = np.asarray(alpha, dtype=np.float64).ravel()
+            if clipped:
+                alpha = alpha[inside]
 
-        :param data: List of lists (row * col) of colors
+        set_color(self.matrix, (rr, cc), rgba, alpha)
+
+        return self
+
+    def put_all(self, data) -> "Layer":
         """
-        for row in range(len(data)):
-            self.put(row, 0, *data[row])
+        Set the color of all pixels
+
+        :param data: List of lists (row * col) of colors, or a float
+                     array of shape (height, width, 3|4)
+        """
+        if isinstance(data, np.ndarray):
+            rr, cc = np.indices(data.shape[:2])
+            return self.put_pixels(rr, cc, data)
+
+        rows = []
+        cols = []
+        colors = []
+        for row, values in enumerate(data):
+            rows.extend([row] * len(values))
+            cols.extend(range(len(values)))
+            colors.extend(values)
+
+        if colors:
+            converted = to_color(*colors)
+            if not isinstance(converted, list):
+                converted = [converted]
+            self.put_pixels(rows, cols, color_to_np(*converted))
 
         return self
 
@@ -5,7 +5,11 @@
 # pylint: disable=invalid-name, too-many-instance-attributes, too-many-function-args
 
 import asyncio
+import os
+import threading
+import time
 from abc import abstractmethod
+from concurrent import futures
 from typing import NamedTuple
 
 from traitlets import Bool, Float, HasTraits, Int, observe
@@ -15,12 +19,26 @@ from uchroma.input_queue import InputQueue
 from uchroma.layer import Layer
 from uchroma.log import Log
 from uchroma.traits import ColorTrait, DefaultCaselessStrEnum, WriteOnceInt
-from uchroma.util import Ticker
+from uchroma.util import Mailbox, RollingStats, Ticker
 
 MAX_FPS = 30
 DEFAULT_FPS = 15
 NUM_BUFFERS = 2
 
+_draw_executor: futures.ThreadPoolExecutor | None = None
+
+
+def _get_draw_executor() -> futures.ThreadPoolExecutor:
+    """
+    Get the worker pool shared by all renderers which offload drawing
+    """
+    global _draw_executor
+    if _draw_executor is None:
+        _draw_executor = futures.ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="uchroma-draw"
+        )
+    return _draw_executor
+
 
 class RendererMeta(NamedTuple):
     display_name: str
@@ -49,9 +67,24 @@ class Renderer(HasTraits):
     zindex = Int(default_value=-1)
     running = Bool(False)
 
+    # Renderers with CPU-heavy draw() implementations may set this to run
+    # draw() on a worker thread, keeping the event loop free for D-Bus,
+    # input and HID I/O. The draw() coroutine must then complete without
+    # awaiting anything, and may only touch the layer, its own traits and
+    # private state. Not the input queue or other event loop objects.
+    # Trait changes made while an offloaded draw() runs wait for it to
+    # finish, so a frame is never drawn with half-applied settings.
+    # No shipped renderer uses this yet.
+    offload_draw = False
+
     def __init__(self, driver, *args, **kwargs):
+        # Held by draw_sync(), see offload_draw
+        self._draw_lock = threading.RLock()
+
+        # Free buffers wait in _avail_q, drawn buffers are handed to the
+        # AnimationLoop through a latest-wins slot
         self._avail_q = asyncio.Queue(maxsize=NUM_BUFFERS)
-        self._active_q = asyncio.Queue(maxsize=NUM_BUFFERS)
+        self._active_slot = Mailbox()
 
         self.running = False
 
@@ -59,6 +92,8 @@ class Renderer(HasTraits):
         self.height = driver.height
 
         self._tick = Ticker(1 / DEFAULT_FPS)
+        self._draw_stats = RollingStats()
+        self._pending_draw: asyncio.Future | None = None
 
         self._input_queue = None
         if hasattr(driver, "input_manager") and driver.input_manager is not None:
@@ -109,6 +144,41 @@ class Renderer(HasTraits):
         """
         return False
 
+    def draw_sync(self, layer: Layer, timestamp: float) -> bool:
+        """
+        Run draw() to completion on the calling thread, without an
+        event loop. Used for offloaded drawing and by the preview.
+
+        :param layer: Layer to draw
+        :param timestamp: The timestamp of this frame
+
+        :raises RuntimeError: if draw() suspends
+
+        :return: True if the frame has been drawn
+        """
+        with self._draw_lock:
+            coro = self.draw(layer, timestamp)
+            try:
+                coro.send(None)
+            except StopIteration as done:
+                return done.value
+            coro.close()
+        raise RuntimeError("draw() must not suspend when run synchronously")
+
+    def __setattr__(self, name, value):
+        if self.offload_draw and self.has_trait(name):
+            with self._draw_lock:
+                super().__setattr__(name, value)
+        else:
+            super().__setattr__(name, value)
+
+    def set_trait(self, name, value):
+        if self.offload_draw:
+            with self._draw_lock:
+                super().set_trait(name, value)
+        else:
+            super().set_trait(name, value)
+
     @property
     def has_key_input(self) -> bool:
         """
@@ -161,6 +231,40 @@ class Renderer(HasTraits):
         """
         return self._logger
 
+    @property
+    def draw_stats(self) -> RollingStats:
+        """
+        Durations (seconds) of recent draw() calls
+        """
+        return self._draw_stats
+
+    @property
+    def ticker(self) -> Ticker:
+        """
+        The ticker pacing this renderer, with late/dropped tick counts
+        """
+        return self._tick
+
+    async def _draw(self, layer: Layer, timestamp: float) -> bool:
+        if not self.offload_draw:
+            return await self.draw(layer, timestamp)
+
+        loop = asyncio.get_running_loop()
+        self._pending_draw = loop.run_in_executor(
+            _get_draw_executor(), self.draw_sync, layer, timestamp
+        )
+        # Shielded: cancelling _run can't stop the worker thread, so the
+        # future stays pending until _stop() has waited for it
+        return await asyncio.shield(self._pending_draw)
+
+    async def _wait_draw(self):
+        """
+        Wait for an offloaded draw() still writing into its layer
+        """
+        pending, self._pending_draw = self._pending_draw, None
+        if pending is not None and not pending.done():
+            await asyncio.wait([pending])
+
     def _free_layer(self, layer):
         """
         Clear the layer and return it to the queue
@@ -192,7 +296,9 @@ class Renderer(HasTraits):
 
                 try:
                     # draw the layer
-                    status = await self.draw(layer, asyncio.get_running_loop().time())
+                    start = time.perf_counter()
+                    status = await self._draw(layer, asyncio.get_running_loop().time())
+                    self._draw_stats.add(time.perf_counter() - start)
                 except Exception as err:
                     self.logger.exception("Exception in renderer, exiting now!", exc_info=err)
                     self.logger.error("Renderer traits: %s", self._trait_values)
@@ -201,10 +307,12 @@ class Renderer(HasTraits):
                 if not self.running:
                     break
 
-                # submit for composition
+                # submit for composition, recycling a frame the loop never took
                 if status:
                     layer.lock(True)
-                    await self._active_q.put(layer)
+                    stale = self._active_slot.swap(layer)
+                    if stale is not None:
+                        self._free_layer(stale)
 
         await self._stop()
 
@@ -213,8 +321,7 @@ class Renderer(HasTraits):
             return
         for _qlen in range(self._avail_q.qsize()):
             self._avail_q.get_nowait()
-        for _qlen in range(self._active_q.qsize()):
-            self._active_q.get_nowait()
+        self._active_slot.clear()
 
     async def _stop(self):
         if not self.running:
@@ -222,6 +329,7 @@ class Renderer(HasTraits):
 
         self.running = False
 
+        await self._wait_draw()
         self._flush()
 
         if self.has_key_input:
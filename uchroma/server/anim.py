@@ -7,30 +7,39 @@
 import asyncio
 import contextlib
 import inspect
+import time
 from collections import OrderedDict
 from concurrent import futures
 from importlib.metadata import entry_points
 from typing import NamedTuple
 
+import numpy as np
 from traitlets import All, Bool, HasTraits, List, observe
 
 from uchroma.log import LOG_TRACE
 from uchroma.renderer import MAX_FPS, NUM_BUFFERS, Renderer, RendererMeta
 from uchroma.traits import FrozenDict, get_args_dict
-from uchroma.util import Signal, Ticker, ensure_future
+from uchroma.util import Mailbox, RollingStats, Signal, Ticker, ensure_future
 
 from .frame import Frame
 
 
 class LayerHolder(HasTraits):
-    def __init__(self, renderer: Renderer, frame: Frame, blend_mode=None, *args, **kwargs):
+    def __init__(
+        self,
+        renderer: Renderer,
+        frame: Frame,
+        blend_mode=None,
+        ready: asyncio.Event | None = None,
+        *args,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
 
         self._renderer = renderer
         self._frame = frame
         self._blend_mode = blend_mode
 
-        self.waiter = None
         self.active_buf = None
         self.task = None
         self._finished = False
@@ -40,6 +49,7 @@ class LayerHolder(HasTraits):
         self._renderer.observe(self._traits_changed, names=All)
 
         self._renderer._flush()
+        self._renderer._active_slot.ready = ready
 
         for _buf in range(NUM_BUFFERS):
             layer = self._frame.create_layer()
@@ -81,10 +91,6 @@ class LayerHolder(HasTraits):
             self.task.cancel()
             tasks.append(self.task)
 
-        if self.waiter is not None and not self.waiter.done():
-            self.waiter.cancel()
-            tasks.append(self.waiter)
-
         await self.renderer._stop()
 
         if tasks:
@@ -104,14 +110,19 @@ class AnimationLoop(HasTraits):
     composited image.
 
     The loop is a fully asynchronous design, and renderers may independently
-    block or yield buffers at different rates. Each renderer has a pair of
-    asyncio.Queue objects and will put buffers onto the "active" queue when
-    their draw cycle is completed. The loop yields on these queues until
-    at least one buffer is available. All new buffers are placed on the
-    "active" list and the previous buffers are returned to the respective
-    renderer on the "avail" queue. If a renderer doesn't produce any output
-    during the round, the current buffer is kept. The active list is finally
-    composed and sent to the hardware.
+    block or yield buffers at different rates. Each renderer hands finished
+    buffers over in a latest-wins "active" slot, and every slot sets one
+    event shared by the loop. The loop yields on this event until at least
+    one buffer is available. All new buffers are placed on the "active"
+    list and the previous buffers are returned to the respective renderer
+    on the "avail" queue. If a renderer doesn't produce any output during
+    the round, the current buffer is kept. The active list is finally
+    composed and handed to the transmit stage.
+
+    Transmission runs in its own task so the next frame can be composed
+    while the current one is being sent. Frames are handed over through a
+    latest-wins mailbox: if the device can't keep up, stale frames are
+    dropped instead of queueing up behind the USB transfers.
 
     The design of this loop intends to be as CPU-efficient as possible and
     does not wake up spuriously or otherwise consume cycles while inactive.
@@ -124,8 +135,17 @@ class AnimationLoop(HasTraits):
         self._default_blend_mode = default_blend_mode
 
         self._anim_task = None
+        self._tx_task = None
         self._stop_task = None
 
+        self._tx_mailbox = Mailbox()
+
+        # Set by any renderer which has a new buffer ready
+        self._layers_ready = asyncio.Event()
+
+        self._tick = Ticker(1 / MAX_FPS)
+        self._compose_stats = RollingStats()
+
         self._pause_event = asyncio.Event()
         self._pause_event.set()
 
@@ -137,6 +157,59 @@ class AnimationLoop(HasTraits):
         self._sorted_layers = []
         self._layers_dirty = True
 
+    @property
+    def dropped_frames(self) -> int:
+        """
+        Number of composed frames which were replaced by a newer
+        frame before the device was ready to receive them
+        """
+        return self._tx_mailbox.dropped
+
+    def stats(self) -> dict:
+        """
+        Snapshot of the frame pipeline timings
+
+        Stage timings are rolling summaries (count, p50, p95, p99, max)
+        in milliseconds. "draw" aggregates all layers, which are also
+        reported individually.
+
+        :return: dict of stage summaries, per-layer draw summaries and
+                 dropped/late frame counters
+        """
+        frame = self._frame
+        layers = []
+        draw_samples = []
+        draw_count = 0
+        for holder in sorted(self.layers, key=lambda z: z.zindex):
+            renderer = holder.renderer
+            draw_samples.append(renderer.draw_stats.samples)
+            draw_count += renderer.draw_stats.count
+            layers.append(
+                {
+                    "zindex": holder.zindex,
+                    "renderer": holder.type_string,
+                    "draw": renderer.draw_stats.summary(scale=1000.0),
+                    "late_ticks": renderer.ticker.late_ticks,
+                    "dropped_ticks": renderer.ticker.dropped_ticks,
+                }
+            )
+
+        samples = np.concatenate(draw_samples) if draw_samples else np.empty(0)
+
+        return {
+            "stages": {
+                "draw": RollingStats.summarize(samples, draw_count, scale=1000.0),
+                "compose": self._compose_stats.summary(scale=1000.0),
+                "align": frame.align_stats.summary(scale=1000.0),
+                "transmit": frame.transmit_stats.summary(scale=1000.0),
+            },
+            "layers": layers,
+            "dropped_frames": self.dropped_frames,
+            "skipped_frames": frame.skipped_frames,
+            "late_ticks": self._tick.late_ticks,
+            "dropped_ticks": self._tick.dropped_ticks,
+        }
+
     @observe("layers")
     def _start_stop(self, change):
         old = 0
@@ -150,32 +223,11 @@ class AnimationLoop(HasTraits):
         elif new == 0 and old > 0 and self.running:
             self.stop()
 
-    async def _dequeue(self, r_idx: int):
-        """
-        Gather completed layers from the renderers. If nothing
-        is available, keep the last layer (in case the renderers
-        are producing output at different rates). Yields until
-        at least one layer is ready.
-        """
-        if not self.running or r_idx >= len(self.layers):
-            return
-
-        layer = self.layers[r_idx]
-        renderer = layer.renderer
-
-        # wait for a buffer
-        buf = await renderer._active_q.get()
-
-        # return the old buffer to the renderer
-        if layer.active_buf is not None:
-            renderer._free_layer(layer.active_buf)
-
-        # put it on the active list
-        layer.active_buf = buf
-
     def _dequeue_nowait(self, r_idx) -> bool:
         """
-        Variation of _dequeue which does not yield.
+        Take a finished buffer from a renderer without yielding.
+        If nothing is available, the last layer is kept (in case
+        the renderers are producing output at different rates).
 
         :return: True if any layers became active
         """
@@ -186,44 +238,38 @@ class AnimationLoop(HasTraits):
         renderer = layer.renderer
 
         # check if a buffer is ready
-        if not renderer._active_q.empty():
-            buf = renderer._active_q.get_nowait()
-            if buf is not None:
-                # return the last buffer
-                if layer.active_buf is not None:
-                    renderer._free_layer(layer.active_buf)
+        buf = renderer._active_slot.get_nowait()
+        if buf is None:
+            return False
 
-                # put it on the composition list
-                layer.active_buf = buf
-                return True
+        # return the last buffer
+        if layer.active_buf is not None:
+            renderer._free_layer(layer.active_buf)
 
-        return False
+        # put it on the composition list
+        layer.active_buf = buf
+        return True
 
     async def _get_layers(self):
         """
         Wait for renderers to produce new layers, yields until at least one
         layer is active.
         """
-        # schedule tasks to wait on each renderer queue
-        for r_idx, _ in enumerate(self.layers):
-            if _.waiter is None or _.waiter.done():
-                _.waiter = ensure_future(self._dequeue(r_idx))
-
-        # async wait for at least one completion
-        waiters = [layer.waiter for layer in self.layers]
-        if not waiters:
-            return
+        while self.running and self.layers:
+            self._layers_ready.clear()
 
-        await asyncio.wait(waiters, return_when=futures.FIRST_COMPLETED)
+            ready = False
+            for r_idx in range(len(self.layers)):
+                ready |= self._dequeue_nowait(r_idx)
+            if ready:
+                return
 
-        # check the rest without waiting
-        for r_idx, _ in enumerate(self.layers):
-            if _.waiter is not None and not _.waiter.done():
-                self._dequeue_nowait(r_idx)
+            await self._layers_ready.wait()
 
     async def _commit_layers(self):
         """
-        Merge layers from all renderers and commit to the hardware
+        Merge layers from all renderers and queue the result for
+        transmission to the hardware
         """
         if self._logger.isEnabledFor(LOG_TRACE - 1):
             self._logger.debug("Layers: %s", self.layers)
@@ -241,21 +287,48 @@ class AnimationLoop(HasTraits):
 
         try:
             if active_bufs:
-                await self._frame.commit(active_bufs)
+                start = time.perf_counter()
+                img = self._frame.compose(active_bufs)
+                self._compose_stats.add(time.perf_counter() - start)
+                if img is not None:
+                    self._tx_mailbox.put(img)
 
         except Exception as err:
             self._logger.error(
-                "Frame commit failed (%s), stopping animation: %s", type(err).__name__, err
+                "Frame composition failed (%s), stopping animation: %s", type(err).__name__, err
             )
             self._error = True
             await self._stop()
 
+    async def _transmit(self):
+        """
+        Transmit stage
+
+        Sends the most recently composed frame to the hardware, waiting
+        for the next one when idle. Runs concurrently with composition.
+        """
+        while self.running:
+            img = await self._tx_mailbox.get()
+            if not self.running:
+                break
+
+            try:
+                await self._frame.commit_image(img)
+
+            except Exception as err:
+                self._logger.error(
+                    "Frame commit failed (%s), stopping animation: %s", type(err).__name__, err
+                )
+                self._error = True
+                await self._stop()
+                break
+
     async def _animate(self):
         """
         Main loop
 
         Starts the renderers, waits for new layers to be drawn,
-        composites the layers, sends them to the hardware, and
+        composites the layers, hands them to the transmit stage, and
         finally syncs to achieve consistent frame rate. If no
         layers are ready, the loop yields to prevent spurious
         wakeups.
@@ -266,13 +339,11 @@ class AnimationLoop(HasTraits):
         for layer in self.layers:
             layer.start()
 
-        tick = Ticker(1 / MAX_FPS)
-
         # loop forever, waiting for layers
         while self.running:
             await self._pause_event.wait()
 
-            async with tick:
+            async with self._tick:
                 await self._get_layers()
 
                 if not self.running:
@@ -310,7 +381,9 @@ class AnimationLoop(HasTraits):
                 self._logger.error("Renderer %s failed to initialize", renderer.name)
                 return False
 
-            layer = LayerHolder(renderer, self._frame, self._default_blend_mode)
+            layer = LayerHolder(
+                renderer, self._frame, self._default_blend_mode, ready=self._layers_ready
+            )
             tmp = self.layers[:]
             tmp.insert(zindex, layer)
             self._update_z(tmp)
@@ -377,6 +450,8 @@ class AnimationLoop(HasTraits):
         self.running = True
 
         self._stop_task = None
+        self._tx_mailbox.clear()
+        self._tx_task = ensure_future(self._transmit())
         self._anim_task = ensure_future(self._animate())
         self._anim_task.add_done_callback(self._renderer_done)
 
@@ -392,15 +467,22 @@ class AnimationLoop(HasTraits):
             return False
 
         self.running = False
+        current_task = asyncio.current_task()
+
+        # Stop transmitting first so no stale frame lands after the reset
+        self._tx_mailbox.clear()
+        tx_task, self._tx_task = self._tx_task, None
+        if tx_task is not None and not tx_task.done() and tx_task is not current_task:
+            tx_task.cancel()
+            await asyncio.wait([tx_task], return_when=futures.ALL_COMPLETED)
 
         for layer in self.layers[::-1]:
             await self.remove_layer(layer)
 
-        if self._anim_task is not None and not self._anim_task.done():
-            current_task = asyncio.current_task()
-            if current_task is not self._anim_task:
-                self._anim_task.cancel()
-                await asyncio.wait([self._anim_task], return_when=futures.ALL_COMPLETED)
+        anim_task = self._anim_task
+        if anim_task is not None and not anim_task.done() and anim_task is not current_task:
+            anim_task.cancel()
+            await asyncio.wait([anim_task], return_when=futures.ALL_COMPLETED)
 
         self._logger.info("AnimationLoop stopped")
 
@@ -696,6 +778,17 @@ class AnimationManager(HasTraits):
         """
         return self._loop is not None and self._loop.running
 
+    def frame_stats(self) -> dict:
+        """
+        Frame pipeline timings of the animation loop
+
+        :return: dict as returned by AnimationLoop.stats(), empty
+                 if no animation has been created
+        """
+        if self._loop is None:
+            return {}
+        return self._loop.stats()
+
     def __del__(self):
         # Note: stop() is async, but we can't await in __del__.
         # Just mark as not running; proper cleanup should use shutdown() coroutine.
@@ -0,0 +1,342 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+"""
+Shared virtual canvas.
+
+A canvas renders one layer stack at its own resolution and fans every
+composed frame out to any number of devices. Each device shows a
+viewport of the canvas, resampled to the size of its lighting matrix,
+so effects stay in sync across devices and are only rendered once.
+"""
+
+import asyncio
+import time
+from contextlib import suppress
+from typing import NamedTuple
+
+import numpy as np
+
+from uchroma.log import Log
+from uchroma.util import Mailbox, Signal, ensure_future
+
+from .anim import AnimationManager
+from .frame import Frame
+from .fx import CUSTOM
+from .prefs import Preferences
+
+
+class Viewport(NamedTuple):
+    """
+    Region of the canvas shown on a device, in canvas pixels
+    """
+
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+class CanvasFrame(Frame):
+    """
+    Frame which hands composed images to the canvas outputs
+    instead of sending them to hardware
+    """
+
+    def __init__(self, canvas: "SharedCanvas"):
+        super().__init__(canvas, canvas.width, canvas.height)
+        self._canvas = canvas
+
+    async def commit_image(
+        self, img: np.ndarray | None, frame_id: int | None = None, show=True
+    ) -> "Frame":
+        if img is None:
+            return self
+
+        start = time.perf_counter()
+        self._canvas._publish(img)
+        self._transmit_stats.add(time.perf_counter() - start)
+
+        self._last_frame = img
+        self._frame_seq += 1
+        self._last_frame_ts = time.monotonic()
+        self.frame_committed.fire(self._frame_seq)
+        return self
+
+    async def reset(self, frame_id: int | None = None) -> "Frame":
+        self._last_frame = None
+        return self
+
+
+class _CanvasOutput:
+    """
+    A device attached to the canvas
+
+    Frames are delivered through a latest-wins mailbox and sent by a
+    task per device, so a slow device only drops its own frames.
+    """
+
+    def __init__(self, canvas: "SharedCanvas", driver, viewport: Viewport):
+        self.driver = driver
+        self.viewport = viewport
+        self.frames = 0
+
+        self._canvas = canvas
+        self._mailbox = Mailbox()
+        self._rows, self._cols = _sample_index(
+            viewport, canvas.height, canvas.width, driver.height, driver.width
+        )
+        self._task = ensure_future(self._run())
+
+    @property
+    def dropped(self) -> int:
+        return self._mailbox.dropped
+
+    def put(self, img: np.ndarray):
+        self._mailbox.put(img)
+
+    def clear(self):
+        self._mailbox.clear()
+
+    def project(self, img: np.ndarray) -> np.ndarray:
+        """
+        Sample this output's viewport from a canvas image
+
+        :param img: Composed canvas image
+        :return: New image sized for the device
+        """
+        return img[self._rows[:, None], self._cols]
+
+    async def stop(self):
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+    async def _run(self):
+        while True:
+            img = await self._mailbox.get()
+            if self.driver.suspended:
+                continue
+
+            try:
+                await self.driver.frame_control.commit_image(self.project(img))
+                self.frames += 1
+
+            except Exception as err:
+                self._canvas.logger.error(
+                    "Frame commit failed on %s (%s), detaching: %s",
+                    self.driver.name,
+                    type(err).__name__,
+                    err,
+                )
+                ensure_future(self._canvas.detach(self.driver, reset=False))
+                return
+
+
+def _sample_index(viewport: Viewport, canvas_h: int, canvas_w: int, height: int, width: int):
+    """
+    Nearest-neighbour sample positions of a viewport at a device's size
+
+    :return: Tuple of (row indices, column indices) into the canvas
+    """
+    rows = viewport.y + (np.arange(height) + 0.5) * (viewport.height / height)
+    cols = viewport.x + (np.arange(width) + 0.5) * (viewport.width / width)
+    return (
+        np.clip(np.floor(rows).astype(np.intp), 0, canvas_h - 1),
+        np.clip(np.floor(cols).astype(np.intp), 0, canvas_w - 1),
+    )
+
+
+class SharedCanvas:
+    """
+    Virtual device which renders a layer stack once for many devices.
+
+    Layers are managed through the canvas's own AnimationManager, exactly
+    like on a device. Attaching a device stops its own animation; starting
+    an animation or a hardware effect on the device detaches it again.
+    """
+
+    def __init__(self, name: str, width: int, height: int):
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Invalid canvas size: {width}x{height}")
+
+        self._name = name
+        self._width = width
+        self._height = height
+
+        self.logger = Log.get(f"uchroma.canvas.{name}")
+
+        self.power_state_changed = Signal()
+        self.restore_prefs = Signal()
+        self.input_manager = None
+
+        self._outputs = {}
+        self._preferences = Preferences()
+        self._frame_control = CanvasFrame(self)
+        self._animation_manager = AnimationManager(self)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def frame_control(self) -> CanvasFrame:
+        return self._frame_control
+
+    @property
+    def animation_manager(self) -> AnimationManager:
+        """
+        Animation manager which renders the canvas layers
+        """
+        return self._animation_manager
+
+    @property
+    def preferences(self) -> Preferences:
+        """
+        In-memory preferences, canvases are not persisted
+        """
+        return self._preferences
+
+    @property
+    def devices(self) -> list:
+        """
+        Drivers currently attached to the canvas
+        """
+        return [output.driver for output in self._outputs.values()]
+
+    def viewport(self, driver) -> Viewport | None:
+        """
+        The region of the canvas shown on a device
+
+        :param driver: An attached device
+        :return: The viewport, or None if the device isn't attached
+        """
+        output = self._outputs.get(driver.key)
+        return output.viewport if output is not None else None
+
+    async def attach(self, driver, viewport: Viewport | None = None) -> bool:
+        """
+        Show the canvas on a device
+
+        Any animation running on the device is stopped. Attaching a
+        device again replaces its viewport.
+
+        :param driver: The device to attach, it must have a lighting matrix
+        :param viewport: Region of the canvas to show, defaults to all of it
+
+        :return: True if the device was attached
+        """
+        if driver.frame_control is None:
+            self.logger.error("Device %s has no lighting matrix", driver.name)
+            return False
+
+        if viewport is None:
+            viewport = Viewport(0, 0, self._width, self._height)
+        if viewport.width <= 0 or viewport.height <= 0:
+            raise ValueError(f"Invalid viewport: {viewport}")
+
+        if driver.key in self._outputs:
+            await self.detach(driver, reset=False)
+
+        if driver.is_animating:
+            await driver.animation_manager.stop_async()
+
+        self._outputs[driver.key] = _CanvasOutput(self, driver, viewport)
+        driver.animation_manager.state_changed.connect(self._device_state_changed)
+        if driver.fx_manager is not None:
+            driver.fx_manager.observe(self._device_fx_changed, names=["current_fx"])
+
+        last = self._frame_control.last_frame
+        if last is not None and self._animation_manager.running:
+            self._outputs[driver.key].put(last)
+
+        self.logger.info("Attached %s at %s", driver.name, viewport)
+        return True
+
+    async def detach(self, driver, reset: bool = True) -> bool:
+        """
+        Stop showing the canvas on a device
+
+        :param driver: The device to detach
+        :param reset: Clear the device's frame afterwards
+
+        :return: True if the device was attached
+        """
+        output = self._outputs.pop(driver.key, None)
+        if output is None:
+            return False
+
+        driver.animation_manager.state_changed.disconnect(self._device_state_changed)
+        if driver.fx_manager is not None:
+            driver.fx_manager.unobserve(self._device_fx_changed, names=["current_fx"])
+
+        await output.stop()
+        if reset:
+            await driver.reset()
+
+        self.logger.info("Detached %s", driver.name)
+        return True
+
+    def stats(self) -> dict:
+        """
+        Delivery counters for each attached device
+
+        :return: dict of device key to frames sent and dropped
+        """
+        return {
+            key: {"frames": output.frames, "dropped_frames": output.dropped}
+            for key, output in self._outputs.items()
+        }
+
+    async def reset(self) -> bool:
+        """
+        Clear all attached devices, called when the canvas animation stops
+        """
+        outputs = list(self._outputs.values())
+        for output in outputs:
+            output.clear()
+
+        results = await asyncio.gather(
+            *(output.driver.reset() for output in outputs), return_exceptions=True
+        )
+        for output, result in zip(outputs, results, strict=True):
+            if isinstance(result, Exception):
+                self.logger.error("Reset failed on %s: %s", output.driver.name, result)
+        return True
+
+    async def shutdown(self):
+        """
+        Stop rendering and detach every device
+        """
+        await self._animation_manager.shutdown()
+        for output in list(self._outputs.values()):
+            await self.detach(output.driver, reset=False)
+
+    def _publish(self, img: np.ndarray):
+        for output in self._outputs.values():
+            output.put(img)
+
+    def _attached(self, predicate) -> list:
+        return [output.driver for output in self._outputs.values() if predicate(output.driver)]
+
+    def _device_state_changed(self, state):
+        # The device started an animation of its own
+        if state != "running":
+            return
+        for driver in self._attached(lambda d: d.animation_manager.running):
+            ensure_future(self.detach(driver, reset=False))
+
+    def _device_fx_changed(self, change):
+        fx_name = change.new[0] if change.new else None
+        if fx_name in (None, CUSTOM, "disable"):
+            return
+        for driver in self._attached(lambda d: d.fx_manager is change.owner):
+            ensure_future(self.detach(driver, reset=False))
@@ -15,6 +15,8 @@ rather than interacting with the hardware directly.
 
 import asyncio
 import os
+import re
+import time
 from collections import OrderedDict
 from contextlib import suppress
 from enum import Enum
@@ -28,6 +30,7 @@ from dbus_fast.service import ServiceInterface, dbus_property, method, signal
 from uchroma.dbus_utils import dbus_prepare
 from uchroma.util import Signal, ensure_future
 
+from .canvas import Viewport
 from .system_control import BoostMode, PowerMode
 from .types import LEDType
 
@@ -39,6 +42,21 @@ def dev_mode_enabled():
 BUS_NAME = "io.uchroma"
 ROOT_PATH = "/io/uchroma"
 
+# D-Bus interface which owns the properties of each telemetry source
+TELEMETRY_INTERFACES = {
+    "wireless": "io.uchroma.Device",
+    "system": "io.uchroma.SystemControl",
+}
+
+# Canvas names become an object path element
+CANVAS_NAME = re.compile(r"[A-Za-z0-9_]+")
+
+# FrameUpdated is emitted no faster than this, whatever subscribers ask for
+FRAME_STREAM_MAX_FPS = 60
+
+# Frame subscriptions expire unless renewed within this many seconds
+FRAME_STREAM_LEASE = 5.0
+
 
 def _interface_properties(iface: ServiceInterface) -> dict:
     props = {}
@@ -213,6 +231,17 @@ class DeviceInterface(ServiceInterface):
         if current != self._driver.suspended:
             self.emit_properties_changed({"Suspended": self._driver.suspended})
 
+    @dbus_property()
+    def HandleIdleTimeout(self) -> "d":
+        return float(getattr(self._driver, "handle_idle_timeout", 0.0))
+
+    @HandleIdleTimeout.setter
+    def HandleIdleTimeout(self, value: "d"):
+        if value < 0.0 or value == self._driver.handle_idle_timeout:
+            return
+        self._driver.handle_idle_timeout = value
+        self.emit_properties_changed({"HandleIdleTimeout": self._driver.handle_idle_timeout})
+
     @method()
     async def Reset(self):
         await self._driver.reset()
@@ -224,6 +253,11 @@ class DeviceInterface(ServiceInterface):
             self.emit_properties_changed(updates)
         return dbus_prepare(updates, variant=True)[0]
 
+    @method()
+    def GetHandleStats(self) -> "a{sv}":
+        """Get HID handle counters, the idle timeout and command pacing state."""
+        return dbus_prepare(self._driver.handle_stats(), variant=True)[0]
+
 
 class LEDManagerInterface(ServiceInterface):
     """
@@ -349,9 +383,18 @@ class AnimationManagerInterface(ServiceInterface):
         self._layers = []
         self._state = None
 
+        # Frame stream: subscriber token -> (lease expiry, requested fps)
+        self._frame_subscribers = {}
+        self._frame_emit_ts = 0.0
+        self._frame_emit_handle = None
+
         self._animgr.layers_changed.connect(self._layers_changed)
         self._animgr.state_changed.connect(self._state_changed)
 
+        frame = getattr(driver, "frame_control", None)
+        if frame is not None:
+            frame.frame_committed.connect(self._frame_committed)
+
     def _sync_layers(self):
         """Sync cached layer info from the animation loop."""
         self._layers = []
@@ -406,8 +449,7 @@ class AnimationManagerInterface(ServiceInterface):
     def AnimationState(self) -> "s":
         return self._state or ""
 
-    @method()
-    def GetCurrentFrame(self) -> "a{sv}":
+    def _frame_payload(self) -> dict:
         frame = getattr(self._driver, "frame_control", None)
         if frame is None or frame.last_frame is None:
             return {}
@@ -425,6 +467,82 @@ class AnimationManagerInterface(ServiceInterface):
             "timestamp": Variant("d", float(frame.last_frame_ts)),
         }
 
+    def _frame_stream_interval(self) -> float | None:
+        """
+        Minimum seconds between FrameUpdated signals, or None if
+        nobody holds a live subscription
+        """
+        now = time.monotonic()
+        for token, (expiry, _fps) in list(self._frame_subscribers.items()):
+            if expiry <= now:
+                del self._frame_subscribers[token]
+
+        if not self._frame_subscribers:
+            return None
+
+        fps = max(fps for _expiry, fps in self._frame_subscribers.values())
+        return 1.0 / min(fps, FRAME_STREAM_MAX_FPS)
+
+    def _frame_committed(self, seq):
+        if self._animgr._shutting_down or self._frame_emit_handle is not None:
+            return
+
+        interval = self._frame_stream_interval()
+        if interval is None:
+            return
+
+        # Throttle, but always deliver the most recent frame once the
+        # window passes so subscribers never get stuck on a stale one
+        wait = self._frame_emit_ts + interval - time.monotonic()
+        if wait <= 0:
+            self._emit_frame()
+        else:
+            self._frame_emit_handle = asyncio.get_running_loop().call_later(wait, self._emit_frame)
+
+    def _emit_frame(self):
+        self._frame_emit_handle = None
+        if self._frame_stream_interval() is None:
+            return
+
+        payload = self._frame_payload()
+        if payload:
+            self._frame_emit_ts = time.monotonic()
+            self.FrameUpdated(payload)
+
+    @signal()
+    def FrameUpdated(self, frame: "a{sv}") -> "a{sv}":
+        return frame
+
+    @method()
+    def SubscribeFrames(self, token: "s", fps: "i") -> "d":
+        """
+        Start or renew a FrameUpdated subscription.
+
+        Clients identify themselves with a token (normally their unique
+        bus name) and must call again before the returned lease expires.
+        """
+        if fps <= 0:
+            raise DBusError("io.uchroma.Error.InvalidArgs", "fps must be positive") from None
+
+        self._frame_subscribers[token] = (time.monotonic() + FRAME_STREAM_LEASE, fps)
+        return FRAME_STREAM_LEASE
+
+    @method()
+    def UnsubscribeFrames(self, token: "s") -> "b":
+        return self._frame_subscribers.pop(token, None) is not None
+
+    @method()
+    def GetCurrentFrame(self) -> "a{sv}":
+        return self._frame_payload()
+
+    @method()
+    def GetFrameStats(self) -> "a{sv}":
+        """Get rolling frame pipeline timings (milliseconds) and counters."""
+        stats = self._animgr.frame_stats()
+        if not stats:
+            return {}
+        return dbus_prepare(stats, variant=True)[0]
+
     @method()
     def AddRenderer(self, name: "s", zindex: "i", traits: "a{sv}") -> "o":
         self._logger.debug("AddRenderer: name=%s zindex=%d traits=%s", name, zindex, traits)
@@ -644,13 +762,46 @@ class SystemControlInterface(ServiceInterface):
         return dbus_prepare(updates, variant=True)[0]
 
 
+class CanvasInterface(ServiceInterface):
+    """
+    D-Bus interface for a shared canvas.
+    """
+
+    def __init__(self, canvas, manager_api):
+        super().__init__("io.uchroma.Canvas")
+        self._canvas = canvas
+        self._manager_api = manager_api
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Name(self) -> "s":
+        return self._canvas.name
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Width(self) -> "i":
+        return self._canvas.width
+
+    @dbus_property(access=PropertyAccess.READ)
+    def Height(self) -> "i":
+        return self._canvas.height
+
+    @method()
+    def GetDevices(self) -> "ao":
+        return self._manager_api.device_paths(self._canvas.devices)
+
+    @method()
+    def GetCanvasStats(self) -> "a{sv}":
+        """Get frames sent and dropped for each attached device."""
+        return dbus_prepare(self._canvas.stats(), variant=True)[0]
+
+
 class DeviceManagerInterface(ServiceInterface):
     """
     D-Bus interface for device manager (root service).
     """
 
-    def __init__(self):
+    def __init__(self, manager_api):
         super().__init__("io.uchroma.DeviceManager")
+        self._manager_api = manager_api
         self._device_paths = []
 
     def set_device_paths(self, paths: list):
@@ -660,6 +811,26 @@ class DeviceManagerInterface(ServiceInterface):
     def GetDevices(self) -> "ao":
         return self._device_paths
 
+    @method()
+    def GetCanvases(self) -> "ao":
+        return self._manager_api.canvas_paths()
+
+    @method()
+    def CreateCanvas(self, name: "s", width: "i", height: "i") -> "o":
+        return self._manager_api.create_canvas(name, width, height)
+
+    @method()
+    async def RemoveCanvas(self, name: "s") -> "b":
+        return await self._manager_api.remove_canvas(name)
+
+    @method()
+    async def AttachCanvas(self, name: "s", device: "o", viewport: "(dddd)") -> "b":
+        return await self._manager_api.attach_canvas(name, device, viewport)
+
+    @method()
+    async def DetachCanvas(self, name: "s", device: "o") -> "b":
+        return await self._manager_api.detach_canvas(name, device)
+
     @signal()
     def DevicesChanged(self, action: "s", device: "o") -> "so":
         return [action, device]
@@ -703,6 +874,10 @@ class DeviceAPI:
 
         self.publish_changed = Signal()
 
+        telemetry = getattr(driver, "telemetry", None)
+        if telemetry is not None:
+            telemetry.changed.connect(self._telemetry_changed)
+
     @property
     def bus_path(self):
         return f"/io/uchroma/{self._driver.device_type.value}/{self._driver.vendor_id:04x}_{self._driver.product_id:04x}_{self._driver.device_index:02d}"
@@ -711,6 +886,12 @@ class DeviceAPI:
     def driver(self):
         return self._driver
 
+    def _telemetry_changed(self, source, changes):
+        name = TELEMETRY_INTERFACES.get(source)
+        for iface in self._interfaces:
+            if iface.name == name:
+                iface.emit_properties_changed(changes)
+
     def interface_map(self) -> dict:
         return {iface.name: _interface_properties(iface) for iface in self._interfaces}
 
@@ -751,6 +932,11 @@ class DeviceAPI:
 
         self._published = True
         self.publish_changed.fire(True)
+
+        # Keep cached properties current now that someone can read them
+        telemetry = getattr(self._driver, "telemetry", None)
+        if telemetry is not None:
+            telemetry.start()
         self._logger.info("Published device at %s", self.bus_path)
 
     def unpublish(self):
@@ -767,6 +953,38 @@ class DeviceAPI:
         self._logger.info("Unpublished device at %s", self.bus_path)
 
 
+class CanvasAPI:
+    """
+    Manages D-Bus interfaces for a shared canvas.
+    """
+
+    def __init__(self, canvas, manager_api, bus):
+        self._canvas = canvas
+        self._bus = bus
+        self._interfaces = [
+            CanvasInterface(canvas, manager_api),
+            AnimationManagerInterface(canvas, self),
+        ]
+
+    @property
+    def bus_path(self):
+        return f"{ROOT_PATH}/canvas/{self._canvas.name}"
+
+    def interface_map(self) -> dict:
+        return {iface.name: _interface_properties(iface) for iface in self._interfaces}
+
+    def interface_names(self) -> list[str]:
+        return [iface.name for iface in self._interfaces]
+
+    def publish(self):
+        for iface in self._interfaces:
+            self._bus.export(self.bus_path, iface)
+
+    def unpublish(self):
+        for iface in self._interfaces:
+            self._bus.unexport(self.bus_path, iface)
+
+
 class DeviceManagerAPI:
     """
     Main D-Bus service manager.
@@ -779,6 +997,7 @@ class DeviceManagerAPI:
         self.ready = asyncio.Event()
         self._dm.callbacks.append(self._dm_callback)
         self._devs = OrderedDict()
+        self._canvases = OrderedDict()
         self._manager_iface = None
         self._object_manager_iface = None
 
@@ -806,6 +1025,66 @@ class DeviceManagerAPI:
         if self._manager_iface:
             self._manager_iface.set_device_paths([x.bus_path for x in self._devs.values()])
 
+    def device_paths(self, drivers) -> list[str]:
+        keys = {driver.key for driver in drivers}
+        return [devapi.bus_path for key, devapi in self._devs.items() if key in keys]
+
+    def canvas_paths(self) -> list[str]:
+        return [canvasapi.bus_path for canvasapi in self._canvases.values()]
+
+    def _get_canvas(self, name: str):
+        canvas = self._dm.canvases.get(name)
+        if canvas is None:
+            raise DBusError("io.uchroma.Error.UnknownCanvas", f"Unknown canvas: {name}") from None
+        return canvas
+
+    def _get_driver(self, path: str):
+        for devapi in self._devs.values():
+            if devapi.bus_path == path:
+                return devapi.driver
+        raise DBusError("io.uchroma.Error.UnknownDevice", f"Unknown device: {path}") from None
+
+    def create_canvas(self, name: str, width: int, height: int) -> str:
+        if not CANVAS_NAME.fullmatch(name):
+            raise DBusError(
+                "io.uchroma.Error.InvalidArgs", f"Invalid canvas name: {name}"
+            ) from None
+        try:
+            canvas = self._dm.create_canvas(name, width, height)
+        except ValueError as err:
+            raise DBusError("io.uchroma.Error.InvalidArgs", str(err)) from None
+
+        canvasapi = CanvasAPI(canvas, self, self._bus)
+        canvasapi.publish()
+        self._canvases[name] = canvasapi
+        if self._object_manager_iface is not None:
+            self._object_manager_iface.InterfacesAdded(
+                canvasapi.bus_path, canvasapi.interface_map()
+            )
+        return canvasapi.bus_path
+
+    async def remove_canvas(self, name: str) -> bool:
+        canvasapi = self._canvases.pop(name, None)
+        if canvasapi is not None:
+            interfaces = canvasapi.interface_names()
+            canvasapi.unpublish()
+            if self._object_manager_iface is not None:
+                self._object_manager_iface.InterfacesRemoved(canvasapi.bus_path, interfaces)
+        return await self._dm.remove_canvas(name)
+
+    async def attach_canvas(self, name: str, path: str, viewport) -> bool:
+        canvas = self._get_canvas(name)
+        driver = self._get_driver(path)
+
+        # An empty viewport shows the whole canvas
+        try:
+            return await canvas.attach(driver, Viewport(*viewport) if any(viewport) else None)
+        except ValueError as err:
+            raise DBusError("io.uchroma.Error.InvalidArgs", str(err)) from None
+
+    async def detach_canvas(self, name: str, path: str) -> bool:
+        return await self._get_canvas(name).detach(self._get_driver(path))
+
     def build_managed_objects(self) -> dict:
         root_ifaces = {}
         if self._manager_iface is not None:
@@ -814,6 +1093,8 @@ class DeviceManagerAPI:
         managed = {ROOT_PATH: root_ifaces}
         for devapi in self._devs.values():
             managed[devapi.bus_path] = devapi.interface_map()
+        for canvasapi in self._canvases.values():
+            managed[canvasapi.bus_path] = canvasapi.interface_map()
         return managed
 
     async def _dm_callback(self, action, device):
@@ -844,7 +1125,7 @@ class DeviceManagerAPI:
             self._bus = await MessageBus(bus_type=BusType.SESSION).connect()
 
             # Create and export manager interface
-            self._manager_iface = DeviceManagerInterface()
+            self._manager_iface = DeviceManagerInterface(self)
             self._object_manager_iface = ObjectManagerInterface(self)
             self._bus.export(ROOT_PATH, self._manager_iface)
             self._bus.export(ROOT_PATH, self._object_manager_iface)
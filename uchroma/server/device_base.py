@@ -4,7 +4,8 @@
 import asyncio
 import re
 import threading
-from concurrent import futures
+import time
+from collections.abc import Hashable
 from contextlib import asynccontextmanager, contextmanager, suppress
 
 from uchroma.log import Log
@@ -15,11 +16,17 @@ from uchroma.version import __version__
 from .anim import AnimationManager
 from .hardware import Hardware
 from .input import InputManager
+from .pacing import BUSY_BACKOFF, BUSY_RETRIES, CommandPacer, PacingStore
 from .prefs import PreferenceManager
 from .protocol import get_transaction_id
 from .report_utils import put_arg
+from .scheduler import CommandPriority, CommandScheduler
+from .telemetry import TelemetryScheduler
 from .types import BaseCommand
 
+# Seconds an unused HID handle stays open before it is released
+HANDLE_IDLE_TIMEOUT = 30.0
+
 
 class BaseUChromaDevice:
     """
@@ -85,8 +92,17 @@ class BaseUChromaDevice:
         self._fx_manager = None
 
         self._ref_count = 0
-        self._executor = futures.ThreadPoolExecutor(max_workers=1)
-        self._async_lock = asyncio.Lock()
+        self._handle_idle_timeout = HANDLE_IDLE_TIMEOUT
+        self._idle_handle = None
+        self._stale = False
+        self._handle_stats = {"opens": 0, "closes": 0, "reopens": 0}
+        self._scheduler = CommandScheduler()
+        self._pacer = CommandPacer(
+            hardware.product_id,
+            int(hardware.get_protocol_config().inter_command_delay * 1000),
+            PacingStore(),
+        )
+        self._telemetry = TelemetryScheduler(self.logger)
         self._open_lock = asyncio.Lock()
         self._info_lock = asyncio.Lock()
         self._sync_lock = threading.Lock()
@@ -101,12 +117,20 @@ class BaseUChromaDevice:
         if hasattr(self, "_input_manager") and self._input_manager is not None:
             await self._input_manager.shutdown()
 
+        if hasattr(self, "_telemetry"):
+            await self._telemetry.stop()
+
+        PacingStore().flush()
         self.close(True)
-        if hasattr(self, "_executor") and self._executor is not None:
-            self._executor.shutdown(wait=True, cancel_futures=True)
-            self._executor = None
 
     def close(self, force: bool = False):
+        """
+        Release the HID handle
+
+        Unless forced, an idle handle is kept open for handle_idle_timeout
+        seconds so back-to-back commands don't pay for reclaiming
+        the interface each time.
+        """
         if not force:
             if self.animation_manager is not None and self.is_animating:
                 return
@@ -114,11 +138,104 @@ class BaseUChromaDevice:
             if self._ref_count > 0:
                 return
 
-        if hasattr(self, "_dev") and self._dev is not None:
+            if self._schedule_idle_close():
+                return
+
+        self._close_handle()
+
+    def _schedule_idle_close(self) -> bool:
+        if getattr(self, "_dev", None) is None or self._handle_idle_timeout <= 0:
+            return False
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        self._cancel_idle_close()
+        self._idle_handle = loop.call_later(self._handle_idle_timeout, self._idle_close)
+        return True
+
+    def _cancel_idle_close(self):
+        if getattr(self, "_idle_handle", None) is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+    def _idle_close(self):
+        self._idle_handle = None
+        if self._ref_count > 0 or self.is_animating:
+            return
+
+        self.logger.debug("Closing idle device handle")
+        self._close_handle()
+
+    def _close_handle(self):
+        self._cancel_idle_close()
+
+        if getattr(self, "_dev", None) is not None:
             with suppress(Exception):
                 self._dev.close()
 
             self._dev = None
+            self._stale = False
+            if hasattr(self, "_handle_stats"):
+                self._handle_stats["closes"] += 1
+
+    async def reopen(self) -> bool:
+        """
+        Replace the HID handle after the device changed underneath it
+
+        Called when udev reports a change on the device. An idle handle
+        is reopened right away, one which is in use is dropped as soon
+        as the last user releases it.
+
+        :return: True if the handle was reopened
+        """
+        if self._dev is None:
+            return False
+
+        if self._ref_count > 0 or self.is_animating:
+            self._stale = True
+            return False
+
+        self._close_handle()
+        self._handle_stats["reopens"] += 1
+
+        if not await self._ensure_open():
+            return False
+
+        self._handle_stats["opens"] += 1
+        self.close()
+        return True
+
+    @property
+    def handle_idle_timeout(self) -> float:
+        """
+        Seconds an unused HID handle is kept open, zero closes it immediately
+        """
+        return self._handle_idle_timeout
+
+    @handle_idle_timeout.setter
+    def handle_idle_timeout(self, timeout: float):
+        self._set_handle_idle_timeout(timeout)
+        self.preferences.handle_idle_timeout = self._handle_idle_timeout
+
+    def _set_handle_idle_timeout(self, timeout: float):
+        self._handle_idle_timeout = max(0.0, float(timeout))
+        if self._idle_handle is not None:
+            self.close()
+
+    def handle_stats(self) -> dict[str, object]:
+        """
+        Counters for HID handle opens, closes and udev-triggered reopens,
+        and the state of the device's command pacing
+        """
+        return {
+            "open": self._dev is not None,
+            "handle_idle_timeout": self._handle_idle_timeout,
+            **self._handle_stats,
+            "pacing": self._pacer.stats(),
+        }
 
     def has_fx(self, fx_type: str) -> bool:
         """
@@ -190,6 +307,27 @@ class BaseUChromaDevice:
     def last_cmd_time(self, last_cmd_time):
         self._last_cmd_time = last_cmd_time
 
+    @property
+    def telemetry(self) -> TelemetryScheduler:
+        """
+        Background refresh of cached device state
+        """
+        return self._telemetry
+
+    @property
+    def pacer(self) -> CommandPacer:
+        """
+        Adaptive gap between reports sent to this device
+        """
+        return self._pacer
+
+    @property
+    def command_scheduler(self) -> CommandScheduler:
+        """
+        Priority scheduler which serializes access to the device
+        """
+        return self._scheduler
+
     def _set_brightness(self, level: float) -> bool:
         return False
 
@@ -393,6 +531,7 @@ class BaseUChromaDevice:
         transaction_id: int | None = None,
         delay: float | None = None,
         remaining_packets: int = 0x00,
+        priority: CommandPriority = CommandPriority.INTERACTIVE,
     ) -> bytes | None:
         report = self.get_report(
             *command.value,
@@ -401,9 +540,15 @@ class BaseUChromaDevice:
             remaining_packets=remaining_packets,
         )
 
-        success, data = await self.run_report(report, delay=delay)
+        success, data = await self.run_report(report, delay=delay, priority=priority)
         return bytes(data) if success else None
 
+    def _report_gap_ms(self, delay: float | None) -> int:
+        gap_ms = self._pacer.gap_ms
+        if delay:
+            gap_ms = max(gap_ms, int(delay * 1000))
+        return gap_ms
+
     def run_report_sync(
         self, report: hid.RazerReport, delay: float | None = None
     ) -> tuple[bool, bytes]:
@@ -414,32 +559,71 @@ class BaseUChromaDevice:
         This sync version is for property accessors and setup code.
         """
         with self._sync_lock, self.device_open_sync():
-            delay_ms = int(delay * 1000) if delay else None
             try:
-                status, data = report.run(self._dev, delay_ms)
-                return status == hid.Status.Ok, data
+                for attempt in range(BUSY_RETRIES + 1):
+                    if attempt:
+                        time.sleep(BUSY_BACKOFF)
+                    status, data = report.run(self._dev, self._report_gap_ms(delay), 0)
+                    if not self._retry_busy(report, status):
+                        break
+                return self._report_done(status), data
             except Exception as err:
                 self.logger.exception("Report failed", exc_info=err)
                 return False, b""
 
     async def run_report(
-        self, report: hid.RazerReport, delay: float | None = None
+        self,
+        report: hid.RazerReport,
+        delay: float | None = None,
+        priority: CommandPriority = CommandPriority.INTERACTIVE,
+        coalesce: Hashable | None = None,
     ) -> tuple[bool, bytes]:
         """
         Runs a previously initialized RazerReport on the device.
 
+        The gap between reports is tuned by the device's CommandPacer,
+        and reports answered with BUSY are retried after a backoff.
+        Intermediate packets of a multi-packet transfer are not paced.
+
         :param report: the report to run
-        :param delay: custom delay to enforce between commands (in seconds)
+        :param delay: minimum delay to enforce between commands (in seconds)
+        :param priority: scheduling class, see CommandPriority
+        :param coalesce: key for idempotent setters; a queued report with
+                         the same key is replaced by this one
         :return: Tuple of (success, data)
         """
-        async with self._async_lock, self.device_open():
-            delay_ms = int(delay * 1000) if delay else None
-            try:
-                status, data = await report.run_async(self._dev, delay_ms)
-                return status == hid.Status.Ok, data
-            except Exception as err:
-                self.logger.exception("Report failed", exc_info=err)
-                return False, b""
+
+        async def run():
+            async with self.device_open():
+                try:
+                    for attempt in range(BUSY_RETRIES + 1):
+                        if attempt:
+                            await asyncio.sleep(BUSY_BACKOFF)
+                        status, data = await report.run_async(
+                            self._dev, self._report_gap_ms(delay), 0
+                        )
+                        if not self._retry_busy(report, status):
+                            break
+                    return self._report_done(status), data
+                except Exception as err:
+                    self.logger.exception("Report failed", exc_info=err)
+                    return False, b""
+
+        return await self._scheduler.run(run, priority, coalesce)
+
+    def _retry_busy(self, report: hid.RazerReport, status) -> bool:
+        # Intermediate packets of a multi-packet transfer are not
+        # answered, so their status says nothing about pacing
+        if report.get_remaining_packets() > 0:
+            return False
+        return self._pacer.record(status)
+
+    def _report_done(self, status) -> bool:
+        if status == hid.Status.Busy:
+            self.logger.warning("Device still busy after %d retries", BUSY_RETRIES)
+        elif status == hid.Status.Timeout:
+            self.logger.warning("Device did not respond to report")
+        return status == hid.Status.Ok
 
     def run_command_sync(
         self,
@@ -472,6 +656,8 @@ class BaseUChromaDevice:
         transaction_id: int | None = None,
         delay: float | None = None,
         remaining_packets: int = 0x00,
+        priority: CommandPriority = CommandPriority.INTERACTIVE,
+        coalesce: Hashable | None = None,
     ) -> bool:
         """
         Run a command.
@@ -483,6 +669,9 @@ class BaseUChromaDevice:
         :param args: The list of arguments to call the command with
         :type args: varies
         :param transaction_id: Transaction identified, defaults to 0xFF
+        :param priority: Scheduling class, see CommandPriority
+        :param coalesce: Key for idempotent setters; a queued command with
+                         the same key is replaced by this one
 
         :return: True if the command was successful
         """
@@ -493,7 +682,9 @@ class BaseUChromaDevice:
             remaining_packets=remaining_packets,
         )
 
-        success, _ = await self.run_report(report, delay=delay)
+        success, _ = await self.run_report(
+            report, delay=delay, priority=priority, coalesce=coalesce
+        )
         return success
 
     def _decode_serial(self, value: bytes | None) -> str | None:
@@ -717,6 +908,9 @@ class BaseUChromaDevice:
                 # Animate from 0 on startup - hardware state may be stale
                 self.set_brightness(self.preferences.brightness, from_value=0)
 
+            if self.preferences.handle_idle_timeout is not None:
+                self._set_handle_idle_timeout(self.preferences.handle_idle_timeout)
+
             self.restore_prefs.fire(self.preferences)
 
     def __repr__(self):
@@ -724,14 +918,26 @@ class BaseUChromaDevice:
 
     def _device_open_sync(self):
         self._ref_count += 1
-        return self._ensure_open_sync()
+        self._cancel_idle_close()
+        was_closed = self._dev is None
+        return self._opened(was_closed, self._ensure_open_sync())
 
     async def _device_open(self):
         self._ref_count += 1
-        return await self._ensure_open()
+        self._cancel_idle_close()
+        was_closed = self._dev is None
+        return self._opened(was_closed, await self._ensure_open())
+
+    def _opened(self, was_closed: bool, result: bool) -> bool:
+        if result and was_closed and self._dev is not None:
+            self._handle_stats["opens"] += 1
+        return result
 
     def _device_close(self):
         self._ref_count -= 1
+        if self._stale and self._ref_count == 0:
+            self._close_handle()
+            self._handle_stats["reopens"] += 1
         self.close()
 
     def _done_cb(self, future):
@@ -756,7 +962,4 @@ class BaseUChromaDevice:
             self._device_close()
 
     def __del__(self):
-        if hasattr(self, "_executor") and self._executor is not None:
-            self._executor.shutdown(wait=False, cancel_futures=True)
-            self._executor = None
         self.close(force=True)
@@ -13,6 +13,7 @@ from uchroma.log import Log
 from uchroma.server import hid
 from uchroma.util import Signal, Singleton, ensure_future
 
+from .canvas import SharedCanvas
 from .device import UChromaDevice
 from .device_base import BaseUChromaDevice
 from .hardware import RAZER_VENDOR_ID, Hardware, Quirks
@@ -78,6 +79,7 @@ class UChromaDeviceManager(metaclass=Singleton):
         self._logger = Log.get("uchroma.devicemanager")
 
         self._devices = OrderedDict()
+        self._canvases = OrderedDict()
         self._monitor = False
         self._udev_context = Context()
         self._udev_observer = None
@@ -110,6 +112,13 @@ class UChromaDeviceManager(metaclass=Singleton):
             return
         ensure_future(self._remove_device_async(sys_path), loop=self._loop)
 
+    def _schedule_reopen(self, key: str):
+        """Schedule a HID handle refresh on the main event loop."""
+        device = self._devices.get(key)
+        if self._loop is None or device is None:
+            return
+        ensure_future(device.reopen(), loop=self._loop)
+
     async def _remove_device_async(self, sys_path: str):
         """Remove a device by its sys_path (runs on main event loop)."""
         key = self._key_for_path(sys_path)
@@ -118,6 +127,8 @@ class UChromaDeviceManager(metaclass=Singleton):
 
         removed = self._devices.pop(key, None)
         if removed is not None:
+            for canvas in self._canvases.values():
+                await canvas.detach(removed, reset=False)
             removed.close()
             if self._callbacks:
                 await self._fire_callbacks("remove", removed)
@@ -249,6 +260,46 @@ class UChromaDeviceManager(metaclass=Singleton):
         """
         return self._devices
 
+    @property
+    def canvases(self):
+        """
+        Dict of shared canvases, keyed by name
+        """
+        return self._canvases
+
+    def create_canvas(self, name: str, width: int, height: int) -> SharedCanvas:
+        """
+        Create a shared canvas which devices can be attached to
+
+        :param name: Unique name of the canvas
+        :param width: Width of the canvas in pixels
+        :param height: Height of the canvas in pixels
+
+        :return: The new canvas
+        :raises ValueError: if the name is taken or the size is invalid
+        """
+        if name in self._canvases:
+            raise ValueError(f"Canvas already exists: {name}")
+
+        canvas = SharedCanvas(name, width, height)
+        self._canvases[name] = canvas
+        return canvas
+
+    async def remove_canvas(self, name: str) -> bool:
+        """
+        Stop a shared canvas and detach its devices
+
+        :param name: Name of the canvas
+
+        :return: True if the canvas existed
+        """
+        canvas = self._canvases.pop(name, None)
+        if canvas is None:
+            return False
+
+        await canvas.shutdown()
+        return True
+
     @property
     def callbacks(self):
         """
@@ -299,13 +350,20 @@ class UChromaDeviceManager(metaclass=Singleton):
             # Schedule removal on main event loop to avoid race conditions
             self._loop.call_soon_threadsafe(self._schedule_remove, device.sys_path)
         else:
-            if self._key_for_path(device.sys_path) is None:
+            key = self._key_for_path(device.sys_path)
+            if key is None:
                 self._loop.call_soon_threadsafe(self._schedule_discover)
+            elif device.action == "change":
+                # Refresh the held HID handle, it may not survive the change
+                self._loop.call_soon_threadsafe(self._schedule_reopen, key)
 
     async def close_devices(self):
         """
         Close all open devices and perform cleanup
         """
+        for name in list(self._canvases):
+            await self.remove_canvas(name)
+
         for device in self._devices.values():
             await device.shutdown()
         self._devices.clear()
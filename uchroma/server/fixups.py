@@ -23,46 +23,50 @@ class KeyboardFixup:
         self._alignment_map = self._hardware.key_fixup_mapping
         self._row_offsets = self._hardware.key_row_offsets
 
+        # Compiled gather indices, keyed by matrix shape
+        self._alignment_index = {}
+
     @staticmethod
-    def _insert(rowdata: ndarray, col: int) -> ndarray:
+    def _compile_alignment(mapping, height: int, width: int) -> tuple:
         """
-        Inserts a "spacer" into the output row, effectively sliding right.
+        Compile an alignment map into flat gather indices.
 
-        :param rowdata: The current data for the current row
-        :param col: The column number where the empty cell should be inserted
+        The operations are replayed once on a matrix of cell indices
+        instead of on pixel data, so the result of the whole sequence of
+        inserts, deletes, and copies (in this order) reduces to the list
+        of cells which change and where each one comes from. Rows keep
+        their width: an insert pushes the last cell of the row off the
+        end, and a delete leaves an empty cell there.
 
-        :return: The updated row data
-        """
-        return np.insert(rowdata, col, [0, 0, 0], axis=0)
+        :param mapping: The KeyFixupMapping from the hardware database
+        :param height: Matrix height
+        :param width: Matrix width
 
-    @staticmethod
-    def _delete(rowdata: ndarray, col: int) -> ndarray:
+        :return: Tuple of (destination cells, source cells, empty cells or None)
         """
-        Deletes a cell from the output row, effectively sliding left.
+        identity = np.arange(height * width, dtype=np.intp)
+        index = identity.reshape(height, width).copy()
+        empty = -1
 
-        :param rowdata: The current data for the current row
-        :param col: The column number where a cell should be removed
+        for rr, cc in mapping.insert or ():
+            index[rr, cc + 1 :] = index[rr, cc:-1].copy()
+            index[rr, cc] = empty
 
-        :return: The updated row data
-        """
-        return np.delete(rowdata, col, axis=0)
+        for rr, cc in mapping.delete or ():
+            index[rr, cc:-1] = index[rr, cc + 1 :].copy()
+            index[rr, -1] = empty
 
-    @staticmethod
-    def _copy(matrix: ndarray, src: tuple, dst: tuple) -> ndarray:
-        """
-        Copy a cell from the source to the destination, effectively moving a key.
+        for src, dst in mapping.copy or ():
+            index[tuple(dst)] = index[tuple(src)]
 
-        :param matrix: The original input frame
-        :param src: Source position, tuple of (row, column)
-        :param dst: Destination position, tuple of (row, column)
+        index = index.ravel()
+        blanks = index == empty
+        moved = (index != identity) & ~blanks
 
-        :return: The updated row data
-        """
-        src_row, src_col = src
-        dst_row, dst_col = dst
-        matrix[dst_row][dst_col] = np.copy(matrix[src_row][src_col])
+        if not blanks.any():
+            return np.flatnonzero(moved), index[moved], None
 
-        return matrix
+        return np.flatnonzero(moved), index[moved], np.flatnonzero(blanks)
 
     @staticmethod
     def _update_debug_info(
@@ -85,7 +89,8 @@ class KeyboardFixup:
     def _align_matrix(self, frame, matrix: ndarray) -> ndarray:
         """
         Apply the alignment map to the given matrix, performing
-        inserts, deletes, and copies (in this order).
+        inserts, deletes, and copies (in this order) as a single
+        gather through the precompiled indices.
 
         :param matrix: The input matrix
 
@@ -97,23 +102,19 @@ class KeyboardFixup:
         KeyboardFixup._update_debug_info(frame, debug_position, in_data=matrix)
 
         if self._alignment_map is not None and not skip_fixups:
-            inserts = self._alignment_map.insert
-            if inserts is not None:
-                for insert in inserts:
-                    rr, cc = insert
-                    matrix[rr] = KeyboardFixup._insert(matrix[rr], cc)
-
-            deletes = self._alignment_map.delete
-            if deletes is not None:
-                for delete in deletes:
-                    rr, cc = delete
-                    matrix[rr] = KeyboardFixup._delete(matrix[rr], cc)
-
-            copies = self._alignment_map.copy
-            if copies is not None:
-                for copy in copies:
-                    src, dst = copy
-                    matrix = KeyboardFixup._copy(matrix, src, dst)
+            height, width = matrix.shape[:2]
+            compiled = self._alignment_index.get((height, width))
+            if compiled is None:
+                compiled = KeyboardFixup._compile_alignment(self._alignment_map, height, width)
+                self._alignment_index[(height, width)] = compiled
+
+            dst, src, blanks = compiled
+            if not matrix.flags["C_CONTIGUOUS"]:
+                matrix = np.ascontiguousarray(matrix)
+            pixels = matrix.reshape(height * width, -1)
+            pixels[dst] = pixels.take(src, axis=0)
+            if blanks is not None:
+                pixels[blanks] = 0
 
         KeyboardFixup._update_debug_info(frame, debug_position, out_data=matrix)
 
@@ -10,12 +10,14 @@ import time
 import numpy as np
 
 from uchroma._native import compose_layers as _rust_compose_layers
-from uchroma.layer import Layer
+from uchroma.layer import LAYER_DTYPES, Layer
+from uchroma.util import RollingStats, Signal
 
 from . import hid
 from .hardware import Hardware, Quirks
 from .protocol import get_protocol_from_quirks, get_transaction_id
 from .report_utils import put_arg
+from .scheduler import CommandPriority
 from .standard_fx import FX, ExtendedFX, StandardFX
 from .types import BaseCommand
 
@@ -39,6 +41,11 @@ class Frame:
 
     DEFAULT_FRAME_ID = 0xFF
 
+    # Matrix uploads only send the row segments which changed since the
+    # last frame. Resend everything periodically in case the device
+    # dropped a report or was reset behind our back.
+    FULL_REFRESH_INTERVAL = 2.0
+
     class Command(BaseCommand):
         """
         Enumeration of raw hardware command data
@@ -48,10 +55,11 @@ class Frame:
         SET_FRAME_DATA_SINGLE = (0x03, 0x0C, None)
         SET_FRAME_EXTENDED = (0x0F, 0x03, None)
 
-    def __init__(self, driver, width: int, height: int):
+    def __init__(self, driver, width: int, height: int, layer_dtype=np.float64):
         self._driver = driver
         self._width = width
         self._height = height
+        self.layer_dtype = layer_dtype
 
         self._logger = driver.logger
 
@@ -60,11 +68,28 @@ class Frame:
         self._frame_seq = 0
         self._last_frame_ts = 0.0
 
+        # Fired with the new sequence number after each frame reaches the device
+        self.frame_committed = Signal()
+
         self._debug_opts = {}
 
         # Track custom frame mode to avoid redundant USB commands
         self._custom_frame_active = False
 
+        # Delta uploads: force a full frame until the hardware state is known
+        self._full_refresh_pending = True
+        self._last_full_refresh_ts = 0.0
+        self._last_row_offsets = None
+
+        # Last composed (pre-alignment) image, for skipping unchanged frames
+        self._last_composed = None
+        self._skipped_frames = 0
+        self._upload_timing = None
+
+        # Rolling durations (seconds) of the alignment and upload stages
+        self._align_stats = RollingStats()
+        self._transmit_stats = RollingStats()
+
     def create_layer(self) -> Layer:
         """
         Create a new layer which can be used for
@@ -74,7 +99,26 @@ class Frame:
         only layers which match the physical size of the
         lighting matrix are supported.
         """
-        return Layer(self._width, self._height, logger=self._logger)
+        return Layer(self._width, self._height, logger=self._logger, dtype=self._layer_dtype)
+
+    @property
+    def layer_dtype(self) -> np.dtype:
+        """
+        Storage type of layers created by this frame
+        """
+        return self._layer_dtype
+
+    @layer_dtype.setter
+    def layer_dtype(self, dtype):
+        """
+        Set the storage type (float64 or float32) for new layers.
+        float32 halves memory traffic for drawing and compositing.
+        Layers which already exist are not converted.
+        """
+        dtype = np.dtype(dtype)
+        if dtype not in LAYER_DTYPES:
+            raise ValueError(f"Unsupported layer dtype: {dtype}")
+        self._layer_dtype = dtype
 
     @property
     def device_name(self) -> str:
@@ -110,6 +154,35 @@ class Frame:
     def last_frame_ts(self) -> float:
         return self._last_frame_ts
 
+    @property
+    def skipped_frames(self) -> int:
+        """Number of commits skipped because the composed image was unchanged."""
+        return self._skipped_frames
+
+    @property
+    def upload_timing(self):
+        """
+        Timing breakdown of the last matrix upload, or None
+
+        :return: hid.FrameTiming with packet count and per-stage microseconds
+        """
+        return self._upload_timing
+
+    @property
+    def align_stats(self) -> RollingStats:
+        """
+        Durations (seconds) of recent key matrix alignments
+        """
+        return self._align_stats
+
+    @property
+    def transmit_stats(self) -> RollingStats:
+        """
+        Durations (seconds) of recent matrix uploads, including
+        the wait for the device lock
+        """
+        return self._transmit_stats
+
     @property
     def debug_opts(self) -> dict:
         """
@@ -168,19 +241,30 @@ class Frame:
         width = self._width
         start_col = 0
 
+        # If the upload fails midway, the hardware state is unknown
+        self._full_refresh_pending = True
+        sent = True
+
+        start = time.perf_counter()
         while start_col < width:
             segment = img[0][start_col : start_col + max_cols]
             seg_width = len(segment)
-            await self._driver.run_command(
+            if not await self._driver.run_command(
                 Frame.Command.SET_FRAME_DATA_SINGLE,
                 start_col,
                 seg_width,
                 segment.tobytes(),
                 transaction_id=0x80,
-            )
+                priority=CommandPriority.FRAME,
+            ):
+                sent = False
             start_col += seg_width
             if start_col < width:
                 await asyncio.sleep(0.001)
+        self._transmit_stats.add(time.perf_counter() - start)
+
+        self._full_refresh_pending = not sent
+        self._last_full_refresh_ts = time.monotonic()
         return img
 
     def _get_frame_data_report(self, remaining_packets: int, *args):
@@ -224,9 +308,28 @@ class Frame:
             data,  # arguments[5+] - RGB data
         ]
 
+    def _get_delta_base(self, img: np.ndarray, row_offsets) -> np.ndarray | None:
+        """
+        Get the previously uploaded frame to diff against, or None
+        if the whole frame needs to be sent.
+        """
+        if self._full_refresh_pending or row_offsets != self._last_row_offsets:
+            return None
+
+        if time.monotonic() - self._last_full_refresh_ts >= Frame.FULL_REFRESH_INTERVAL:
+            return None
+
+        last = self._last_frame
+        if last is None or last.shape != img.shape:
+            return None
+
+        return last
+
     async def _set_frame_data_matrix(self, img, frame_id: int):
         if hasattr(self._driver, "align_key_matrix"):
+            start = time.perf_counter()
             img = self._driver.align_key_matrix(self, img)
+            self._align_stats.add(time.perf_counter() - start)
 
         if img is None:
             return img
@@ -253,11 +356,15 @@ class Frame:
         proto = get_protocol_from_quirks(self._driver.hardware)
         pre_delay_ms = max(0, int(proto.inter_command_delay * 1000))
 
-        if self._driver._async_lock is None:
-            self._driver._async_lock = asyncio.Lock()
+        previous = self._get_delta_base(img, row_offsets)
 
-        async with self._driver._async_lock, self._driver.device_open():
-            await hid.send_frame_async(
+        # If the upload fails midway, the hardware state is unknown
+        self._full_refresh_pending = True
+
+        start = time.perf_counter()
+        scheduler = self._driver.command_scheduler
+        async with scheduler.slot(CommandPriority.FRAME), self._driver.device_open():
+            self._upload_timing = await hid.send_frame_async(
                 self._driver.hid_device,
                 img,
                 frame_id=frame_id,
@@ -266,7 +373,15 @@ class Frame:
                 row_offsets=row_offsets,
                 pre_delay_ms=pre_delay_ms,
                 post_delay_ms=1,
+                previous=previous,
             )
+        self._transmit_stats.add(time.perf_counter() - start)
+
+        self._full_refresh_pending = False
+        self._last_row_offsets = row_offsets
+        if previous is None:
+            self._last_full_refresh_ts = time.monotonic()
+
         return img
 
     async def _set_frame_data(self, img, frame_id: int | None = None):
@@ -282,6 +397,7 @@ class Frame:
             self._last_frame = img
             self._frame_seq += 1
             self._last_frame_ts = time.monotonic()
+            self.frame_committed.fire(self._frame_seq)
 
     async def _set_custom_frame(self):
         """
@@ -321,16 +437,41 @@ class Frame:
 
         Call this when switching away from custom frame mode (e.g., to a
         hardware effect) so the next animation will re-activate custom frame.
+        The next frame is also uploaded in full.
         """
         self._custom_frame_active = False
+        self._full_refresh_pending = True
+        self._last_composed = None
+
+    def _is_unchanged(self, img: np.ndarray, show: bool) -> bool:
+        """
+        True if the composed image matches what the hardware is already
+        showing, so the commit can be skipped.
+        """
+        if (show and not self._custom_frame_active) or self._debug_opts:
+            return False
+
+        # A failed upload may have left part of another frame on the device
+        if self._full_refresh_pending:
+            return False
+
+        last = self._last_composed
+        if last is None or last.shape != img.shape:
+            return False
+
+        # Let the periodic full refresh through even when idle
+        if time.monotonic() - self._last_full_refresh_ts >= Frame.FULL_REFRESH_INTERVAL:
+            return False
+
+        return np.array_equal(img, last)
 
     async def commit(self, layers, frame_id: int | None = None, show=True) -> "Frame":
         """
         Display this frame and prepare for the next frame.
 
         Composes layers, sends RGB data to hardware, and activates custom
-        frame mode if needed. This is the main entry point for the animation
-        loop.
+        frame mode if needed. If the composed image is identical to the
+        previous one, nothing is sent to the hardware.
 
         :param layers: List of Layer objects to composite
         :param frame_id: Internal frame identifier
@@ -338,10 +479,35 @@ class Frame:
 
         :return: This Frame instance
         """
-        img = Frame.compose(layers)
+        return await self.commit_image(Frame.compose(layers), frame_id=frame_id, show=show)
+
+    async def commit_image(
+        self, img: np.ndarray | None, frame_id: int | None = None, show=True
+    ) -> "Frame":
+        """
+        Display an image which was already composed with compose().
+
+        This is the transmit half of commit(), used by the animation
+        loop to send frames separately from composing them.
+
+        :param img: RGB image (uint8) returned by compose()
+        :param frame_id: Internal frame identifier
+        :param show: If True, activate custom frame mode (default)
+
+        :return: This Frame instance
+        """
         if img is None:
             return self
+
+        if self._is_unchanged(img, show):
+            self._skipped_frames += 1
+            return self
+
+        # Keyboard alignment may modify the image in place
+        composed = img.copy()
+
         await self._set_frame_data(img, frame_id)
+        self._last_composed = composed
         if show:
             await self._set_custom_frame()
 
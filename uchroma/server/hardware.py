@@ -7,6 +7,8 @@
 from __future__ import annotations
 
 import os
+import pickle
+import tempfile
 from collections import OrderedDict
 from datetime import datetime
 from enum import Enum, IntEnum, StrEnum
@@ -23,6 +25,11 @@ if TYPE_CHECKING:
 
 RAZER_VENDOR_ID = 0x1532
 
+HARDWARE_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+# Bump when the layout of the compiled device index changes
+HARDWARE_CACHE_VERSION = 1
+
 
 class Quirks(IntEnum):
     """
@@ -135,6 +142,18 @@ class Capability(StrEnum):
     EC_BOOST = "ec_boost"  # CPU/GPU boost control (0x0d,0x0d/0x8d)
 
 
+# Legacy quirks which imply a capability
+_CAPABILITY_QUIRKS = {
+    Capability.WIRELESS.value: Quirks.WIRELESS,
+    Capability.HYPERPOLLING.value: Quirks.HYPERPOLLING,
+    Capability.NO_LED.value: Quirks.NO_LED,
+    Capability.SINGLE_LED.value: Quirks.SINGLE_LED,
+    Capability.SOFTWARE_EFFECTS.value: Quirks.SOFTWARE_EFFECTS,
+    Capability.ANALOG_KEYS.value: Quirks.ANALOG_KEYS,
+    Capability.PROFILE_LEDS.value: Quirks.PROFILE_LEDS,
+}
+
+
 class MatrixType(StrEnum):
     """
     Type of LED matrix the device has.
@@ -277,6 +296,9 @@ class Hardware(BaseHardware):
         MOUSE = "Mouse"
         MOUSEPAD = "Mousepad"
 
+    # Compiled product ID lookup, see get_device
+    _device_index = None
+
     @property
     def has_matrix(self) -> bool:
         """
@@ -329,18 +351,8 @@ class Hardware(BaseHardware):
                     return True
 
         # Fall back to legacy quirks mapping
-        quirk_mapping = {
-            Capability.WIRELESS.value: Quirks.WIRELESS,
-            Capability.HYPERPOLLING.value: Quirks.HYPERPOLLING,
-            Capability.NO_LED.value: Quirks.NO_LED,
-            Capability.SINGLE_LED.value: Quirks.SINGLE_LED,
-            Capability.SOFTWARE_EFFECTS.value: Quirks.SOFTWARE_EFFECTS,
-            Capability.ANALOG_KEYS.value: Quirks.ANALOG_KEYS,
-            Capability.PROFILE_LEDS.value: Quirks.PROFILE_LEDS,
-        }
-
-        if cap_str in quirk_mapping:
-            return self.has_quirk(quirk_mapping[cap_str])
+        if cap_str in _CAPABILITY_QUIRKS:
+            return self.has_quirk(_CAPABILITY_QUIRKS[cap_str])
 
         return False
 
@@ -444,32 +456,124 @@ class Hardware(BaseHardware):
         if hw_type is None:
             return None
 
-        config_path = os.path.join(os.path.dirname(__file__), "data")
-        yaml_path = os.path.join(config_path, f"{hw_type.name.lower()}.yaml")
+        yaml_path = os.path.join(HARDWARE_DATA_DIR, f"{hw_type.name.lower()}.yaml")
 
         config = cls.load_yaml(yaml_path)
         assert config is not None
 
         return config
 
+    @staticmethod
+    def _cache_path() -> str:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        return os.path.join(cache_home, "uchroma", f"hardware-v{HARDWARE_CACHE_VERSION}.pickle")
+
+    @staticmethod
+    def _data_signature() -> tuple:
+        """
+        Identify the current state of the hardware database files
+
+        The record field names are included so a cache written by a
+        build with a different Hardware layout is never loaded.
+
+        :return: Tuple of (filename, mtime, size) for each data file,
+                 followed by the Hardware field names
+        """
+        signature = []
+        for hw_type in Hardware.Type:
+            yaml_path = os.path.join(HARDWARE_DATA_DIR, f"{hw_type.name.lower()}.yaml")
+            stat = os.stat(yaml_path)
+            signature.append((os.path.basename(yaml_path), stat.st_mtime_ns, stat.st_size))
+        signature.append(Hardware.__slots__)
+        return tuple(signature)
+
     @classmethod
-    def _get_device(cls, product_id: int, hw_type) -> Hardware | None:
-        if product_id is None:
-            return None
+    def _build_index(cls) -> dict:
+        """
+        Parse the YAML database and flatten every device entry
+
+        :return: Mapping of type name to {product_id: field dict}
+        """
+        index = {}
+        for hw_type in Hardware.Type:
+            devices = index[hw_type.name] = {}
+            nodes = [cls.get_type(hw_type)]
+            while nodes:
+                node = nodes.pop()
+                if node.children:
+                    nodes.extend(reversed(node.children))
+                product_id = node.product_id
+                if product_id is not None and product_id not in devices:
+                    devices[int(product_id)] = dict(node.flatten()._asdict())
+        return index
+
+    @classmethod
+    def _load_index(cls) -> dict:
+        """
+        Load the compiled device index, rebuilding it if the cache is
+        missing or older than the YAML files.
 
-        config = cls.get_type(hw_type)
+        :return: Mapping of Hardware.Type to {product_id: Hardware}
+        """
+        signature = cls._data_signature()
+        cache_path = cls._cache_path()
+
+        index = None
+        try:
+            with open(cache_path, "rb") as cache_file:
+                cached = pickle.load(cache_file)
+            if cached.get("signature") == signature:
+                index = cached["devices"]
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError, TypeError):
+            pass
+
+        if index is None:
+            index = cls._build_index()
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    "wb", dir=os.path.dirname(cache_path), delete=False
+                ) as temp:
+                    pickle.dump(
+                        {"signature": signature, "devices": index},
+                        temp,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                os.replace(temp.name, cache_path)
+            except OSError:
+                # Read-only home, just use the in-memory index
+                pass
+
+        return {
+            hw_type: {pid: cls(**fields) for pid, fields in index[hw_type.name].items()}
+            for hw_type in Hardware.Type
+        }
 
-        result = config.search("product_id", product_id)
-        if not result:
+    @classmethod
+    def _get_device(cls, product_id: int, hw_type) -> Hardware | None:
+        if product_id is None or hw_type is None:
             return None
 
-        if isinstance(result, list) and len(result) == 1:
-            return result[0]
+        if cls._device_index is None:
+            cls._device_index = cls._load_index()
 
-        return result
+        return cls._device_index[hw_type].get(product_id)
 
     @classmethod
     def get_device(cls, product_id: int, hw_type=None) -> Hardware | None:
+        """
+        Look up a device in the hardware database
+
+        Lookups go through a compiled index of fully inherited device
+        records, cached on disk and rebuilt when the YAML changes.
+
+        :param product_id: USB product ID
+        :param hw_type: Restrict the search to this Hardware.Type
+
+        :return: The Hardware record, or None if unknown
+        """
         if hw_type is not None:
             return cls._get_device(product_id, hw_type)
 
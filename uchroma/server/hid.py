@@ -11,6 +11,7 @@ from uchroma._native import (
     DATA_SIZE,
     REPORT_SIZE,
     DeviceInfo,
+    FrameTiming,
     HeadsetDevice,
     HidDevice,
     RazerReport,
@@ -36,6 +37,7 @@ __all__ = [
     "REPORT_SIZE",
     "WRITE_RAM",
     "DeviceInfo",
+    "FrameTiming",
     "HeadsetDevice",
     "HidDevice",
     "RazerReport",
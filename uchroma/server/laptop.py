@@ -8,6 +8,7 @@ from uchroma.util import scale_brightness
 
 from .hardware import Hardware
 from .keyboard import UChromaKeyboard
+from .scheduler import CommandPriority
 from .system_control import SystemControlMixin
 from .types import BaseCommand
 
@@ -63,6 +64,7 @@ class UChromaLaptop(SystemControlMixin, UChromaKeyboard):
             VARSTORE,
             BACKLIGHT_LED,
             scale_brightness(level),
+            coalesce=UChromaLaptop.Command.SET_BRIGHTNESS,
         )
         if success:
             self._cached_brightness = level
@@ -71,7 +73,11 @@ class UChromaLaptop(SystemControlMixin, UChromaKeyboard):
     async def refresh_brightness(self) -> float | None:
         async with self._brightness_lock:
             value = await self.run_with_result(
-                UChromaLaptop.Command.GET_BRIGHTNESS, VARSTORE, BACKLIGHT_LED, 0x00
+                UChromaLaptop.Command.GET_BRIGHTNESS,
+                VARSTORE,
+                BACKLIGHT_LED,
+                0x00,
+                priority=CommandPriority.TELEMETRY,
             )
             if value is not None and len(value) > 2:
                 self._cached_brightness = scale_brightness(int(value[2]), True)
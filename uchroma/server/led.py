@@ -1,10 +1,12 @@
 #
 # Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
 #
+import asyncio
+import time
 from collections import OrderedDict
 from enum import Enum
 
-from traitlets import Bool, Float, HasTraits, observe
+from traitlets import Bool, Bunch, Float, HasTraits, observe
 
 from uchroma.color import to_color
 from uchroma.colorlib import Color
@@ -12,11 +14,17 @@ from uchroma.traits import ColorTrait, UseEnumCaseless, WriteOnceUseEnumCaseless
 from uchroma.util import Signal, ensure_future, scale_brightness
 
 from .hardware import Quirks
+from .scheduler import CommandPriority
 from .types import BaseCommand, LEDType
 
 NOSTORE = 0
 VARSTORE = 1
 
+# Seconds a refresh from hardware stays valid
+REFRESH_TTL = 5.0
+
+_HARDWARE_TRAITS = ("brightness", "color", "mode", "state")
+
 
 class LEDMode(Enum):
     """
@@ -63,16 +71,20 @@ class LED(HasTraits):
         SET_LED_BRIGHTNESS = (0x0F, 0x04, 0x03)
         GET_LED_BRIGHTNESS = (0x0F, 0x84, 0x03)
 
-    def __init__(self, driver, led_type: LEDType, *args, **kwargs):
+    def __init__(self, driver, led_type: LEDType, *args, manager=None, **kwargs):
         super().__init__(*args, **kwargs)
         self._driver = driver
+        self._manager = manager
         self._led_type = led_type
         self._logger = driver.logger
         self.led_type = led_type
         self._restoring = True
         self._refreshing = False
         self._dirty = True
+        self._refreshed_at = None
         self._refresh_task = None
+        self._pending_changes = {}
+        self._apply_task = None
 
         # dynamic traits, since they are normally class-level
         brightness = Float(min=0.0, max=100.0, default_value=80.0, allow_none=False).tag(
@@ -90,20 +102,34 @@ class LED(HasTraits):
         self._restoring = False
 
     def __getattribute__(self, name):
-        if name in ("brightness", "color", "mode", "state") and self._dirty:
-            if self._refresh_task is None or self._refresh_task.done():
+        if name in _HARDWARE_TRAITS and self._dirty and self.refresh_expired:
+            if self._manager is not None:
+                self._manager.refresh(self)
+            elif self._refresh_task is None or self._refresh_task.done():
                 self._refresh_task = ensure_future(self._refresh())
             self._dirty = False
 
         return super().__getattribute__(name)
 
+    @property
+    def refresh_expired(self) -> bool:
+        """
+        True if the cached state is older than REFRESH_TTL
+        """
+        return self._refreshed_at is None or time.monotonic() - self._refreshed_at >= REFRESH_TTL
+
     # Async methods (default)
     async def _get(self, cmd):
-        return await self._driver.run_with_result(cmd, VARSTORE, self._led_type.hardware_id)
+        return await self._driver.run_with_result(
+            cmd, VARSTORE, self._led_type.hardware_id, priority=CommandPriority.TELEMETRY
+        )
 
     async def _set(self, cmd, *args):
+        # Setters are idempotent, so a fade only needs its latest step
         return await self._driver.run_command(
-            cmd, *(VARSTORE, self._led_type.hardware_id, *args), delay=0.035
+            cmd,
+            *(VARSTORE, self._led_type.hardware_id, *args),
+            coalesce=(cmd, self._led_type),
         )
 
     async def _get_brightness(self):
@@ -146,13 +172,22 @@ class LED(HasTraits):
 
         finally:
             self._refreshing = False
+            self._refreshed_at = time.monotonic()
 
     @observe("color", "mode", "state", "brightness")
     def _observer(self, change):
         if self._refreshing or change.old == change.new:
             return
 
-        ensure_future(self._apply_change(change))
+        # Merge with a write that hasn't gone out yet, so only the
+        # latest value of each property is sent
+        pending = self._pending_changes.get(change.name)
+        if pending is not None:
+            change = Bunch(change, old=pending.old)
+        self._pending_changes[change.name] = change
+
+        if self._apply_task is None or self._apply_task.done():
+            self._apply_task = ensure_future(self._apply_pending())
 
         if not self._restoring:
             self._dirty = True
@@ -160,6 +195,13 @@ class LED(HasTraits):
             if self.led_type != LEDType.BACKLIGHT:
                 self._update_prefs()
 
+    async def _apply_pending(self):
+        while self._pending_changes:
+            name = next(iter(self._pending_changes))
+            change = self._pending_changes.pop(name)
+            if change.old != change.new:
+                await self._apply_change(change)
+
     async def _apply_change(self, change):
         is_extended = self._driver.has_quirk(Quirks.EXTENDED_FX_CMDS)
 
@@ -214,6 +256,8 @@ class LEDManager:
     def __init__(self, driver):
         self._driver = driver
         self._leds = {}
+        self._refresh_pending = []
+        self._refresh_task = None
 
         self.led_changed = Signal()
 
@@ -235,11 +279,42 @@ class LEDManager:
             return None
 
         if led_type not in self._leds:
-            self._leds[led_type] = LED(self._driver, led_type)
+            self._leds[led_type] = LED(self._driver, led_type, manager=self)
             self._leds[led_type].observe(self._led_changed)
 
         return self._leds[led_type]
 
+    def refresh(self, led: LED | None = None):
+        """
+        Schedule a refresh of LED state from the hardware
+
+        Every LED whose cached state has expired is refreshed in a
+        single background pass, so reading several LEDs in a row
+        doesn't start a refresh for each one.
+
+        :param led: An LED to refresh even if its cache is still valid
+        """
+        for other in self._leds.values():
+            if (other is led or other.refresh_expired) and other not in self._refresh_pending:
+                self._refresh_pending.append(other)
+
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = ensure_future(self._refresh_batch())
+
+    async def _refresh_batch(self):
+        # Let LEDs read in the same pass join this batch
+        await asyncio.sleep(0)
+
+        while self._refresh_pending:
+            led = self._refresh_pending.pop(0)
+            try:
+                await led._refresh()
+            except Exception as err:
+                # Don't let one bad LED stall the rest of the batch
+                self._driver.logger.error(
+                    "Failed to refresh LED %s: %s", led.led_type.name.lower(), err
+                )
+
     def _led_changed(self, change):
         self.led_changed.fire(change.owner)
 
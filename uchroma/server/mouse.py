@@ -13,8 +13,14 @@ from uchroma.util import clamp, scale, scale_brightness
 from .device import UChromaDevice
 from .device_base import BaseCommand
 from .hardware import Hardware
+from .scheduler import CommandPriority
 from .types import LEDType
 
+# Seconds between background telemetry refreshes
+POLLING_RATE_INTERVAL = 300.0
+BATTERY_POLL_CHARGING = 30.0
+BATTERY_POLL_INTERVAL = 300.0
+
 
 class PollingRate(Enum):
     """
@@ -55,17 +61,27 @@ class UChromaMouse(UChromaDevice):
         **kwargs,
     ):
         super().__init__(hardware, devinfo, devindex, sys_path, input_devices, *args, **kwargs)
+        self._cached_polling_rate = PollingRate.INVALID
+
+        self.telemetry.add("polling", self.refresh_polling_rate, POLLING_RATE_INTERVAL)
 
     @property
     def polling_rate(self) -> PollingRate:
         """
         Get the current polling rate
         """
-        value = self.run_with_result_sync(UChromaMouse.Command.GET_POLLING_RATE)
-        if value is None:
-            return PollingRate.INVALID
+        return self._cached_polling_rate
 
-        return PollingRate(value[0])
+    async def refresh_polling_rate(self) -> dict[str, object]:
+        value = await self.run_with_result(
+            UChromaMouse.Command.GET_POLLING_RATE, priority=CommandPriority.TELEMETRY
+        )
+        try:
+            self._cached_polling_rate = PollingRate(value[0]) if value else PollingRate.INVALID
+        except ValueError:
+            self._cached_polling_rate = PollingRate.INVALID
+
+        return {"PollingRate": self._cached_polling_rate.name}
 
     @polling_rate.setter
     def polling_rate(self, rate: PollingRate):
@@ -75,7 +91,8 @@ class UChromaMouse(UChromaDevice):
         if isinstance(rate, str):
             rate = PollingRate.__members__[rate.upper()]
 
-        self.run_command_sync(UChromaMouse.Command.SET_POLLING_RATE, rate.value)
+        if self.run_command_sync(UChromaMouse.Command.SET_POLLING_RATE, rate.value):
+            self._cached_polling_rate = rate
 
     @property
     def dpi_xy(self) -> tuple:
@@ -158,6 +175,8 @@ class UChromaWirelessMouse(UChromaMouse):
         self._cached_is_charging = False
         self._wireless_lock = asyncio.Lock()
 
+        self.telemetry.add("wireless", self.refresh_wireless_state, self._wireless_poll_interval)
+
     @property
     def is_wireless(self):
         """
@@ -201,15 +220,24 @@ class UChromaWirelessMouse(UChromaMouse):
         """
         return self._cached_is_charging
 
+    def _wireless_poll_interval(self) -> float:
+        if self._cached_is_charging:
+            return BATTERY_POLL_CHARGING
+        return BATTERY_POLL_INTERVAL
+
     async def refresh_wireless_state(self) -> dict[str, object]:
         async with self._wireless_lock:
-            value = await self.run_with_result(UChromaWirelessMouse.Command.GET_BATTERY_LEVEL)
+            value = await self.run_with_result(
+                UChromaWirelessMouse.Command.GET_BATTERY_LEVEL, priority=CommandPriority.TELEMETRY
+            )
             if value is None or len(value) < 2:
                 self._cached_battery_level = -1.0
             else:
                 self._cached_battery_level = (value[1] / 255) * 100
 
-            value = await self.run_with_result(UChromaWirelessMouse.Command.GET_CHARGING_STATUS)
+            value = await self.run_with_result(
+                UChromaWirelessMouse.Command.GET_CHARGING_STATUS, priority=CommandPriority.TELEMETRY
+            )
             self._cached_is_charging = bool(value is not None and len(value) > 1 and value[1] == 1)
 
         return {
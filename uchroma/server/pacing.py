@@ -0,0 +1,201 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+"""
+Adaptive inter-command pacing.
+
+Razer firmware answers BUSY when a report arrives before the previous
+one has been processed. Instead of always waiting a fixed gap, each
+device starts from its protocol's delay, probes for a shorter gap while
+reports keep being acknowledged, and backs off as soon as it sees BUSY.
+The fastest gap found is remembered per product ID.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+
+from uchroma.log import Log
+from uchroma.util import Singleton
+
+from . import hid
+
+# Bounds for the gap between reports, in milliseconds
+MIN_GAP_MS = 1
+MAX_GAP_MS = 100
+
+# Consecutive acknowledged reports before trying a shorter gap
+PROBE_AFTER = 32
+
+# Retries for a report answered with BUSY, and the wait before each
+BUSY_RETRIES = 3
+BUSY_BACKOFF = 0.1
+
+# Learned gaps are written out at most this often
+SAVE_DELAY = 5.0
+
+
+class PacingStore(metaclass=Singleton):
+    """
+    Learned inter-command gaps, keyed by product ID.
+
+    Stored as JSON next to the hardware cache. Changes made under an
+    event loop are written after SAVE_DELAY; call flush() to write
+    them immediately. This class is a singleton.
+    """
+
+    def __init__(self):
+        self._logger = Log.get("uchroma.pacing")
+        self._path = PacingStore._store_path()
+        self._gaps = self._load()
+        self._dirty = False
+        self._save_handle = None
+
+    @staticmethod
+    def _store_path() -> str:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        return os.path.join(cache_home, "uchroma", "pacing.json")
+
+    def _load(self) -> dict[str, int]:
+        try:
+            with open(self._path) as store_file:
+                data = json.load(store_file)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+        return {key: int(gap) for key, gap in data.items() if isinstance(gap, int)}
+
+    @staticmethod
+    def _key(product_id: int) -> str:
+        return f"{int(product_id):04x}"
+
+    def get(self, product_id: int) -> int | None:
+        """
+        Learned gap for a product in milliseconds, None if unknown
+        """
+        return self._gaps.get(PacingStore._key(product_id))
+
+    def put(self, product_id: int, gap_ms: int):
+        """
+        Remember the gap for a product
+        """
+        key = PacingStore._key(product_id)
+        if self._gaps.get(key) == gap_ms:
+            return
+
+        self._gaps[key] = gap_ms
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(SAVE_DELAY, self.flush)
+
+    def flush(self):
+        """
+        Write pending changes to disk
+        """
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+
+        if not self._dirty:
+            return
+
+        self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=os.path.dirname(self._path), delete=False
+            ) as temp:
+                json.dump(self._gaps, temp, indent=2, sort_keys=True)
+            os.replace(temp.name, self._path)
+        except OSError as err:
+            self._logger.error("Failed to save command pacing", exc_info=err)
+
+
+class CommandPacer:
+    """
+    Tunes the gap between reports sent to one device.
+
+    The gap is lowered by a millisecond after every PROBE_AFTER
+    acknowledged reports. A BUSY answer doubles it and raises the
+    floor above the gap which failed, so probing stops just short of
+    what the firmware tolerates. Timeouts say nothing about pacing
+    and leave the gap alone.
+    """
+
+    def __init__(self, product_id: int, default_ms: int, store: PacingStore | None = None):
+        self._product_id = product_id
+        self._store = store
+        self._default_ms = max(MIN_GAP_MS, min(MAX_GAP_MS, int(default_ms)))
+
+        learned = store.get(product_id) if store is not None else None
+        self._gap_ms = self._default_ms if learned is None else learned
+        self._gap_ms = max(MIN_GAP_MS, min(MAX_GAP_MS, self._gap_ms))
+        self._floor_ms = MIN_GAP_MS
+        self._acks = 0
+
+        self._stats = {"acks": 0, "busy": 0, "probes": 0}
+
+    @property
+    def gap_ms(self) -> int:
+        """
+        Current gap between reports in milliseconds
+        """
+        return self._gap_ms
+
+    @property
+    def default_ms(self) -> int:
+        """
+        The protocol's fixed gap this pacer started from
+        """
+        return self._default_ms
+
+    def record(self, status) -> bool:
+        """
+        Account for the status a device answered a report with
+
+        :param status: hid.Status of the response
+        :return: True if the device was busy and the report should be retried
+        """
+        if status == hid.Status.Ok:
+            self._stats["acks"] += 1
+            self._acks += 1
+            if self._acks >= PROBE_AFTER and self._gap_ms > self._floor_ms:
+                self._acks = 0
+                self._stats["probes"] += 1
+                self._set_gap(self._gap_ms - 1)
+            return False
+
+        if status == hid.Status.Busy:
+            self._stats["busy"] += 1
+            self._acks = 0
+            self._floor_ms = min(MAX_GAP_MS, max(self._floor_ms, self._gap_ms + 1))
+            self._set_gap(max(self._floor_ms, self._gap_ms * 2))
+            return True
+
+        return False
+
+    def _set_gap(self, gap_ms: int):
+        self._gap_ms = max(MIN_GAP_MS, min(MAX_GAP_MS, gap_ms))
+        if self._store is not None:
+            self._store.put(self._product_id, self._gap_ms)
+
+    def stats(self) -> dict[str, object]:
+        """
+        Current gap, bounds and counters
+        """
+        return {
+            "gap_ms": self._gap_ms,
+            "floor_ms": self._floor_ms,
+            "default_ms": self._default_ms,
+            **self._stats,
+        }
@@ -12,6 +12,7 @@ from uchroma.log import Log
 from uchroma.util import Singleton
 
 from .device_manager import UChromaDeviceManager
+from .prefs import PreferenceManager
 
 SCREENSAVERS = (
     ("org.freedesktop.ScreenSaver", "/org/freedesktop/ScreenSaver"),
@@ -53,6 +54,10 @@ class PowerMonitor(metaclass=Singleton):
                 self._logger.info("Resuming device: %s", name)
                 device.resume()
 
+        if sleeping:
+            # Saved brightness must be on disk before the system goes down
+            PreferenceManager().flush()
+
     def _prepare_for_sleep(self, sleeping):
         self._suspend(sleeping, True)
 
@@ -4,14 +4,18 @@
 
 # pylint: disable=invalid-name
 
+import asyncio
 import os
+import tempfile
 import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 
 import ruamel.yaml as yaml
 
 from uchroma.colorlib import Color
+from uchroma.log import Log
 from uchroma.util import Singleton
 
 from .config import Configuration
@@ -19,6 +23,9 @@ from .config import Configuration
 CONFDIR = os.path.join(os.path.expanduser("~"), ".config", "uchroma")
 CONFFILE = os.path.join(CONFDIR, "preferences.yaml")
 
+# Changes made within this many seconds are written out together
+SAVE_DELAY = 2.0
+
 
 _Preferences = Configuration.create(
     "_Preferences",
@@ -31,6 +38,7 @@ _Preferences = Configuration.create(
         ("fx_args", OrderedDict),
         ("layers", OrderedDict),
         ("power_mode", str),
+        ("handle_idle_timeout", float),
     ],
     mutable=True,
     yaml_name="!preferences",
@@ -49,17 +57,35 @@ class PreferenceManager(metaclass=Singleton):
     """
     Hierarchical preferences holder.
 
-    Automatically serializes to YAML when items
-    are changed. This class is a singleton.
+    Automatically serializes to YAML when items are changed. When
+    running under an event loop, changes are coalesced and written
+    at most once per SAVE_DELAY by a background thread; call flush()
+    to force pending changes to disk. This class is a singleton.
     """
 
     def __init__(self):
+        self._logger = Log.get("uchroma.prefs")
+        self._dirty = False
+        self._save_handle = None
+        self._pending_write = None
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="uchroma-prefs")
+
         self._root = PreferenceManager._load_prefs()
         self._root.__class__.observe(self._preferences_changed)
 
     def _preferences_changed(self, obj, name, value):
-        if name != "last_updated":
+        if name == "last_updated":
+            return
+
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
             self._save_prefs()
+            return
+
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(SAVE_DELAY, self._save_later)
 
     @staticmethod
     def _load_prefs():
@@ -70,9 +96,60 @@ class PreferenceManager(metaclass=Singleton):
             return prefs
         return Preferences(last_updated=time.time())
 
-    def _save_prefs(self):
+    def _render(self) -> str:
+        """
+        Snapshot the preferences as YAML, clearing the dirty flag
+        """
+        self._dirty = False
         self._root.last_updated = time.time()
-        self._root.save_yaml(CONFFILE)
+        Preferences._yaml_cache.pop(CONFFILE, None)
+        return self._root._yaml_header() + self._root.yaml
+
+    @staticmethod
+    def _write(text: str):
+        with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(CONFFILE), delete=False) as temp:
+            temp.write(text)
+            tempname = temp.name
+        os.rename(tempname, CONFFILE)
+
+    def _write_done(self, future):
+        if future.exception() is not None:
+            self._logger.error("Failed to save preferences", exc_info=future.exception())
+
+    def _save_later(self):
+        self._save_handle = None
+        if not self._dirty:
+            return
+
+        # Don't queue up behind a slow disk, try again next interval
+        if self._pending_write is not None and not self._pending_write.done():
+            loop = asyncio.get_running_loop()
+            self._save_handle = loop.call_later(SAVE_DELAY, self._save_later)
+            return
+
+        self._pending_write = self._writer.submit(PreferenceManager._write, self._render())
+        self._pending_write.add_done_callback(self._write_done)
+
+    def _save_prefs(self):
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+
+        # The writer runs one job at a time, so this lands after any
+        # write already in flight
+        self._writer.submit(PreferenceManager._write, self._render()).result()
+
+    def flush(self):
+        """
+        Write any pending changes to disk immediately.
+
+        Blocks until the file has been written. Called on shutdown
+        and before the system suspends.
+        """
+        if self._dirty:
+            self._save_prefs()
+        elif self._pending_write is not None:
+            wait([self._pending_write])
 
     def get(self, serial: str | None) -> Preferences:
         """
@@ -0,0 +1,175 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+"""
+Per-device command scheduling.
+
+Everything sent to a device goes through a single channel. Instead of a
+FIFO lock, callers wait in priority order so a slow telemetry poll or a
+long frame upload can't hold up a user-visible change.
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import asynccontextmanager
+from enum import IntEnum
+
+
+class CommandPriority(IntEnum):
+    """
+    Priority classes for device commands, most urgent first
+    """
+
+    # User-visible changes: brightness, LEDs, effects, system control
+    INTERACTIVE = 0
+
+    # Animation frame uploads
+    FRAME = 1
+
+    # Background state refresh: battery, fan speed, LED state queries
+    TELEMETRY = 2
+
+
+class _Coalesced:
+    """
+    A queued request which may still be replaced by a newer one
+    """
+
+    __slots__ = ("func", "started", "task")
+
+    def __init__(self, func):
+        self.func = func
+        self.started = False
+        self.task = None
+
+
+class CommandScheduler:
+    """
+    Priority lock for a device's command channel.
+
+    Waiters are served by CommandPriority and then in arrival order.
+    Requests submitted with a coalescing key replace a queued request
+    with the same key (latest wins), and every caller gets the result
+    of the request which actually ran.
+    """
+
+    def __init__(self):
+        self._busy = False
+        self._waiters = []
+        self._counter = itertools.count()
+        self._coalesced = {}
+        self._superseded = 0
+
+    @property
+    def locked(self) -> bool:
+        """
+        True if a command currently holds the channel
+        """
+        return self._busy
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of callers waiting for the channel
+        """
+        return sum(1 for *_, waiter in self._waiters if not waiter.done())
+
+    @property
+    def superseded(self) -> int:
+        """
+        Number of requests replaced by a newer one before they ran
+        """
+        return self._superseded
+
+    async def acquire(self, priority: CommandPriority = CommandPriority.INTERACTIVE):
+        """
+        Wait for exclusive use of the channel
+
+        :param priority: Priority class of the caller
+        """
+        if not self._busy and not self.pending:
+            self._busy = True
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._counter), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Ownership may have been handed over just as we were cancelled
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        """
+        Hand the channel to the most urgent waiter, or free it
+        """
+        while self._waiters:
+            *_, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._busy = False
+
+    @asynccontextmanager
+    async def slot(self, priority: CommandPriority = CommandPriority.INTERACTIVE):
+        """
+        Hold the channel for the duration of the block
+
+        :param priority: Priority class of the caller
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def run(
+        self,
+        func: Callable[[], Awaitable],
+        priority: CommandPriority = CommandPriority.INTERACTIVE,
+        key: Hashable | None = None,
+    ):
+        """
+        Run a coroutine function while holding the channel
+
+        :param func: Zero-argument coroutine function to run
+        :param priority: Priority class of the request
+        :param key: Coalescing key for idempotent requests. A queued
+                    request with the same key is replaced by this one.
+
+        :return: The result of func, or of the request which replaced it
+        """
+        if key is None:
+            async with self.slot(priority):
+                return await func()
+
+        entry = self._coalesced.get(key)
+        if entry is not None and not entry.started:
+            self._superseded += 1
+            entry.func = func
+        else:
+            entry = _Coalesced(func)
+            self._coalesced[key] = entry
+            entry.task = asyncio.ensure_future(self._run_coalesced(key, entry, priority))
+
+        task = entry.task
+        assert task is not None
+
+        # Shared by every caller, so one giving up doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def _run_coalesced(self, key: Hashable, entry: _Coalesced, priority: CommandPriority):
+        try:
+            async with self.slot(priority):
+                entry.started = True
+                if self._coalesced.get(key) is entry:
+                    del self._coalesced[key]
+                return await entry.func()
+        finally:
+            if self._coalesced.get(key) is entry:
+                del self._coalesced[key]
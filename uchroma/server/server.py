@@ -13,6 +13,7 @@ from uchroma.version import __version__
 from .dbus import DeviceManagerAPI
 from .device_manager import UChromaDeviceManager
 from .power import PowerMonitor
+from .prefs import PreferenceManager
 
 
 class UChromaServer:
@@ -112,6 +113,7 @@ class UChromaServer:
             await power.stop()
             await dm.close_devices()
             await dm.monitor_stop()
+            PreferenceManager().flush()
 
             self._logger.info("Shutdown complete")
 
@@ -426,13 +426,8 @@ class StandardFX(FXModule):
             frame = self._driver.frame_control
             layer = frame.create_layer()
 
-            for row in range(layer.height):
-                for col in range(layer.width):
-                    if col == 0:
-                        color = first
-                    else:
-                        color = colors[int((col - 1) % len(colors))]
-                    layer.put(row, col, color)
+            row = [first] + [colors[(col - 1) % len(colors)] for col in range(1, layer.width)]
+            layer.put_all([row] * layer.height)
 
             layer.put(self.cur_row, self.cur_col, single)
             frame.debug_opts["debug_position"] = (self.cur_row, self.cur_col)
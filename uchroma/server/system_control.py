@@ -17,6 +17,7 @@ from enum import IntEnum
 from uchroma.util import Signal, ensure_future
 
 from .hardware import Capability, Hardware
+from .scheduler import CommandPriority
 from .types import BaseCommand
 
 
@@ -76,6 +77,10 @@ FAN_LIMITS = {
     "default": FanLimits(max_rpm=5000, supports_dual_fan=False),
 }
 
+# Seconds between background EC refreshes, and while the fans are ramping
+SYSTEM_POLL_INTERVAL = 10.0
+SYSTEM_POLL_RAMP_INTERVAL = 2.0
+
 
 class ECCommand(BaseCommand):
     """Embedded Controller commands for Blade laptops (Class 0x0D).
@@ -138,8 +143,11 @@ class SystemControlMixin:
         self._cached_cpu_boost: BoostMode = BoostMode.LOW
         self._cached_gpu_boost: BoostMode = BoostMode.LOW
         self._last_refresh_ts = 0.0
-        self._refresh_task = None
         self._refresh_lock = asyncio.Lock()
+        self._fan_ramping = False
+
+        if self.supports_system_control or self.supports_boost:
+            self.telemetry.add("system", self.refresh_system_state, self._system_poll_interval)
 
         # Connect to restore_prefs signal for persistence
         if hasattr(self, "restore_prefs"):
@@ -165,15 +173,18 @@ class SystemControlMixin:
             self.preferences.power_mode = mode.name.lower()
 
     def _schedule_refresh(self):
-        if not self.supports_system_control and not self.supports_boost:
-            return
+        # Getters only read the cache, which telemetry keeps current
+        self.telemetry.start()
 
-        now = time.monotonic()
-        if now - self._last_refresh_ts < 1.0:
-            return
+    def _system_poll_interval(self) -> float:
+        if self._fan_ramping:
+            return SYSTEM_POLL_RAMP_INTERVAL
+        return SYSTEM_POLL_INTERVAL
 
-        if self._refresh_task is None or self._refresh_task.done():
-            self._refresh_task = ensure_future(self._refresh_state())
+    def _fan_state_changed(self):
+        # Watch closely until the EC settles on the new state
+        self._fan_ramping = True
+        self.telemetry.poke("system")
 
     async def _refresh_state(self):
         if not self.supports_system_control and not self.supports_boost:
@@ -189,7 +200,14 @@ class SystemControlMixin:
             fan_setting_rpm2 = None
 
             if self.supports_system_control:
-                result = await self.run_with_result(ECCommand.GET_FAN_MODE, 0x00, 0x00, 0x00, 0x00)
+                result = await self.run_with_result(
+                    ECCommand.GET_FAN_MODE,
+                    0x00,
+                    0x00,
+                    0x00,
+                    0x00,
+                    priority=CommandPriority.TELEMETRY,
+                )
                 if result is not None and len(result) >= 4:
                     try:
                         self._cached_power_mode = PowerMode(result[2])
@@ -201,7 +219,12 @@ class SystemControlMixin:
 
                 if self.fan_limits.supports_dual_fan:
                     result2 = await self.run_with_result(
-                        ECCommand.GET_FAN_MODE, 0x00, 0x01, 0x00, 0x00
+                        ECCommand.GET_FAN_MODE,
+                        0x00,
+                        0x01,
+                        0x00,
+                        0x00,
+                        priority=CommandPriority.TELEMETRY,
                     )
                     if result2 is not None and len(result2) >= 4:
                         fan_setting_rpm2 = result2[3] * 100
@@ -209,14 +232,19 @@ class SystemControlMixin:
                 if self.supports_fan_speed:
                     rpm1 = 0
                     rpm2 = None
-                    result = await self.run_with_result(ECCommand.GET_FAN_SPEED, 0x00, 0x00)
+                    result = await self.run_with_result(
+                        ECCommand.GET_FAN_SPEED, 0x00, 0x00, priority=CommandPriority.TELEMETRY
+                    )
                     if result is not None and len(result) >= 3:
                         rpm1 = result[2] * 100
 
                     if self.fan_limits.supports_dual_fan:
-                        result2 = await self.run_with_result(ECCommand.GET_FAN_SPEED, 0x00, 0x01)
+                        result2 = await self.run_with_result(
+                            ECCommand.GET_FAN_SPEED, 0x00, 0x01, priority=CommandPriority.TELEMETRY
+                        )
                         if result2 is not None and len(result2) >= 3:
                             rpm2 = result2[2] * 100
+                    self._fan_ramping = (rpm1, rpm2) != self._cached_fan_rpm
                     self._cached_fan_rpm = (rpm1, rpm2)
                 else:
                     self._cached_fan_rpm = (fan_setting_rpm1, fan_setting_rpm2)
@@ -224,14 +252,18 @@ class SystemControlMixin:
             self._cached_fan_setting_rpm = (fan_setting_rpm1, fan_setting_rpm2)
 
             if self.supports_boost:
-                result = await self.run_with_result(ECCommand.GET_BOOST, 0x01, 0x00)
+                result = await self.run_with_result(
+                    ECCommand.GET_BOOST, 0x01, 0x00, priority=CommandPriority.TELEMETRY
+                )
                 if result is not None and len(result) >= 1:
                     try:
                         self._cached_cpu_boost = BoostMode(result[0])
                     except ValueError:
                         self._cached_cpu_boost = BoostMode.LOW
 
-                result = await self.run_with_result(ECCommand.GET_BOOST, 0x01, 0x01)
+                result = await self.run_with_result(
+                    ECCommand.GET_BOOST, 0x01, 0x01, priority=CommandPriority.TELEMETRY
+                )
                 if result is not None and len(result) >= 1:
                     try:
                         self._cached_gpu_boost = BoostMode(result[0])
@@ -336,6 +368,7 @@ class SystemControlMixin:
             if not self.supports_fan_speed:
                 self._cached_fan_rpm = self._cached_fan_setting_rpm
             self.fan_changed.fire(self)
+            self._fan_state_changed()
         return success
 
     async def set_fan_rpm(self, rpm: int, fan2_rpm: int | None = None) -> bool:
@@ -388,6 +421,7 @@ class SystemControlMixin:
             if not self.supports_fan_speed:
                 self._cached_fan_rpm = self._cached_fan_setting_rpm
             self.fan_changed.fire(self)
+            self._fan_state_changed()
 
         return success
 
@@ -427,6 +461,7 @@ class SystemControlMixin:
         if success:
             self._cached_power_mode = mode
             self.power_mode_changed.fire(self, mode)
+            self._fan_state_changed()
         return success
 
     # ─────────────────────────────────────────────────────────────────────────
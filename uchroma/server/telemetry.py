@@ -0,0 +1,164 @@
+#
+# Copyright (C) 2026 UChroma Developers — LGPL-3.0-or-later
+#
+"""
+Background refresh of device telemetry.
+
+Battery, fan and similar state is read from the hardware on a timer and
+cached, so property getters never wait on USB. Each source picks its next
+interval after every refresh, which lets it poll faster while something is
+changing (charging, a fan ramping) and back off when idle.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+
+from uchroma.util import Signal, ensure_future
+
+
+class _Source:
+    __slots__ = ("due", "interval", "name", "refresh", "values")
+
+    def __init__(self, name, refresh, interval):
+        self.name = name
+        self.refresh = refresh
+        self.interval = interval
+        self.values = {}
+        self.due = 0.0
+
+    def next_interval(self) -> float:
+        return self.interval() if callable(self.interval) else self.interval
+
+
+class TelemetryScheduler:
+    """
+    Per-device scheduler for background telemetry refreshes.
+
+    A source is a coroutine function returning a dict of values keyed by
+    their D-Bus property names. The changed signal fires with the source
+    name and the values which differ from the previous refresh.
+    """
+
+    def __init__(self, logger):
+        self._logger = logger
+        self._sources = {}
+        self._task = None
+        self._wakeup = None
+
+        self.changed = Signal()
+
+    def add(
+        self,
+        name: str,
+        refresh: Callable[[], Awaitable[dict]],
+        interval: float | Callable[[], float],
+    ):
+        """
+        Register a telemetry source
+
+        :param name: Name of the source, passed to changed handlers
+        :param refresh: Coroutine function which reads the values from hardware
+        :param interval: Seconds between refreshes, or a function returning
+                         it which is called after each refresh
+        """
+        self._sources[name] = _Source(name, refresh, interval)
+        self._wake()
+
+    @property
+    def running(self) -> bool:
+        """
+        True if the background task is active
+        """
+        return self._task is not None and not self._task.done()
+
+    def values(self, name: str) -> dict:
+        """
+        Values from the last refresh of a source
+
+        :param name: Name of the source
+        :return: The cached values, empty if never refreshed
+        """
+        return dict(self._sources[name].values)
+
+    def start(self):
+        """
+        Start refreshing in the background, beginning with every source
+        """
+        if self.running or not self._sources:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._task = ensure_future(self._run())
+
+    async def stop(self):
+        """
+        Stop the background task
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def poke(self, name: str | None = None):
+        """
+        Refresh a source, or all of them, as soon as possible
+
+        :param name: Name of the source, None for all
+        """
+        for source in self._sources.values():
+            if name is None or source.name == name:
+                source.due = 0.0
+        self._wake()
+
+    async def refresh(self, name: str) -> dict:
+        """
+        Refresh a source immediately
+
+        :param name: Name of the source
+        :return: The full set of values read
+        """
+        source = self._sources[name]
+        try:
+            values = await source.refresh()
+        finally:
+            source.due = time.monotonic() + source.next_interval()
+
+        changes = {
+            k: v for k, v in values.items() if k not in source.values or source.values[k] != v
+        }
+        source.values = dict(values)
+
+        if changes:
+            self.changed.fire(name, changes)
+        return dict(values)
+
+    def _wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self):
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                self._wakeup.clear()
+                now = time.monotonic()
+                for source in [s for s in self._sources.values() if s.due <= now]:
+                    try:
+                        await self.refresh(source.name)
+                    except Exception as err:
+                        self._logger.exception(
+                            "Telemetry refresh failed: %s", source.name, exc_info=err
+                        )
+
+                delay = min(s.due for s in self._sources.values()) - time.monotonic()
+                if delay > 0:
+                    with suppress(TimeoutError):
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+        finally:
+            self._wakeup = None
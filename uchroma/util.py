@@ -17,6 +17,7 @@ import time
 import typing
 from functools import wraps
 
+import numpy as np
 from numpy import interp
 
 AUTOCAST_CACHE = {}
@@ -298,13 +299,22 @@ class Signal:
         """
         self._handlers.add(handler)
 
+    def disconnect(self, handler):
+        """
+        Disconnect a handler from this signal
+
+        :param handler: The handler passed to connect()
+        """
+        self._handlers.discard(handler)
+
     def fire(self, *args, **kwargs):
         """
         Fire the signal, invoking all connected handlers
 
         :params args: Arguments to call handlers with
         """
-        for handler in self._handlers:
+        # Handlers may disconnect themselves
+        for handler in tuple(self._handlers):
             handler(*args, **kwargs)
 
 
@@ -335,18 +345,22 @@ class Ticker:
         self._interval = interval
         self._tick_start = 0.0
         self._next_tick = 0.0
+        self._late_ticks = 0
+        self._dropped_ticks = 0
 
     def __enter__(self):
         self._tick_start = time.monotonic()
         return self
 
     def __exit__(self, *args):
-        next_tick = time.monotonic() - self._tick_start
+        elapsed = time.monotonic() - self._tick_start
 
-        if next_tick > self._interval:
-            next_tick = next_tick % self._interval
+        if elapsed > self._interval:
+            self._late_ticks += 1
+            self._dropped_ticks += int(elapsed // self._interval)
+            self._next_tick = self._interval - (elapsed % self._interval)
         else:
-            self._next_tick = self._interval - next_tick
+            self._next_tick = self._interval - elapsed
 
     async def tick(self):
         """
@@ -372,6 +386,186 @@ class Ticker:
     def interval(self, value: float):
         self._interval = value
 
+    @property
+    def late_ticks(self) -> int:
+        """
+        Number of ticks where the work overran the interval
+        """
+        return self._late_ticks
+
+    @property
+    def dropped_ticks(self) -> int:
+        """
+        Number of whole intervals skipped because of overruns
+        """
+        return self._dropped_ticks
+
+
+class RollingStats:
+    """
+    Rolling window of timing samples with percentile summaries.
+
+    The most recent samples are kept in a fixed-size ring buffer,
+    so recording is cheap enough to do for every frame.
+    """
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, size: int = 300):
+        self._samples = np.zeros(size, dtype=np.float64)
+        self._index = 0
+        self._count = 0
+
+    def add(self, value: float):
+        """
+        Record a sample, replacing the oldest one if the window is full
+
+        :param value: The sample value
+        """
+        self._samples[self._index] = value
+        self._index = (self._index + 1) % len(self._samples)
+        self._count += 1
+
+    @property
+    def count(self) -> int:
+        """
+        Total number of samples recorded, including expired ones
+        """
+        return self._count
+
+    @property
+    def samples(self) -> np.ndarray:
+        """
+        The samples currently in the window (unordered)
+        """
+        return self._samples[: min(self._count, len(self._samples))]
+
+    def clear(self):
+        """
+        Discard all samples
+        """
+        self._index = 0
+        self._count = 0
+
+    def summary(self, scale: float = 1.0) -> dict:
+        """
+        Summarize the current window
+
+        :param scale: Factor applied to the reported values (e.g. 1000 for ms)
+
+        :return: dict with count, p50, p95, p99 and max
+        """
+        return RollingStats.summarize(self.samples, self._count, scale)
+
+    @staticmethod
+    def summarize(samples: np.ndarray, count: int | None = None, scale: float = 1.0) -> dict:
+        """
+        Summarize an arbitrary array of samples
+
+        :param samples: Sample values
+        :param count: Total count to report (defaults to the number of samples)
+        :param scale: Factor applied to the reported values
+
+        :return: dict with count, p50, p95, p99 and max
+        """
+        result = {"count": len(samples) if count is None else count}
+        if len(samples) == 0:
+            for pct in RollingStats.PERCENTILES:
+                result[f"p{pct}"] = 0.0
+            result["max"] = 0.0
+            return result
+
+        values = np.percentile(samples, RollingStats.PERCENTILES) * scale
+        for pct, value in zip(RollingStats.PERCENTILES, values, strict=True):
+            result[f"p{pct}"] = float(value)
+        result["max"] = float(samples.max() * scale)
+        return result
+
+
+class Mailbox:
+    """
+    Single-slot, latest-wins handoff between a producer and a consumer.
+
+    Putting an item replaces any item which has not been taken yet,
+    so a slow consumer always gets the most recent value instead of
+    working through a backlog of stale ones.
+    """
+
+    def __init__(self, ready: asyncio.Event | None = None):
+        self._item = None
+        self._event = asyncio.Event()
+        self._dropped = 0
+
+        # Optional event shared by several mailboxes, set on every put so
+        # a consumer can wait for any of them without a task per mailbox
+        self.ready = ready
+
+    def put(self, item) -> bool:
+        """
+        Place an item in the mailbox, replacing any pending item
+
+        :param item: The item to deliver (must not be None)
+
+        :return: True if a pending item was dropped
+        """
+        return self.swap(item) is not None
+
+    def swap(self, item):
+        """
+        Place an item in the mailbox and hand back the item it replaced
+
+        :param item: The item to deliver (must not be None)
+
+        :return: The pending item which was dropped, or None
+        """
+        dropped = self._item
+        if dropped is not None:
+            self._dropped += 1
+
+        self._item = item
+        self._event.set()
+        if self.ready is not None:
+            self.ready.set()
+        return dropped
+
+    def get_nowait(self):
+        """
+        Take the pending item without waiting
+
+        :return: The pending item, or None if the mailbox is empty
+        """
+        item = self._item
+        self._item = None
+        self._event.clear()
+        return item
+
+    async def get(self):
+        """
+        Take the pending item, yielding until one is available
+        """
+        while self._item is None:
+            await self._event.wait()
+        return self.get_nowait()
+
+    def empty(self) -> bool:
+        """
+        True if no item is pending
+        """
+        return self._item is None
+
+    def clear(self):
+        """
+        Discard any pending item
+        """
+        self.get_nowait()
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of items which were replaced before being taken
+        """
+        return self._dropped
+
 
 class ValueAnimator:
     """